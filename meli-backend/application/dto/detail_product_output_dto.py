@@ -6,9 +6,10 @@ Archivo fuente TypeScript: meli-frontend/src/types/product.ts
 Interface: ProductDetail
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Union
+from domain.shared.slotted import slotted
 
 # Importar enums desde el dominio (evitar duplicación)
 from domain.product_detail.entity.product_detail import ConditionType
@@ -29,6 +30,7 @@ from domain.characteristic.entity.characteristic import CharacteristicType
 # SUBDTOS - Navegación
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class CategoryPathItemDto:
     """
@@ -43,6 +45,7 @@ class CategoryPathItemDto:
 # SUBDTOS - Vendedor
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class ReputationDto:
     """
@@ -60,6 +63,7 @@ class ReputationDto:
             raise ValueError(f"Reputation must sum to 100, got {total}")
 
 
+@slotted
 @dataclass(frozen=True)
 class SellerDto:
     """
@@ -87,6 +91,7 @@ class SellerDto:
 # SUBDTOS - Envío
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class EstimatedDaysDto:
     """
@@ -97,6 +102,7 @@ class EstimatedDaysDto:
     max: int
 
 
+@slotted
 @dataclass(frozen=True)
 class ShippingDto:
     """
@@ -111,6 +117,7 @@ class ShippingDto:
 # SUBDTOS - Características
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class SimpleCharacteristicDto:
     """
@@ -121,6 +128,7 @@ class SimpleCharacteristicDto:
     value: str
 
 
+@slotted
 @dataclass(frozen=True)
 class RangeCharacteristicDto:
     """
@@ -139,6 +147,7 @@ class RangeCharacteristicDto:
     segments: int = 5  # Número de segmentos (default: 5)
 
 
+@slotted
 @dataclass(frozen=True)
 class HighlightCharacteristicDto:
     """
@@ -151,6 +160,7 @@ class HighlightCharacteristicDto:
     icon: str
 
 
+@slotted
 @dataclass(frozen=True)
 class CategoryCharacteristicDto:
     """
@@ -174,6 +184,7 @@ CharacteristicDto = Union[
 # SUBDTOS - Preguntas
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class QuestionDto:
     """
@@ -192,6 +203,7 @@ class QuestionDto:
 # SUBDTOS - Productos Relacionados
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class RelatedProductDto:
     """
@@ -214,6 +226,7 @@ class RelatedProductDto:
 # SUBDTOS - Variantes
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class VariantDto:
     """
@@ -228,6 +241,7 @@ class VariantDto:
     available: bool = True
 
 
+@slotted
 @dataclass(frozen=True)
 class VariantGroupDto:
     """
@@ -249,6 +263,7 @@ ProductVariantsDto = Dict[str, VariantGroupDto]
 # SUBDTOS - Pagos
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class PaymentMethodDto:
     """
@@ -265,6 +280,7 @@ class PaymentMethodDto:
 # SUBDTOS - Ratings y Reviews
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class RatingCategoryDto:
     """
@@ -276,6 +292,7 @@ class RatingCategoryDto:
     order: int = 0
 
 
+@slotted
 @dataclass(frozen=True)
 class ReviewDto:
     """
@@ -293,6 +310,7 @@ class ReviewDto:
     category_ratings: Optional[Dict[str, float]] = None
 
 
+@slotted
 @dataclass(frozen=True)
 class RatingDistributionDto:
     """
@@ -324,6 +342,7 @@ CategoryRatingsDto = Dict[str, float]
 # SUBDTOS - Media (Imágenes)
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class ProductMediaDto:
     """
@@ -338,6 +357,7 @@ class ProductMediaDto:
 # SUBDTOS - Información Básica del Producto
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class ProductBasicsDto:
     """
@@ -359,6 +379,7 @@ class ProductBasicsDto:
 # DTO PRINCIPAL
 # ============================================================================
 
+@slotted
 @dataclass(frozen=True)
 class DetailProductOutputDto:
     """
@@ -420,3 +441,10 @@ class DetailProductOutputDto:
     total_reviews: int
     rating_distribution: Dict[int, int]  # {5: 650, 4: 89, ...}
     average_category_ratings: CategoryRatingsDto  # {"camera_quality": 4.7, ...}
+
+    # ========================================
+    # Degradación (1 campo)
+    # ========================================
+    # Secciones reemplazadas por un placeholder vacío por superar su presupuesto
+    # de latencia o fallar (vacío = respuesta completa)
+    partial: List[str] = field(default_factory=list)
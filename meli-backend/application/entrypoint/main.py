@@ -1,10 +1,48 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 
+from infrastructure.api.FastAPI.admission_control import AdmissionControlMiddleware, AdmissionController
 from infrastructure.api.FastAPI.detail_product import router as product_router
 from infrastructure.api.FastAPI.variant_resolver import router as variant_router
+from infrastructure.api.FastAPI.monitoring import router as monitoring_router
+from infrastructure.api.FastAPI.product_listing import router as listing_router
+from infrastructure.api.FastAPI.product_questions import router as question_router
+from infrastructure.api.FastAPI.product_reviews import router as review_router
+from infrastructure.api.FastAPI.warmup import Readiness, resolve_warmup_products, warm_up
+from infrastructure.container.dependency_container import (
+    get_default_container,
+    shutdown_default_container,
+    start_catalog_watcher
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Arranque de la aplicación: el warm-up corre en segundo plano (en el
+    threadpool) para que /health responda mientras tanto; /ready recién
+    responde 200 cuando el catálogo está cargado y los productos más vistos
+    están pre-renderizados. Con la instancia lista se empiezan a seguir los
+    logs de escrituras de los otros workers y los CSV del catálogo.
+    """
+    async def start():
+        readiness = await run_in_threadpool(warm_up, app.state.readiness, resolve_warmup_products())
+        if readiness.ready:
+            get_default_container().start_background_writers()
+            start_catalog_watcher()
+
+    warmup = asyncio.ensure_future(start())
+    yield
+    if not warmup.done():
+        warmup.cancel()
+    shutdown_default_container()
 
 
 def create_application() -> FastAPI:
@@ -19,8 +57,15 @@ def create_application() -> FastAPI:
         description="API REST para gestión de productos estilo Mercado Libre",
         version="1.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        lifespan=lifespan
     )
+    app.state.readiness = Readiness()
+
+    # Control de admisión: límite de concurrencia adaptativo y 503 ante sobrecarga.
+    # Se registra antes que CORS para que las respuestas 503 también lleven sus headers
+    app.state.admission_controller = AdmissionController()
+    app.add_middleware(AdmissionControlMiddleware, controller=app.state.admission_controller)
 
     # Configurar CORS
     app.add_middleware(
@@ -33,7 +78,11 @@ def create_application() -> FastAPI:
 
     # Registrar routers
     app.include_router(product_router)
+    app.include_router(review_router)
+    app.include_router(question_router)
     app.include_router(variant_router)
+    app.include_router(monitoring_router)
+    app.include_router(listing_router)
 
     # Configurar archivos estáticos
     static_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "static")
@@ -46,6 +95,14 @@ def create_application() -> FastAPI:
         """Endpoint para verificar el estado del servicio."""
         return {"status": "healthy", "service": "meli-backend"}
 
+    # Readiness: 503 hasta que termina el warm-up del arranque
+    @app.get("/ready", tags=["health"])
+    async def readiness_check():
+        """Endpoint para verificar si la instancia puede recibir tráfico."""
+        readiness = app.state.readiness.to_dict()
+        status_code = status.HTTP_200_OK if readiness["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE
+        return JSONResponse(readiness, status_code=status_code)
+
     return app
 
 
@@ -0,0 +1,228 @@
+"""
+Materialización offline de los payloads de detalle de producto.
+
+Renderiza el JSON de cada producto de product_detail.csv (orquestación más
+serialización) en un pool de procesos y lo escribe, con sus variantes
+precomprimidas al máximo nivel, en un pack indexado que la API sirve vía mmap
+(MELI_PAYLOAD_PACK) sin orquestar.
+
+Los workers adjuntan el snapshot compilado del catálogo vía mmap en lugar de
+parsear los CSV cada uno. Cada producto del pack guarda la huella de las filas
+de las que depende su payload; al volver a correr el job sobre el mismo pack
+solo se renderizan los productos cuya huella cambió, el resto se copia.
+
+Uso:
+    python -m application.entrypoint.materialize /var/lib/meli/payloads.pack --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from application.service.catalog_dependency_tracker import SECTION_GLOBAL_TABLES, CatalogDependencyTracker
+from infrastructure.api.FastAPI.detail_product import render_cacheable_body
+from infrastructure.cache.compression import BROTLI, GZIP, IDENTITY, SUPPORTED_ENCODINGS, compress
+from infrastructure.cache.payload_pack import FINGERPRINT_SIZE, MmapPayloadPack, PackedPayload, write_pack
+from infrastructure.container.dependency_container import DependencyContainer
+from infrastructure.persist.catalog.catalog_loader import load_validated_snapshot
+from infrastructure.persist.catalog.catalog_snapshot import GLOBAL_KEY, PERSIST_DIR, ICatalogSnapshot
+from infrastructure.persist.catalog.shared_catalog import MmapCatalogSnapshot, compile_snapshot
+
+# Offline el costo de CPU no importa: se comprime al máximo nivel
+PACK_COMPRESSION_LEVELS = {GZIP: 9, BROTLI: 11}
+
+
+def _digest_rows(digest: Any, table: str, rows: List[Dict[str, Any]]) -> None:
+    digest.update(table.encode('utf-8'))
+    digest.update(json.dumps(rows, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+
+
+def global_fingerprint(catalog: ICatalogSnapshot) -> bytes:
+    """Huella de las tablas globales (medios de pago, categorías de rating)"""
+    digest = hashlib.sha256()
+    for tables in SECTION_GLOBAL_TABLES.values():
+        for table in tables:
+            _digest_rows(digest, table, catalog.get_rows(table, GLOBAL_KEY))
+    return digest.digest()
+
+
+def payload_fingerprint(catalog: ICatalogSnapshot,
+                        product_id: str,
+                        global_digest: bytes = b"",
+                        tracker: Optional[CatalogDependencyTracker] = None) -> bytes:
+    """
+    Huella de las filas de las que depende el payload de un producto.
+
+    Las dependencias (filas propias del producto y de sus vendedores) las
+    define el CatalogDependencyTracker; las tablas globales entran por
+    global_digest. Si ninguna fila cambió, el payload renderizado sigue siendo válido.
+
+    Args:
+        catalog: Snapshot del catálogo
+        product_id: ID del producto
+        global_digest: Resultado de global_fingerprint (se calcula una vez por job)
+        tracker: Tracker del snapshot (se reutiliza entre productos)
+
+    Returns:
+        FINGERPRINT_SIZE bytes
+    """
+    tracker = tracker or CatalogDependencyTracker(catalog)
+    digest = hashlib.sha256(global_digest)
+    for table, key in tracker.product_dependencies(product_id):
+        _digest_rows(digest, table, catalog.get_rows(table, key))
+    return digest.digest()[:FINGERPRINT_SIZE]
+
+
+# Estado de cada proceso del pool (lo inicializa _init_worker)
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(snapshot_path: str, encodings: List[str]) -> None:
+    """Adjunta el snapshot compilado y arma el container del proceso"""
+    catalog = MmapCatalogSnapshot(snapshot_path)
+    _worker["container"] = DependencyContainer(catalog)
+    _worker["version"] = catalog.version
+    _worker["encodings"] = encodings
+
+
+def _render_product(product_id: str) -> Tuple[str, Optional[Dict[str, bytes]]]:
+    """Renderiza y precomprime un producto (None si no se puede materializar)"""
+    try:
+        body = render_cacheable_body(_worker["container"], product_id, _worker["version"])
+    except Exception as e:
+        print(f"Error materializing product {product_id}: {e}")
+        body = None
+    if body is None:
+        return product_id, None
+    bodies = {IDENTITY: body}
+    for encoding in _worker["encodings"][1:]:
+        bodies[encoding] = compress(body, encoding, PACK_COMPRESSION_LEVELS[encoding])
+    return product_id, bodies
+
+
+def _open_previous(path: str, encodings: List[str]) -> Optional[MmapPayloadPack]:
+    """Pack de una corrida anterior, si existe y tiene las mismas codificaciones"""
+    if not os.path.exists(path):
+        return None
+    try:
+        previous = MmapPayloadPack(path)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring previous payload pack ({path}): {e}")
+        return None
+    if previous.encodings != encodings:
+        previous.close()
+        return None
+    return previous
+
+
+def materialize(output_path: str,
+                workers: Optional[int] = None,
+                encodings: Optional[List[str]] = None,
+                base_dir: str = PERSIST_DIR,
+                full: bool = False) -> Dict[str, Any]:
+    """
+    Materializa los payloads de todos los productos del catálogo en un pack.
+
+    Args:
+        output_path: Ruta del pack (si ya existe, se reutiliza lo que no cambió)
+        workers: Procesos del pool (por defecto, uno por núcleo; 1 renderiza en el proceso actual)
+        encodings: Codificaciones precomprimidas (por defecto, las soportadas)
+        base_dir: Directorio raíz de los repositorios CSV
+        full: Renderiza todo, ignorando el pack anterior
+
+    Returns:
+        Resumen de la corrida (productos renderizados, reutilizados y omitidos)
+    """
+    started = time.monotonic()
+    workers = workers or os.cpu_count() or 1
+    encodings = [IDENTITY] + [encoding for encoding in (encodings or SUPPORTED_ENCODINGS) if encoding != IDENTITY]
+    unsupported = [encoding for encoding in encodings[1:] if encoding not in SUPPORTED_ENCODINGS]
+    if unsupported:
+        raise ValueError(f"Unsupported encodings: {', '.join(unsupported)}")
+
+    catalog = load_validated_snapshot(base_dir)
+    global_digest = global_fingerprint(catalog)
+    tracker = CatalogDependencyTracker(catalog)
+    previous = None if full else _open_previous(output_path, encodings)
+
+    reused: List[str] = []
+    pending: List[Tuple[str, bytes]] = []
+    for product_id in catalog.keys("product_detail"):
+        fingerprint = payload_fingerprint(catalog, product_id, global_digest, tracker)
+        if previous is not None and previous.fingerprint(product_id) == fingerprint:
+            reused.append(product_id)
+        else:
+            pending.append((product_id, fingerprint))
+
+    fingerprints = dict(pending)
+    skipped: List[str] = []
+
+    # Los workers adjuntan el catálogo compilado vía mmap (una copia en el page cache)
+    fd, snapshot_path = tempfile.mkstemp(prefix="meli-materialize-", suffix=".snapshot")
+    os.close(fd)
+    try:
+        compile_snapshot(catalog, snapshot_path)
+
+        def payloads(rendered: Iterator[Tuple[str, Optional[Dict[str, bytes]]]]) -> Iterator[PackedPayload]:
+            # Lo reutilizado se copia del pack anterior, que sigue mapeado
+            # hasta terminar aunque el nuevo lo reemplace
+            for product_id in reused:
+                yield previous.get_payload(product_id)
+            for product_id, bodies in rendered:
+                if bodies is None:
+                    skipped.append(product_id)
+                else:
+                    yield PackedPayload(product_id, fingerprints[product_id], bodies)
+
+        product_ids = [product_id for product_id, _ in pending]
+        if workers <= 1:
+            _init_worker(snapshot_path, encodings)
+            written = write_pack(payloads(map(_render_product, product_ids)), output_path, catalog.version, encodings)
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(snapshot_path, encodings)) as executor:
+                # Los payloads se escriben a medida que llegan, sin reunirlos en memoria
+                rendered = executor.map(_render_product, product_ids, chunksize=max(1, len(product_ids) // (workers * 8)))
+                written = write_pack(payloads(rendered), output_path, catalog.version, encodings)
+    finally:
+        _worker.clear()
+        os.remove(snapshot_path)
+        if previous is not None:
+            previous.close()
+
+    return {
+        "version": catalog.version,
+        "products": written,
+        "rendered": len(pending) - len(skipped),
+        "reused": len(reused),
+        "skipped": skipped,
+        "encodings": encodings,
+        "duration_ms": round((time.monotonic() - started) * 1000, 3)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Materializa los payloads de detalle en un pack servido vía mmap")
+    parser.add_argument("output", help="Ruta del pack a generar (o actualizar)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--encodings", default=",".join(SUPPORTED_ENCODINGS),
+                        help="Codificaciones precomprimidas separadas por comas")
+    parser.add_argument("--full", action="store_true", help="Renderiza todo, ignorando el pack anterior")
+    args = parser.parse_args()
+
+    encodings = [encoding.strip() for encoding in args.encodings.split(',') if encoding.strip()]
+    summary = materialize(args.output, workers=args.workers, encodings=encodings, full=args.full)
+    print(
+        f"Payload pack {summary['version']} written to {args.output}: "
+        f"{summary['rendered']} rendered, {summary['reused']} reused, {len(summary['skipped'])} skipped "
+        f"in {summary['duration_ms']} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Arranque multi-worker con catálogo compartido.
+
+El proceso padre compila el snapshot del catálogo una sola vez y luego lanza los
+workers de uvicorn en modo compartido: cada worker adjunta el mismo archivo vía
+mmap en lugar de parsear los CSV en su propia memoria.
+
+Uso:
+    python -m application.entrypoint.serve --workers 4
+"""
+
+import argparse
+import os
+
+import uvicorn
+
+from infrastructure.persist.catalog.catalog_loader import (
+    CATALOG_FILE_ENV,
+    CATALOG_MODE_ENV,
+    DEFAULT_CATALOG_FILE,
+    MODE_SHARED,
+    load_validated_snapshot
+)
+from infrastructure.persist.catalog.shared_catalog import compile_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Levanta la API con catálogo compartido entre workers")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--catalog-file", default=os.getenv(CATALOG_FILE_ENV, DEFAULT_CATALOG_FILE))
+    args = parser.parse_args()
+
+    # Validar y compilar el snapshot en el padre (los workers heredan el entorno)
+    catalog = load_validated_snapshot()
+    compile_snapshot(catalog, args.catalog_file)
+    os.environ[CATALOG_MODE_ENV] = MODE_SHARED
+    os.environ[CATALOG_FILE_ENV] = args.catalog_file
+    print(f"Catalog snapshot {catalog.version} compiled to {args.catalog_file}")
+
+    uvicorn.run(
+        "application.entrypoint.main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level="info"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Bulkhead: límite de llamadas concurrentes hacia una dependencia"""
+
+import threading
+from typing import Any, Dict
+
+
+class BulkheadFullError(RuntimeError):
+    """El bulkhead no tiene capacidad libre: la llamada se rechaza sin esperar"""
+
+
+class Bulkhead:
+    """
+    Cupo fijo de llamadas concurrentes para una dependencia.
+
+    acquire() no espera: si el cupo está lleno la llamada se rechaza, de modo
+    que una dependencia lenta ocupa como máximo max_concurrent hilos y nunca
+    la capacidad reservada para las demás.
+    """
+
+    def __init__(self, name: str, max_concurrent: int):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be positive")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._max_in_use = 0
+        self._rejected = 0
+
+    def acquire(self) -> None:
+        """
+        Ocupa un lugar del cupo.
+
+        Raises:
+            BulkheadFullError: Si no hay lugar libre
+        """
+        with self._lock:
+            if self._in_use >= self.max_concurrent:
+                self._rejected += 1
+                raise BulkheadFullError(f"Bulkhead {self.name} is full ({self.max_concurrent})")
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+
+    def release(self) -> None:
+        """Libera un lugar del cupo"""
+        with self._lock:
+            if self._in_use == 0:
+                raise RuntimeError(f"Bulkhead {self.name} released more times than acquired")
+            self._in_use -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna la ocupación del cupo"""
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "in_use": self._in_use,
+                "max_in_use": self._max_in_use,
+                "rejected": self._rejected
+            }
@@ -0,0 +1,255 @@
+"""
+Dependencias entre las filas del catálogo y las secciones del detalle.
+
+Registra de qué filas (por tabla y clave) y de qué entidades (vendedores)
+depende cada sección del payload de un producto. Con eso, un cambio en los
+datos se traduce en el conjunto mínimo de productos y secciones a invalidar o
+volver a materializar, en lugar de descartar todos los cachés con la versión
+anterior del catálogo.
+"""
+
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from application.service.detail_product_orchestrator_service import SECTIONS
+from infrastructure.persist.catalog.catalog_snapshot import CATALOG_TABLES, GLOBAL_KEY, ICatalogSnapshot
+
+# Tablas indexadas por product_id que lee cada sección
+SECTION_TABLES: Dict[str, Tuple[str, ...]] = {
+    "basics": ("product_detail",),
+    "media": ("product_image",),
+    "category_path": ("category_path",),
+    "seller": ("product_seller",),
+    "shipping": ("shipping",),
+    "characteristics": ("characteristic",),
+    "highlights": ("highlight",),
+    "questions": ("question",),
+    "related_products": ("related_product", "related_product_computed"),
+    "variants": ("variant",),
+    "payments": (),
+    "reviews": ("review",),
+}
+
+# Tablas globales (sin clave) que lee cada sección: afectan a todos los productos
+SECTION_GLOBAL_TABLES: Dict[str, Tuple[str, ...]] = {
+    "payments": ("payment",),
+    "reviews": ("rating_category",),
+}
+
+# Entidades referenciadas: tabla de la entidad → (tabla puente, columna, sección)
+ENTITY_REFERENCES: Dict[str, Tuple[str, str, str]] = {
+    "seller": ("product_seller", "seller_id", "seller"),
+}
+
+# Tablas que el detalle no lee (ej: el mapeo de variantes solo lo usa el resolver)
+UNTRACKED_TABLES = frozenset(
+    set(CATALOG_TABLES)
+    - {table for tables in SECTION_TABLES.values() for table in tables}
+    - {table for tables in SECTION_GLOBAL_TABLES.values() for table in tables}
+    - set(ENTITY_REFERENCES)
+)
+
+# Dependencia: (tabla, clave)
+Dependency = Tuple[str, str]
+
+
+class TableDiff(NamedTuple):
+    """Cambios de una tabla entre dos versiones del catálogo"""
+    table: str
+    # Claves con alguna fila agregada, eliminada o modificada
+    changed_keys: FrozenSet[str]
+    added_rows: int
+    removed_rows: int
+
+
+class CatalogDiff(NamedTuple):
+    """Diferencias fila a fila entre dos versiones del catálogo"""
+    old_version: str
+    new_version: str
+    tables: Dict[str, TableDiff]
+
+    def changed_keys(self, table: str) -> FrozenSet[str]:
+        """Claves de la tabla con cambios"""
+        diff = self.tables.get(table)
+        return diff.changed_keys if diff is not None else frozenset()
+
+    @property
+    def empty(self) -> bool:
+        """Indica si las versiones tienen las mismas filas"""
+        return not self.tables
+
+
+def _row_counter(rows: List[Dict[str, Any]]) -> Counter:
+    return Counter(tuple(sorted(row.items(), key=lambda item: item[0])) for row in rows)
+
+
+def diff_catalogs(old: ICatalogSnapshot, new: ICatalogSnapshot) -> CatalogDiff:
+    """
+    Compara dos snapshots fila a fila (CSV en memoria o snapshot compilado).
+
+    Las filas de cada clave se comparan como multiconjunto: una fila
+    modificada cuenta como una eliminada y una agregada.
+
+    Args:
+        old: Snapshot anterior
+        new: Snapshot nuevo
+
+    Returns:
+        CatalogDiff con solo las tablas que cambiaron
+    """
+    tables: Dict[str, TableDiff] = {}
+    for table in CATALOG_TABLES:
+        changed: Set[str] = set()
+        added = removed = 0
+        for key in set(old.keys(table)) | set(new.keys(table)):
+            old_rows = old.get_rows(table, key)
+            new_rows = new.get_rows(table, key)
+            if old_rows == new_rows:
+                continue
+            old_counter, new_counter = _row_counter(old_rows), _row_counter(new_rows)
+            added += sum((new_counter - old_counter).values())
+            removed += sum((old_counter - new_counter).values())
+            # Un reordenamiento también cambia el payload (se conserva el orden del CSV)
+            changed.add(key)
+        if changed:
+            tables[table] = TableDiff(table, frozenset(changed), added, removed)
+    return CatalogDiff(old.version, new.version, tables)
+
+
+class CatalogDependencyTracker:
+    """
+    Dependencias de las secciones de cada producto sobre un snapshot.
+
+    El índice inverso de entidades (vendedor → productos) se arma en el
+    primer uso.
+    """
+
+    def __init__(self, catalog: ICatalogSnapshot):
+        self._catalog = catalog
+        self._referencing: Optional[Dict[str, Dict[str, Set[str]]]] = None
+
+    def dependencies(self, product_id: str) -> Dict[str, List[Dependency]]:
+        """
+        Filas de las que depende cada sección del producto.
+
+        Returns:
+            Sección → [(tabla, clave)], incluidas las tablas globales y las
+            entidades referenciadas
+        """
+        result: Dict[str, List[Dependency]] = {
+            section: [(table, product_id) for table in tables]
+            for section, tables in SECTION_TABLES.items()
+        }
+        for section, tables in SECTION_GLOBAL_TABLES.items():
+            result[section].extend((table, GLOBAL_KEY) for table in tables)
+        for entity_table, (bridge_table, column, section) in ENTITY_REFERENCES.items():
+            for row in self._catalog.get_rows(bridge_table, product_id):
+                if row.get(column):
+                    result[section].append((entity_table, row[column]))
+        return result
+
+    def product_dependencies(self, product_id: str) -> List[Dependency]:
+        """Dependencias propias del producto (sin las tablas globales)"""
+        return [
+            dependency
+            for dependencies in self.dependencies(product_id).values()
+            for dependency in dependencies
+            if dependency[1] != GLOBAL_KEY
+        ]
+
+    def referencing_products(self, entity_table: str, entity_id: str) -> Set[str]:
+        """Productos que referencian una entidad (ej: los productos de un vendedor)"""
+        if self._referencing is None:
+            referencing: Dict[str, Dict[str, Set[str]]] = {}
+            for table, (bridge_table, column, _) in ENTITY_REFERENCES.items():
+                index: Dict[str, Set[str]] = {}
+                for product_id in self._catalog.keys(bridge_table):
+                    for row in self._catalog.get_rows(bridge_table, product_id):
+                        if row.get(column):
+                            index.setdefault(row[column], set()).add(product_id)
+                referencing[table] = index
+            self._referencing = referencing
+        return set(self._referencing[entity_table].get(entity_id, ()))
+
+    def products(self) -> List[str]:
+        """Productos del catálogo"""
+        return self._catalog.keys("product_detail")
+
+
+class CatalogUpdate(NamedTuple):
+    """Productos y secciones afectados por el cambio de una versión del catálogo a otra"""
+    diff: CatalogDiff
+    # Producto → secciones a invalidar o volver a materializar
+    affected: Dict[str, FrozenSet[str]]
+
+    @property
+    def stale_products(self) -> FrozenSet[str]:
+        """Productos con al menos una sección afectada"""
+        return frozenset(self.affected)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Resumen serializable del cambio"""
+        return {
+            "old_version": self.diff.old_version,
+            "new_version": self.diff.new_version,
+            "tables": {
+                table: {
+                    "changed_keys": len(diff.changed_keys),
+                    "added_rows": diff.added_rows,
+                    "removed_rows": diff.removed_rows
+                }
+                for table, diff in self.diff.tables.items()
+            },
+            "stale_products": len(self.affected),
+            "stale_sections": sum(len(sections) for sections in self.affected.values())
+        }
+
+
+def _add(affected: Dict[str, Set[str]], product_ids: Iterable[str], sections: Iterable[str]) -> None:
+    sections = tuple(sections)
+    for product_id in product_ids:
+        affected.setdefault(product_id, set()).update(sections)
+
+
+def plan_catalog_update(old: ICatalogSnapshot,
+                        new: ICatalogSnapshot,
+                        diff: Optional[CatalogDiff] = None) -> CatalogUpdate:
+    """
+    Calcula el conjunto mínimo de productos y secciones afectados por un cambio.
+
+    Las referencias a entidades se resuelven en ambas versiones: si un
+    producto cambia de vendedor, o cambian los datos de su vendedor anterior o
+    nuevo, se invalida su sección de vendedor. Un producto que aparece o
+    desaparece invalida todas sus secciones.
+
+    Args:
+        old: Snapshot anterior
+        new: Snapshot nuevo
+        diff: Diferencias ya calculadas con diff_catalogs (opcional)
+
+    Returns:
+        CatalogUpdate con las secciones afectadas por producto
+    """
+    diff = diff or diff_catalogs(old, new)
+    old_tracker, new_tracker = CatalogDependencyTracker(old), CatalogDependencyTracker(new)
+    affected: Dict[str, Set[str]] = {}
+
+    for section, tables in SECTION_TABLES.items():
+        for table in tables:
+            _add(affected, diff.changed_keys(table), (section,))
+
+    for product_id in diff.changed_keys("product_detail"):
+        if not (old.has_key("product_detail", product_id) and new.has_key("product_detail", product_id)):
+            _add(affected, (product_id,), SECTIONS)
+
+    for entity_table, (_, _, section) in ENTITY_REFERENCES.items():
+        for entity_id in diff.changed_keys(entity_table):
+            products = old_tracker.referencing_products(entity_table, entity_id) | \
+                new_tracker.referencing_products(entity_table, entity_id)
+            _add(affected, products, (section,))
+
+    for section, tables in SECTION_GLOBAL_TABLES.items():
+        if any(table in diff.tables for table in tables):
+            _add(affected, set(old_tracker.products()) | set(new_tracker.products()), (section,))
+
+    return CatalogUpdate(diff, {product_id: frozenset(sections) for product_id, sections in affected.items()})
@@ -0,0 +1,173 @@
+"""Circuit breaker con ventanas móviles de fallas y latencia"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, NamedTuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """El circuito está abierto: la llamada se rechaza sin ejecutarse"""
+
+
+class _Outcome(NamedTuple):
+    """Resultado de una llamada dentro de la ventana móvil"""
+    failed: bool
+    slow: bool
+    duration: float
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por dependencia, basado en las últimas window_size llamadas.
+
+    - closed: las llamadas pasan; si en la ventana (con al menos minimum_calls)
+      la tasa de fallas o de llamadas lentas supera su umbral, se abre.
+    - open: las llamadas se rechazan con CircuitOpenError durante open_seconds.
+    - half_open: se dejan pasar hasta half_open_calls llamadas de prueba; si
+      todas terminan bien y rápido el circuito se cierra, si alguna falla o es
+      lenta vuelve a abrirse.
+
+    El llamador pide permiso con acquire() y reporta el resultado con
+    record_success/record_failure (o cancel si la llamada no llegó a ejecutarse).
+    """
+
+    def __init__(self,
+                 name: str,
+                 window_size: int = 20,
+                 minimum_calls: int = 10,
+                 failure_rate_threshold: float = 0.5,
+                 slow_call_threshold: float = 1.0,
+                 slow_call_rate_threshold: float = 0.5,
+                 open_seconds: float = 30.0,
+                 half_open_calls: int = 3,
+                 clock: Callable[[], float] = time.monotonic):
+        if window_size < 1 or half_open_calls < 1:
+            raise ValueError("window_size and half_open_calls must be positive")
+        if not 1 <= minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        self.name = name
+        self._minimum_calls = minimum_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_threshold = slow_call_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_seconds = open_seconds
+        self._half_open_calls = half_open_calls
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._window: Deque[_Outcome] = deque(maxlen=window_size)
+        self._failures = 0
+        self._slow_calls = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials_in_flight = 0
+        self._trial_successes = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Estado actual (closed, open o half_open)"""
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _refresh_state(self) -> None:
+        # Pasado open_seconds, el circuito abierto admite llamadas de prueba
+        if self._state == OPEN and self._clock() - self._opened_at >= self._open_seconds:
+            self._state = HALF_OPEN
+            self._trials_in_flight = 0
+            self._trial_successes = 0
+
+    def acquire(self) -> bool:
+        """
+        Pide permiso para ejecutar una llamada.
+
+        Returns:
+            True si la llamada es de prueba (circuito half_open)
+
+        Raises:
+            CircuitOpenError: Si el circuito está abierto o no quedan pruebas libres
+        """
+        with self._lock:
+            self._refresh_state()
+            if self._state == CLOSED:
+                return False
+            if self._state == HALF_OPEN and self._trials_in_flight < self._half_open_calls:
+                self._trials_in_flight += 1
+                return True
+            self._rejected += 1
+            raise CircuitOpenError(f"Circuit {self.name} is {self._state}")
+
+    def record_success(self, duration: float, trial: bool = False) -> None:
+        """Registra una llamada terminada sin error (lenta si supera el umbral)"""
+        self._record(_Outcome(False, duration >= self._slow_call_threshold, duration), trial)
+
+    def record_failure(self, duration: float, trial: bool = False) -> None:
+        """Registra una llamada terminada con error"""
+        self._record(_Outcome(True, duration >= self._slow_call_threshold, duration), trial)
+
+    def cancel(self, trial: bool = False) -> None:
+        """Devuelve el permiso de una llamada que no llegó a ejecutarse"""
+        if trial:
+            with self._lock:
+                if self._state == HALF_OPEN:
+                    self._trials_in_flight = max(0, self._trials_in_flight - 1)
+
+    def _record(self, outcome: _Outcome, trial: bool) -> None:
+        with self._lock:
+            if len(self._window) == self._window.maxlen:
+                dropped = self._window[0]
+                self._failures -= dropped.failed
+                self._slow_calls -= dropped.slow
+            self._window.append(outcome)
+            self._failures += outcome.failed
+            self._slow_calls += outcome.slow
+
+            if self._state == HALF_OPEN and trial:
+                self._trials_in_flight = max(0, self._trials_in_flight - 1)
+                if outcome.failed or outcome.slow:
+                    self._open()
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self._half_open_calls:
+                        self._close()
+            elif self._state == CLOSED and len(self._window) >= self._minimum_calls:
+                calls = len(self._window)
+                if self._failures / calls >= self._failure_rate_threshold or \
+                        self._slow_calls / calls >= self._slow_call_rate_threshold:
+                    self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._times_opened += 1
+
+    def _close(self) -> None:
+        # Al cerrar se empieza una ventana nueva: las fallas previas ya no cuentan
+        self._state = CLOSED
+        self._window.clear()
+        self._failures = 0
+        self._slow_calls = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna el estado y las métricas de la ventana móvil"""
+        with self._lock:
+            self._refresh_state()
+            calls = len(self._window)
+            durations = [outcome.duration for outcome in self._window]
+            return {
+                "state": self._state,
+                "window_calls": calls,
+                "failure_rate": round(self._failures / calls, 4) if calls else 0.0,
+                "slow_call_rate": round(self._slow_calls / calls, 4) if calls else 0.0,
+                "avg_latency_ms": round(sum(durations) / calls * 1000, 3) if calls else 0.0,
+                "max_latency_ms": round(max(durations) * 1000, 3) if calls else 0.0,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened
+            }
@@ -0,0 +1,62 @@
+"""Capa single-flight delante del orquestador de detalle de producto"""
+
+from typing import Any, Dict, Iterable, Optional
+from application.dto.detail_product_output_dto import DetailProductOutputDto
+from application.service.detail_product_orchestrator_service import DetailProductService, SECTIONS
+from application.service.single_flight import SingleFlight
+
+
+class CoalescingDetailProductService:
+    """
+    Envuelve DetailProductService para que las peticiones concurrentes por el
+    mismo product_id compartan una única orquestación.
+
+    Evita la estampida cuando un producto se vuelve viral o justo después de
+    recargar los datos, momento en que todas las peticiones llegan sin caché.
+    """
+
+    def __init__(self, detail_product_service: DetailProductService, single_flight: SingleFlight = None):
+        self.detail_product_service = detail_product_service
+        self._single_flight = single_flight or SingleFlight()
+
+    def get_detail_product_by_id(self, product_id: str) -> Optional[DetailProductOutputDto]:
+        """
+        Obtiene el detalle completo de un producto coalesciendo llamadas concurrentes.
+
+        Args:
+            product_id: ID del producto a buscar
+
+        Returns:
+            DetailProductOutputDto compartido por las llamadas concurrentes, None si no existe
+        """
+        return self._single_flight.do(
+            product_id,
+            lambda: self.detail_product_service.get_detail_product_by_id(product_id)
+        )
+
+    def get_sections_by_product_id(self,
+                                   product_id: str,
+                                   sections: Iterable[str] = SECTIONS,
+                                   revision: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Obtiene algunas secciones del detalle coalesciendo llamadas concurrentes
+        que piden las mismas secciones del mismo producto.
+
+        Args:
+            product_id: ID del producto
+            sections: Nombres de sección a consultar
+            revision: Revisión del producto (ProductRevision.token): una
+                llamada no se suma a una orquestación iniciada antes de una escritura
+
+        Returns:
+            Diccionario {campo del DTO: valor}, None si el producto no existe
+        """
+        sections = tuple(sections)
+        return self._single_flight.do(
+            ("sections", product_id, sections, revision),
+            lambda: self.detail_product_service.get_sections_by_product_id(product_id, sections)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna las estadísticas de coalescencia"""
+        return self._single_flight.get_stats()
@@ -1,11 +1,17 @@
 """Servicio orquestador para detalle de producto"""
 
-from typing import Optional, List
+import os
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, List
 from application.dto.detail_product_output_dto import (
     DetailProductOutputDto,
     CategoryPathItemDto,
-    ConditionType
+    ConditionType,
+    ProductMediaDto
 )
+from application.service.bulkhead import Bulkhead
+from application.service.circuit_breaker import CircuitBreaker
 from application.service.shipping_service import ShippingService
 from application.service.question_service import QuestionService
 from application.service.variant_product_service import VariantProductService
@@ -21,6 +27,123 @@ from application.service.product_detail_service import ProductDetailService
 from application.service.product_image_service import ProductImageService
 
 
+# Secciones del detalle y los campos de DetailProductOutputDto que produce cada una.
+# Cada sección se consulta (y se cachea ya serializada) de forma independiente.
+SECTION_FIELDS: Dict[str, tuple] = {
+    "basics": ("basics",),
+    "media": ("media",),
+    "category_path": ("category_path",),
+    "seller": ("seller",),
+    "shipping": ("shipping",),
+    "characteristics": ("characteristics",),
+    "highlights": ("highlights",),
+    "questions": ("questions",),
+    "related_products": ("related_products",),
+    "variants": ("variants",),
+    "payments": ("payment_methods", "max_installments"),
+    "reviews": (
+        "review_count",
+        "available_rating_categories",
+        "reviews",
+        "average_rating",
+        "total_reviews",
+        "rating_distribution",
+        "average_category_ratings",
+    ),
+}
+
+SECTIONS = tuple(SECTION_FIELDS)
+
+# Campo con las secciones degradadas de la respuesta
+PARTIAL_FIELD = "partial"
+
+# Buy box: siempre se espera, sin presupuesto (precio, variantes, envío, vendedor, cuotas)
+BUY_BOX_SECTIONS = frozenset({"basics", "seller", "shipping", "variants", "payments"})
+
+# Presupuesto de latencia de las secciones secundarias y deadline total de la
+# petición (ms). Se pueden ajustar por sección con MELI_SECTION_BUDGET_<SECCIÓN>_MS
+DEFAULT_SECTION_BUDGET_MS = int(os.getenv("MELI_SECTION_BUDGET_MS", "250"))
+REQUEST_DEADLINE_MS = int(os.getenv("MELI_REQUEST_DEADLINE_MS", "500"))
+
+# Secciones protegidas por circuit breaker. basics no tiene fallback
+# posible: sin datos básicos no hay página que mostrar
+GUARDED_SECTIONS = tuple(section for section in SECTIONS if section != "basics")
+# Secciones con bulkhead: solo las secundarias, que ocupan hilos del pool
+# compartido. El buy box corre en el hilo de la petición y no se rechaza por
+# concurrencia (una dependencia lenta la corta su circuit breaker)
+BULKHEAD_SECTIONS = tuple(section for section in GUARDED_SECTIONS if section not in BUY_BOX_SECTIONS)
+
+# Llamadas concurrentes por sección y parámetros de los circuit breakers
+BULKHEAD_SIZE = int(os.getenv("MELI_BULKHEAD_SIZE", "8"))
+BREAKER_WINDOW = int(os.getenv("MELI_BREAKER_WINDOW", "20"))
+BREAKER_MINIMUM_CALLS = int(os.getenv("MELI_BREAKER_MINIMUM_CALLS", "10"))
+BREAKER_FAILURE_RATE = float(os.getenv("MELI_BREAKER_FAILURE_RATE", "0.5"))
+BREAKER_SLOW_CALL_RATE = float(os.getenv("MELI_BREAKER_SLOW_CALL_RATE", "0.5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("MELI_BREAKER_OPEN_SECONDS", "30"))
+
+
+def default_section_budgets() -> Dict[str, float]:
+    """Presupuesto en segundos de cada sección secundaria"""
+    return {
+        section: int(os.getenv(f"MELI_SECTION_BUDGET_{section.upper()}_MS", DEFAULT_SECTION_BUDGET_MS)) / 1000
+        for section in SECTIONS
+        if section not in BUY_BOX_SECTIONS
+    }
+
+
+def default_breakers(section_budgets: Dict[str, float], request_deadline: float) -> Dict[str, CircuitBreaker]:
+    """
+    Un circuit breaker por sección protegida.
+
+    Una llamada cuenta como lenta si supera el presupuesto de su sección (el
+    deadline de la petición para las secciones del buy box).
+    """
+    return {
+        section: CircuitBreaker(
+            section,
+            window_size=BREAKER_WINDOW,
+            minimum_calls=BREAKER_MINIMUM_CALLS,
+            failure_rate_threshold=BREAKER_FAILURE_RATE,
+            slow_call_threshold=section_budgets.get(section, request_deadline),
+            slow_call_rate_threshold=BREAKER_SLOW_CALL_RATE,
+            open_seconds=BREAKER_OPEN_SECONDS
+        )
+        for section in GUARDED_SECTIONS
+    }
+
+
+def default_bulkheads() -> Dict[str, Bulkhead]:
+    """Un bulkhead por sección secundaria"""
+    return {section: Bulkhead(section, BULKHEAD_SIZE) for section in BULKHEAD_SECTIONS}
+
+
+def section_placeholder(section: str) -> Dict[str, Any]:
+    """Valores de fallback de una sección degradada (se listan en partial)"""
+    if section == "seller":
+        return {"seller": SellerInformationService.fallback_dto()}
+    if section == "shipping":
+        return {"shipping": ShippingService.fallback_dto()}
+    if section == "variants":
+        return {"variants": {}}
+    if section == "payments":
+        return {"payment_methods": (), "max_installments": 1}
+    if section == "media":
+        return {"media": ProductMediaDto(images=[], description_images=[])}
+    if section == "reviews":
+        return {
+            "review_count": 0,
+            "available_rating_categories": [],
+            "reviews": [],
+            "average_rating": 0.0,
+            "total_reviews": 0,
+            "rating_distribution": {5: 0, 4: 0, 3: 0, 2: 0, 1: 0},
+            "average_category_ratings": {}
+        }
+    if section in ("category_path", "characteristics", "highlights", "questions", "related_products"):
+        return {section: []}
+    raise ValueError(f"Section {section} cannot be degraded")
+
+
 class DetailProductService:
     """
     Servicio orquestador que coordina todos los servicios para construir
@@ -40,7 +163,12 @@ class DetailProductService:
                  seller_information_service: SellerInformationService,
                  category_path_service: CategoryPathService,
                  product_detail_service: ProductDetailService,
-                 product_image_service: ProductImageService):
+                 product_image_service: ProductImageService,
+                 executor: Optional[Executor] = None,
+                 section_budgets: Optional[Dict[str, float]] = None,
+                 request_deadline: float = REQUEST_DEADLINE_MS / 1000,
+                 breakers: Optional[Dict[str, CircuitBreaker]] = None,
+                 bulkheads: Optional[Dict[str, Bulkhead]] = None):
         self.shipping_service = shipping_service
         self.question_service = question_service
         self.variant_service = variant_service
@@ -54,81 +182,237 @@ class DetailProductService:
         self.category_path_service = category_path_service
         self.product_detail_service = product_detail_service
         self.product_image_service = product_image_service
+        self._section_budgets = section_budgets if section_budgets is not None else default_section_budgets()
+        self._request_deadline = request_deadline
+        # Cada dependencia tiene su circuit breaker y su cupo de concurrencia
+        self._breakers = breakers if breakers is not None else \
+            default_breakers(self._section_budgets, request_deadline)
+        self._bulkheads = bulkheads if bulkheads is not None else default_bulkheads()
+        # Las secciones secundarias se consultan en paralelo con su presupuesto.
+        # El pool alcanza para todos los cupos: una sección saturada nunca deja
+        # sin hilos a las demás. Solo se cierra en close() si lo creó el servicio
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=sum(self._bulkheads[section].max_concurrent
+                            for section in self._section_budgets if section in self._bulkheads) or 1,
+            thread_name_prefix="pdp-section"
+        )
 
-    def get_detail_product_by_id(self, product_id: str) -> Optional[DetailProductOutputDto]:
+    def close(self) -> None:
         """
-        Obtiene el detalle completo de un producto por su ID.
+        Libera los hilos del pool de secciones (si lo creó el servicio). Las
+        consultas ya encoladas terminan; no se deben armar detalles después.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def _load_section(self, section: str, product_id: str) -> Dict[str, Any]:
+        """Consulta los servicios de una sección y retorna sus campos del DTO"""
+        if section == "basics":
+            return {"basics": self.product_detail_service.get_basics_by_product_id(product_id)}
+        if section == "media":
+            return {"media": self.product_image_service.get_media_by_product_id(product_id)}
+        if section == "category_path":
+            return {"category_path": self.category_path_service.get_category_path_by_product_id(product_id)}
+        if section == "seller":
+            return {"seller": self.seller_information_service.get_seller_information_by_product_id(product_id)}
+        if section == "shipping":
+            return {"shipping": self.shipping_service.get_shipping_by_product_id(product_id)}
+        if section == "characteristics":
+            return {"characteristics": self.characteristic_service.get_characteristics_by_product_id(product_id)}
+        if section == "highlights":
+            return {"highlights": self.highlight_service.get_highlights_by_product_id(product_id)}
+        if section == "questions":
+            return {"questions": self.question_service.get_questions_by_product_id(product_id)}
+        if section == "related_products":
+            return {"related_products": self.related_product_service.get_related_products_by_product_id(product_id)}
+        if section == "variants":
+            return {"variants": self.variant_service.get_variants_by_product_id(product_id)}
+        if section == "payments":
+            return {
+                "payment_methods": self.payment_service.get_payment_methods_by_product_id(product_id),
+                "max_installments": self.payment_service.get_max_installments()
+            }
+        if section == "reviews":
+            total_reviews = self.review_statistics_service.get_total_reviews(product_id)
+            return {
+                # Métricas
+                "review_count": total_reviews,
+                "available_rating_categories":
+                    self.rating_category_service.get_rating_categories_by_product_id(product_id),
+                "reviews": self.review_statistics_service.get_reviews_by_product_id(product_id),
+                "average_rating": self.review_statistics_service.get_average_rating(product_id),
+                "total_reviews": total_reviews,
+                "rating_distribution": self.review_statistics_service.get_rating_distribution(product_id),
+                "average_category_ratings":
+                    self.review_statistics_service.get_average_category_ratings(product_id)
+            }
+        raise ValueError(f"Unknown section: {section}")
+
+    def _enter(self, section: str) -> bool:
+        """
+        Reserva el cupo del bulkhead (si la sección tiene) y el permiso del
+        circuit breaker de la sección.
+
+        Returns:
+            True si la llamada es de prueba del circuit breaker (half_open)
+
+        Raises:
+            BulkheadFullError, CircuitOpenError: La llamada se rechaza sin ejecutarse
+        """
+        bulkhead = self._bulkheads.get(section)
+        if bulkhead is not None:
+            bulkhead.acquire()
+        try:
+            return self._breakers[section].acquire()
+        except BaseException:
+            if bulkhead is not None:
+                bulkhead.release()
+            raise
+
+    def _release(self, section: str) -> None:
+        """Libera el cupo del bulkhead de la sección (si tiene)"""
+        bulkhead = self._bulkheads.get(section)
+        if bulkhead is not None:
+            bulkhead.release()
+
+    def _abandon(self, section: str, trial: bool) -> None:
+        """Libera el cupo y el permiso de una llamada que no llegó a ejecutarse"""
+        self._breakers[section].cancel(trial)
+        self._release(section)
+
+    def _call_guarded(self, section: str, product_id: str, trial: bool) -> Dict[str, Any]:
+        """Ejecuta la sección registrando su resultado y latencia en el circuit breaker"""
+        breaker = self._breakers[section]
+        started = time.monotonic()
+        try:
+            values = self._load_section(section, product_id)
+        except Exception:
+            breaker.record_failure(time.monotonic() - started, trial)
+            raise
+        finally:
+            self._release(section)
+        breaker.record_success(time.monotonic() - started, trial)
+        return values
+
+    def _submit(self, section: str, product_id: str) -> Future:
+        """Encola una sección secundaria; si el bulkhead o el breaker la rechazan, falla de inmediato"""
+        try:
+            trial = self._enter(section)
+        except Exception as e:
+            future: Future = Future()
+            future.set_exception(e)
+            return future
+        try:
+            future = self._executor.submit(self._call_guarded, section, product_id, trial)
+        except BaseException:
+            self._abandon(section, trial)
+            raise
+        # Si se cancela antes de correr, la llamada no cuenta como resultado para el breaker
+        future.add_done_callback(lambda done: done.cancelled() and self._abandon(section, trial))
+        return future
+
+    def get_sections_by_product_id(self,
+                                   product_id: str,
+                                   sections: Iterable[str] = SECTIONS) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene solo algunas secciones del detalle de un producto.
+
+        Permite reconstruir únicamente las secciones que no están en caché
+        (ver SECTION_FIELDS) sin orquestar la página completa.
+
+        Las secciones del buy box se consultan siempre. Las secundarias corren
+        en paralelo y se esperan hasta su presupuesto (acotado por el deadline
+        de la petición); si lo superan o fallan, se reemplazan por un
+        placeholder vacío y se listan en el campo partial. Con el circuit
+        breaker abierto (también en el buy box) o el bulkhead lleno (solo
+        secundarias), la sección va directo a su fallback sin llamar a la
+        dependencia.
 
         Args:
-            product_id: ID del producto a buscar
+            product_id: ID del producto
+            sections: Nombres de sección a consultar
 
         Returns:
-            DetailProductOutputDto con la información completa del producto, None si no existe
+            Diccionario {campo del DTO: valor} de las secciones pedidas más
+            partial, None si el producto no existe
         """
         if not product_id:
             return None
 
-        # TODO: Implementar validación de existencia del producto
+        # Verificar existencia antes de orquestar: los IDs inexistentes
+        # no deben pagar las búsquedas de todas las secciones
+        if not self.product_detail_service.exists(product_id):
+            return None
 
-        # Orquestar llamadas a todos los servicios
-        basics = self.product_detail_service.get_basics_by_product_id(product_id)
-        media = self.product_image_service.get_media_by_product_id(product_id)
-        shipping = self.shipping_service.get_shipping_by_product_id(product_id)
-        questions = self.question_service.get_questions_by_product_id(product_id)
-        variants = self.variant_service.get_variants_by_product_id(product_id)
-        related_products = self.related_product_service.get_related_products_by_product_id(product_id)
-        highlights = self.highlight_service.get_highlights_by_product_id(product_id)
-        rating_categories = self.rating_category_service.get_rating_categories_by_product_id(product_id)
-        characteristics = self.characteristic_service.get_characteristics_by_product_id(product_id)
-        reviews = self.review_statistics_service.get_reviews_by_product_id(product_id)
-        average_rating = self.review_statistics_service.get_average_rating(product_id)
-        total_reviews = self.review_statistics_service.get_total_reviews(product_id)
-        rating_distribution = self.review_statistics_service.get_rating_distribution(product_id)
-        average_category_ratings = self.review_statistics_service.get_average_category_ratings(product_id)
-        payment_methods = self.payment_service.get_payment_methods_by_product_id(product_id)
-        seller = self.seller_information_service.get_seller_information_by_product_id(product_id)
-        category_path = self.category_path_service.get_category_path_by_product_id(product_id)
+        start = time.monotonic()
+        sections = list(sections)
+        futures = {
+            section: (self._submit(section, product_id) if section in self._breakers
+                      else self._executor.submit(self._load_section, section, product_id))
+            for section in sections
+            if section in self._section_budgets
+        }
+
+        values: Dict[str, Any] = {}
+        degraded: List[str] = []
+        for section in sections:
+            if section in futures:
+                continue
+            if section not in self._breakers:
+                values.update(self._load_section(section, product_id))
+                continue
+            # Buy box: se espera siempre, salvo que el breaker esté abierto
+            try:
+                values.update(self._call_guarded(section, product_id, self._enter(section)))
+            except Exception:
+                degraded.append(section)
+                values.update(section_placeholder(section))
 
         # Validar que existan los datos básicos del producto
-        if not basics:
+        if "basics" in values and not values["basics"]:
+            for future in futures.values():
+                future.cancel()
+            return None
+
+        request_deadline = start + self._request_deadline
+        for section, future in futures.items():
+            deadline = min(start + self._section_budgets[section], request_deadline)
+            try:
+                values.update(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except Exception:
+                # Timeout, error o rechazo: la página se entrega sin la sección
+                future.cancel()
+                degraded.append(section)
+                values.update(section_placeholder(section))
+
+        values[PARTIAL_FIELD] = degraded
+        return values
+
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """Estado de los circuit breakers y ocupación de los bulkheads por sección (None en el buy box)"""
+        return {
+            section: {
+                "breaker": self._breakers[section].get_stats(),
+                "bulkhead": self._bulkheads[section].get_stats() if section in self._bulkheads else None
+            }
+            for section in self._breakers
+        }
+
+    def get_detail_product_by_id(self, product_id: str) -> Optional[DetailProductOutputDto]:
+        """
+        Obtiene el detalle completo de un producto por su ID.
+
+        Args:
+            product_id: ID del producto a buscar
+
+        Returns:
+            DetailProductOutputDto con la información completa del producto, None si no existe
+        """
+        # Orquestar llamadas a todos los servicios
+        values = self.get_sections_by_product_id(product_id, SECTIONS)
+        if values is None:
             return None
 
         # Construir DTO principal
-        return DetailProductOutputDto(
-            # Información básica del producto
-            basics=basics,
-
-            # Media
-            media=media,
-
-            # Métricas
-            review_count=total_reviews,
-
-            # Navegación
-            category_path=category_path,
-
-            # Vendedor y envío
-            seller=seller,
-            shipping=shipping,
-
-            # Características y destacados
-            characteristics=characteristics,
-            highlights=highlights,
-
-            # Interacción y variantes
-            questions=questions,
-            related_products=related_products,
-            variants=variants,
-
-            # Pagos
-            payment_methods=payment_methods,
-            max_installments=self.payment_service.get_max_installments(),
-
-            # Reviews y estadísticas
-            available_rating_categories=rating_categories,
-            reviews=reviews,
-            average_rating=average_rating,
-            total_reviews=total_reviews,
-            rating_distribution=rating_distribution,
-            average_category_ratings=average_category_ratings
-        )
+        return DetailProductOutputDto(**values)
@@ -0,0 +1,175 @@
+"""
+Base de los servicios de escritura respaldados por un AppendLog.
+
+Una escritura se vuelve durable en el log (group commit) y recién después se
+aplica a los índices en memoria del proceso. Cada proceso además sigue el log
+para aplicar lo que escribieron los demás workers, y periódicamente se vuelca
+el log a los datos base (compactación, que rota el log a una generación
+nueva). Un worker que no llegó a leer una generación antes de que se
+descartara vuelve a cargar los datos base, que ya la contienen.
+"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+from application.service.product_revisions import ProductRevisions
+from infrastructure.persist.append_log.append_log import AppendLog, LogPosition, Record
+
+# Cada cuánto se leen las escrituras de los otros workers
+DEFAULT_POLL_INTERVAL = float(os.getenv("MELI_LOG_POLL_MS", "200")) / 1000
+# Tamaño del log a partir del cual se compacta, y cada cuánto se verifica
+DEFAULT_COMPACT_THRESHOLD = int(os.getenv("MELI_LOG_COMPACT_BYTES", str(1 << 20)))
+DEFAULT_COMPACT_INTERVAL = float(os.getenv("MELI_LOG_COMPACT_INTERVAL", "60"))
+
+
+class LoggedWriteService:
+    """
+    Aplica registros de un AppendLog a los índices en memoria.
+
+    Las subclases definen _apply (aplicar un registro, idempotente), _merge
+    (persistir registros en los datos base) y _base_records (los datos base
+    como registros, para recuperar generaciones del log que este proceso no
+    llegó a leer). Los registros llevan id,
+    product_id y ts; cada registro aplicado suma una revisión a la sección del
+    producto.
+    """
+
+    # Sección del detalle que modifican los registros
+    section = ""
+
+    def __init__(self,
+                 log: AppendLog,
+                 revisions: ProductRevisions,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+                 compact_interval: float = DEFAULT_COMPACT_INTERVAL):
+        self._log = log
+        self._revisions = revisions
+        self._poll_interval = poll_interval
+        self._compact_threshold = compact_threshold
+        self._compact_interval = compact_interval
+        self._position: Optional[LogPosition] = None
+        # Serializa el seguimiento del log con la compactación
+        self._follow_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._applied = 0
+        self._compactions = 0
+        self._base_reloads = 0
+        self.catch_up()
+
+    def _apply(self, record: Record) -> bool:
+        """Aplica un registro a los índices; False si ya estaba aplicado"""
+        raise NotImplementedError
+
+    def _merge(self, records: List[Record]) -> None:
+        """Persiste los registros del log en los datos base"""
+        raise NotImplementedError
+
+    def _base_records(self) -> Iterable[Record]:
+        """Registros equivalentes a los datos base actuales (ej: filas del CSV)"""
+        raise NotImplementedError
+
+    def _commit(self, record: Record) -> None:
+        """Escribe el registro en el log (espera al fsync) y lo aplica"""
+        record.setdefault("id", uuid.uuid4().hex)
+        record.setdefault("ts", time.time())
+        self._log.append(record)
+        self._publish(record)
+
+    def _publish(self, record: Record) -> bool:
+        if not self._apply(record):
+            return False
+        # La revisión se publica después de que los datos son visibles
+        self._revisions.bump(record["product_id"], self.section, record["id"], record["ts"])
+        self._applied += 1
+        return True
+
+    def catch_up(self) -> int:
+        """
+        Aplica los registros del log que este proceso todavía no leyó
+        (al arrancar, toda la historia sin compactar).
+
+        Returns:
+            Cantidad de registros nuevos aplicados
+        """
+        with self._follow_lock:
+            read = self._log.follow(self._position)
+            applied = 0
+            if read.missed:
+                # Otro worker compactó registros que este no leyó: ya están en los datos base
+                applied += sum(1 for record in self._base_records() if self._publish(record))
+                self._base_reloads += 1
+            applied += sum(1 for record in read.records if self._publish(record))
+            self._position = read.position
+            return applied
+
+    def compact(self) -> int:
+        """
+        Vuelca el log a los datos base y lo rota a una generación nueva.
+
+        Returns:
+            Cantidad de registros compactados
+        """
+        def merge(records: List[Record]) -> None:
+            # Lo que todavía no se leyó se aplica antes de que desaparezca del log
+            for record in records:
+                self._publish(record)
+            self._merge(records)
+
+        with self._follow_lock:
+            compacted = self._log.compact(merge)
+            self._position: Optional[LogPosition] = None
+        if compacted:
+            self._compactions += 1
+        return compacted
+
+    def _run(self) -> None:
+        next_compaction = time.monotonic() + self._compact_interval
+        while not self._stop.wait(self._poll_interval):
+            try:
+                self.catch_up()
+                if time.monotonic() >= next_compaction:
+                    next_compaction = time.monotonic() + self._compact_interval
+                    if self._log.size() >= self._compact_threshold:
+                        self.compact()
+            except Exception as e:
+                print(f"Error following append log {self._log.path}: {e}")
+
+    def start(self) -> None:
+        """Inicia el seguimiento del log y la compactación en segundo plano"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.section}-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el hilo de segundo plano (el log queda abierto)"""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def get_log(self) -> AppendLog:
+        """Log que respalda las escrituras"""
+        return self._log
+
+    @property
+    def running(self) -> bool:
+        """Indica si el seguimiento en segundo plano está activo"""
+        return self._thread is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Registros aplicados, compactaciones y estado del log"""
+        return {
+            "applied": self._applied,
+            "position": self._position._asdict() if self._position is not None else None,
+            "compactions": self._compactions,
+            "base_reloads": self._base_reloads,
+            "running": self.running,
+            "log": self._log.get_stats()
+        }
@@ -0,0 +1,45 @@
+"""Caché negativo acotado para claves que se sabe que no existen"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+class NegativeCache:
+    """
+    Conjunto LRU de tamaño acotado con las claves cuya búsqueda falló.
+
+    Al superar max_size se descarta la clave usada hace más tiempo, de modo que
+    un bot que prueba IDs al azar no puede hacer crecer la memoria sin límite.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._keys: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains(self, key: Hashable) -> bool:
+        """Indica si la clave está registrada como inexistente"""
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._keys.move_to_end(key)
+            return True
+
+    def add(self, key: Hashable) -> None:
+        """Registra la clave como inexistente"""
+        with self._lock:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+            if len(self._keys) > self._max_size:
+                self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vacía el caché (ej: tras recargar el catálogo)"""
+        with self._lock:
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
@@ -1,29 +1,52 @@
 """Servicio para métodos de pago"""
 
-from typing import List
+from typing import NamedTuple, Tuple
 from application.dto.detail_product_output_dto import PaymentMethodDto
+from application.service.versioned_memo import VersionedMemo
 from infrastructure.persist.payment.payment_repository import PaymentRepository
 
 
+class _PaymentSection(NamedTuple):
+    """Sección de pagos (independiente del producto) de una versión del catálogo"""
+    payment_methods: Tuple[PaymentMethodDto, ...]
+    max_installments: int
+
+
 class PaymentService:
     """Servicio para obtener métodos de pago"""
 
     def __init__(self, repository: PaymentRepository = None):
         self.repository = repository or PaymentRepository()
+        self._section = VersionedMemo()
+
+    def _get_section(self) -> _PaymentSection:
+        # Los pagos no dependen del producto: se construyen una vez por versión
+        return self._section.get(self.repository.data_version, self._build_section)
 
-    def get_payment_methods_by_product_id(self, product_id: str) -> List[PaymentMethodDto]:
-        """Obtiene métodos de pago desde CSV"""
+    def _build_section(self) -> _PaymentSection:
         payments = self.repository.get_all()
-        return [
-            PaymentMethodDto(
-                id=p.id,
-                name=p.name,
-                image_url=p.image_url,
-                type=p.type
-            )
-            for p in payments
-        ]
+        return _PaymentSection(
+            payment_methods=tuple(
+                PaymentMethodDto(
+                    id=p.id,
+                    name=p.name,
+                    image_url=p.image_url,
+                    type=p.type
+                )
+                for p in payments
+            ),
+            max_installments=self.repository.get_max_installments()
+        )
+
+    def get_payment_methods_by_product_id(self, product_id: str) -> Tuple[PaymentMethodDto, ...]:
+        """
+        Obtiene los métodos de pago.
+
+        Los métodos de pago son globales: se retorna la misma tupla inmutable
+        para todos los productos de una versión del catálogo.
+        """
+        return self._get_section().payment_methods
 
     def get_max_installments(self) -> int:
         """Obtiene el número máximo de cuotas disponible"""
-        return self.repository.get_max_installments()
+        return self._get_section().max_installments
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from application.dto.detail_product_output_dto import ProductBasicsDto
+from application.service.negative_cache import NegativeCache
 from infrastructure.persist.product_detail.product_detail_repository import ProductDetailRepository
 from infrastructure.persist.product_detail.product_detail_mapper import ProductDetailMapper
 
@@ -12,12 +13,36 @@ class ProductDetailService:
 
     Responsabilidades:
     - Obtener datos básicos del producto (título, precio, descripción, etc.)
+    - Verificar existencia de productos con caché negativo acotado
     - Transformar entidades de dominio a DTOs
     """
 
-    def __init__(self, repository: ProductDetailRepository, mapper: ProductDetailMapper):
+    def __init__(self,
+                 repository: ProductDetailRepository,
+                 mapper: ProductDetailMapper,
+                 negative_cache: Optional[NegativeCache] = None):
         self._repository = repository
         self._mapper = mapper
+        self._negative_cache = negative_cache or NegativeCache()
+
+    def exists(self, product_id: str) -> bool:
+        """
+        Verifica si un producto existe, recordando los IDs inexistentes.
+
+        Args:
+            product_id: ID del producto
+
+        Returns:
+            True si el producto existe
+        """
+        if self._negative_cache.contains(product_id):
+            return False
+
+        if self._repository.exists(product_id):
+            return True
+
+        self._negative_cache.add(product_id)
+        return False
 
     def get_basics_by_product_id(self, product_id: str) -> Optional[ProductBasicsDto]:
         """
@@ -0,0 +1,48 @@
+"""Servicio de listados de productos por atributos numéricos"""
+
+from typing import List, Optional, Tuple
+from application.service.versioned_memo import VersionedMemo
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot
+from infrastructure.persist.product_detail.product_attribute_store import ProductAttributes, ProductAttributeStore
+
+
+class ProductListingService:
+    """
+    Servicio para consultas de listado (ej: productos con descuento en un
+    rango de precio ordenados por ventas).
+
+    Las consultas se resuelven sobre el almacén columnar, que se construye
+    una vez por versión del catálogo en la primera consulta.
+    """
+
+    def __init__(self, catalog: ICatalogSnapshot):
+        self._catalog = catalog
+        self._store = VersionedMemo()
+
+    def get_store(self) -> ProductAttributeStore:
+        """Retorna el almacén columnar de la versión actual del catálogo"""
+        return self._store.get(self._catalog.version, lambda: ProductAttributeStore.from_catalog(self._catalog))
+
+    def search(self,
+               min_price: Optional[int] = None,
+               max_price: Optional[int] = None,
+               discounted: Optional[bool] = None,
+               in_stock: bool = False,
+               sort_by: str = "sold_count",
+               descending: bool = True,
+               limit: int = 20) -> Tuple[int, List[ProductAttributes]]:
+        """
+        Busca productos por rango de precio, descuento y stock.
+
+        Returns:
+            (cantidad total de coincidencias, top-K ordenado por sort_by)
+        """
+        return self.get_store().query(
+            min_price=min_price,
+            max_price=max_price,
+            discounted=discounted,
+            in_stock=in_stock,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit
+        )
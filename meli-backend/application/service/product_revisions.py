@@ -0,0 +1,104 @@
+"""
+Revisiones por producto de los datos escritos en caliente.
+
+Las escrituras de la API (reviews, preguntas) no cambian la versión del
+catálogo: se registran como revisiones de una sección de un producto. Los
+cachés y el ETag se indexan por la versión del catálogo más la revisión del
+producto, así una escritura deja visibles sus datos de inmediato sin
+invalidar nada (las entradas anteriores salen solas del LRU) y sin carreras
+con un render que estaba en curso.
+
+Cada proceso registra las escrituras que aplica (propias o leídas del log):
+la revisión de una sección es la cantidad de escrituras más una huella de sus
+IDs que no depende del orden, así que todos los workers llegan a las mismas
+revisiones y comparten las entradas del caché en disco.
+"""
+
+import threading
+import zlib
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+
+class ProductRevision(NamedTuple):
+    """Escrituras aplicadas a un producto desde que se cargó el catálogo"""
+    # Sección → (cantidad de escrituras, XOR del crc32 de sus IDs)
+    sections: Dict[str, Tuple[int, int]]
+    # Timestamp de la última escritura
+    last_modified: float
+
+    @property
+    def token(self) -> str:
+        """Identificador de la revisión (ej: questions2-1f3a09c2.reviews1-77e0b1d4)"""
+        return ".".join(_section_token(section, revision) for section, revision in sorted(self.sections.items()))
+
+    def version(self, version: str, section: Optional[str] = None) -> str:
+        """Versión de caché del producto (o de una sección) sobre una versión del catálogo"""
+        if section is None:
+            return f"{version}+{self.token}"
+        revision = self.sections.get(section)
+        return f"{version}+{_section_token(section, revision)}" if revision else version
+
+
+def _section_token(section: str, revision: Tuple[int, int]) -> str:
+    return f"{section}{revision[0]}-{revision[1]:08x}"
+
+
+class ProductRevisions:
+    """
+    Registro copy-on-write de revisiones: cada escritura publica un
+    ProductRevision nuevo, y las lecturas (una por petición) no toman locks.
+    """
+
+    def __init__(self):
+        self._revisions: Dict[str, ProductRevision] = {}
+        self._lock = threading.Lock()
+
+    def get(self, product_id: str) -> Optional[ProductRevision]:
+        """Revisión actual del producto (None si no tuvo escrituras)"""
+        return self._revisions.get(product_id)
+
+    def bump(self, product_id: str, section: str, write_id: str, timestamp: float) -> ProductRevision:
+        """
+        Registra una escritura aplicada a una sección del producto.
+
+        Args:
+            product_id: ID del producto
+            section: Sección modificada
+            write_id: ID único de la escritura
+            timestamp: Momento de la escritura
+
+        Debe llamarse después de que los datos nuevos son visibles en el
+        repositorio: quien lea la revisión nueva ya lee esos datos.
+        """
+        with self._lock:
+            current = self._revisions.get(product_id)
+            sections = dict(current.sections) if current is not None else {}
+            count, digest = sections.get(section, (0, 0))
+            sections[section] = (count + 1, digest ^ zlib.crc32(write_id.encode('utf-8')))
+            last_modified = max(timestamp, current.last_modified) if current is not None else timestamp
+            revision = ProductRevision(sections, last_modified)
+            self._revisions[product_id] = revision
+            return revision
+
+    def versioned(self, version: str, product_id: str, section: Optional[str] = None) -> str:
+        """
+        Versión de caché del producto (o de una de sus secciones).
+
+        Args:
+            version: Versión del catálogo
+            product_id: ID del producto
+            section: Sección; None para el payload completo
+
+        Returns:
+            La versión del catálogo, con la revisión agregada si hubo escrituras
+        """
+        revision = self._revisions.get(product_id)
+        return version if revision is None else revision.version(version, section)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Productos y escrituras registrados"""
+        revisions = list(self._revisions.values())
+        return {
+            "products": len(revisions),
+            "writes": sum(count for revision in revisions for count, _ in revision.sections.values())
+        }
@@ -0,0 +1,195 @@
+"""Servicio de escritura de preguntas y respuestas"""
+
+import os
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from application.service.logged_write_service import LoggedWriteService
+from application.service.product_detail_service import ProductDetailService
+from application.service.product_revisions import ProductRevisions
+from domain.question.entity.question import Question, QuestionStatus
+from infrastructure.persist.append_log.append_log import AppendLog, Record
+from infrastructure.persist.question.question_repository import DATA_DIR, QuestionRepository
+
+QUESTION_LOG_ENV = "MELI_QUESTION_LOG_PATH"
+
+# Tipos de registro del log de preguntas
+QUESTION_ASKED = "asked"
+QUESTION_ANSWERED = "answered"
+
+
+def default_question_log() -> AppendLog:
+    """
+    Log de preguntas configurado por MELI_QUESTION_LOG_PATH. Por defecto
+    queda junto a question.csv, donde se compacta (como el log de reviews)
+    """
+    return AppendLog(os.getenv(QUESTION_LOG_ENV) or os.path.join(DATA_DIR, "question-log.jsonl"))
+
+
+def _now() -> str:
+    # Mismo formato que question.csv (ISO 8601 sin zona, en UTC): ordena como texto
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _answer_write_id(question_id: str, answered_at: str, answer: str) -> str:
+    """
+    ID de la escritura de una respuesta, derivado de sus datos: la misma
+    respuesta recuperada de question.csv suma la misma revisión que el
+    registro original
+    """
+    return f"{question_id}:{answered_at}:{zlib.crc32(answer.encode('utf-8')):08x}"
+
+
+class QuestionAlreadyAnsweredError(ValueError):
+    """La pregunta ya tiene respuesta"""
+
+
+class QuestionWriteService(LoggedWriteService):
+    """
+    Alta de preguntas y respuestas: cada operación se escribe en el log de
+    preguntas y se aplica al índice por producto del repositorio.
+
+    Responder mueve la pregunta de PENDING a ANSWERED. Si dos workers
+    responden la misma pregunta a la vez, todos los procesos se quedan con la
+    misma respuesta (la de answered_at mayor), sin importar el orden en que
+    apliquen los registros.
+    """
+
+    section = "questions"
+
+    def __init__(self,
+                 repository: QuestionRepository,
+                 product_detail_service: ProductDetailService,
+                 log: AppendLog,
+                 revisions: ProductRevisions,
+                 **options):
+        self.repository = repository
+        self._product_detail_service = product_detail_service
+        # El chequeo del estado actual y el reemplazo deben ser atómicos
+        self._apply_lock = threading.Lock()
+        super().__init__(log, revisions, **options)
+
+    def ask_question(self, product_id: str, text: str) -> Optional[Question]:
+        """
+        Publica una pregunta sin responder.
+
+        Returns:
+            Pregunta creada, o None si el producto no existe
+
+        Raises:
+            ValueError: Si la pregunta está vacía
+        """
+        if not self._product_detail_service.exists(product_id):
+            return None
+        question = Question(
+            id=uuid.uuid4().hex,
+            question=text.strip(),
+            answer="",
+            asked_at=_now(),
+            answered_at="",
+            status=QuestionStatus.PENDING
+        )
+        self._commit({
+            # El ID de la escritura es el de la pregunta: al recargar question.csv
+            # se reconstruye la misma revisión
+            "id": question.id,
+            "type": QUESTION_ASKED,
+            "product_id": product_id,
+            "question_id": question.id,
+            "question": question.question,
+            "asked_at": question.asked_at
+        })
+        return question
+
+    def answer_question(self, product_id: str, question_id: str, answer: str) -> Optional[Question]:
+        """
+        Responde una pregunta pendiente.
+
+        Retorna cuando la respuesta está en disco; desde ese momento ya se ve
+        en el detalle del producto.
+
+        Returns:
+            Pregunta respondida, o None si el producto o la pregunta no existen
+
+        Raises:
+            QuestionAlreadyAnsweredError: Si la pregunta ya tenía respuesta
+            ValueError: Si la respuesta está vacía
+        """
+        if not self._product_detail_service.exists(product_id):
+            return None
+        question = self.repository.get_by_id(product_id, question_id)
+        if question is None:
+            return None
+        if question.status == QuestionStatus.ANSWERED:
+            raise QuestionAlreadyAnsweredError(f"Question {question_id} is already answered")
+        answer = answer.strip()
+        if not answer:
+            raise ValueError("answer cannot be empty")
+
+        answered_at = _now()
+        self._commit({
+            "id": _answer_write_id(question_id, answered_at, answer),
+            "type": QUESTION_ANSWERED,
+            "product_id": product_id,
+            "question_id": question_id,
+            "answer": answer,
+            "answered_at": answered_at
+        })
+        return self.repository.get_by_id(product_id, question_id)
+
+    def _apply(self, record: Record) -> bool:
+        product_id, question_id = record["product_id"], record["question_id"]
+        with self._apply_lock:
+            current = self.repository.get_by_id(product_id, question_id)
+            if record["type"] == QUESTION_ASKED:
+                if current is not None:
+                    return False
+                question = Question(
+                    id=question_id,
+                    question=record["question"],
+                    answer="",
+                    asked_at=record["asked_at"],
+                    answered_at="",
+                    status=QuestionStatus.PENDING
+                )
+            else:
+                if current is None:
+                    return False
+                # Entre respuestas concurrentes gana la más nueva (a igual momento, la mayor)
+                if current.status == QuestionStatus.ANSWERED and \
+                        (current.answered_at, current.answer) >= (record["answered_at"], record["answer"]):
+                    return False
+                question = Question(
+                    id=question_id,
+                    question=current.question,
+                    answer=record["answer"],
+                    asked_at=current.asked_at,
+                    answered_at=record["answered_at"],
+                    status=QuestionStatus.ANSWERED
+                )
+            self.repository.put(product_id, question)
+            return True
+
+    def _merge(self, records: List[Record]) -> None:
+        # Al compactar todos los registros ya están aplicados: se vuelca el estado final
+        questions = []
+        for product_id, question_id in dict.fromkeys((record["product_id"], record["question_id"]) for record in records):
+            question = self.repository.get_by_id(product_id, question_id)
+            if question is not None:
+                questions.append((product_id, question))
+        self.repository.merge_into_csv(questions)
+
+    def _base_records(self) -> Iterable[Record]:
+        # Cada fila se aplica como su alta y, si está respondida, su respuesta
+        now = time.time()
+        for product_id, question in self.repository.read_csv():
+            yield {"id": question.id, "type": QUESTION_ASKED, "product_id": product_id, "ts": now,
+                   "question_id": question.id, "question": question.question, "asked_at": question.asked_at}
+            if question.status == QuestionStatus.ANSWERED:
+                yield {"id": _answer_write_id(question.id, question.answered_at, question.answer),
+                       "type": QUESTION_ANSWERED, "product_id": product_id, "ts": now,
+                       "question_id": question.id, "answer": question.answer, "answered_at": question.answered_at}
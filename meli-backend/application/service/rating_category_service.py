@@ -1,7 +1,8 @@
 """Servicio para categorías de rating"""
 
-from typing import List
+from typing import Tuple
 from application.dto.detail_product_output_dto import RatingCategoryDto
+from application.service.versioned_memo import VersionedMemo
 from infrastructure.persist.rating_category.rating_category_repository import RatingCategoryRepository
 
 
@@ -10,15 +11,24 @@ class RatingCategoryService:
 
     def __init__(self, repository: RatingCategoryRepository = None):
         self.repository = repository or RatingCategoryRepository()
+        self._categories = VersionedMemo()
 
-    def get_rating_categories_by_product_id(self, product_id: str) -> List[RatingCategoryDto]:
-        """Obtiene categorías de rating desde CSV"""
+    def get_rating_categories_by_product_id(self, product_id: str) -> Tuple[RatingCategoryDto, ...]:
+        """
+        Obtiene las categorías de rating.
+
+        Las categorías son globales: se construyen una vez por versión del
+        catálogo y se comparte la misma tupla inmutable entre productos.
+        """
+        return self._categories.get(self.repository.data_version, self._build_categories)
+
+    def _build_categories(self) -> Tuple[RatingCategoryDto, ...]:
         categories = self.repository.get_all()
-        return [
+        return tuple(
             RatingCategoryDto(
                 id=c.id,
                 name=c.name,
                 order=c.order
             )
             for c in categories
-        ]
+        )
@@ -0,0 +1,122 @@
+"""Servicio de escritura de reviews"""
+
+import os
+import time
+import uuid
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from application.service.logged_write_service import LoggedWriteService
+from application.service.product_detail_service import ProductDetailService
+from application.service.product_revisions import ProductRevisions
+from domain.review.entity.review import Review
+from infrastructure.persist.append_log.append_log import AppendLog, Record
+from infrastructure.persist.review.review_repository import CATEGORY_RATING_COLUMNS, DATA_DIR, ReviewRepository
+
+REVIEW_LOG_ENV = "MELI_REVIEW_LOG_PATH"
+
+
+def default_review_log() -> AppendLog:
+    """
+    Log de reviews configurado por MELI_REVIEW_LOG_PATH. Por defecto queda
+    junto a review.csv, donde se compacta: las reviews confirmadas viven en
+    el mismo disco que los datos base (no en /tmp, que puede no sobrevivir a
+    un reinicio)
+    """
+    return AppendLog(os.getenv(REVIEW_LOG_ENV) or os.path.join(DATA_DIR, "review-log.jsonl"))
+
+
+def _review_to_record(review: Review) -> Dict:
+    return {
+        "id": review.id,
+        "user_name": review.user_name,
+        "rating": review.rating,
+        "date": review.date,
+        "comment": review.comment,
+        "likes": review.likes,
+        "verified": review.verified,
+        "images": review.images,
+        "category_ratings": review.category_ratings
+    }
+
+
+class ReviewWriteService(LoggedWriteService):
+    """
+    Alta de reviews: cada review se escribe en el log de reviews y se agrega
+    al índice en memoria del repositorio, que actualiza las estadísticas del
+    producto en el mismo paso.
+    """
+
+    section = "reviews"
+
+    def __init__(self,
+                 repository: ReviewRepository,
+                 product_detail_service: ProductDetailService,
+                 log: AppendLog,
+                 revisions: ProductRevisions,
+                 **options):
+        self.repository = repository
+        self._product_detail_service = product_detail_service
+        super().__init__(log, revisions, **options)
+
+    def add_review(self,
+                   product_id: str,
+                   user_name: str,
+                   rating: float,
+                   comment: str,
+                   verified: bool = False,
+                   images: Optional[List[str]] = None,
+                   category_ratings: Optional[Dict[str, int]] = None) -> Optional[Review]:
+        """
+        Agrega una review a un producto.
+
+        Retorna cuando la review está en disco; desde ese momento ya cuenta en
+        las estadísticas del producto.
+
+        Returns:
+            Review creada, o None si el producto no existe
+
+        Raises:
+            ValueError: Si los datos de la review no son válidos
+        """
+        if not self._product_detail_service.exists(product_id):
+            return None
+        if not 1 <= rating <= 5:
+            raise ValueError("rating must be between 1 and 5")
+        for cat_id, value in (category_ratings or {}).items():
+            if cat_id not in CATEGORY_RATING_COLUMNS:
+                raise ValueError(f"Unknown rating category: {cat_id}")
+            if not 1 <= value <= 5:
+                raise ValueError("category ratings must be between 1 and 5")
+
+        review = Review(
+            id=uuid.uuid4().hex,
+            user_name=user_name,
+            rating=float(rating),
+            date=date.today().isoformat(),
+            comment=comment,
+            likes=0,
+            verified=verified,
+            images=list(images) if images else None,
+            category_ratings=dict(category_ratings) if category_ratings else None
+        )
+        self._commit({"id": review.id, "product_id": product_id, "review": _review_to_record(review)})
+        return review
+
+    def get_statistics(self, product_id: str) -> Dict:
+        """Estadísticas actuales de reviews del producto"""
+        return self.repository.get_statistics(product_id)
+
+    def _apply(self, record: Record) -> bool:
+        return self.repository.add(record["product_id"], Review(**record["review"]))
+
+    def _merge(self, records: List[Record]) -> None:
+        self.repository.merge_into_csv(
+            (record["product_id"], Review(**record["review"])) for record in records
+        )
+
+    def _base_records(self) -> Iterable[Record]:
+        # El ID de la escritura es el de la review: la revisión coincide con la de los demás workers
+        now = time.time()
+        for product_id, review in self.repository.read_csv():
+            yield {"id": review.id, "product_id": product_id, "ts": now, "review": _review_to_record(review)}
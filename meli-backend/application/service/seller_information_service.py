@@ -1,6 +1,9 @@
 """Servicio para información del vendedor"""
 
+from typing import Dict, Optional
 from application.dto.detail_product_output_dto import SellerDto, ReputationDto
+from application.service.versioned_memo import VersionedMemo
+from domain.seller_information.entity.seller_information import SellerInformation
 from infrastructure.persist.seller_information.seller_information_repository import SellerInformationRepository
 
 
@@ -9,11 +12,32 @@ class SellerInformationService:
 
     def __init__(self, repository: SellerInformationRepository = None):
         self.repository = repository or SellerInformationRepository()
+        self._dtos = VersionedMemo()
 
     def get_seller_information_by_product_id(self, product_id: str) -> SellerDto:
-        """Obtiene información del vendedor desde CSV"""
-        seller = self.repository.get_by_product_id(product_id)
+        """
+        Obtiene información del vendedor desde CSV.
 
+        Con catálogo, el DTO se construye una vez por vendedor y versión: todos
+        los productos del mismo vendedor reciben la misma instancia inmutable.
+        """
+        seller_id = self.repository.get_seller_id_by_product_id(product_id)
+        version = self.repository.data_version
+        if version is None:
+            return self._build_dto(self.repository.get_by_seller_id(seller_id) if seller_id else None)
+
+        dtos: Dict[Optional[str], SellerDto] = self._dtos.get(version, dict)
+        dto = dtos.get(seller_id)
+        if dto is None:
+            seller = self.repository.get_by_seller_id(seller_id) if seller_id else None
+            dto = self._build_dto(seller)
+            # Un vendedor inexistente o inválido no se recuerda (usa el fallback)
+            if seller is not None:
+                dto = dtos.setdefault(seller_id, dto)
+        return dto
+
+    @staticmethod
+    def _build_dto(seller: Optional[SellerInformation]) -> SellerDto:
         if seller:
             return SellerDto(
                 name=seller.name,
@@ -27,7 +51,8 @@ class SellerInformationService:
                 total_sales=seller.total_sales,
                 rating=seller.rating,
                 review_count=seller.review_count,
-                reputation=ReputationDto(
+                # La entidad Reputation ya garantiza que la distribución suma 100
+                reputation=ReputationDto.trusted(
                     red=seller.reputation.red,
                     orange=seller.reputation.orange,
                     yellow=seller.reputation.yellow,
@@ -37,8 +62,11 @@ class SellerInformationService:
                 good_attention=seller.good_attention,
                 on_time_delivery=seller.on_time_delivery
             )
+        return SellerInformationService.fallback_dto()
 
-        # Fallback
+    @staticmethod
+    def fallback_dto() -> SellerDto:
+        """Vendedor a mostrar cuando no hay información disponible"""
         from domain.seller_information.entity.seller_information import SellerLevel, Reputation
         return SellerDto(
             name="Vendedor Desconocido",
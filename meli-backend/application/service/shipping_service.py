@@ -24,6 +24,11 @@ class ShippingService:
             )
 
         # Fallback por si no existe el producto
+        return self.fallback_dto()
+
+    @staticmethod
+    def fallback_dto() -> ShippingDto:
+        """Envío estimado a mostrar cuando no hay información disponible"""
         return ShippingDto(
             is_free=False,
             estimated_days=EstimatedDaysDto(min=3, max=7)
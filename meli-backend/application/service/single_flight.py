@@ -0,0 +1,89 @@
+"""Coalescencia de llamadas concurrentes idénticas (single-flight)"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _InFlightCall:
+    """Cómputo en curso compartido por todas las llamadas con la misma clave"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Garantiza que, para una misma clave, solo un cómputo esté en curso a la vez.
+
+    La primera llamada (líder) ejecuta la función; las llamadas concurrentes con
+    la misma clave esperan ese cómputo y reciben su resultado (o su excepción).
+    Una vez terminado, la clave se libera: no es un caché.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self._total_calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._max_waiters = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Ejecuta fn para la clave o espera al cómputo en curso con la misma clave.
+
+        Args:
+            key: Clave que identifica el cómputo (ej: product_id)
+            fn: Función sin argumentos que produce el resultado
+
+        Returns:
+            Resultado de fn, compartido entre todas las llamadas concurrentes
+        """
+        with self._lock:
+            self._total_calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._coalesced += 1
+                self._max_waiters = max(self._max_waiters, call.waiters)
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas de coalescencia"""
+        with self._lock:
+            return {
+                "total_calls": self._total_calls,
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+                "max_waiters": self._max_waiters,
+                "coalescing_ratio": round(self._coalesced / self._total_calls, 4) if self._total_calls else 0.0
+            }
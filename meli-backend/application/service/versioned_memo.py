@@ -0,0 +1,50 @@
+"""Memoización de valores derivados de una versión del catálogo"""
+
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class VersionedMemo(Generic[T]):
+    """
+    Guarda un único valor calculado para la versión actual del catálogo.
+
+    Mientras la versión no cambie, get retorna la misma instancia (compartida
+    por todas las peticiones); con una versión nueva se recalcula. Sin versión
+    (repositorios leyendo el CSV directamente) no se memoiza.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[str] = None
+        self._value: Optional[T] = None
+
+    def get(self, version: Optional[str], compute: Callable[[], T]) -> T:
+        """
+        Retorna el valor de la versión, calculándolo una sola vez.
+
+        Args:
+            version: Versión del catálogo (None desactiva la memoización)
+            compute: Función que produce el valor
+
+        Returns:
+            Valor memoizado para la versión
+        """
+        if version is None:
+            return compute()
+
+        if self._version == version:
+            return self._value
+
+        with self._lock:
+            if self._version != version:
+                self._value = compute()
+                self._version = version
+            return self._value
+
+    def clear(self) -> None:
+        """Descarta el valor memoizado"""
+        with self._lock:
+            self._version = None
+            self._value = None
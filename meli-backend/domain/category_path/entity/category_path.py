@@ -1,8 +1,10 @@
 """Entidad CategoryPath para navegación de categorías"""
 
 from dataclasses import dataclass
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class CategoryPath:
     """
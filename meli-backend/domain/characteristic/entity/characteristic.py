@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional
+from domain.shared.slotted import slotted
 
 
 class CharacteristicType(Enum):
@@ -12,6 +13,7 @@ class CharacteristicType(Enum):
     CATEGORY = "category"
 
 
+@slotted
 @dataclass(frozen=True)
 class SimpleCharacteristic:
     """Característica simple (nombre-valor)"""
@@ -25,6 +27,7 @@ class SimpleCharacteristic:
             raise ValueError("value cannot be empty")
 
 
+@slotted
 @dataclass(frozen=True)
 class RangeCharacteristic:
     """Característica con rango visual (ej: tamaño de pantalla)"""
@@ -52,6 +55,7 @@ class RangeCharacteristic:
             raise ValueError("segments must be positive")
 
 
+@slotted
 @dataclass(frozen=True)
 class HighlightCharacteristic:
     """Característica destacada con ícono"""
@@ -71,6 +75,7 @@ class HighlightCharacteristic:
             raise ValueError("icon cannot be empty")
 
 
+@slotted
 @dataclass(frozen=True)
 class CategoryCharacteristic:
     """Grupo de características por categoría"""
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from domain.shared.slotted import slotted
 
 
 class PaymentMethodType(Enum):
@@ -9,6 +10,7 @@ class PaymentMethodType(Enum):
     DEBIT = 'debit'
 
 
+@slotted
 @dataclass(frozen=True)
 class Payment:
     """
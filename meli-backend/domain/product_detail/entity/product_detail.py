@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from typing import List
 from enum import Enum
+from domain.shared.slotted import slotted
 
 
 class ConditionType(Enum):
@@ -12,6 +13,7 @@ class ConditionType(Enum):
     REFURBISHED = "refurbished"
 
 
+@slotted
 @dataclass(frozen=True)
 class ProductDetail:
     """
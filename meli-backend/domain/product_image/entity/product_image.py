@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from domain.shared.slotted import slotted
 
 
 class ImageType(Enum):
@@ -10,6 +11,7 @@ class ImageType(Enum):
     DESCRIPTION = "description"  # Imagen de la descripción
 
 
+@slotted
 @dataclass(frozen=True)
 class ProductImage:
     """
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Dict
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class ProductVariantMapping:
     """
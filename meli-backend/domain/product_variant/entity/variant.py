@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 from typing import List, Optional
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class Variant:
     """Variante individual de producto (color, talla, etc.)"""
@@ -23,6 +25,7 @@ class Variant:
             raise ValueError("slug cannot be empty")
 
 
+@slotted
 @dataclass(frozen=True)
 class VariantGroup:
     """Grupo de variantes (color, talla, material, etc.)"""
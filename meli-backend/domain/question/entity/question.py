@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from domain.shared.slotted import slotted
 
 
 class QuestionStatus(Enum):
@@ -10,6 +11,7 @@ class QuestionStatus(Enum):
     PENDING = "pending"
 
 
+@slotted
 @dataclass(frozen=True)
 class Question:
     """Pregunta sobre un producto"""
@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 from typing import Optional
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class RelatedProduct:
     """Producto relacionado"""
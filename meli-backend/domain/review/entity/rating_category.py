@@ -1,8 +1,10 @@
 """Entidad de dominio para categorías de rating"""
 
 from dataclasses import dataclass
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class RatingCategory:
     """Categoría de rating para opiniones de productos"""
@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 from typing import Optional, List, Dict
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class Review:
     """Entidad que representa una reseña de producto"""
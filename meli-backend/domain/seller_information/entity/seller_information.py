@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from domain.shared.slotted import slotted
 
 
 class SellerLevel(Enum):
@@ -10,6 +11,7 @@ class SellerLevel(Enum):
     PLATINUM = "platinum"
 
 
+@slotted
 @dataclass(frozen=True)
 class Reputation:
     """Distribución de reputación del vendedor (debe sumar 100)"""
@@ -24,6 +26,7 @@ class Reputation:
             raise ValueError(f"Reputation must sum to 100, got {total}")
 
 
+@slotted
 @dataclass(frozen=True)
 class SellerInformation:
     """Información completa del vendedor"""
@@ -0,0 +1,105 @@
+"""
+Dataclasses con __slots__ y constructor de confianza.
+
+dataclass(slots=True) no existe en Python 3.9, así que el decorador slotted
+recrea la clase con __slots__ (sin __dict__ por instancia) y le agrega el
+classmethod trusted: construye la instancia sin ejecutar __post_init__, para
+datos que ya fueron validados (ej: al cargar el snapshot del catálogo).
+
+Uso:
+    @slotted
+    @dataclass(frozen=True)
+    class Variant:
+        ...
+
+    Variant(...)          # valida en __post_init__
+    Variant.trusted(...)  # mismos argumentos, sin validación
+"""
+
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def _make_trusted_constructor(cls: type) -> Callable[..., Any]:
+    """
+    Genera un constructor con la misma firma que __init__ pero sin __post_init__.
+
+    Se compila una vez por clase (igual que dataclasses genera __init__), de modo
+    que construir una instancia es asignar sus campos y nada más.
+    """
+    namespace: Dict[str, Any] = {
+        "_new": object.__new__,
+        "_set": object.__setattr__,
+        "_MISSING": MISSING
+    }
+    params = []
+    body = ["    self = _new(cls)"]
+    for field in fields(cls):
+        name = field.name
+        if field.default is not MISSING:
+            namespace[f"_dflt_{name}"] = field.default
+            params.append(f"{name}=_dflt_{name}")
+        elif field.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = field.default_factory
+            params.append(f"{name}=_MISSING")
+            body.append(f"    if {name} is _MISSING: {name} = _factory_{name}()")
+        else:
+            params.append(name)
+        body.append(f"    _set(self, '{name}', {name})")
+    body.append("    return self")
+
+    source = f"def trusted(cls, {', '.join(params)}):\n" + "\n".join(body)
+    exec(source, namespace)
+    constructor = namespace["trusted"]
+    constructor.__qualname__ = f"{cls.__qualname__}.trusted"
+    constructor.__doc__ = "Construye la instancia sin validación (datos ya validados)"
+    return constructor
+
+
+def _getstate(self) -> Tuple[Any, ...]:
+    return tuple(getattr(self, field.name) for field in fields(self))
+
+
+def _setstate(self, state: Tuple[Any, ...]) -> None:
+    # Las clases frozen bloquean setattr: se asigna directo en los slots
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Recrea un dataclass con __slots__ y le agrega el constructor trusted.
+
+    Args:
+        cls: Clase ya decorada con @dataclass
+
+    Returns:
+        Nueva clase equivalente, con __slots__
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} must be a dataclass")
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already defines __slots__")
+
+    field_names = tuple(field.name for field in fields(cls))
+    inherited = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(getattr(base, "__slots__", ()))
+
+    class_dict = dict(cls.__dict__)
+    class_dict["__slots__"] = tuple(name for name in field_names if name not in inherited)
+    # Los defaults ya están embebidos en __init__; como atributos de clase
+    # chocarían con los descriptores de los slots
+    for name in field_names:
+        class_dict.pop(name, None)
+    class_dict.pop("__dict__", None)
+    class_dict.pop("__weakref__", None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, class_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    new_cls.__getstate__ = _getstate
+    new_cls.__setstate__ = _setstate
+    new_cls.trusted = classmethod(_make_trusted_constructor(new_cls))
+    return new_cls
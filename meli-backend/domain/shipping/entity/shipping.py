@@ -1,8 +1,10 @@
 """Entidad de dominio para información de envío"""
 
 from dataclasses import dataclass
+from domain.shared.slotted import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class EstimatedDays:
     """Rango de días estimados de envío"""
@@ -18,6 +20,7 @@ class EstimatedDays:
             raise ValueError("min cannot be greater than max")
 
 
+@slotted
 @dataclass(frozen=True)
 class Shipping:
     """Información de envío del producto"""
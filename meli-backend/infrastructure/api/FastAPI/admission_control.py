@@ -0,0 +1,298 @@
+"""
+Control de admisión y descarte de carga (load shedding) para la API.
+
+Un middleware ASGI limita el trabajo en curso con un límite de concurrencia
+adaptativo: el límite crece mientras la latencia se mantiene cerca de la
+latencia sin carga y se reduce cuando empieza a subir (cola en el servidor).
+Lo que excede el límite espera brevemente en una cola por prioridad y, si no
+entra a tiempo, se responde 503 con Retry-After en lugar de acumular latencia.
+
+Prioridades:
+- CRITICAL: /products/{product_id} (la página de producto)
+- NORMAL: el resto de la API
+- LOW: /docs, /redoc, /openapi.json, /static y crawlers (por User-Agent)
+
+Las prioridades más bajas solo pueden usar una fracción del límite, así que
+bajo presión son las primeras en descartarse. /health, /ready y /monitoring
+no pasan por el control de admisión.
+"""
+
+import asyncio
+import json
+import math
+import os
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+CRITICAL = 0
+NORMAL = 1
+LOW = 2
+
+PRIORITY_NAMES = ("critical", "normal", "low")
+
+# Fracción del límite que puede ocupar cada prioridad
+PRIORITY_SHARES = (1.0, 0.9, 0.5)
+
+INITIAL_LIMIT = int(os.getenv("MELI_ADMISSION_INITIAL_LIMIT", "32"))
+MIN_LIMIT = int(os.getenv("MELI_ADMISSION_MIN_LIMIT", "4"))
+MAX_LIMIT = int(os.getenv("MELI_ADMISSION_MAX_LIMIT", "256"))
+MAX_QUEUE = int(os.getenv("MELI_ADMISSION_MAX_QUEUE", "128"))
+QUEUE_TIMEOUT_MS = int(os.getenv("MELI_ADMISSION_QUEUE_TIMEOUT_MS", "100"))
+RETRY_AFTER_SECONDS = int(os.getenv("MELI_ADMISSION_RETRY_AFTER", "1"))
+
+_PRODUCT_PATH = re.compile(r"^/products/[^/]+/?$")
+_LOW_PRIORITY_PREFIXES = ("/docs", "/redoc", "/openapi.json", "/static")
+_BYPASS_PREFIXES = ("/health", "/ready", "/monitoring")
+_CRAWLER_AGENT = re.compile(rb"bot|crawl|spider|slurp|facebookexternalhit|headless", re.IGNORECASE)
+
+
+class GradientLimit:
+    """
+    Límite de concurrencia según el gradiente de latencia.
+
+    gradient = tolerance * min_rtt / latencia, acotado a [0.5, 1]. Con latencia
+    cercana a la mínima el gradiente es 1 y el límite crece en sqrt(límite)
+    (margen de cola); cuando la latencia supera tolerance veces la mínima el
+    límite se reduce proporcionalmente. El cambio se suaviza con smoothing.
+
+    La latencia mínima se reaprende cada probe_interval muestras para seguir
+    cambios reales del servicio (ej: un despliegue más lento).
+    """
+
+    def __init__(self,
+                 initial_limit: int = INITIAL_LIMIT,
+                 min_limit: int = MIN_LIMIT,
+                 max_limit: int = MAX_LIMIT,
+                 tolerance: float = 2.0,
+                 smoothing: float = 0.2,
+                 probe_interval: int = 1000):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._probe_interval = probe_interval
+        self._min_rtt = math.inf
+        self._samples = 0
+
+    @property
+    def limit(self) -> int:
+        """Límite actual de peticiones concurrentes"""
+        return round(self._limit)
+
+    @property
+    def min_rtt(self) -> float:
+        """Latencia mínima observada (segundos)"""
+        return self._min_rtt
+
+    def on_sample(self, latency: float, in_flight: int) -> None:
+        """
+        Ajusta el límite con la latencia de una petición terminada.
+
+        Args:
+            latency: Duración de la petición (segundos)
+            in_flight: Peticiones en curso cuando terminó (incluida ella)
+        """
+        self._samples += 1
+        if self._samples % self._probe_interval == 0:
+            self._min_rtt = latency
+        self._min_rtt = min(self._min_rtt, latency)
+
+        gradient = max(0.5, min(1.0, self._tolerance * self._min_rtt / latency)) if latency > 0 else 1.0
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+        if in_flight < self._limit / 2:
+            # Con poco uso la latencia no dice nada del límite: no se agranda
+            new_limit = min(new_limit, self._limit)
+        new_limit = max(self._min_limit, min(self._max_limit, new_limit))
+        self._limit = self._limit * (1 - self._smoothing) + new_limit * self._smoothing
+
+
+class AdmissionController:
+    """
+    Admite, encola o descarta peticiones según el límite adaptativo.
+
+    Corre en el event loop (sin locks). Los lugares liberados se entregan
+    primero a la cola CRITICAL, luego NORMAL y LOW; dentro de una prioridad
+    el orden es FIFO.
+    """
+
+    def __init__(self,
+                 limit: Optional[GradientLimit] = None,
+                 max_queue: int = MAX_QUEUE,
+                 queue_timeouts: Tuple[float, float, float] = (
+                     QUEUE_TIMEOUT_MS / 1000, QUEUE_TIMEOUT_MS / 1000, 0.0
+                 ),
+                 retry_after: int = RETRY_AFTER_SECONDS):
+        self._limit = limit or GradientLimit()
+        self._max_queue = max_queue
+        self._queue_timeouts = queue_timeouts
+        self.retry_after = retry_after
+        self._queues: Tuple[Deque[asyncio.Future], ...] = tuple(deque() for _ in PRIORITY_NAMES)
+        self._in_flight = 0
+        self._admitted = [0] * len(PRIORITY_NAMES)
+        self._queued = [0] * len(PRIORITY_NAMES)
+        self._shed = [0] * len(PRIORITY_NAMES)
+
+    @property
+    def in_flight(self) -> int:
+        """Peticiones admitidas que todavía no terminaron"""
+        return self._in_flight
+
+    def _capacity(self, priority: int) -> int:
+        return max(1, int(self._limit.limit * PRIORITY_SHARES[priority]))
+
+    def _waiting_ahead(self, priority: int) -> bool:
+        return any(self._queues[level] for level in range(priority + 1))
+
+    def try_acquire(self, priority: int) -> bool:
+        """Admite la petición si hay lugar y nadie de igual o mayor prioridad espera"""
+        if self._in_flight < self._capacity(priority) and not self._waiting_ahead(priority):
+            self._in_flight += 1
+            self._admitted[priority] += 1
+            return True
+        return False
+
+    async def acquire(self, priority: int) -> bool:
+        """
+        Admite la petición, esperando en la cola como máximo el timeout de su prioridad.
+
+        Returns:
+            True si fue admitida (debe llamarse release al terminar),
+            False si se descartó
+        """
+        if self.try_acquire(priority):
+            return True
+
+        timeout = self._queue_timeouts[priority]
+        if timeout <= 0 or sum(len(queue) for queue in self._queues) >= self._max_queue:
+            self._shed[priority] += 1
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        queue = self._queues[priority]
+        queue.append(waiter)
+        self._queued[priority] += 1
+        expiry = loop.call_later(timeout, self._expire, priority, waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # El cliente se fue mientras esperaba
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self._in_flight -= 1
+                self._dispatch()
+            elif waiter in queue:
+                queue.remove(waiter)
+            raise
+        finally:
+            expiry.cancel()
+
+    def _expire(self, priority: int, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            return
+        self._queues[priority].remove(waiter)
+        self._shed[priority] += 1
+        waiter.set_result(False)
+
+    def release(self, latency: float) -> None:
+        """Libera el lugar de una petición terminada y registra su latencia"""
+        self._limit.on_sample(latency, self._in_flight)
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        for priority, queue in enumerate(self._queues):
+            while queue and self._in_flight < self._capacity(priority):
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self._in_flight += 1
+                self._admitted[priority] += 1
+                waiter.set_result(True)
+            if queue:
+                # Las prioridades más bajas no adelantan a una cola pendiente
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna el límite actual, el trabajo en curso y los contadores por prioridad"""
+        min_rtt = self._limit.min_rtt
+        return {
+            "limit": self._limit.limit,
+            "in_flight": self._in_flight,
+            "min_rtt_ms": round(min_rtt * 1000, 3) if min_rtt != math.inf else None,
+            "priorities": {
+                name: {
+                    "capacity": self._capacity(priority),
+                    "waiting": len(self._queues[priority]),
+                    "admitted": self._admitted[priority],
+                    "queued": self._queued[priority],
+                    "shed": self._shed[priority]
+                }
+                for priority, name in enumerate(PRIORITY_NAMES)
+            }
+        }
+
+
+def classify(scope: Dict[str, Any]) -> Optional[int]:
+    """
+    Prioridad de una petición HTTP.
+
+    Returns:
+        CRITICAL, NORMAL o LOW; None si no pasa por el control de admisión
+    """
+    path = scope.get("path", "")
+    if path.startswith(_BYPASS_PREFIXES):
+        return None
+    if path.startswith(_LOW_PRIORITY_PREFIXES):
+        return LOW
+    user_agent = next((value for key, value in scope.get("headers", ()) if key == b"user-agent"), b"")
+    if _CRAWLER_AGENT.search(user_agent):
+        return LOW
+    if _PRODUCT_PATH.match(path):
+        return CRITICAL
+    return NORMAL
+
+
+class AdmissionControlMiddleware:
+    """Middleware ASGI que aplica el AdmissionController a las peticiones HTTP"""
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        priority = classify(scope)
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.controller.acquire(priority):
+            await self._reject(send)
+            return
+
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(time.monotonic() - started)
+
+    async def _reject(self, send) -> None:
+        body = json.dumps({"detail": "Service overloaded, retry later"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(self.controller.retry_after).encode("ascii")),
+                (b"cache-control", b"no-store")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
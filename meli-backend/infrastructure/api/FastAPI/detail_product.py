@@ -1,35 +1,170 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Dict, Any
+import asyncio
 
-from application.service.detail_product_orchestrator_service import DetailProductService
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Optional, Set
+
+from application.service.coalescing_detail_product_service import CoalescingDetailProductService
 from application.dto.detail_product_output_dto import DetailProductOutputDto
-from infrastructure.container.dependency_container import DependencyContainer
-from infrastructure.api.FastAPI.serializer import serialize_to_dict
+from infrastructure.container.dependency_container import DependencyContainer, get_default_container
+from infrastructure.api.FastAPI.msgpack_serializer import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate_media_type,
+    to_msgpack_bytes
+)
+from infrastructure.api.FastAPI.streaming_serializer import iter_chunks
+from infrastructure.cache.product_response_cache import CachedPayload, ProductResponseCache
+from infrastructure.cache.compression import (
+    IDENTITY,
+    SUPPORTED_ENCODINGS,
+    compress,
+    iter_compress,
+    negotiate_encoding
+)
+from infrastructure.api.FastAPI.http_cache import (
+    build_etag,
+    cache_headers,
+    etag_matches,
+    not_modified_since
+)
 
 router = APIRouter(
     prefix="/products",
     tags=["products"]
 )
 
-# Instancia global del container de dependencias
-_container = DependencyContainer()
+# Redirect de producto base a variante por defecto (Natural 256GB).
+# El producto base MLC123456789 fue eliminado para evitar duplicación
+PRODUCT_ALIASES = {"MLC123456789": "MLC137702355"}
 
 
-def get_detail_product_service() -> DetailProductService:
+def get_detail_product_service() -> CoalescingDetailProductService:
     """
     Dependency provider para obtener el servicio de detalle de producto.
     Utiliza el Dependency Container para inyectar todas las dependencias.
 
     Returns:
-        DetailProductService con todas las dependencias inyectadas
+        Orquestador con todas las dependencias inyectadas, detrás de la capa single-flight
+    """
+    return get_default_container().get_coalescing_detail_product_service()
+
+
+def canonical_product_id(product_id: str) -> str:
+    """Resuelve los IDs redirigidos a su producto canónico"""
+    return PRODUCT_ALIASES.get(product_id, product_id)
+
+
+# Recálculos y escrituras al L2 en segundo plano (referencia fuerte hasta que terminan)
+_background_tasks: Set[asyncio.Future] = set()
+
+
+def render_cacheable_body(container: DependencyContainer,
+                          product_id: str,
+                          version: str,
+                          media_type: str = JSON_MEDIA_TYPE,
+                          refresh: bool = False) -> Optional[bytes]:
+    """
+    Renderiza el payload completo de un producto para el caché de respuestas.
+
+    Args:
+        container: Container con el orquestador y el ensamblador de secciones
+        product_id: ID canónico del producto
+        version: Versión del catálogo
+        media_type: JSON o MessagePack
+        refresh: Recalcula todas las secciones ignorando los fragmentos cacheados
+
+    Returns:
+        Payload listo para el caché de respuestas, o None si no debe cachearse
+        (producto inexistente, secciones degradadas o producto servido en streaming)
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        product_detail = container.get_coalescing_detail_product_service().get_detail_product_by_id(product_id)
+        if product_detail is None or product_detail.partial:
+            return None
+        return to_msgpack_bytes(product_detail)
+
+    assembled = container.get_section_assembler().assemble(product_id, version, refresh=refresh)
+    if assembled is None or assembled.partial or assembled.streaming:
+        return None
+    return ''.join(assembled.pieces).encode('utf-8')
+
+
+async def _refresh_payload(container: DependencyContainer,
+                           product_id: str,
+                           version: str,
+                           media_type: str) -> None:
     """
-    return _container.get_detail_product_service()
+    Recalcula un payload stale y lo reemplaza en el caché; si falla, se sigue sirviendo el anterior.
+
+    version es la versión de caché del payload (catálogo más revisión del producto)
+    """
+    response_cache = container.get_product_response_cache()
+    catalog_version = container.get_catalog().version
+    try:
+        body = await run_in_threadpool(render_cacheable_body, container, product_id, catalog_version, media_type, True)
+        if body is not None:
+            # put también escribe el L2 (SQLite): fuera del event loop
+            await run_in_threadpool(response_cache.put, product_id, version, body, media_type)
+    except Exception as e:
+        print(f"Error refreshing product {product_id}: {e}")
+    finally:
+        response_cache.end_refresh(product_id, version, media_type)
+
+
+def _schedule_refresh(container: DependencyContainer,
+                      product_id: str,
+                      version: str,
+                      media_type: str) -> None:
+    """Lanza el recálculo en segundo plano (quien llama ya reservó la clave con begin_refresh)"""
+    _run_in_background(_refresh_payload(container, product_id, version, media_type))
+
+
+def _schedule_l2_write(response_cache: ProductResponseCache,
+                       product_id: str,
+                       version: str,
+                       payload: CachedPayload,
+                       media_type: str) -> None:
+    """Escribe en el L2 en el threadpool, sin demorar la respuesta"""
+    _run_in_background(run_in_threadpool(response_cache.put_l2, product_id, version, payload, media_type))
+
+
+def _run_in_background(coroutine) -> None:
+    task = asyncio.ensure_future(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _uncacheable_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    """Headers de una respuesta degradada: sin validadores y sin caché en el cliente"""
+    return {"Cache-Control": "no-store", "Vary": headers["Vary"]}
+
+
+def _partial_response(body: bytes, media_type: str, accept_encoding: Optional[str],
+                      headers: Dict[str, str], response_cache: ProductResponseCache) -> Response:
+    """
+    Respuesta con secciones degradadas: se comprime pero no se cachea.
+
+    response_cache es el del container que resolvió la petición: durante una
+    recarga del catálogo la respuesta no mezcla dos containers.
+    """
+    headers = _uncacheable_headers(headers)
+    encoding = negotiate_encoding(accept_encoding, SUPPORTED_ENCODINGS)
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+        body = compress(body, encoding, response_cache.compression_level(encoding))
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 @router.get("/{product_id}", response_model=Dict[str, Any])
 async def get_product_detail(
     product_id: str,
-    service: DetailProductService = Depends(get_detail_product_service)
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    service: CoalescingDetailProductService = Depends(get_detail_product_service)
 ) -> Dict[str, Any]:
     """
     Obtiene el detalle completo de un producto por su ID.
@@ -38,12 +173,44 @@ async def get_product_detail(
     la respuesta completa del producto siguiendo la especificación TypeScript
     de ProductDetail del frontend.
 
+    La respuesta incluye ETag débil (derivado de la versión del catálogo y el
+    ID, compartido por gzip/br/identity), Last-Modified y Cache-Control. Las
+    peticiones condicionales que coinciden (If-None-Match / If-Modified-Since)
+    se responden con 304 antes de orquestar.
+
+    El JSON renderizado se guarda en el caché de respuestas junto con sus
+    variantes comprimidas (gzip/br), que se negocian según Accept-Encoding.
+    En un miss, el JSON se arma concatenando fragmentos cacheados por sección;
+    solo se orquestan las secciones que faltan. Los productos muy grandes
+    (miles de reviews o preguntas) no se cachean: se transmiten en streaming.
+
+    Si hay un pack materializado offline (MELI_PAYLOAD_PACK) para la versión
+    actual del catálogo, el JSON se sirve desde ahí sin orquestar.
+
+    Los productos con escrituras de la API (reviews) posteriores a la carga
+    del catálogo se cachean y validan con la versión del catálogo más su
+    revisión, así que los datos nuevos se ven de inmediato.
+
+    Los payloads cacheados que superan el soft TTL se siguen sirviendo mientras
+    se recalculan en segundo plano (stale-while-revalidate).
+
+    Si alguna sección secundaria supera su presupuesto de latencia, la respuesta
+    la lista en partial y se entrega con Cache-Control: no-store (no se cachea).
+
+    Los consumidores internos pueden pedir MessagePack (Accept: application/msgpack)
+    con las mismas claves camelCase que el JSON.
+
     Args:
         product_id: ID del producto a consultar (ej: MLC63903651)
+        if_none_match: Header If-None-Match
+        if_modified_since: Header If-Modified-Since
+        accept: Header Accept (application/msgpack para consumidores internos)
+        accept_encoding: Header Accept-Encoding
         service: Servicio inyectado automáticamente por FastAPI
 
     Returns:
         Diccionario con los detalles completos del producto en formato camelCase
+        (o 304 Not Modified sin cuerpo)
 
     Raises:
         HTTPException 404: Si el producto no se encuentra
@@ -52,22 +219,102 @@ async def get_product_detail(
     Example:
         GET /products/MLC63903651
     """
-    # Redirect de producto base a variante por defecto (Natural 256GB)
-    # El producto base MLC123456789 fue eliminado para evitar duplicación
-    if product_id == "MLC123456789":
-        product_id = "MLC137702355"  # Natural 256GB
+    product_id = canonical_product_id(product_id)
+    container = get_default_container()
+
+    # Peticiones condicionales: responder 304 sin orquestar ni serializar
+    catalog = container.get_catalog()
+    revision = container.get_product_revisions().get(product_id)
+    if revision is None:
+        version, last_modified = catalog.version, catalog.last_modified
+    else:
+        version = revision.version(catalog.version)
+        last_modified = max(catalog.last_modified, revision.last_modified)
+    media_type = negotiate_media_type(accept)
+    etag = build_etag(version, product_id, "" if media_type == JSON_MEDIA_TYPE else media_type)
+    headers = cache_headers(etag, last_modified)
+    headers["Vary"] = "Accept, Accept-Encoding"
+    if if_none_match is not None:
+        not_modified = etag_matches(if_none_match, etag)
+    else:
+        not_modified = not_modified_since(if_modified_since, last_modified)
+    # La verificación de existencia es una búsqueda en el índice (no orquesta)
+    if not_modified and container.get_product_detail_service().exists(product_id):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Payload materializado offline: los bytes salen directo del pack (mmap)
+    pack = container.get_payload_pack()
+    if pack is not None and media_type == JSON_MEDIA_TYPE and pack.version == catalog.version and revision is None:
+        encoding = negotiate_encoding(accept_encoding, pack.encodings[1:])
+        body = pack.get(product_id, encoding)
+        if body is not None:
+            if encoding != IDENTITY:
+                headers["Content-Encoding"] = encoding
+            return Response(content=body, media_type=media_type, headers=headers)
 
     try:
-        product_detail: DetailProductOutputDto = service.get_detail_product_by_id(product_id)
+        response_cache = container.get_product_response_cache()
+        # En el loop solo se consulta el L1 (memoria); el L2 es SQLite y puede
+        # esperar locks de otros workers: va al threadpool
+        payload = response_cache.get_l1(product_id, version, media_type)
+        if payload is None and response_cache.has_l2:
+            payload = await run_in_threadpool(response_cache.get_l2, product_id, version, media_type)
+
+        # Stale-while-revalidate: se responde con el payload stale y un único
+        # recálculo por clave corre en segundo plano
+        if payload is not None and response_cache.is_stale(payload) and \
+                response_cache.begin_refresh(product_id, version, media_type):
+            _schedule_refresh(container, product_id, version, media_type)
 
-        if product_detail is None:
-            raise HTTPException(
+        if payload is None:
+            not_found = HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Producto con ID {product_id} no encontrado"
             )
 
-        # Serializar a camelCase para compatibilidad con TypeScript
-        return serialize_to_dict(product_detail)
+            # La orquestación es síncrona: se ejecuta en el threadpool para no bloquear
+            # el event loop y para que las peticiones concurrentes puedan coalescer
+            if media_type == MSGPACK_MEDIA_TYPE:
+                product_detail: DetailProductOutputDto = await run_in_threadpool(
+                    service.get_detail_product_by_id, product_id
+                )
+                if product_detail is None:
+                    raise not_found
+                body = to_msgpack_bytes(product_detail)
+                if product_detail.partial:
+                    return _partial_response(body, media_type, accept_encoding, headers, response_cache)
+            else:
+                # JSON armado con fragmentos por sección: solo se consultan y
+                # serializan las secciones que no están en caché
+                assembled = await run_in_threadpool(
+                    container.get_section_assembler().assemble, product_id, catalog.version
+                )
+                if assembled is None:
+                    raise not_found
+
+                if assembled.streaming:
+                    if assembled.partial:
+                        headers = _uncacheable_headers(headers)
+                    encoding = negotiate_encoding(accept_encoding, SUPPORTED_ENCODINGS)
+                    chunks = iter_chunks(assembled.pieces)
+                    if encoding != IDENTITY:
+                        headers["Content-Encoding"] = encoding
+                        chunks = iter_compress(chunks, encoding, response_cache.compression_level(encoding))
+                    return StreamingResponse(chunks, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+                body = ''.join(assembled.pieces).encode('utf-8')
+                if assembled.partial:
+                    return _partial_response(body, media_type, accept_encoding, headers, response_cache)
+
+            payload = response_cache.put_l1(product_id, version, body, media_type)
+            if response_cache.has_l2:
+                _schedule_l2_write(response_cache, product_id, version, payload, media_type)
+
+        encoding = negotiate_encoding(accept_encoding, payload.encodings)
+        if encoding != IDENTITY:
+            headers["Content-Encoding"] = encoding
+        # Las variantes comprimidas se generan una sola vez por payload cacheado
+        return Response(content=payload.encoded(encoding), media_type=media_type, headers=headers)
 
     except ValueError as e:
         # Errores de validación o producto no encontrado
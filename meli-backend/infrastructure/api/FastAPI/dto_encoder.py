@@ -0,0 +1,129 @@
+"""
+Encoders generados a partir de las definiciones de los DTOs.
+
+Para cada dataclass se compila (una vez) una función que lo convierte a
+estructuras nativas (dict/list/primitivos) con las mismas claves camelCase que
+el JSON del frontend. A diferencia de serialize_to_dict, no usa asdict ni
+inspecciona tipos en cada llamada: el recorrido se decide con las anotaciones
+del DTO. El resultado lo consumen los formatos binarios (msgpack).
+"""
+
+import threading
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Union, get_args, get_origin, get_type_hints
+
+from infrastructure.api.FastAPI.serializer import to_camel_case
+
+Encoder = Callable[[Any], Any]
+
+_encoders: Dict[type, Encoder] = {}
+_lock = threading.Lock()
+
+
+def _encode_key(key: Any) -> Any:
+    # Mismo contrato que el JSON: claves str en camelCase, las demás como string
+    if isinstance(key, str):
+        return to_camel_case(key)
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    return str(key)
+
+
+def _encode_any(value: Any) -> Any:
+    """Encoder genérico para valores sin anotación precisa (Any, Union)"""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return get_encoder(type(value))(value)
+    if isinstance(value, dict):
+        return {_encode_key(key): _encode_any(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_any(item) for item in value]
+    return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _build_value_encoder(annotation: Any) -> Encoder:
+    """Elige el encoder de un campo según su anotación de tipo"""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union:
+        non_null = [arg for arg in args if arg is not type(None)]
+        if len(non_null) == 1:
+            inner = _build_value_encoder(non_null[0])
+            return lambda value: None if value is None else inner(value)
+        # Unión polimórfica (ej: CharacteristicDto): se despacha por la clase real
+        return _encode_any
+
+    if origin in (list, tuple):
+        item = _build_value_encoder(args[0]) if args else _encode_any
+        if item is _identity:
+            return list
+        return lambda value: [item(element) for element in value]
+
+    if origin is dict:
+        item = _build_value_encoder(args[1]) if len(args) == 2 else _encode_any
+        return lambda value: {_encode_key(key): item(element) for key, element in value.items()}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return lambda value: value.value
+        if is_dataclass(annotation):
+            # Resolución diferida: permite DTOs que se referencian entre sí
+            return lambda value: get_encoder(type(value))(value)
+        if annotation in (str, int, float, bool):
+            return _identity
+
+    return _encode_any
+
+
+def _compile(cls: type) -> Encoder:
+    hints = get_type_hints(cls)
+    plan = [
+        (field.name, to_camel_case(field.name), _build_value_encoder(hints[field.name]))
+        for field in fields(cls)
+    ]
+
+    def encode(obj: Any) -> Dict[str, Any]:
+        return {key: encoder(getattr(obj, name)) for name, key, encoder in plan}
+
+    encode.__name__ = f"encode_{cls.__name__}"
+    return encode
+
+
+def get_encoder(cls: type) -> Encoder:
+    """
+    Retorna el encoder compilado para una clase dataclass.
+
+    Args:
+        cls: Clase del DTO
+
+    Returns:
+        Función que convierte instancias de cls a estructuras nativas
+    """
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        with _lock:
+            encoder = _encoders.get(cls)
+            if encoder is None:
+                encoder = _compile(cls)
+                _encoders[cls] = encoder
+    return encoder
+
+
+def to_plain(obj: Any) -> Any:
+    """
+    Convierte un DTO a estructuras nativas con claves camelCase.
+
+    El resultado es igual a json.loads(json.dumps(serialize_to_dict(obj))).
+    """
+    if is_dataclass(obj):
+        return get_encoder(type(obj))(obj)
+    return _encode_any(obj)
@@ -0,0 +1,60 @@
+"""Fragmentos JSON pre-renderizados de las secciones globales del detalle"""
+
+import json
+from typing import Any, Dict, NamedTuple
+
+from application.service.payment_service import PaymentService
+from application.service.rating_category_service import RatingCategoryService
+from application.service.versioned_memo import VersionedMemo
+from infrastructure.api.FastAPI.dto_encoder import to_plain
+
+
+class RenderedFragment(NamedTuple):
+    """Valor compartido de una sección y su JSON ya serializado"""
+    value: Any
+    json: str
+
+
+def render_fragment(value: Any) -> RenderedFragment:
+    """Serializa un valor con el mismo formato que la respuesta JSON"""
+    return RenderedFragment(
+        value,
+        json.dumps(to_plain(value), ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+    )
+
+
+class GlobalSectionFragments:
+    """
+    Métodos de pago y categorías de rating serializados una vez por versión.
+
+    Estas secciones no dependen del producto: los servicios retornan la misma
+    tupla inmutable a todos los productos, y el serializador inserta el
+    fragmento ya renderizado cuando el DTO referencia esa misma tupla.
+    """
+
+    def __init__(self, payment_service: PaymentService, rating_category_service: RatingCategoryService):
+        self._payment_service = payment_service
+        self._rating_category_service = rating_category_service
+        self._fragments = VersionedMemo()
+
+    def get(self, catalog_version: str) -> Dict[str, RenderedFragment]:
+        """
+        Retorna los fragmentos por campo de nivel raíz del DTO.
+
+        Args:
+            catalog_version: Versión del catálogo
+
+        Returns:
+            {nombre del campo: RenderedFragment}
+        """
+        return self._fragments.get(catalog_version, self._render)
+
+    def _render(self) -> Dict[str, RenderedFragment]:
+        return {
+            "payment_methods": render_fragment(
+                self._payment_service.get_payment_methods_by_product_id("")
+            ),
+            "available_rating_categories": render_fragment(
+                self._rating_category_service.get_rating_categories_by_product_id("")
+            ),
+        }
@@ -0,0 +1,95 @@
+"""Utilidades de caché HTTP (ETag, Last-Modified, Cache-Control)"""
+
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional
+
+# Segundos que navegadores y CDN pueden reutilizar la respuesta sin revalidar
+PRODUCT_CACHE_MAX_AGE = int(os.getenv("MELI_PRODUCT_CACHE_MAX_AGE", "60"))
+
+
+def build_etag(catalog_version: str, product_id: str, representation: str = "") -> str:
+    """
+    Construye un ETag débil para el detalle de un producto.
+
+    El payload de un producto solo cambia cuando cambia el snapshot del
+    catálogo, así que (versión, product_id) lo identifica sin serializarlo.
+    Es débil porque las variantes gzip/br/identity comparten el ETag: son
+    equivalentes pero no idénticas byte a byte, y el ETag se calcula antes de
+    negociar la codificación (para responder 304 sin orquestar).
+
+    Args:
+        catalog_version: Versión del snapshot del catálogo
+        product_id: ID del producto
+        representation: Formato alternativo (ej: msgpack); vacío para JSON
+
+    Returns:
+        ETag débil (ej: W/"3f2a...")
+    """
+    key = f"{catalog_version}:{product_id}"
+    if representation:
+        key = f"{key}:{representation}"
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """ETag sin el prefijo de validador débil"""
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evalúa If-None-Match contra el ETag actual (comparación débil, RFC 7232).
+
+    Args:
+        if_none_match: Valor del header If-None-Match
+        etag: ETag actual de la representación
+
+    Returns:
+        True si alguno de los ETags enviados coincide (o es "*")
+    """
+    if not if_none_match:
+        return False
+
+    opaque_tag = _opaque_tag(etag)
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if _opaque_tag(candidate) == opaque_tag:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: float) -> bool:
+    """
+    Evalúa If-Modified-Since contra la fecha de modificación del catálogo.
+
+    Args:
+        if_modified_since: Valor del header If-Modified-Since
+        last_modified: Timestamp de la última modificación
+
+    Returns:
+        True si el recurso no cambió desde la fecha enviada
+    """
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    # Last-Modified tiene resolución de segundos
+    return int(last_modified) <= since.timestamp()
+
+
+def cache_headers(etag: str, last_modified: float) -> Dict[str, str]:
+    """Headers de validación y caché para respuestas 200 y 304"""
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(last_modified, usegmt=True),
+        "Cache-Control": f"public, max-age={PRODUCT_CACHE_MAX_AGE}, must-revalidate"
+    }
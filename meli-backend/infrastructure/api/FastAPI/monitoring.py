@@ -0,0 +1,187 @@
+"""
+API Router con métricas internas para monitoreo.
+"""
+
+import hmac
+import os
+
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, Any, Optional
+
+from infrastructure.container.dependency_container import (
+    get_catalog_watcher,
+    get_default_container,
+    reload_default_container
+)
+
+
+router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+
+# Token de las operaciones administrativas (sin token, quedan deshabilitadas)
+ADMIN_TOKEN_ENV = "MELI_ADMIN_TOKEN"
+
+
+@router.get("/coalescing", response_model=Dict[str, Any])
+async def get_coalescing_stats() -> Dict[str, Any]:
+    """
+    Estadísticas de la capa single-flight del detalle de producto.
+
+    Returns:
+        Diccionario con llamadas totales, ejecuciones reales, llamadas coalescidas
+        y cómputos en curso
+    """
+    return get_default_container().get_coalescing_detail_product_service().get_stats()
+
+
+@router.get("/catalog", response_model=Dict[str, Any])
+async def get_catalog_status() -> Dict[str, Any]:
+    """
+    Estado del snapshot del catálogo y reporte de la validación de carga.
+
+    Returns:
+        Diccionario con versión, fecha de modificación, si el catálogo quedó
+        validado y el reporte estructurado (errores y advertencias)
+    """
+    catalog = get_default_container().get_catalog()
+    return {
+        "version": catalog.version,
+        "last_modified": catalog.last_modified,
+        "validated": catalog.validated,
+        "validation_report": catalog.validation_report
+    }
+
+
+def _require_admin_token(token: Optional[str]) -> None:
+    """Valida el header X-Admin-Token contra MELI_ADMIN_TOKEN"""
+    expected = os.getenv(ADMIN_TOKEN_ENV)
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if token is None or not hmac.compare_digest(token.encode('utf-8'), expected.encode('utf-8')):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
+
+@router.post("/catalog/reload", response_model=Dict[str, Any])
+async def reload_catalog(x_admin_token: Optional[str] = Header(None)) -> Dict[str, Any]:
+    """
+    Vuelve a cargar el catálogo en este worker conservando los cachés de lo
+    que no cambió, sin esperar al seguimiento de los CSV (que aplica el cambio
+    en todos los workers). Requiere el header X-Admin-Token con el valor de
+    MELI_ADMIN_TOKEN; sin esa variable el endpoint no existe.
+
+    Returns:
+        Diccionario con las versiones, las filas cambiadas por tabla, los
+        productos y secciones invalidados y las entradas reutilizadas
+    """
+    _require_admin_token(x_admin_token)
+    return await run_in_threadpool(reload_default_container)
+
+
+@router.get("/catalog/watcher", response_model=Dict[str, Any])
+async def get_catalog_watcher_stats() -> Dict[str, Any]:
+    """
+    Estado del seguimiento de los CSV del catálogo en este worker.
+
+    Returns:
+        Diccionario con la huella en uso, los cambios aplicados y si el
+        seguimiento está activo
+    """
+    watcher = get_catalog_watcher()
+    if watcher is None:
+        return {"running": False}
+    return watcher.get_stats()
+
+
+@router.get("/sections", response_model=Dict[str, Any])
+async def get_section_cache_stats() -> Dict[str, Any]:
+    """
+    Estadísticas del caché de fragmentos JSON por sección.
+
+    Returns:
+        Diccionario con entradas, fragmentos compartidos, hits y misses
+    """
+    return get_default_container().get_section_assembler().get_stats()
+
+
+@router.get("/response-cache", response_model=Dict[str, Any])
+async def get_response_cache_stats() -> Dict[str, Any]:
+    """
+    Estadísticas del caché de payloads de detalle de producto.
+
+    Returns:
+        Diccionario con entradas, hits, misses, hits stale, vencidos por hard
+        TTL y recálculos en segundo plano
+    """
+    return get_default_container().get_product_response_cache().get_stats()
+
+
+@router.get("/payload-pack", response_model=Dict[str, Any])
+async def get_payload_pack_stats() -> Dict[str, Any]:
+    """
+    Estado del pack de payloads materializados offline.
+
+    Returns:
+        Diccionario con la versión, productos, codificaciones y payloads
+        servidos; enabled es False si no hay pack configurado
+    """
+    container = get_default_container()
+    pack = container.get_payload_pack()
+    if pack is None:
+        return {"enabled": False}
+    return {
+        "enabled": True,
+        # Un pack de otra versión del catálogo no se sirve hasta rematerializar
+        "current": pack.version == container.get_catalog().version,
+        **pack.get_stats()
+    }
+
+
+@router.get("/writes", response_model=Dict[str, Any])
+async def get_write_stats() -> Dict[str, Any]:
+    """
+    Estado de las escrituras de la API (reviews, preguntas y respuestas).
+
+    Returns:
+        Diccionario con los registros aplicados, compactaciones y lotes de
+        cada log (registros por fsync), los productos con revisiones y lo
+        escrito en los índices en memoria
+    """
+    container = get_default_container()
+    review_write_service = container.get_review_write_service()
+    question_write_service = container.get_question_write_service()
+    return {
+        "revisions": container.get_product_revisions().get_stats(),
+        "reviews": {
+            **review_write_service.get_stats(),
+            "index": review_write_service.repository.get_stats()
+        },
+        "questions": {
+            **question_write_service.get_stats(),
+            "index": question_write_service.repository.get_stats()
+        }
+    }
+
+
+@router.get("/breakers", response_model=Dict[str, Any])
+async def get_breaker_stats() -> Dict[str, Any]:
+    """
+    Estado de los circuit breakers y bulkheads de cada sección del detalle.
+
+    Returns:
+        Diccionario por sección con el estado del breaker (closed, open,
+        half_open), tasas de falla y lentitud de la ventana móvil, latencias y
+        la ocupación del bulkhead
+    """
+    return get_default_container().get_detail_product_service().get_resilience_stats()
+
+
+@router.get("/admission", response_model=Dict[str, Any])
+async def get_admission_stats(request: Request) -> Dict[str, Any]:
+    """
+    Estado del control de admisión de la API.
+
+    Returns:
+        Diccionario con el límite de concurrencia actual, peticiones en curso,
+        latencia mínima y, por prioridad, capacidad, cola, admitidas y descartadas
+    """
+    return request.app.state.admission_controller.get_stats()
@@ -0,0 +1,81 @@
+"""Formato MessagePack para consumidores internos (negociado por Accept)"""
+
+from typing import Any, Dict, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - dependencia opcional
+    msgpack = None
+
+from infrastructure.api.FastAPI.dto_encoder import to_plain
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Alias usados por clientes msgpack más antiguos
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def msgpack_available() -> bool:
+    """Indica si el paquete msgpack está instalado"""
+    return msgpack is not None
+
+
+def _parse_accept(accept: str) -> Dict[str, float]:
+    preferences: Dict[str, float] = {}
+    for part in accept.split(','):
+        media_type, *params = [token.strip() for token in part.split(';')]
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        preferences[media_type.lower()] = quality
+    return preferences
+
+
+def negotiate_media_type(accept: Optional[str]) -> str:
+    """
+    Elige entre JSON y MessagePack según el header Accept.
+
+    JSON es el formato por defecto: msgpack solo se elige si el cliente lo pide
+    explícitamente con una calidad mayor o igual a la de JSON y el paquete
+    está instalado.
+
+    Args:
+        accept: Valor del header Accept
+
+    Returns:
+        JSON_MEDIA_TYPE o MSGPACK_MEDIA_TYPE
+    """
+    if not accept or not msgpack_available():
+        return JSON_MEDIA_TYPE
+
+    preferences = _parse_accept(accept)
+    msgpack_quality = max(preferences.get(alias, 0.0) for alias in _MSGPACK_ALIASES)
+    json_quality = preferences.get(
+        JSON_MEDIA_TYPE,
+        preferences.get("application/*", preferences.get("*/*", 0.0))
+    )
+    if msgpack_quality > 0 and msgpack_quality >= json_quality:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def to_msgpack_bytes(obj: Any) -> bytes:
+    """
+    Serializa un DTO a MessagePack con las mismas claves camelCase del JSON.
+
+    Args:
+        obj: DTO a serializar
+
+    Returns:
+        Bytes MessagePack
+    """
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(to_plain(obj), use_bin_type=True)
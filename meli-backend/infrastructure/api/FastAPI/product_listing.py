@@ -0,0 +1,85 @@
+"""
+API Router para listados de productos por atributos numéricos.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+from pydantic import BaseModel
+
+from infrastructure.container.dependency_container import get_default_container
+from infrastructure.persist.product_detail.product_attribute_store import SORTABLE_COLUMNS
+
+
+router = APIRouter(prefix="/listings", tags=["listings"])
+
+
+class ProductListingItem(BaseModel):
+    """Producto de un listado con sus atributos numéricos"""
+    id: str
+    price: int
+    originalPrice: int
+    discount: int
+    soldCount: int
+    availableStock: int
+
+
+class ProductListingResponse(BaseModel):
+    """Respuesta del endpoint de listados"""
+    total: int
+    items: List[ProductListingItem]
+
+
+@router.get("/products", response_model=ProductListingResponse)
+async def list_products(
+    min_price: Optional[int] = Query(None, ge=0, description="Precio mínimo (inclusive)"),
+    max_price: Optional[int] = Query(None, ge=0, description="Precio máximo (inclusive)"),
+    discounted: Optional[bool] = Query(None, description="true: solo con descuento, false: solo sin descuento"),
+    in_stock: bool = Query(False, description="Solo productos con stock disponible"),
+    sort: str = Query("sold_count", description="Columna de orden: " + ", ".join(sorted(SORTABLE_COLUMNS))),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    limit: int = Query(20, ge=1, le=200)
+):
+    """
+    Lista productos filtrados por precio, descuento y stock, ordenados por una
+    columna numérica (top-K).
+
+    Example:
+        GET /listings/products?discounted=true&min_price=1000000&max_price=1300000&sort=sold_count
+
+        Response:
+        {
+            "total": 3,
+            "items": [{"id": "MLC621083881", "price": 1099990, "soldCount": 145, ...}]
+        }
+    """
+    if sort not in SORTABLE_COLUMNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort column. Expected one of: {', '.join(sorted(SORTABLE_COLUMNS))}"
+        )
+
+    listing_service = get_default_container().get_product_listing_service()
+    total, products = listing_service.search(
+        min_price=min_price,
+        max_price=max_price,
+        discounted=discounted,
+        in_stock=in_stock,
+        sort_by=sort,
+        descending=order == "desc",
+        limit=limit
+    )
+
+    return ProductListingResponse(
+        total=total,
+        items=[
+            ProductListingItem(
+                id=product.product_id,
+                price=product.price,
+                originalPrice=product.original_price,
+                discount=product.discount,
+                soldCount=product.sold_count,
+                availableStock=product.available_stock
+            )
+            for product in products
+        ]
+    )
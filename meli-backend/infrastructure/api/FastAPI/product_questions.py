@@ -0,0 +1,149 @@
+"""
+API Router para preguntas y respuestas de productos.
+"""
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from domain.question.entity.question import Question, QuestionStatus
+from application.service.question_write_service import QuestionAlreadyAnsweredError
+from infrastructure.api.FastAPI.detail_product import canonical_product_id
+from infrastructure.container.dependency_container import get_default_container
+
+
+router = APIRouter(prefix="/products", tags=["questions"])
+
+
+class CreateQuestionRequest(BaseModel):
+    """Pregunta a publicar"""
+    question: str = Field(..., min_length=1, max_length=2000)
+
+
+class AnswerQuestionRequest(BaseModel):
+    """Respuesta a una pregunta"""
+    answer: str = Field(..., min_length=1, max_length=5000)
+
+
+class QuestionResponse(BaseModel):
+    """Pregunta de un producto"""
+    id: str
+    question: str
+    answer: str
+    askedAt: str
+    answeredAt: str
+    status: str
+
+
+class QuestionPageResponse(BaseModel):
+    """Página de preguntas de un producto"""
+    total: int
+    offset: int
+    limit: int
+    items: List[QuestionResponse]
+
+
+def _to_response(question: Question) -> QuestionResponse:
+    return QuestionResponse(
+        id=question.id,
+        question=question.question,
+        answer=question.answer,
+        askedAt=question.asked_at,
+        answeredAt=question.answered_at,
+        status=question.status.value
+    )
+
+
+def _product_not_found(product_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Producto con ID {product_id} no encontrado"
+    )
+
+
+@router.get("/{product_id}/questions", response_model=QuestionPageResponse)
+async def get_questions(product_id: str,
+                        status_filter: Optional[QuestionStatus] = Query(None, alias="status"),
+                        offset: int = Query(0, ge=0),
+                        limit: int = Query(20, ge=1, le=100)):
+    """
+    Lista las preguntas de un producto, de la más nueva a la más vieja.
+
+    Example:
+        GET /products/MLC137702355/questions?status=pending&offset=0&limit=10
+
+        Response:
+        {"total": 3, "offset": 0, "limit": 10, "items": [{"id": "...", "status": "pending", ...}]}
+    """
+    product_id = canonical_product_id(product_id)
+    container = get_default_container()
+    if not container.get_product_detail_service().exists(product_id):
+        raise _product_not_found(product_id)
+    repository = container.get_question_write_service().repository
+    total, questions = repository.get_page(product_id, offset, limit, status_filter)
+    return QuestionPageResponse(
+        total=total,
+        offset=offset,
+        limit=limit,
+        items=[_to_response(question) for question in questions]
+    )
+
+
+@router.post("/{product_id}/questions", response_model=QuestionResponse, status_code=status.HTTP_201_CREATED)
+async def create_question(product_id: str, request: CreateQuestionRequest):
+    """
+    Publica una pregunta (sin responder) sobre un producto.
+
+    La respuesta se envía cuando la pregunta está en disco (log de preguntas
+    con fsync por lotes); desde ese momento ya se ve en el detalle del producto.
+
+    Example:
+        POST /products/MLC137702355/questions
+        {"question": "¿Tiene garantía?"}
+
+        Response (201):
+        {"id": "3f9c...", "question": "¿Tiene garantía?", "answer": "", "status": "pending", ...}
+    """
+    product_id = canonical_product_id(product_id)
+    service = get_default_container().get_question_write_service()
+    try:
+        # El append espera al fsync del lote: se ejecuta en el threadpool
+        question = await run_in_threadpool(service.ask_question, product_id, request.question)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if question is None:
+        raise _product_not_found(product_id)
+    return _to_response(question)
+
+
+@router.post("/{product_id}/questions/{question_id}/answer", response_model=QuestionResponse)
+async def answer_question(product_id: str, question_id: str, request: AnswerQuestionRequest):
+    """
+    Responde una pregunta pendiente: pasa de "pending" a "answered".
+
+    Example:
+        POST /products/MLC137702355/questions/3f9c.../answer
+        {"answer": "Sí, 1 año de garantía oficial."}
+
+        Response:
+        {"id": "3f9c...", "answer": "Sí, 1 año de garantía oficial.", "status": "answered", ...}
+
+    Errors:
+        404: El producto o la pregunta no existen
+        409: La pregunta ya estaba respondida
+    """
+    product_id = canonical_product_id(product_id)
+    service = get_default_container().get_question_write_service()
+    try:
+        question = await run_in_threadpool(service.answer_question, product_id, question_id, request.answer)
+    except QuestionAlreadyAnsweredError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if question is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pregunta {question_id} del producto {product_id} no encontrada"
+        )
+    return _to_response(question)
@@ -0,0 +1,114 @@
+"""
+API Router para el alta de reviews de productos.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from infrastructure.api.FastAPI.detail_product import canonical_product_id
+from infrastructure.container.dependency_container import get_default_container
+
+
+router = APIRouter(prefix="/products", tags=["reviews"])
+
+
+class CreateReviewRequest(BaseModel):
+    """Review a publicar"""
+    userName: str = Field(..., min_length=1, max_length=100)
+    rating: float = Field(..., ge=1, le=5)
+    comment: str = Field("", max_length=5000)
+    verified: bool = False
+    images: Optional[List[str]] = None
+    categoryRatings: Optional[Dict[str, int]] = None
+
+
+class ReviewResponse(BaseModel):
+    """Review publicada"""
+    id: str
+    userName: str
+    rating: float
+    date: str
+    comment: str
+    likes: int
+    verified: bool
+    images: Optional[List[str]] = None
+    categoryRatings: Optional[Dict[str, int]] = None
+
+
+class ReviewStatisticsResponse(BaseModel):
+    """Estadísticas del producto después del alta"""
+    totalReviews: int
+    averageRating: float
+    ratingDistribution: Dict[int, int]
+    averageCategoryRatings: Dict[str, float]
+
+
+class CreateReviewResponse(BaseModel):
+    """Respuesta del alta de una review"""
+    review: ReviewResponse
+    statistics: ReviewStatisticsResponse
+
+
+@router.post("/{product_id}/reviews", response_model=CreateReviewResponse, status_code=status.HTTP_201_CREATED)
+async def create_review(product_id: str, request: CreateReviewRequest):
+    """
+    Publica una review de un producto.
+
+    La respuesta se envía cuando la review está en disco (log de reviews con
+    fsync por lotes); desde ese momento ya se refleja en el detalle del
+    producto y en sus estadísticas, que se devuelven actualizadas.
+
+    Example:
+        POST /products/MLC137702355/reviews
+        {"userName": "Ana", "rating": 5, "comment": "Excelente", "categoryRatings": {"battery_life": 5}}
+
+        Response (201):
+        {
+            "review": {"id": "3f9c...", "userName": "Ana", "rating": 5.0, "date": "2026-10-19", ...},
+            "statistics": {"totalReviews": 8, "averageRating": 4.6, ...}
+        }
+    """
+    product_id = canonical_product_id(product_id)
+    service = get_default_container().get_review_write_service()
+    try:
+        # El append espera al fsync del lote: se ejecuta en el threadpool
+        review = await run_in_threadpool(
+            service.add_review,
+            product_id,
+            request.userName,
+            request.rating,
+            request.comment,
+            request.verified,
+            request.images,
+            request.categoryRatings
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if review is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Producto con ID {product_id} no encontrado"
+        )
+
+    statistics = service.get_statistics(product_id)
+    return CreateReviewResponse(
+        review=ReviewResponse(
+            id=review.id,
+            userName=review.user_name,
+            rating=review.rating,
+            date=review.date,
+            comment=review.comment,
+            likes=review.likes,
+            verified=review.verified,
+            images=review.images,
+            categoryRatings=review.category_ratings
+        ),
+        statistics=ReviewStatisticsResponse(
+            totalReviews=statistics['total_reviews'],
+            averageRating=statistics['average_rating'],
+            ratingDistribution=statistics['rating_distribution'],
+            averageCategoryRatings=statistics['average_category_ratings']
+        )
+    )
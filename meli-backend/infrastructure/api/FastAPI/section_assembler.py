@@ -0,0 +1,206 @@
+"""
+Ensamblado del JSON de detalle a partir de fragmentos por sección.
+
+Cada sección (vendedor, envío, características, variantes, ruta de categorías,
+media, reviews...) se serializa por separado y se guarda en el
+SectionFragmentCache. La respuesta se arma concatenando los fragmentos en el
+orden de DetailProductOutputDto, consultando al orquestador solo las secciones
+que faltan.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+
+from application.dto.detail_product_output_dto import DetailProductOutputDto
+from application.service.coalescing_detail_product_service import CoalescingDetailProductService
+from application.service.detail_product_orchestrator_service import PARTIAL_FIELD, SECTION_FIELDS, SECTIONS
+from application.service.product_revisions import ProductRevisions
+from infrastructure.api.FastAPI.dto_encoder import to_plain
+from infrastructure.api.FastAPI.global_fragments import GlobalSectionFragments
+from infrastructure.api.FastAPI.streaming_serializer import (
+    LIST_FIELDS,
+    STREAMING_MIN_ITEMS,
+    encode_json_key,
+    iter_json_pieces
+)
+from infrastructure.cache.section_fragment_cache import SectionFragmentCache
+
+# Valores renderizados recordados por contenido (vendedores y rutas compartidas)
+DEFAULT_RENDER_MEMO_SIZE = int(os.getenv("MELI_RENDER_MEMO_SIZE", "4096"))
+
+# Campos que suelen repetirse entre SKUs: se serializan una vez por contenido
+SHARED_FIELDS = frozenset({"seller", "category_path", "shipping"})
+
+# Campos del DTO en el orden del JSON, con su clave ya codificada
+_ROOT_FIELDS = [(field.name, encode_json_key(field.name)) for field in fields(DetailProductOutputDto)]
+_FIELD_SECTION = {name: section for section, names in SECTION_FIELDS.items() for name in names}
+
+
+class AssembledProduct(NamedTuple):
+    """
+    Piezas JSON del detalle en orden; streaming indica un payload grande y
+    partial las secciones degradadas (la respuesta no debe cachearse)
+    """
+    pieces: Iterator[str]
+    streaming: bool
+    partial: Tuple[str, ...] = ()
+
+
+def _content_key(value: Any) -> Optional[Hashable]:
+    """Clave por contenido para DTOs inmutables (None si no es hasheable)"""
+    if isinstance(value, list):
+        value = tuple(value)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (type(value), value)
+
+
+class SectionAssembler:
+    """
+    Arma el JSON de detalle concatenando fragmentos cacheados por sección.
+
+    Una sección se invalida de forma independiente (ej: al actualizar reviews
+    solo se vuelve a consultar y serializar la sección de reviews). Con
+    revisiones, los fragmentos de cada sección se indexan por la versión del
+    catálogo más la revisión de esa sección: una review nueva solo cambia la
+    clave de la sección de reviews del producto.
+    """
+
+    def __init__(self,
+                 service: CoalescingDetailProductService,
+                 fragment_cache: SectionFragmentCache,
+                 global_fragments: GlobalSectionFragments,
+                 render_memo_size: int = DEFAULT_RENDER_MEMO_SIZE,
+                 revisions: Optional[ProductRevisions] = None):
+        self._service = service
+        self._fragment_cache = fragment_cache
+        self._global_fragments = global_fragments
+        self._revisions = revisions
+        self._render_memo: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._render_memo_size = render_memo_size
+        self._lock = threading.Lock()
+
+    def _render_value(self, name: str, value: Any, global_fragments: Dict[str, Any]) -> str:
+        """Serializa el valor de un campo reutilizando fragmentos ya renderizados"""
+        fragment = global_fragments.get(name)
+        if fragment is not None and fragment.value is value:
+            return fragment.json
+
+        key = _content_key(value) if name in SHARED_FIELDS else None
+        if key is not None:
+            with self._lock:
+                rendered = self._render_memo.get(key)
+                if rendered is not None:
+                    self._render_memo.move_to_end(key)
+                    return rendered
+
+        rendered = json.dumps(to_plain(value), ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+        if key is not None:
+            with self._lock:
+                self._render_memo[key] = rendered
+                while len(self._render_memo) > self._render_memo_size:
+                    self._render_memo.popitem(last=False)
+        return rendered
+
+    def assemble(self, product_id: str, version: str, refresh: bool = False) -> Optional[AssembledProduct]:
+        """
+        Arma el JSON de detalle de un producto.
+
+        Args:
+            product_id: ID del producto
+            version: Versión del catálogo
+            refresh: Recalcula todas las secciones ignorando (y reemplazando) los fragmentos cacheados
+
+        Returns:
+            AssembledProduct, o None si el producto no existe
+        """
+        # La revisión se lee una vez: todas las secciones usan la misma
+        revision = self._revisions.get(product_id) if self._revisions is not None else None
+        keys = {
+            section: version if revision is None else revision.version(version, section)
+            for section in SECTIONS
+        }
+        if refresh:
+            cached: Dict[str, Optional[tuple]] = dict.fromkeys(SECTIONS)
+        else:
+            cached = {section: self._fragment_cache.get(product_id, keys[section], section) for section in SECTIONS}
+        missing = [section for section in SECTIONS if cached[section] is None]
+
+        values: Dict[str, Any] = {}
+        if missing:
+            if revision is None:
+                values = self._service.get_sections_by_product_id(product_id, missing)
+            else:
+                values = self._service.get_sections_by_product_id(product_id, missing, revision.token)
+            if values is None:
+                return None
+        # values puede ser compartido por peticiones coalescidas: no se modifica
+        partial = tuple(values.get(PARTIAL_FIELD, ()))
+
+        if sum(len(values.get(name) or ()) for name in LIST_FIELDS) >= STREAMING_MIN_ITEMS:
+            # Producto muy grande: las secciones nuevas se serializan al vuelo y no se cachean
+            return AssembledProduct(self._iter_streaming(cached, values, partial), streaming=True, partial=partial)
+
+        global_fragments = self._global_fragments.get(version)
+        rendered: Dict[str, str] = {PARTIAL_FIELD: json.dumps(list(partial))}
+        for section, fragments in cached.items():
+            if fragments is None:
+                fragments = tuple(
+                    self._render_value(name, values[name], global_fragments)
+                    for name in SECTION_FIELDS[section]
+                )
+                # Los placeholders de secciones degradadas no se cachean
+                if section not in partial:
+                    fragments = self._fragment_cache.put(product_id, keys[section], section, fragments)
+            rendered.update(zip(SECTION_FIELDS[section], fragments))
+
+        return AssembledProduct(self._iter_rendered(rendered), streaming=False, partial=partial)
+
+    @staticmethod
+    def _iter_rendered(rendered: Dict[str, str]) -> Iterator[str]:
+        yield '{'
+        for position, (name, key) in enumerate(_ROOT_FIELDS):
+            if position:
+                yield ','
+            yield key
+            yield ':'
+            yield rendered[name]
+        yield '}'
+
+    @staticmethod
+    def _iter_streaming(cached: Dict[str, Optional[tuple]],
+                        values: Dict[str, Any],
+                        partial: Tuple[str, ...]) -> Iterator[str]:
+        yield '{'
+        for position, (name, key) in enumerate(_ROOT_FIELDS):
+            if position:
+                yield ','
+            yield key
+            yield ':'
+            if name == PARTIAL_FIELD:
+                yield json.dumps(list(partial))
+                continue
+            fragments = cached[_FIELD_SECTION[name]]
+            if fragments is not None:
+                yield fragments[SECTION_FIELDS[_FIELD_SECTION[name]].index(name)]
+            else:
+                yield from iter_json_pieces(values[name])
+        yield '}'
+
+    def invalidate(self, product_id: str, section: Optional[str] = None) -> int:
+        """Invalida los fragmentos de un producto (o solo una sección)"""
+        return self._fragment_cache.invalidate(product_id, section)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas del caché de fragmentos"""
+        stats = self._fragment_cache.get_stats()
+        with self._lock:
+            stats["render_memo_entries"] = len(self._render_memo)
+        return stats
@@ -53,3 +53,4 @@ def serialize_to_dict(obj: Any) -> Any:
 
     # Primitivos
     return obj
+
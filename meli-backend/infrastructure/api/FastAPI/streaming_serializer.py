@@ -0,0 +1,101 @@
+"""
+Serialización JSON incremental de DTOs.
+
+Produce el mismo JSON que serialize_to_dict + json.dumps pero recorriendo
+los dataclasses directamente (sin asdict ni el diccionario intermedio) y
+entregándolo en fragmentos, de modo que las listas grandes (reviews,
+preguntas, productos relacionados) nunca existen dos veces en memoria.
+"""
+
+import json
+import os
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List
+
+from infrastructure.api.FastAPI.serializer import to_camel_case
+
+# Cantidad de elementos en listas a partir de la cual la respuesta se transmite en streaming
+STREAMING_MIN_ITEMS = int(os.getenv("MELI_STREAMING_MIN_ITEMS", "500"))
+
+# Campos cuyas listas crecen con el producto (deciden el streaming)
+LIST_FIELDS = ("reviews", "questions", "related_products", "characteristics")
+
+# Tamaño aproximado de cada fragmento enviado al cliente
+STREAMING_CHUNK_SIZE = 16 * 1024
+
+_camel_keys: Dict[str, str] = {}
+
+
+def encode_json_key(key: Any) -> str:
+    """Codifica una clave (o nombre de campo) igual que serialize_to_dict + json.dumps"""
+    if isinstance(key, str):
+        camel_key = _camel_keys.get(key)
+        if camel_key is None:
+            camel_key = _camel_keys.setdefault(key, json.dumps(to_camel_case(key), ensure_ascii=False))
+        return camel_key
+    if isinstance(key, bool):
+        return '"true"' if key else '"false"'
+    if isinstance(key, (int, float)):
+        return f'"{json.dumps(key)}"'
+    if key is None:
+        return '"null"'
+    raise TypeError(f"Unsupported key type: {type(key).__name__}")
+
+
+def iter_json_pieces(obj: Any) -> Iterator[str]:
+    """Genera los fragmentos JSON (str) de un valor, sin construirlo completo"""
+    if isinstance(obj, Enum):
+        obj = obj.value
+
+    if is_dataclass(obj):
+        yield '{'
+        for position, field in enumerate(fields(obj)):
+            if position:
+                yield ','
+            yield encode_json_key(field.name)
+            yield ':'
+            yield from iter_json_pieces(getattr(obj, field.name))
+        yield '}'
+    elif isinstance(obj, dict):
+        yield '{'
+        for position, (key, value) in enumerate(obj.items()):
+            if position:
+                yield ','
+            yield encode_json_key(key)
+            yield ':'
+            yield from iter_json_pieces(value)
+        yield '}'
+    elif isinstance(obj, (list, tuple)):
+        yield '['
+        for position, item in enumerate(obj):
+            if position:
+                yield ','
+            yield from iter_json_pieces(item)
+        yield ']'
+    else:
+        yield json.dumps(obj, ensure_ascii=False, allow_nan=False)
+
+
+def iter_chunks(pieces: Iterable[str], chunk_size: int = STREAMING_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Agrupa fragmentos JSON en bloques de bytes UTF-8 de tamaño aproximado chunk_size.
+
+    Args:
+        pieces: Fragmentos JSON en orden
+        chunk_size: Tamaño aproximado de cada bloque en caracteres
+
+    Returns:
+        Iterador de bloques listos para enviar
+    """
+    buffer: List[str] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode('utf-8')
+
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Query, HTTPException
 from typing import Dict
 from pydantic import BaseModel
 
-from infrastructure.container.dependency_container import DependencyContainer
+from infrastructure.container.dependency_container import get_default_container
 
 
 router = APIRouter(prefix="/api", tags=["variants"])
@@ -67,7 +67,7 @@ async def resolve_variant_product_id(
         )
 
     # Resolver usando el servicio unificado
-    container = DependencyContainer()
+    container = get_default_container()
     variant_product_service = container.get_variant_product_service()
 
     product_variant_id = variant_product_service.resolve_product_id(
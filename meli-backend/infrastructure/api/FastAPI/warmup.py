@@ -0,0 +1,185 @@
+"""
+Warm-up del arranque de la API.
+
+Antes de reportarse lista, cada instancia carga el catálogo con sus índices
+(repositorios, almacén columnar de listados, secciones globales) y
+pre-renderiza en el caché de respuestas los productos más vistos (los que ya
+están en el caché en disco solo se cargan). Así un pod nuevo no paga la
+latencia del primer acceso con tráfico real.
+
+Los productos a precalentar se toman, en este orden, de:
+- MELI_WARMUP_PRODUCTS: IDs separados por comas
+- MELI_WARMUP_PRODUCTS_FILE: archivo con un ID por línea (# para comentarios)
+- MELI_WARMUP_ACCESS_LOG: access log; se cuentan los GET /products/{id}
+
+y se limitan a los MELI_WARMUP_TOP_N primeros.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Optional
+
+from infrastructure.api.FastAPI.detail_product import canonical_product_id, render_cacheable_body
+from infrastructure.container.dependency_container import DependencyContainer, get_default_container
+
+WARMUP_PRODUCTS_ENV = "MELI_WARMUP_PRODUCTS"
+WARMUP_PRODUCTS_FILE_ENV = "MELI_WARMUP_PRODUCTS_FILE"
+WARMUP_ACCESS_LOG_ENV = "MELI_WARMUP_ACCESS_LOG"
+WARMUP_TOP_N = int(os.getenv("MELI_WARMUP_TOP_N", "100"))
+
+# Fases del arranque
+STARTING = "starting"
+LOADING_CATALOG = "loading_catalog"
+PRERENDERING = "prerendering"
+READY = "ready"
+FAILED = "failed"
+
+_PRODUCT_REQUEST = re.compile(r'"GET /products/([^/?\s"]+)')
+
+
+def top_products_from_access_log(path: str, limit: int = WARMUP_TOP_N) -> List[str]:
+    """
+    Cuenta las peticiones GET /products/{id} de un access log.
+
+    Args:
+        path: Ruta del access log (formato uvicorn o combined)
+        limit: Cantidad máxima de productos
+
+    Returns:
+        IDs de producto del más al menos pedido
+    """
+    counts: Counter = Counter()
+    with open(path, 'r', encoding='utf-8', errors='replace') as file:
+        for line in file:
+            match = _PRODUCT_REQUEST.search(line)
+            if match:
+                counts[canonical_product_id(match.group(1))] += 1
+    return [product_id for product_id, _ in counts.most_common(limit)]
+
+
+def read_product_list(path: str) -> List[str]:
+    """Lee un archivo con un ID de producto por línea (ignora vacías y comentarios)"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith('#')]
+
+
+def resolve_warmup_products(limit: int = WARMUP_TOP_N,
+                            environ: Optional[Mapping[str, str]] = None) -> List[str]:
+    """
+    Productos a pre-renderizar según la configuración del entorno.
+
+    Returns:
+        IDs canónicos sin repetir, como máximo limit
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get(WARMUP_PRODUCTS_ENV):
+        product_ids = [value.strip() for value in environ[WARMUP_PRODUCTS_ENV].split(',') if value.strip()]
+    elif environ.get(WARMUP_PRODUCTS_FILE_ENV):
+        product_ids = read_product_list(environ[WARMUP_PRODUCTS_FILE_ENV])
+    elif environ.get(WARMUP_ACCESS_LOG_ENV):
+        product_ids = top_products_from_access_log(environ[WARMUP_ACCESS_LOG_ENV], limit)
+    else:
+        return []
+    # dict.fromkeys conserva el orden (el más visto primero) y quita duplicados
+    return list(dict.fromkeys(canonical_product_id(product_id) for product_id in product_ids))[:limit]
+
+
+class Readiness:
+    """Estado del arranque de la instancia (lo consulta el endpoint de readiness)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phase = STARTING
+        self.prerendered = 0
+        self.skipped: List[str] = []
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.duration_ms: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Indica si la instancia puede recibir tráfico"""
+        return self.phase == READY
+
+    def record_prerendered(self) -> None:
+        """Cuenta un producto dejado en el caché de respuestas"""
+        with self._lock:
+            self.prerendered += 1
+
+    def record_skipped(self, product_id: str) -> None:
+        """Registra un producto que no se pudo pre-renderizar"""
+        with self._lock:
+            self.skipped.append(product_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retorna el estado serializable"""
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "phase": self.phase,
+                "prerendered": self.prerendered,
+                "skipped": list(self.skipped),
+                "error": self.error,
+                "duration_ms": self.duration_ms
+            }
+
+
+def warm_up(readiness: Readiness,
+            product_ids: List[str],
+            container: Optional[DependencyContainer] = None) -> Readiness:
+    """
+    Carga el catálogo con sus índices y pre-renderiza los productos indicados.
+
+    Un producto que no existe o que no se puede cachear (secciones degradadas,
+    streaming) se omite sin impedir el arranque; si falla la carga del
+    catálogo la instancia queda en FAILED y nunca se reporta lista.
+
+    Args:
+        readiness: Estado a actualizar
+        product_ids: Productos a dejar en el caché de respuestas
+        container: Container a calentar (por defecto, el del proceso)
+
+    Returns:
+        El mismo Readiness, en READY o FAILED
+    """
+    started = time.monotonic()
+    readiness.started_at = time.time()
+    try:
+        readiness.phase = LOADING_CATALOG
+        container = container or get_default_container()
+        version = container.get_catalog().version
+        container.get_product_listing_service().get_store()
+        container.get_global_section_fragments().get(version)
+
+        readiness.phase = PRERENDERING
+        response_cache = container.get_product_response_cache()
+        revisions = container.get_product_revisions()
+        for product_id in product_ids:
+            # Productos con reviews escritas desde la carga: se cachean con su revisión
+            cache_version = revisions.versioned(version, product_id)
+            # Lo que ya está en el L2 (de antes de un reinicio) solo se promueve al L1
+            if response_cache.get(product_id, cache_version) is not None:
+                readiness.record_prerendered()
+                continue
+            try:
+                body = render_cacheable_body(container, product_id, version)
+            except Exception as e:
+                print(f"Error pre-rendering product {product_id}: {e}")
+                body = None
+            if body is None:
+                readiness.record_skipped(product_id)
+                continue
+            response_cache.put(product_id, cache_version, body)
+            readiness.record_prerendered()
+
+        readiness.phase = READY
+    except Exception as e:
+        readiness.error = str(e)
+        readiness.phase = FAILED
+        print(f"Warm-up failed: {e}")
+    finally:
+        readiness.duration_ms = round((time.monotonic() - started) * 1000, 3)
+    return readiness
@@ -0,0 +1,116 @@
+"""Compresión de cuerpos de respuesta y negociación de Accept-Encoding"""
+
+import gzip
+import zlib
+from typing import Dict, Iterable, Iterator, Optional
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+IDENTITY = "identity"
+
+# Codificaciones disponibles en orden de preferencia ante igual calidad
+SUPPORTED_ENCODINGS = [BROTLI, GZIP] if brotli is not None else [GZIP]
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """
+    Comprime un cuerpo con la codificación indicada.
+
+    Args:
+        body: Bytes sin comprimir
+        encoding: GZIP o BROTLI
+        level: Nivel de compresión (gzip 1-9, brotli 0-11)
+
+    Returns:
+        Bytes comprimidos
+    """
+    if encoding == GZIP:
+        # mtime=0 para que el resultado sea determinista
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(body, quality=level)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def iter_compress(chunks: Iterable[bytes], encoding: str, level: int) -> Iterator[bytes]:
+    """
+    Comprime un flujo de fragmentos sin reunir el cuerpo completo.
+
+    Args:
+        chunks: Fragmentos sin comprimir
+        encoding: GZIP o BROTLI
+        level: Nivel de compresión (gzip 1-9, brotli 0-11)
+
+    Returns:
+        Iterador de fragmentos comprimidos
+    """
+    if encoding == GZIP:
+        # wbits=31: formato gzip (header + trailer)
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        process, finish = compressor.compress, compressor.flush
+    elif encoding == BROTLI and brotli is not None:
+        compressor = brotli.Compressor(quality=level)
+        process, finish = compressor.process, compressor.finish
+    else:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+
+    for chunk in chunks:
+        compressed = process(chunk)
+        if compressed:
+            yield compressed
+    yield finish()
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Parsea el header Accept-Encoding a {codificación: calidad}.
+
+    Args:
+        accept_encoding: Valor del header (ej: "gzip, br;q=0.8")
+
+    Returns:
+        Diccionario con la calidad (q) de cada codificación aceptada
+    """
+    preferences: Dict[str, float] = {}
+    if not accept_encoding:
+        return preferences
+
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        preferences[token] = quality
+    return preferences
+
+
+def negotiate_encoding(accept_encoding: Optional[str], available: Iterable[str]) -> str:
+    """
+    Elige la mejor codificación disponible según Accept-Encoding.
+
+    Args:
+        accept_encoding: Valor del header Accept-Encoding
+        available: Codificaciones que el servidor puede entregar
+
+    Returns:
+        Codificación elegida, o IDENTITY si ninguna es aceptable
+    """
+    preferences = parse_accept_encoding(accept_encoding)
+    best, best_quality = IDENTITY, 0.0
+    for encoding in available:
+        quality = preferences.get(encoding, preferences.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
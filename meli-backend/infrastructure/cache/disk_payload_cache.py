@@ -0,0 +1,229 @@
+"""
+Caché persistente (L2) de payloads renderizados, en un archivo SQLite.
+
+Es el segundo nivel detrás del LRU en memoria de ProductResponseCache: mucho
+más grande, compartido por todos los workers del nodo (modo WAL, lectores
+concurrentes con un escritor) y sobrevive a reinicios y despliegues. Las
+entradas se identifican por (product_id, versión del catálogo, formato), así
+que un catálogo nuevo nunca lee payloads de la versión anterior.
+
+Los errores de disco no rompen las peticiones: el L2 se comporta como un miss.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import AbstractSet, Any, Dict, Optional, Tuple
+
+# Ruta por defecto (vacía para desactivar el L2)
+L2_PATH_ENV = "MELI_L2_CACHE_PATH"
+DEFAULT_L2_PATH = os.path.join(tempfile.gettempdir(), "meli_payload_cache.sqlite3")
+DEFAULT_L2_MAX_ENTRIES = int(os.getenv("MELI_L2_CACHE_MAX_ENTRIES", "100000"))
+
+# Cada cuántas escrituras se recorta el archivo a max_entries
+_PRUNE_EVERY = 256
+
+# Resolución del último acceso (segundos): evita una escritura por cada lectura
+_ACCESS_RESOLUTION = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payload (
+    product_id TEXT NOT NULL,
+    version TEXT NOT NULL,
+    media_type TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (product_id, version, media_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS payload_accessed_at ON payload (accessed_at);
+"""
+
+
+class DiskPayloadCache:
+    """
+    Payloads por (product_id, versión, formato) en SQLite.
+
+    Cada hilo usa su propia conexión. Al superar max_entries se descartan las
+    entradas accedidas hace más tiempo (LRU aproximado por _ACCESS_RESOLUTION).
+    """
+
+    def __init__(self, path: str = DEFAULT_L2_PATH, max_entries: int = DEFAULT_L2_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self._max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # autocommit: cada sentencia es su propia transacción corta
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, product_id: str, version: str, media_type: str) -> Optional[Tuple[bytes, float]]:
+        """
+        Retorna (payload, momento de almacenamiento) o None.
+
+        El momento de almacenamiento es time.time(), comparable entre procesos.
+        """
+        try:
+            connection = self._connection()
+            row = connection.execute(
+                "SELECT body, stored_at FROM payload WHERE product_id = ? AND version = ? AND media_type = ?",
+                (product_id, version, media_type)
+            ).fetchone()
+            if row is None:
+                self._count("_misses")
+                return None
+            now = time.time()
+            connection.execute(
+                "UPDATE payload SET accessed_at = ? "
+                "WHERE product_id = ? AND version = ? AND media_type = ? AND accessed_at < ?",
+                (now, product_id, version, media_type, now - _ACCESS_RESOLUTION)
+            )
+            self._count("_hits")
+            return bytes(row[0]), row[1]
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error reading L2 cache: {e}")
+            return None
+
+    def put(self, product_id: str, version: str, media_type: str, body: bytes, stored_at: float) -> None:
+        """Almacena (o reemplaza) un payload"""
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO payload (product_id, version, media_type, body, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (product_id, version, media_type, sqlite3.Binary(body), stored_at, time.time())
+            )
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error writing L2 cache: {e}")
+            return
+
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % _PRUNE_EVERY == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Recorta el archivo a max_entries descartando lo accedido hace más tiempo.
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM payload WHERE (product_id, version, media_type) IN ("
+                "SELECT product_id, version, media_type FROM payload "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,)
+            )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error pruning L2 cache: {e}")
+            return 0
+
+    def invalidate(self, product_id: str) -> int:
+        """Descarta los payloads de un producto (todas las versiones y formatos)"""
+        try:
+            return self._connection().execute("DELETE FROM payload WHERE product_id = ?", (product_id,)).rowcount
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error invalidating L2 cache: {e}")
+            return 0
+
+    def carry_over(self, old_version: str, new_version: str, stale_products: AbstractSet[str]) -> int:
+        """
+        Copia a la versión nueva los payloads de los productos no afectados.
+
+        Returns:
+            Cantidad de payloads copiados
+        """
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("CREATE TEMP TABLE IF NOT EXISTS stale_product (product_id TEXT PRIMARY KEY)")
+                connection.execute("DELETE FROM stale_product")
+                connection.executemany(
+                    "INSERT OR IGNORE INTO stale_product (product_id) VALUES (?)",
+                    ((product_id,) for product_id in stale_products)
+                )
+                cursor = connection.execute(
+                    "INSERT OR IGNORE INTO payload (product_id, version, media_type, body, stored_at, accessed_at) "
+                    "SELECT product_id, ?, media_type, body, stored_at, accessed_at FROM payload "
+                    "WHERE version = ? AND product_id NOT IN (SELECT product_id FROM stale_product)",
+                    (new_version, old_version)
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error carrying over L2 cache: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """Vacía el caché"""
+        try:
+            self._connection().execute("DELETE FROM payload")
+        except sqlite3.Error as e:
+            self._count("_errors")
+            print(f"Error clearing L2 cache: {e}")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM payload").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas del L2"""
+        try:
+            entries = len(self)
+        except sqlite3.Error:
+            entries = None
+        with self._lock:
+            return {
+                "path": self.path,
+                "entries": entries,
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors
+            }
+
+
+def default_disk_cache() -> Optional[DiskPayloadCache]:
+    """L2 configurado por MELI_L2_CACHE_PATH (None si está desactivado o no se puede abrir)"""
+    path = os.getenv(L2_PATH_ENV, DEFAULT_L2_PATH)
+    if not path:
+        return None
+    try:
+        return DiskPayloadCache(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"L2 cache disabled ({path}): {e}")
+        return None
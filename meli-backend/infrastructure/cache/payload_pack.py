@@ -0,0 +1,256 @@
+"""
+Pack de payloads de detalle materializados offline, servido vía mmap.
+
+El job de materialización (application.entrypoint.materialize) renderiza el
+JSON de cada producto del catálogo y lo escribe, junto con sus variantes
+precomprimidas, en un único archivo indexado. En modo de servicio la API
+adjunta el archivo y responde con esos bytes sin orquestar ni serializar; el
+page cache del sistema operativo lo comparte entre todos los workers.
+
+Formato del archivo:
+
+    MAGIC (8 bytes) | largo del header (uint32) | header JSON | cuerpo
+
+    El cuerpo contiene, por producto, su ID y sus payloads (uno por
+    codificación, en el orden de header["encodings"]), seguidos de un índice
+    de entradas de tamaño fijo ordenadas por ID sobre el que se hace búsqueda
+    binaria. Cada entrada guarda además la huella de los datos de entrada del
+    producto, para que una nueva materialización reutilice lo que no cambió.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from infrastructure.cache.compression import IDENTITY
+
+MAGIC = b"MELIPAK1"
+
+# Variable de entorno con la ruta del pack a servir (sin definir: no se usa)
+PAYLOAD_PACK_ENV = "MELI_PAYLOAD_PACK"
+
+_HEADER_LENGTH = struct.Struct("<I")
+# key_offset, key_length, huella (relativos al inicio del cuerpo)
+_ENTRY_PREFIX = struct.Struct("<QI16s")
+# data_offset, data_length de cada codificación
+_LOCATION = struct.Struct("<QI")
+
+FINGERPRINT_SIZE = 16
+
+
+class PackedPayload(NamedTuple):
+    """Payload de un producto listo para escribir en el pack"""
+    product_id: str
+    # Huella de los datos de entrada (FINGERPRINT_SIZE bytes)
+    fingerprint: bytes
+    # Codificación → bytes; siempre incluye IDENTITY
+    bodies: Dict[str, bytes]
+
+
+def _entry_struct(encodings: List[str]) -> struct.Struct:
+    return struct.Struct(_ENTRY_PREFIX.format + _LOCATION.format[1:] * len(encodings))
+
+
+def write_pack(payloads: Iterable[PackedPayload],
+               output_path: str,
+               version: str,
+               encodings: List[str]) -> int:
+    """
+    Escribe el pack de forma atómica (archivo temporal + os.replace).
+
+    Los workers que ya tienen adjunto el pack anterior lo siguen leyendo hasta
+    volver a abrirlo: el archivo reemplazado no se modifica.
+
+    Args:
+        payloads: Payloads por producto (cada uno con todas las codificaciones)
+        output_path: Ruta del pack a generar
+        version: Versión del catálogo con la que se renderizaron
+        encodings: Codificaciones incluidas (IDENTITY primero)
+
+    Returns:
+        Cantidad de productos escritos
+    """
+    if not encodings or encodings[0] != IDENTITY:
+        raise ValueError("encodings must start with identity")
+    entry_struct = _entry_struct(encodings)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".payloads-", suffix=".tmp")
+    try:
+        # Los payloads se vuelcan a un segundo temporal a medida que llegan (el
+        # header va antes y no se conoce hasta el final); solo el índice se ordena
+        entries: List[Tuple[bytes, bytes]] = []
+        offset = 0
+        with tempfile.TemporaryFile(dir=directory) as body:
+            for payload in payloads:
+                encoded_key = payload.product_id.encode('utf-8')
+                key_offset = offset
+                body.write(encoded_key)
+                offset += len(encoded_key)
+
+                locations = []
+                for encoding in encodings:
+                    data = payload.bodies[encoding]
+                    locations.extend((offset, len(data)))
+                    body.write(data)
+                    offset += len(data)
+                entries.append((encoded_key, entry_struct.pack(
+                    key_offset, len(encoded_key), payload.fingerprint, *locations
+                )))
+
+            header = json.dumps({
+                "version": version,
+                "encodings": encodings,
+                "index_offset": offset,
+                "count": len(entries)
+            }).encode('utf-8')
+
+            with os.fdopen(fd, 'wb') as file:
+                file.write(MAGIC)
+                file.write(_HEADER_LENGTH.pack(len(header)))
+                file.write(header)
+                body.seek(0)
+                while True:
+                    chunk = body.read(1 << 20)
+                    if not chunk:
+                        break
+                    file.write(chunk)
+                for _, entry in sorted(entries):
+                    file.write(entry)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return len(entries)
+
+
+class MmapPayloadPack:
+    """
+    Pack de payloads adjunto vía mmap de solo lectura.
+
+    Solo el header se decodifica al adjuntar; cada búsqueda es una búsqueda
+    binaria sobre el índice y un slice del archivo mapeado.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Payload pack file is empty: {path}")
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Invalid payload pack file: {path}")
+
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mm, len(MAGIC))
+        header = json.loads(self._mm[header_start:header_start + header_length].decode('utf-8'))
+
+        self._body_offset = header_start + header_length
+        self._index_offset = self._body_offset + header["index_offset"]
+        self._count = header["count"]
+        self.version: str = header["version"]
+        self.encodings: List[str] = header["encodings"]
+        self._entry = _entry_struct(self.encodings)
+        self._served = 0
+
+    def _entry_at(self, position: int) -> tuple:
+        return self._entry.unpack_from(self._mm, self._index_offset + position * self._entry.size)
+
+    def _key_at(self, key_offset: int, key_length: int) -> bytes:
+        start = self._body_offset + key_offset
+        return self._mm[start:start + key_length]
+
+    def _find(self, product_id: str) -> Optional[tuple]:
+        """Búsqueda binaria del producto en el índice"""
+        target = product_id.encode('utf-8')
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry = self._entry_at(middle)
+            current = self._key_at(entry[0], entry[1])
+            if current == target:
+                return entry
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def get(self, product_id: str, encoding: str = IDENTITY) -> Optional[bytes]:
+        """
+        Retorna el payload del producto en la codificación indicada.
+
+        Returns:
+            Bytes del payload, o None si el producto (o la codificación) no está en el pack
+        """
+        if encoding not in self.encodings:
+            return None
+        entry = self._find(product_id)
+        if entry is None:
+            return None
+        position = 3 + 2 * self.encodings.index(encoding)
+        start = self._body_offset + entry[position]
+        self._served += 1
+        return self._mm[start:start + entry[position + 1]]
+
+    def fingerprint(self, product_id: str) -> Optional[bytes]:
+        """Huella de los datos de entrada con los que se renderizó el producto"""
+        entry = self._find(product_id)
+        return entry[2] if entry is not None else None
+
+    def get_payload(self, product_id: str) -> Optional[PackedPayload]:
+        """Retorna el producto con todas sus codificaciones (para reutilizarlo en otro pack)"""
+        entry = self._find(product_id)
+        if entry is None:
+            return None
+        bodies = {}
+        for number, encoding in enumerate(self.encodings):
+            start = self._body_offset + entry[3 + 2 * number]
+            bodies[encoding] = self._mm[start:start + entry[4 + 2 * number]]
+        return PackedPayload(product_id, entry[2], bodies)
+
+    def keys(self) -> List[str]:
+        """IDs de producto del pack, ordenados"""
+        return [self._key_at(*self._entry_at(position)[:2]).decode('utf-8') for position in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna el tamaño y el uso del pack"""
+        return {
+            "path": self.path,
+            "version": self.version,
+            "products": self._count,
+            "encodings": list(self.encodings),
+            "bytes": len(self._mm),
+            "served": self._served
+        }
+
+    def close(self) -> None:
+        """Libera el mapeo y el descriptor de archivo"""
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+
+def default_payload_pack() -> Optional[MmapPayloadPack]:
+    """Pack configurado por MELI_PAYLOAD_PACK (None si no está definido o no se puede abrir)"""
+    path = os.getenv(PAYLOAD_PACK_ENV)
+    if not path:
+        return None
+    try:
+        return MmapPayloadPack(path)
+    except (OSError, ValueError) as e:
+        print(f"Payload pack disabled ({path}): {e}")
+        return None
@@ -0,0 +1,339 @@
+"""Caché de payloads renderizados de detalle de producto"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from infrastructure.cache.disk_payload_cache import DiskPayloadCache
+from infrastructure.cache.compression import (
+    BROTLI,
+    GZIP,
+    IDENTITY,
+    SUPPORTED_ENCODINGS,
+    compress
+)
+
+# Configuración por defecto (sobrescribible por entorno)
+DEFAULT_MAX_ENTRIES = int(os.getenv("MELI_RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+DEFAULT_COMPRESSION_MIN_SIZE = int(os.getenv("MELI_COMPRESSION_MIN_SIZE", "1024"))
+DEFAULT_GZIP_LEVEL = int(os.getenv("MELI_GZIP_LEVEL", "6"))
+DEFAULT_BROTLI_QUALITY = int(os.getenv("MELI_BROTLI_QUALITY", "5"))
+
+# Stale-while-revalidate (segundos): pasado el soft TTL el payload se sigue
+# sirviendo mientras se recalcula en segundo plano; pasado el hard TTL es un miss
+DEFAULT_SOFT_TTL = float(os.getenv("MELI_RESPONSE_CACHE_SOFT_TTL", "5"))
+DEFAULT_HARD_TTL = float(os.getenv("MELI_RESPONSE_CACHE_HARD_TTL", "300"))
+
+DEFAULT_MEDIA_TYPE = "application/json"
+
+
+class CachedPayload:
+    """
+    Payload renderizado de un producto junto con sus variantes comprimidas.
+
+    Cada variante se comprime la primera vez que se pide y queda almacenada
+    junto a los bytes originales: un producto caliente nunca se recomprime.
+    """
+
+    def __init__(self, body: bytes, compressible: bool, levels: Dict[str, int], stored_at: float = 0.0):
+        self.body = body
+        self.stored_at = stored_at
+        self._compressible = compressible
+        self._levels = levels
+        self._encoded: Dict[str, bytes] = {}
+
+    @property
+    def encodings(self) -> List[str]:
+        """Codificaciones que este payload puede entregar (además de identity)"""
+        return list(SUPPORTED_ENCODINGS) if self._compressible else []
+
+    def encoded(self, encoding: str) -> bytes:
+        """
+        Retorna el cuerpo en la codificación pedida, comprimiéndolo una sola vez.
+
+        Args:
+            encoding: IDENTITY, GZIP o BROTLI
+
+        Returns:
+            Bytes del cuerpo en esa codificación
+        """
+        if encoding == IDENTITY or not self._compressible:
+            return self.body
+        body = self._encoded.get(encoding)
+        if body is None:
+            body = compress(self.body, encoding, self._levels[encoding])
+            self._encoded[encoding] = body
+        return body
+
+
+class ProductResponseCache:
+    """
+    Caché LRU acotado de payloads renderizados, por (product_id, versión del
+    catálogo, formato).
+
+    Los cuerpos por debajo de compression_min_size no se comprimen: en payloads
+    chicos el costo de CPU y los headers extra no compensan.
+
+    Es el L1 en memoria (chico, por proceso). Con un L2 (DiskPayloadCache) las
+    escrituras van a ambos niveles y un miss del L1 se busca en el L2 antes de
+    recalcular; lo encontrado se promueve al L1 como recién almacenado. Las
+    entradas del L2 no vencen por tiempo: están indexadas por versión del
+    catálogo (y revisión del producto), así que un cambio de datos ya cambia
+    la clave, y un reinicio o despliegue recupera todo el working set.
+
+    get y put acceden a ambos niveles. El L2 es I/O bloqueante (SQLite), así
+    que desde el event loop se usan por separado: get_l1 / put_l1 (solo
+    memoria) en el loop, y get_l2 / put_l2 en el threadpool.
+
+    Cada payload del L1 tiene dos TTL: pasado soft_ttl está "stale" (se sigue
+    sirviendo, y quien lo lee puede reservar su recálculo con begin_refresh,
+    a lo sumo uno por clave); pasado hard_ttl se descarta y la lectura es un miss.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 compression_min_size: int = DEFAULT_COMPRESSION_MIN_SIZE,
+                 gzip_level: int = DEFAULT_GZIP_LEVEL,
+                 brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+                 soft_ttl: float = DEFAULT_SOFT_TTL,
+                 hard_ttl: float = DEFAULT_HARD_TTL,
+                 clock: Callable[[], float] = time.time,
+                 l2: Optional[DiskPayloadCache] = None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        if not 0 < soft_ttl <= hard_ttl:
+            raise ValueError("TTLs must satisfy 0 < soft_ttl <= hard_ttl")
+        if not 1 <= gzip_level <= 9:
+            raise ValueError("gzip_level must be between 1 and 9")
+        if not 0 <= brotli_quality <= 11:
+            raise ValueError("brotli_quality must be between 0 and 11")
+
+        self._max_entries = max_entries
+        self._compression_min_size = compression_min_size
+        self._levels = {GZIP: gzip_level, BROTLI: brotli_quality}
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._clock = clock
+        self._l2 = l2
+        self._entries: "OrderedDict[Tuple[str, str, str], CachedPayload]" = OrderedDict()
+        # Claves con un recálculo en curso
+        self._refreshing: Set[Tuple[str, str, str]] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._expired = 0
+        self._refreshes = 0
+        self._l2_hits = 0
+
+    def compression_level(self, encoding: str) -> int:
+        """Nivel de compresión configurado para la codificación"""
+        return self._levels[encoding]
+
+    @property
+    def has_l2(self) -> bool:
+        """Indica si hay un L2 detrás del L1"""
+        return self._l2 is not None
+
+    def get(self, product_id: str, version: str, media_type: str = DEFAULT_MEDIA_TYPE) -> Optional[CachedPayload]:
+        """Retorna el payload cacheado (aunque esté stale) o None si no existe o venció el hard TTL"""
+        payload = self.get_l1(product_id, version, media_type)
+        if payload is None and self._l2 is not None:
+            payload = self.get_l2(product_id, version, media_type)
+        return payload
+
+    def get_l1(self, product_id: str, version: str, media_type: str = DEFAULT_MEDIA_TYPE) -> Optional[CachedPayload]:
+        """
+        Busca solo en el L1 (memoria, sin I/O).
+
+        Sin L2 un miss acá es definitivo; con L2 quien llama sigue con get_l2.
+        """
+        key = (product_id, version, media_type)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None and self._clock() - payload.stored_at >= self._hard_ttl:
+                del self._entries[key]
+                self._expired += 1
+                payload = None
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                if self.is_stale(payload):
+                    self._stale_hits += 1
+                return payload
+            if self._l2 is None:
+                self._misses += 1
+            return None
+
+    def get_l2(self, product_id: str, version: str, media_type: str = DEFAULT_MEDIA_TYPE) -> Optional[CachedPayload]:
+        """
+        Busca en el L2 (bloqueante: SQLite) y promueve lo encontrado al L1,
+        donde sus TTL empiezan a correr desde la promoción.
+
+        Desde el event loop se llama en el threadpool, después de un miss de get_l1.
+        """
+        key = (product_id, version, media_type)
+        payload = self._get_from_l2(product_id, version, media_type)
+        with self._lock:
+            if payload is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._l2_hits += 1
+            self._store(key, payload)
+        return payload
+
+    def _get_from_l2(self, product_id: str, version: str, media_type: str) -> Optional[CachedPayload]:
+        # La lectura del disco se hace fuera del lock del L1
+        if self._l2 is None:
+            return None
+        entry = self._l2.get(product_id, version, media_type)
+        if entry is None:
+            return None
+        # La versión de la clave ya garantiza que el payload está vigente
+        body, _ = entry
+        return CachedPayload(body, len(body) >= self._compression_min_size, self._levels, self._clock())
+
+    def _store(self, key: Tuple[str, str, str], payload: CachedPayload) -> None:
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def is_stale(self, payload: CachedPayload) -> bool:
+        """Indica si el payload superó el soft TTL"""
+        return self._clock() - payload.stored_at >= self._soft_ttl
+
+    def begin_refresh(self, product_id: str, version: str, media_type: str = DEFAULT_MEDIA_TYPE) -> bool:
+        """
+        Reserva el recálculo de una clave.
+
+        Returns:
+            True si quien llama debe recalcular (y luego llamar end_refresh),
+            False si ya hay un recálculo en curso para la clave
+        """
+        key = (product_id, version, media_type)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._refreshes += 1
+            return True
+
+    def end_refresh(self, product_id: str, version: str, media_type: str = DEFAULT_MEDIA_TYPE) -> None:
+        """Libera la reserva de recálculo de una clave"""
+        with self._lock:
+            self._refreshing.discard((product_id, version, media_type))
+
+    def put(self,
+            product_id: str,
+            version: str,
+            body: bytes,
+            media_type: str = DEFAULT_MEDIA_TYPE) -> CachedPayload:
+        """
+        Almacena el JSON renderizado de un producto.
+
+        Args:
+            product_id: ID del producto
+            version: Versión del catálogo con la que se renderizó
+            body: Payload serializado
+            media_type: Formato del payload (JSON por defecto)
+
+        Returns:
+            CachedPayload almacenado
+        """
+        payload = self.put_l1(product_id, version, body, media_type)
+        self.put_l2(product_id, version, payload, media_type)
+        return payload
+
+    def put_l1(self,
+               product_id: str,
+               version: str,
+               body: bytes,
+               media_type: str = DEFAULT_MEDIA_TYPE) -> CachedPayload:
+        """Almacena solo en el L1 (sin I/O); el L2 se escribe aparte con put_l2"""
+        payload = CachedPayload(body, len(body) >= self._compression_min_size, self._levels, self._clock())
+        with self._lock:
+            self._store((product_id, version, media_type), payload)
+        return payload
+
+    def put_l2(self,
+               product_id: str,
+               version: str,
+               payload: CachedPayload,
+               media_type: str = DEFAULT_MEDIA_TYPE) -> None:
+        """Escribe en el L2 un payload ya almacenado con put_l1 (bloqueante: SQLite)"""
+        if self._l2 is not None:
+            self._l2.put(product_id, version, media_type, payload.body, payload.stored_at)
+
+    def invalidate(self, product_id: str) -> int:
+        """
+        Descarta los payloads de un producto (todas las versiones y formatos)
+        en ambos niveles.
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == product_id]
+            for key in keys:
+                del self._entries[key]
+        if self._l2 is not None:
+            return max(len(keys), self._l2.invalidate(product_id))
+        return len(keys)
+
+    def carry_over(self, old_version: str, new_version: str, stale_products: AbstractSet[str]) -> int:
+        """
+        Reutiliza los payloads de una versión anterior del catálogo (ambos niveles).
+
+        Los payloads conservan su momento de almacenamiento, así que los TTL
+        siguen corriendo desde el render original.
+
+        Args:
+            old_version: Versión con la que se renderizaron
+            new_version: Versión nueva del catálogo
+            stale_products: Productos afectados por el cambio (no se copian)
+
+        Returns:
+            Cantidad de payloads del L1 reutilizados
+        """
+        with self._lock:
+            carried = [
+                ((product_id, new_version, media_type), payload)
+                for (product_id, version, media_type), payload in self._entries.items()
+                if version == old_version and product_id not in stale_products
+            ]
+            for key, payload in carried:
+                self._store(key, payload)
+        if self._l2 is not None:
+            self._l2.carry_over(old_version, new_version, stale_products)
+        return len(carried)
+
+    def clear(self) -> None:
+        """Vacía el caché (ambos niveles)"""
+        with self._lock:
+            self._entries.clear()
+        if self._l2 is not None:
+            self._l2.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas del caché"""
+        l2_stats = self._l2.get_stats() if self._l2 is not None else None
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "stale_hits": self._stale_hits,
+                "expired": self._expired,
+                "refreshes": self._refreshes,
+                "refreshing": len(self._refreshing),
+                "soft_ttl": self._soft_ttl,
+                "hard_ttl": self._hard_ttl,
+                "l2_hits": self._l2_hits,
+                "l2": l2_stats,
+                "encodings": list(SUPPORTED_ENCODINGS)
+            }
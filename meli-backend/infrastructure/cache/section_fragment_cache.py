@@ -0,0 +1,145 @@
+"""Caché de fragmentos JSON por sección del detalle de producto"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import AbstractSet, Any, Dict, Mapping, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("MELI_SECTION_CACHE_MAX_ENTRIES", "8192"))
+
+# Fragmentos JSON de los campos de una sección, en el orden del DTO
+Fragments = Tuple[str, ...]
+
+
+class SectionFragmentCache:
+    """
+    Caché LRU de secciones ya serializadas, por (product_id, versión, sección).
+
+    Los fragmentos con el mismo contenido (ej: el mismo vendedor o la misma ruta
+    de categorías en varios SKUs) se almacenan una sola vez y se comparten.
+    Invalidar una sección de un producto no afecta a las demás.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Fragments]" = OrderedDict()
+        self._shared: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._shared_hits = 0
+
+    def get(self, product_id: str, version: str, section: str) -> Optional[Fragments]:
+        """Retorna los fragmentos cacheados de la sección o None"""
+        key = (product_id, version, section)
+        with self._lock:
+            fragments = self._entries.get(key)
+            if fragments is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return fragments
+
+    def put(self, product_id: str, version: str, section: str, fragments: Fragments) -> Fragments:
+        """
+        Almacena los fragmentos de una sección.
+
+        Args:
+            product_id: ID del producto
+            version: Versión del catálogo con la que se renderizó
+            section: Nombre de la sección
+            fragments: JSON de cada campo de la sección
+
+        Returns:
+            Fragmentos almacenados (compartidos si ya existía el mismo contenido)
+        """
+        key = (product_id, version, section)
+        with self._lock:
+            fragments = tuple(self._share(fragment) for fragment in fragments)
+            self._entries[key] = fragments
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return fragments
+
+    def _share(self, fragment: str) -> str:
+        shared = self._shared.get(fragment)
+        if shared is not None:
+            self._shared.move_to_end(fragment)
+            self._shared_hits += 1
+            return shared
+        self._shared[fragment] = fragment
+        while len(self._shared) > self._max_entries:
+            self._shared.popitem(last=False)
+        return fragment
+
+    def invalidate(self, product_id: str, section: Optional[str] = None) -> int:
+        """
+        Descarta los fragmentos de un producto (todas las versiones).
+
+        Args:
+            product_id: ID del producto
+            section: Sección a invalidar; None invalida todas
+
+        Returns:
+            Cantidad de entradas descartadas
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if key[0] == product_id and (section is None or key[2] == section)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def carry_over(self,
+                   old_version: str,
+                   new_version: str,
+                   stale: Mapping[str, AbstractSet[str]]) -> int:
+        """
+        Reutiliza los fragmentos de una versión anterior del catálogo.
+
+        Las secciones que no dependen de filas cambiadas quedan disponibles
+        para la versión nueva sin volver a consultarse ni serializarse.
+
+        Args:
+            old_version: Versión con la que se renderizaron
+            new_version: Versión nueva del catálogo
+            stale: Producto → secciones afectadas por el cambio (no se copian)
+
+        Returns:
+            Cantidad de secciones reutilizadas
+        """
+        with self._lock:
+            carried = [
+                ((product_id, new_version, section), fragments)
+                for (product_id, version, section), fragments in self._entries.items()
+                if version == old_version and section not in stale.get(product_id, ())
+            ]
+            for key, fragments in carried:
+                self._entries[key] = fragments
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return len(carried)
+
+    def clear(self) -> None:
+        """Vacía el caché"""
+        with self._lock:
+            self._entries.clear()
+            self._shared.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna estadísticas del caché"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "shared_fragments": len(self._shared),
+                "hits": self._hits,
+                "misses": self._misses,
+                "shared_hits": self._shared_hits
+            }
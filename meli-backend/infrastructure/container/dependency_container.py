@@ -3,6 +3,10 @@ Dependency Injection Container
 Inyecta todas las dependencias necesarias para el orquestador
 """
 
+import os
+import threading
+from typing import Any, Dict, Optional
+
 # Servicios
 from application.service.shipping_service import ShippingService
 from application.service.question_service import QuestionService
@@ -17,13 +21,41 @@ from application.service.seller_information_service import SellerInformationServ
 from application.service.category_path_service import CategoryPathService
 from application.service.product_detail_service import ProductDetailService
 from application.service.product_image_service import ProductImageService
+from application.service.product_listing_service import ProductListingService
+from application.service.product_revisions import ProductRevisions
+from application.service.question_write_service import QuestionWriteService, default_question_log
+from application.service.review_write_service import ReviewWriteService, default_review_log
 
 # Repositorios
+from infrastructure.persist.shipping.shipping_repository import ShippingRepository
+from infrastructure.persist.question.question_repository import QuestionRepository
+from infrastructure.persist.related_product.related_product_repository import RelatedProductRepository
+from infrastructure.persist.highlight.highlight_repository import HighlightRepository
+from infrastructure.persist.rating_category.rating_category_repository import RatingCategoryRepository
+from infrastructure.persist.characteristic.characteristic_repository import CharacteristicRepository
+from infrastructure.persist.review.review_repository import ReviewRepository
+from infrastructure.persist.payment.payment_repository import PaymentRepository
+from infrastructure.persist.seller_information.seller_information_repository import SellerInformationRepository
 from infrastructure.persist.category_path.category_path_repository import CategoryPathRepository
 from infrastructure.persist.product_detail.product_detail_repository import ProductDetailRepository
 from infrastructure.persist.product_image.product_image_repository import ProductImageRepository
 from infrastructure.persist.product_variant.product_variant_mapping_repository import ProductVariantMappingRepository
 from infrastructure.persist.product_variant.variant_repository import VariantRepository
+from infrastructure.persist.append_log.append_log import AppendLog
+
+# Catálogo
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, source_fingerprint
+from infrastructure.persist.catalog.catalog_loader import load_catalog
+from infrastructure.persist.catalog.catalog_watcher import CatalogWatcher
+from application.service.catalog_dependency_tracker import CatalogUpdate, plan_catalog_update
+
+# Caché de respuestas
+from infrastructure.cache.disk_payload_cache import default_disk_cache
+from infrastructure.cache.payload_pack import MmapPayloadPack, default_payload_pack
+from infrastructure.cache.product_response_cache import ProductResponseCache
+from infrastructure.cache.section_fragment_cache import SectionFragmentCache
+from infrastructure.api.FastAPI.global_fragments import GlobalSectionFragments
+from infrastructure.api.FastAPI.section_assembler import SectionAssembler
 
 # Mappers
 from infrastructure.persist.category_path.category_path_mapper import CategoryPathMapper
@@ -32,6 +64,7 @@ from infrastructure.persist.product_image.product_image_mapper import ProductIma
 
 # Orquestador
 from application.service.detail_product_orchestrator_service import DetailProductService
+from application.service.coalescing_detail_product_service import CoalescingDetailProductService
 
 
 class DependencyContainer:
@@ -39,20 +72,41 @@ class DependencyContainer:
     Container de inyección de dependencias siguiendo Clean Architecture
     """
 
-    def __init__(self):
-        # Instanciar servicios (cada servicio instancia su repositorio CSV internamente)
-        self._shipping_service = ShippingService()
-        self._question_service = QuestionService()
-        self._related_product_service = RelatedProductService()
-        self._highlight_service = HighlightService()
-        self._rating_category_service = RatingCategoryService()
-        self._characteristic_service = CharacteristicService()
-        self._review_statistics_service = ReviewStatisticsService()
-        self._payment_service = PaymentService()
-        self._seller_information_service = SellerInformationService()
+    def __init__(self,
+                 catalog: Optional[ICatalogSnapshot] = None,
+                 previous: Optional["DependencyContainer"] = None,
+                 review_log: Optional[AppendLog] = None,
+                 question_log: Optional[AppendLog] = None):
+        """
+        Args:
+            catalog: Snapshot del catálogo (por defecto, según MELI_CATALOG_MODE)
+            previous: Container de la versión anterior del catálogo, del que se
+                heredan los cachés de payloads y fragmentos, el pack materializado
+                y los logs de escrituras
+            review_log: Log de reviews escritas por la API (por defecto, MELI_REVIEW_LOG_PATH)
+            question_log: Log de preguntas y respuestas escritas por la API
+                (por defecto, MELI_QUESTION_LOG_PATH)
+        """
+        # Snapshot del catálogo compartido por todos los repositorios
+        # (modo según MELI_CATALOG_MODE: memoria del proceso o archivo mmap compartido)
+        self._catalog = catalog if catalog is not None else load_catalog()
+        catalog = self._catalog
+
+        # Instanciar servicios con sus repositorios sobre el catálogo
+        self._shipping_service = ShippingService(ShippingRepository(catalog))
+        question_repository = QuestionRepository(catalog)
+        self._question_service = QuestionService(question_repository)
+        self._related_product_service = RelatedProductService(RelatedProductRepository(catalog))
+        self._highlight_service = HighlightService(HighlightRepository(catalog))
+        self._rating_category_service = RatingCategoryService(RatingCategoryRepository(catalog))
+        self._characteristic_service = CharacteristicService(CharacteristicRepository(catalog))
+        review_repository = ReviewRepository(catalog)
+        self._review_statistics_service = ReviewStatisticsService(review_repository)
+        self._payment_service = PaymentService(PaymentRepository(catalog))
+        self._seller_information_service = SellerInformationService(SellerInformationRepository(catalog))
 
         # Instanciar CategoryPathService con repositorio y mapper
-        category_path_repository = CategoryPathRepository()
+        category_path_repository = CategoryPathRepository(catalog)
         category_path_mapper = CategoryPathMapper()
         self._category_path_service = CategoryPathService(
             repository=category_path_repository,
@@ -60,7 +114,7 @@ class DependencyContainer:
         )
 
         # Instanciar ProductDetailService con repositorio y mapper
-        product_detail_repository = ProductDetailRepository()
+        product_detail_repository = ProductDetailRepository(catalog)
         product_detail_mapper = ProductDetailMapper()
         self._product_detail_service = ProductDetailService(
             repository=product_detail_repository,
@@ -68,7 +122,7 @@ class DependencyContainer:
         )
 
         # Instanciar ProductImageService con repositorio y mapper
-        product_image_repository = ProductImageRepository()
+        product_image_repository = ProductImageRepository(catalog)
         product_image_mapper = ProductImageMapper()
         self._product_image_service = ProductImageService(
             repository=product_image_repository,
@@ -76,13 +130,38 @@ class DependencyContainer:
         )
 
         # Instanciar VariantProductService unificado con ambos repositorios
-        variant_repository = VariantRepository()
-        product_variant_mapping_repository = ProductVariantMappingRepository()
+        variant_repository = VariantRepository(catalog)
+        product_variant_mapping_repository = ProductVariantMappingRepository(catalog)
         self._variant_product_service = VariantProductService(
             variant_repository=variant_repository,
             mapping_repository=product_variant_mapping_repository
         )
 
+        # Listados sobre el almacén columnar de atributos numéricos
+        self._product_listing_service = ProductListingService(catalog)
+
+        # Escrituras de la API (reviews, preguntas y respuestas): durables en un log de solo agregado y
+        # aplicadas a los índices en memoria; cada una suma una revisión al
+        # producto. Al crearse, el servicio aplica lo que haya en el log
+        self._product_revisions = ProductRevisions()
+        if review_log is None:
+            review_log = previous.get_review_write_service().get_log() if previous is not None else default_review_log()
+        self._review_write_service = ReviewWriteService(
+            review_repository,
+            self._product_detail_service,
+            review_log,
+            self._product_revisions
+        )
+        if question_log is None:
+            question_log = (previous.get_question_write_service().get_log() if previous is not None
+                            else default_question_log())
+        self._question_write_service = QuestionWriteService(
+            question_repository,
+            self._product_detail_service,
+            question_log,
+            self._product_revisions
+        )
+
         # Instanciar orquestador con todos los servicios
         self._detail_product_service = DetailProductService(
             shipping_service=self._shipping_service,
@@ -100,12 +179,128 @@ class DependencyContainer:
             product_image_service=self._product_image_service
         )
 
+        # Capa single-flight delante del orquestador
+        self._coalescing_detail_product_service = CoalescingDetailProductService(
+            self._detail_product_service
+        )
+
+        # Payloads renderizados (y sus variantes comprimidas) por versión del catálogo:
+        # L1 en memoria delante de un L2 en disco compartido por los workers del nodo
+        if previous is not None:
+            self._product_response_cache = previous.get_product_response_cache()
+        else:
+            self._product_response_cache = ProductResponseCache(l2=default_disk_cache())
+
+        # Payloads materializados offline (MELI_PAYLOAD_PACK), servidos vía mmap
+        self._payload_pack = previous.get_payload_pack() if previous is not None else default_payload_pack()
+
+        # Secciones globales (pagos, categorías de rating) serializadas una vez por versión
+        self._global_section_fragments = GlobalSectionFragments(
+            self._payment_service,
+            self._rating_category_service
+        )
+
+        # JSON del detalle armado a partir de fragmentos cacheados por sección
+        self._section_fragment_cache = (
+            previous.get_section_fragment_cache() if previous is not None else SectionFragmentCache()
+        )
+        self._section_assembler = SectionAssembler(
+            self._coalescing_detail_product_service,
+            self._section_fragment_cache,
+            self._global_section_fragments,
+            revisions=self._product_revisions
+        )
+
+    def get_catalog(self) -> ICatalogSnapshot:
+        """
+        Retorna el snapshot del catálogo usado por los repositorios
+        """
+        return self._catalog
+
     def get_detail_product_service(self) -> DetailProductService:
         """
         Retorna el servicio orquestador con todas las dependencias inyectadas
         """
         return self._detail_product_service
 
+    def get_coalescing_detail_product_service(self) -> CoalescingDetailProductService:
+        """
+        Retorna el orquestador envuelto en la capa single-flight (usado por la API)
+        """
+        return self._coalescing_detail_product_service
+
+    def get_product_response_cache(self) -> ProductResponseCache:
+        """
+        Retorna el caché de payloads renderizados de detalle de producto
+        """
+        return self._product_response_cache
+
+    def get_payload_pack(self) -> Optional[MmapPayloadPack]:
+        """
+        Retorna el pack de payloads materializados offline (None si no está configurado)
+        """
+        return self._payload_pack
+
+    def get_global_section_fragments(self) -> GlobalSectionFragments:
+        """
+        Retorna los fragmentos JSON de las secciones globales del detalle
+        """
+        return self._global_section_fragments
+
+    def get_section_fragment_cache(self) -> SectionFragmentCache:
+        """
+        Retorna el caché de fragmentos JSON por sección
+        """
+        return self._section_fragment_cache
+
+    def get_product_revisions(self) -> ProductRevisions:
+        """
+        Retorna las revisiones por producto de los datos escritos por la API
+        """
+        return self._product_revisions
+
+    def get_review_write_service(self) -> ReviewWriteService:
+        """
+        Retorna el servicio de alta de reviews
+        """
+        return self._review_write_service
+
+    def get_question_write_service(self) -> QuestionWriteService:
+        """
+        Retorna el servicio de alta de preguntas y respuestas
+        """
+        return self._question_write_service
+
+    def start_background_writers(self) -> None:
+        """
+        Inicia el seguimiento de los logs de escrituras (lo que escriben los
+        otros workers) y su compactación en segundo plano
+        """
+        self._review_write_service.start()
+        self._question_write_service.start()
+
+    def stop_background_writers(self) -> None:
+        """
+        Detiene el seguimiento y la compactación de los logs de escrituras
+        """
+        self._review_write_service.stop()
+        self._question_write_service.stop()
+
+    def close(self) -> None:
+        """
+        Libera los hilos propios del container (seguimiento de los logs y pool
+        de secciones del orquestador). Los cachés y los logs, compartidos con
+        el container que lo reemplaza, quedan abiertos.
+        """
+        self.stop_background_writers()
+        self._detail_product_service.close()
+
+    def get_section_assembler(self) -> SectionAssembler:
+        """
+        Retorna el ensamblador del JSON de detalle por secciones
+        """
+        return self._section_assembler
+
     # Getters para servicios individuales (si se necesitan)
     def get_shipping_service(self) -> ShippingService:
         return self._shipping_service
@@ -145,3 +340,124 @@ class DependencyContainer:
 
     def get_product_image_service(self) -> ProductImageService:
         return self._product_image_service
+
+    def get_product_listing_service(self) -> ProductListingService:
+        return self._product_listing_service
+
+
+# Segundos que el container reemplazado por una recarga sigue atendiendo las
+# peticiones que ya lo habían tomado antes de liberar sus hilos
+CONTAINER_RETIRE_GRACE = float(os.getenv("MELI_CONTAINER_RETIRE_GRACE", "30"))
+
+_default_container: Optional[DependencyContainer] = None
+_default_container_lock = threading.Lock()
+# Una sola recarga a la vez (seguimiento de los CSV y POST de monitoreo)
+_reload_lock = threading.Lock()
+_catalog_watcher: Optional[CatalogWatcher] = None
+
+
+def get_default_container() -> DependencyContainer:
+    """
+    Retorna el container compartido del proceso, creándolo en el primer uso.
+
+    Los routers lo comparten para que cada worker cargue (o adjunte) el
+    catálogo una sola vez. La creación está protegida por un lock: el
+    warm-up del arranque y las primeras peticiones pueden pedirlo a la vez.
+    """
+    global _default_container
+    if _default_container is None:
+        with _default_container_lock:
+            if _default_container is None:
+                _default_container = DependencyContainer()
+    return _default_container
+
+
+def reload_default_container(catalog: Optional[ICatalogSnapshot] = None,
+                             retire_grace: float = CONTAINER_RETIRE_GRACE) -> Dict[str, Any]:
+    """
+    Cambia el container del proceso a una versión nueva del catálogo.
+
+    Los cachés sobreviven al cambio: se compara el catálogo nuevo con el
+    anterior fila a fila y solo se descartan los payloads y las secciones de
+    los productos afectados; el resto se reutiliza con la versión nueva. Si
+    los CSV no cambiaron desde la carga anterior (misma huella) no se vuelven
+    a leer. En modo compartido load_catalog recompila el snapshot.
+
+    El container anterior libera sus hilos pasados retire_grace segundos,
+    cuando ya terminaron las peticiones que lo estaban usando.
+
+    Args:
+        catalog: Snapshot nuevo (por defecto, se vuelve a cargar según MELI_CATALOG_MODE)
+        retire_grace: Segundos antes de cerrar el container reemplazado
+
+    Returns:
+        Resumen del cambio (tablas, productos y secciones afectados, entradas reutilizadas)
+    """
+    global _default_container
+    with _reload_lock:
+        old_catalog = get_default_container().get_catalog()
+        if catalog is None and old_catalog.source is not None and old_catalog.source == source_fingerprint():
+            return {"old_version": old_catalog.version, "new_version": old_catalog.version, "changed": False}
+        catalog = catalog if catalog is not None else load_catalog()
+        with _default_container_lock:
+            current = _default_container
+            old_catalog = current.get_catalog()
+            if catalog.version == old_catalog.version:
+                return {"old_version": old_catalog.version, "new_version": catalog.version, "changed": False}
+
+            update: CatalogUpdate = plan_catalog_update(old_catalog, catalog)
+            carried_sections = current.get_section_fragment_cache().carry_over(
+                old_catalog.version, catalog.version, update.affected
+            )
+            carried_payloads = current.get_product_response_cache().carry_over(
+                old_catalog.version, catalog.version, update.stale_products
+            )
+            # El container nuevo vuelve a aplicar el log sobre el catálogo nuevo
+            _default_container = DependencyContainer(catalog, previous=current)
+            if current.get_review_write_service().running or current.get_question_write_service().running:
+                current.stop_background_writers()
+                _default_container.start_background_writers()
+        _retire(current, retire_grace)
+
+    summary = update.to_dict()
+    summary.update(changed=True, carried_sections=carried_sections, carried_payloads=carried_payloads)
+    return summary
+
+
+def _retire(container: DependencyContainer, grace: float) -> None:
+    """Cierra el container reemplazado pasado el período de gracia"""
+    if grace <= 0:
+        container.close()
+        return
+    timer = threading.Timer(grace, container.close)
+    timer.daemon = True
+    timer.start()
+
+
+def start_catalog_watcher() -> CatalogWatcher:
+    """
+    Inicia el seguimiento de los CSV del catálogo en este worker: cada worker
+    recarga su container por su cuenta cuando los CSV cambian
+    (MELI_CATALOG_POLL_INTERVAL).
+    """
+    global _catalog_watcher
+    if _catalog_watcher is None:
+        _catalog_watcher = CatalogWatcher(reload_default_container,
+                                          source=get_default_container().get_catalog().source)
+    _catalog_watcher.start()
+    return _catalog_watcher
+
+
+def get_catalog_watcher() -> Optional[CatalogWatcher]:
+    """Retorna el seguimiento de los CSV del proceso (None si no se inició)"""
+    return _catalog_watcher
+
+
+def shutdown_default_container() -> None:
+    """Detiene los procesos en segundo plano del container del proceso (si se creó)"""
+    global _catalog_watcher
+    watcher, _catalog_watcher = _catalog_watcher, None
+    if watcher is not None:
+        watcher.stop()
+    if _default_container is not None:
+        _default_container.stop_background_writers()
@@ -0,0 +1,380 @@
+"""
+Log de solo agregado (JSON lines) con group commit.
+
+Las escrituras de los datos del catálogo que cambian en caliente (reviews,
+preguntas) se registran primero en un log durable. Cada append espera a que su
+registro esté en disco, pero el fsync se hace por lotes: un hilo escritor junta
+los registros que llegan mientras el disco está ocupado (hasta max_batch, o
+max_delay desde el primero) y los escribe y sincroniza juntos.
+
+Varios procesos pueden compartir el archivo: cada lote se escribe con un único
+write en modo O_APPEND, y los demás workers siguen el log con follow. La
+compactación vuelca el log a los datos base y lo rota: el archivo compactado
+se archiva como <path>.<generación> y se empieza uno nuevo cuya primera línea
+indica la generación siguiente. Nunca se trunca en el lugar: un worker que no
+terminó de leer la generación anterior la sigue leyendo del archivo
+archivado. La compactación toma un lock exclusivo del archivo; las
+escrituras, uno compartido (y se reabre el archivo si otro proceso lo rotó).
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: sin coordinación entre procesos
+    fcntl = None
+
+DEFAULT_MAX_BATCH = int(os.getenv("MELI_LOG_MAX_BATCH", "256"))
+DEFAULT_MAX_DELAY_MS = float(os.getenv("MELI_LOG_MAX_DELAY_MS", "2"))
+
+Record = Dict[str, Any]
+
+# Primera línea de cada archivo rotado: {"log_generation":N}. Un log sin esa
+# línea es la generación 0
+_GENERATION_KEY = "log_generation"
+_HEADER_PREFIX = b'{"log_generation":'
+
+
+class LogPosition(NamedTuple):
+    """Punto de lectura de un log: generación y offset dentro de su archivo"""
+    generation: int
+    offset: int
+
+
+class LogRead(NamedTuple):
+    """Resultado de seguir un log (ver AppendLog.follow)"""
+    records: List[Record]
+    position: LogPosition
+    # Se compactaron registros que el lector no llegó a leer: ya están en los
+    # datos base, que el lector debe volver a cargar
+    missed: bool
+
+
+def _encode(record: Record) -> bytes:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _read_header(file: IO[bytes]) -> Tuple[int, int]:
+    """(generación, offset del primer registro) de un archivo del log"""
+    first = file.readline()
+    if first.startswith(_HEADER_PREFIX) and first.endswith(b"\n"):
+        return json.loads(first)[_GENERATION_KEY], len(first)
+    return 0, 0
+
+
+def _read_records(file: IO[bytes], offset: int) -> Tuple[List[Record], int]:
+    """Registros completos a partir de offset y el offset siguiente"""
+    file.seek(offset)
+    data = file.read()
+    end = data.rfind(b"\n") + 1
+    return [json.loads(line) for line in data[:end].splitlines() if line.strip()], offset + end
+
+
+class _Batch:
+    """Lote de registros que se vuelven durables con un mismo fsync"""
+
+    def __init__(self):
+        self.lines: List[bytes] = []
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class AppendLog:
+    """
+    Log durable de registros JSON, uno por línea.
+
+    append es bloqueante hasta el fsync del lote que contiene al registro; el
+    archivo se abre y el hilo escritor se crea en la primera escritura (leer un
+    log que no existe no lo crea).
+    """
+
+    def __init__(self,
+                 path: str,
+                 max_batch: int = DEFAULT_MAX_BATCH,
+                 max_delay: float = DEFAULT_MAX_DELAY_MS / 1000):
+        if max_batch < 1:
+            raise ValueError("max_batch must be positive")
+        self.path = path
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._fd: Optional[int] = None
+        # flock es por descripción de archivo: entre hilos del mismo proceso
+        # la exclusión entre escritor y compactación la da este lock
+        self._io_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._batch = _Batch()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._records = 0
+        self._batches = 0
+
+    def append(self, record: Record) -> None:
+        """
+        Agrega un registro y espera a que esté en disco.
+
+        Raises:
+            OSError: Si el lote no se pudo escribir (el registro no es durable)
+        """
+        line = _encode(record)
+        with self._condition:
+            if self._closed:
+                raise ValueError("append log is closed")
+            batch = self._batch
+            batch.lines.append(line)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_batches, name="append-log", daemon=True)
+                self._writer.start()
+            self._condition.notify_all()
+        batch.done.wait()
+        if batch.error is not None:
+            raise batch.error
+
+    def _write_batches(self) -> None:
+        while True:
+            with self._condition:
+                while not self._batch.lines and not self._closed:
+                    self._condition.wait()
+                if not self._batch.lines:
+                    return
+                # Se espera un poco a que se sumen más registros al lote
+                deadline = time.monotonic() + self._max_delay
+                while len(self._batch.lines) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._batch = self._batch, _Batch()
+
+            try:
+                data = b"".join(batch.lines)
+                with self._io_lock, self._locked_file(exclusive=False) as fd:
+                    written = os.write(fd, data)
+                    while written < len(data):
+                        written += os.write(fd, data[written:])
+                    os.fsync(fd)
+                with self._condition:
+                    self._records += len(batch.lines)
+                    self._batches += 1
+            except BaseException as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+
+    def _open(self) -> int:
+        # Se llama con _io_lock tomado
+        if self._fd is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _is_current(self, fd: int) -> bool:
+        """Indica si fd sigue siendo el archivo del log (otro proceso pudo rotarlo)"""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+    @contextmanager
+    def _locked_file(self, exclusive: bool) -> Iterator[int]:
+        """flock del archivo actual del log; se llama con _io_lock tomado"""
+        while True:
+            fd = self._open()
+            with _FileLock(fd, exclusive):
+                if self._is_current(fd):
+                    yield fd
+                    return
+            # El archivo abierto es una generación ya rotada: se abre el actual
+            os.close(fd)
+            self._fd = None
+
+    def _archive_path(self, generation: int) -> str:
+        return f"{self.path}.{generation}"
+
+    def read_from(self, offset: int = 0) -> Tuple[List[Record], int]:
+        """
+        Lee los registros completos de la generación actual a partir de un offset.
+
+        Returns:
+            (registros, offset siguiente); una línea a medio escribir por otro
+            proceso queda para la próxima lectura. Para seguir el log a través
+            de las compactaciones se usa follow
+        """
+        try:
+            with open(self.path, 'rb') as file:
+                _, start = _read_header(file)
+                return _read_records(file, max(offset, start))
+        except FileNotFoundError:
+            return [], 0
+
+    def _read_archive(self, generation: int, offset: int) -> Optional[List[Record]]:
+        """Registros de una generación archivada a partir de offset (None si ya no está)"""
+        try:
+            with open(self._archive_path(generation), 'rb') as file:
+                _, start = _read_header(file)
+                return _read_records(file, max(offset, start))[0]
+        except FileNotFoundError:
+            return None
+
+    def follow(self, position: Optional[LogPosition] = None) -> LogRead:
+        """
+        Lee los registros posteriores a una posición, aunque el log se haya
+        compactado desde la lectura anterior.
+
+        Si el log rotó, primero se termina de leer la generación de la
+        posición (archivada) y después se sigue desde el principio de la
+        actual. Solo se conserva la última generación archivada: un lector
+        más atrasado recibe missed=True. Un lector nuevo (sin posición)
+        también lee la última generación archivada: sus datos base pudieron
+        cargarse antes de esa compactación. Quien lee debe ignorar los
+        registros repetidos.
+
+        Args:
+            position: Posición retornada por la lectura anterior (None: desde el principio)
+
+        Returns:
+            LogRead con los registros, la posición siguiente y si se perdieron generaciones
+        """
+        try:
+            file = open(self.path, 'rb')
+        except FileNotFoundError:
+            return LogRead([], position or LogPosition(0, 0), False)
+        with file:
+            generation, start = _read_header(file)
+            records: List[Record] = []
+            missed = False
+            if position is not None and position.generation == generation:
+                start = max(position.offset, start)
+            elif position is None:
+                if generation > 0:
+                    records.extend(self._read_archive(generation - 1, 0) or [])
+            else:
+                archived = (self._read_archive(position.generation, position.offset)
+                            if position.generation == generation - 1 else None)
+                missed = archived is None
+                records.extend(archived or [])
+            current, offset = _read_records(file, start)
+        records.extend(current)
+        return LogRead(records, LogPosition(generation, offset), missed)
+
+    def generation(self) -> int:
+        """Generación actual del log (cantidad de compactaciones)"""
+        try:
+            with open(self.path, 'rb') as file:
+                return _read_header(file)[0]
+        except FileNotFoundError:
+            return 0
+
+    def size(self) -> int:
+        """Bytes de registros de la generación actual"""
+        try:
+            with open(self.path, 'rb') as file:
+                _, start = _read_header(file)
+                return os.fstat(file.fileno()).st_size - start
+        except FileNotFoundError:
+            return 0
+
+    def compact(self, merge: Callable[[List[Record]], None]) -> int:
+        """
+        Vuelca el log a los datos base y lo rota.
+
+        merge recibe todos los registros de la generación actual y debe
+        dejarlos persistidos (ej: reescribiendo el CSV de forma atómica). Si
+        falla, el log queda intacto. Mientras dura, las escrituras de todos
+        los procesos esperan; después siguen en la generación nueva.
+
+        Returns:
+            Cantidad de registros compactados
+        """
+        with self._io_lock, self._locked_file(exclusive=True):
+            with open(self.path, 'rb') as file:
+                generation, start = _read_header(file)
+                records, _ = _read_records(file, start)
+            if not records:
+                return 0
+            merge(records)
+            self._rotate(generation)
+        return len(records)
+
+    def _rotate(self, generation: int) -> None:
+        """
+        Archiva la generación compactada y publica un archivo nuevo para la
+        siguiente (con el lock exclusivo tomado). El archivo del log existe
+        en todo momento: el nuevo reemplaza al anterior de forma atómica.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(self.path)}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(_encode({_GENERATION_KEY: generation + 1}))
+                file.flush()
+                os.fsync(file.fileno())
+            archive = self._archive_path(generation)
+            if os.path.exists(archive):
+                os.remove(archive)
+            os.link(self.path, archive)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        # Se conserva solo la última generación archivada
+        try:
+            os.remove(self._archive_path(generation - 1))
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retorna registros y lotes escritos por este proceso"""
+        with self._condition:
+            return {
+                "path": self.path,
+                "generation": self.generation(),
+                "bytes": self.size(),
+                "records": self._records,
+                "batches": self._batches,
+                "pending": len(self._batch.lines),
+                "records_per_batch": round(self._records / self._batches, 2) if self._batches else None
+            }
+
+    def close(self) -> None:
+        """Escribe lo pendiente y cierra el archivo"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+        with self._io_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class _FileLock:
+    """flock del archivo del log (no-op sin fcntl)"""
+
+    def __init__(self, fd: int, exclusive: bool):
+        self._fd = fd
+        self._exclusive = exclusive
+
+    def __enter__(self) -> int:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX if self._exclusive else fcntl.LOCK_SH)
+        return self._fd
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return False
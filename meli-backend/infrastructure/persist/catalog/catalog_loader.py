@@ -0,0 +1,86 @@
+"""Selección del modo de carga del catálogo según el entorno"""
+
+import os
+import tempfile
+from typing import Optional
+
+from infrastructure.persist.catalog.catalog_snapshot import (
+    PERSIST_DIR,
+    CatalogSnapshot,
+    ICatalogSnapshot,
+    source_fingerprint
+)
+from infrastructure.persist.catalog.catalog_validator import validate_catalog
+from infrastructure.persist.catalog.shared_catalog import MmapCatalogSnapshot, compile_snapshot
+
+# Variables de entorno
+CATALOG_MODE_ENV = "MELI_CATALOG_MODE"
+CATALOG_FILE_ENV = "MELI_CATALOG_FILE"
+
+# Modos de carga
+MODE_MEMORY = "memory"  # Cada proceso parsea los CSV en su propia memoria
+MODE_SHARED = "shared"  # Los workers adjuntan un snapshot compilado vía mmap
+
+DEFAULT_CATALOG_FILE = os.path.join(tempfile.gettempdir(), "meli_catalog.snapshot")
+
+
+def load_validated_snapshot(base_dir: str = PERSIST_DIR) -> CatalogSnapshot:
+    """
+    Carga los CSV y ejecuta la validación de carga sobre el snapshot.
+
+    El snapshot queda marcado como validado solo si el reporte no tiene
+    errores; en ese caso los repositorios omiten la validación por objeto.
+
+    Args:
+        base_dir: Directorio raíz de los repositorios CSV
+
+    Returns:
+        CatalogSnapshot con validated y validation_report asignados
+    """
+    snapshot = CatalogSnapshot.load(base_dir)
+    report = validate_catalog(snapshot)
+    snapshot.validated = report.ok
+    snapshot.validation_report = report.to_dict()
+    if report.issues:
+        print(report.summary())
+    return snapshot
+
+
+def load_catalog(mode: Optional[str] = None, snapshot_path: Optional[str] = None) -> ICatalogSnapshot:
+    """
+    Carga el catálogo en el modo indicado (por defecto, el de MELI_CATALOG_MODE).
+
+    En modo compartido se adjunta el archivo de MELI_CATALOG_FILE. Si todavía no
+    existe (por ejemplo, un worker levantado sin el proceso padre) o fue
+    compilado a partir de otros CSV (un snapshot de un despliegue anterior en
+    /tmp, o CSV editados desde entonces) se compila en el momento; la escritura
+    atómica hace que compilaciones concurrentes sean inofensivas.
+
+    Args:
+        mode: MODE_MEMORY o MODE_SHARED
+        snapshot_path: Ruta del snapshot compartido
+
+    Returns:
+        Snapshot del catálogo listo para los repositorios
+    """
+    mode = mode or os.getenv(CATALOG_MODE_ENV, MODE_MEMORY)
+
+    if mode == MODE_MEMORY:
+        return load_validated_snapshot()
+
+    if mode == MODE_SHARED:
+        path = snapshot_path or os.getenv(CATALOG_FILE_ENV, DEFAULT_CATALOG_FILE)
+        if os.path.exists(path):
+            try:
+                catalog = MmapCatalogSnapshot(path)
+            except ValueError:
+                catalog = None
+            if catalog is not None and catalog.source == source_fingerprint():
+                return catalog
+            if catalog is not None:
+                print(f"Catalog snapshot {path} does not match the current CSVs, recompiling")
+                catalog.close()
+        compile_snapshot(load_validated_snapshot(), path)
+        return MmapCatalogSnapshot(path)
+
+    raise ValueError(f"Unknown catalog mode: {mode}")
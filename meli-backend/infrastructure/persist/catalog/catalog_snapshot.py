@@ -0,0 +1,316 @@
+"""Snapshot del catálogo CSV cargado una sola vez en memoria"""
+
+import csv
+import hashlib
+import io
+import os
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+# Directorio raíz de los repositorios CSV (infrastructure/persist)
+PERSIST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tablas del catálogo: nombre → (ruta del CSV relativa a PERSIST_DIR, columna clave)
+# Las tablas globales no tienen columna clave y se indexan bajo GLOBAL_KEY
+CATALOG_TABLES: Dict[str, Tuple[str, Optional[str]]] = {
+    "category_path": ("category_path/data/category_path.csv", "product_id"),
+    "characteristic": ("characteristic/data/characteristic.csv", "product_id"),
+    "highlight": ("highlight/data/highlight.csv", "product_id"),
+    "payment": ("payment/data/payment.csv", None),
+    "product_detail": ("product_detail/data/product_detail.csv", "product_id"),
+    "product_image": ("product_image/data/product_image.csv", "product_id"),
+    "variant": ("product_variant/data/variant.csv", "product_id"),
+    "variant_product_mapping": ("product_variant/data/variant_product_mapping.csv", "base_product_id"),
+    "question": ("question/data/question.csv", "product_id"),
+    "rating_category": ("rating_category/data/rating_category.csv", None),
+    "related_product": ("related_product/data/related_product.csv", "product_id"),
+    "related_product_computed": ("related_product/data/related_product_computed.csv", "product_id"),
+    "review": ("review/data/review.csv", "product_id"),
+    "seller": ("seller_information/data/seller.csv", "seller_id"),
+    "product_seller": ("seller_information/data/product_seller.csv", "product_id"),
+    "shipping": ("shipping/data/shipping.csv", "product_id"),
+}
+
+GLOBAL_KEY = ""
+
+Row = Dict[str, str]
+
+T = TypeVar("T")
+
+# Código reservado para valores ausentes (filas con menos campos que el header)
+NULL_CODE = 0
+
+
+class StringTable:
+    """
+    Diccionario de strings compartido por todas las tablas del catálogo.
+
+    Cada valor distinto (URL, ícono, nombre de característica, href...) se
+    guarda una sola vez, internado, y las filas lo referencian por su código.
+    """
+
+    def __init__(self):
+        self.strings: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        """Retorna el código del valor, agregándolo si no existe"""
+        if value is None:
+            return NULL_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            value = sys.intern(value)
+            self._codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def code_of(self, value: str) -> Optional[int]:
+        """Retorna el código de un valor existente (None si nunca apareció)"""
+        return self._codes.get(value)
+
+    def __len__(self) -> int:
+        return len(self.strings) - 1
+
+
+class EncodedTable(NamedTuple):
+    """Tabla codificada: filas agrupadas por clave como códigos contiguos"""
+    columns: List[str]
+    # Códigos de todas las filas, fila tras fila (len(columns) códigos por fila)
+    codes: array
+    # Código de la clave → (primera fila, cantidad de filas), en orden de aparición
+    index: Dict[int, Tuple[int, int]]
+
+
+class ICatalogSnapshot(ABC):
+    """
+    Vista de solo lectura sobre las tablas del catálogo.
+
+    Cada tabla se indexa por su columna clave (product_id en la mayoría)
+    y conserva el orden original de las filas del CSV dentro de cada clave.
+    """
+
+    version: str
+    last_modified: float
+    # True cuando las filas pasaron la validación de carga: los repositorios
+    # pueden construir entidades con el constructor trusted (sin __post_init__)
+    validated: bool = False
+    # Reporte de la validación de carga (ValidationReport.to_dict), si se ejecutó
+    validation_report: Optional[Dict[str, Any]] = None
+    # Huella de los CSV de origen al cargar (ver source_fingerprint)
+    source: Optional[str] = None
+
+    @abstractmethod
+    def get_rows(self, table: str, key: str) -> List[Row]:
+        """Retorna las filas de la tabla asociadas a la clave (lista vacía si no existe)"""
+
+    def has_key(self, table: str, key: str) -> bool:
+        """Indica si la tabla tiene filas para la clave"""
+        return bool(self.get_rows(table, key))
+
+    @abstractmethod
+    def keys(self, table: str) -> List[str]:
+        """Retorna todas las claves presentes en la tabla"""
+
+    @abstractmethod
+    def columns(self, table: str) -> List[str]:
+        """Retorna los nombres de columna de la tabla"""
+
+    def get_all(self, table: str) -> List[Row]:
+        """Retorna todas las filas de la tabla"""
+        rows = []
+        for key in self.keys(table):
+            rows.extend(self.get_rows(table, key))
+        return rows
+
+
+class CatalogSnapshot(ICatalogSnapshot):
+    """
+    Snapshot del catálogo en memoria del proceso.
+
+    Parsea todos los CSV una sola vez y agrupa las filas por clave, de modo que
+    cada búsqueda es un acceso a diccionario en lugar de recorrer el archivo.
+
+    Las filas se guardan codificadas con diccionario: cada valor es un código
+    entero (array compacto) sobre un StringTable compartido, y los strings se
+    decodifican a las mismas instancias internadas en cada get_rows.
+    """
+
+    def __init__(self,
+                 tables: Dict[str, EncodedTable],
+                 strings: StringTable,
+                 version: str,
+                 last_modified: float):
+        self._tables = tables
+        self._strings = strings
+        self.version = version
+        self.last_modified = last_modified
+
+    @classmethod
+    def load(cls, base_dir: str = PERSIST_DIR) -> "CatalogSnapshot":
+        """
+        Carga todas las tablas de CATALOG_TABLES desde base_dir.
+
+        La versión del snapshot es un hash del contenido de los CSV, por lo que
+        dos cargas sobre los mismos datos producen la misma versión.
+
+        Args:
+            base_dir: Directorio raíz de los repositorios CSV
+
+        Returns:
+            CatalogSnapshot con todas las tablas indexadas
+        """
+        # La huella se toma antes de leer: si un CSV cambia durante la carga,
+        # la próxima comparación ya no coincide y el snapshot se vuelve a compilar
+        source = source_fingerprint(base_dir)
+        tables: Dict[str, EncodedTable] = {}
+        strings = StringTable()
+        digest = hashlib.sha256()
+        last_modified = 0.0
+
+        for table, (relative_path, key_column) in CATALOG_TABLES.items():
+            path = os.path.join(base_dir, relative_path)
+            if not os.path.exists(path):
+                tables[table] = EncodedTable([], array('I'), {})
+                continue
+
+            with open(path, 'r', encoding='utf-8') as file:
+                content = file.read()
+            digest.update(table.encode('utf-8'))
+            digest.update(content.encode('utf-8'))
+            last_modified = max(last_modified, os.path.getmtime(path))
+
+            reader = csv.reader(io.StringIO(content))
+            columns = [sys.intern(column) for column in next(reader, [])]
+            key_position = columns.index(key_column) if key_column else None
+
+            # Agrupar por clave conservando el orden del CSV dentro de cada clave
+            grouped: Dict[int, List[List[int]]] = {}
+            for values in reader:
+                if not values:
+                    # Líneas vacías (DictReader también las omite)
+                    continue
+                values = values[:len(columns)] + [None] * (len(columns) - len(values))
+                codes = [strings.encode(value) for value in values]
+                key_code = codes[key_position] if key_position is not None else strings.encode(GLOBAL_KEY)
+                grouped.setdefault(key_code, []).append(codes)
+
+            encoded = array('I')
+            index: Dict[int, Tuple[int, int]] = {}
+            for key_code, rows in grouped.items():
+                index[key_code] = (len(encoded) // max(len(columns), 1), len(rows))
+                for codes in rows:
+                    encoded.extend(codes)
+            tables[table] = EncodedTable(columns, encoded, index)
+
+        snapshot = cls(tables, strings, digest.hexdigest()[:16], last_modified)
+        snapshot.source = source
+        return snapshot
+
+    def _locate(self, table: str, key: str) -> Optional[Tuple[int, int]]:
+        key_code = self._strings.code_of(key)
+        if key_code is None:
+            return None
+        return self._tables[table].index.get(key_code)
+
+    def get_rows(self, table: str, key: str) -> List[Row]:
+        location = self._locate(table, key)
+        if location is None:
+            return []
+        columns, codes, _ = self._tables[table]
+        decode = self._strings.strings.__getitem__
+        width = len(columns)
+        first, count = location
+        return [
+            dict(zip(columns, map(decode, codes[start:start + width])))
+            for start in range(first * width, (first + count) * width, width)
+        ]
+
+    def has_key(self, table: str, key: str) -> bool:
+        return self._locate(table, key) is not None
+
+    def keys(self, table: str) -> List[str]:
+        strings = self._strings.strings
+        return [strings[key_code] for key_code in self._tables[table].index]
+
+    def columns(self, table: str) -> List[str]:
+        return self._tables[table].columns
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tamaño del diccionario de strings frente a la cantidad de valores codificados"""
+        encoded_values = sum(len(table.codes) for table in self._tables.values())
+        return {
+            "distinct_strings": len(self._strings),
+            "encoded_values": encoded_values,
+            "encoded_bytes": sum(len(table.codes) * table.codes.itemsize for table in self._tables.values())
+        }
+
+
+def source_fingerprint(base_dir: str = PERSIST_DIR) -> str:
+    """
+    Huella barata de los CSV del catálogo (tamaño y mtime de cada archivo).
+
+    No lee el contenido: sirve para decidir si un snapshot compilado sigue
+    correspondiendo a los CSV actuales sin volver a cargarlos.
+    """
+    digest = hashlib.sha256()
+    for table, (relative_path, _) in CATALOG_TABLES.items():
+        path = os.path.join(base_dir, relative_path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            digest.update(f"{table}:-;".encode('utf-8'))
+            continue
+        digest.update(f"{table}:{stat.st_size}:{stat.st_mtime_ns};".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def is_trusted(catalog: Optional[ICatalogSnapshot]) -> bool:
+    """Indica si las filas del catálogo ya fueron validadas al cargarlo"""
+    return catalog is not None and catalog.validated
+
+
+def entity_constructor(entity_cls: Type[T], catalog: Optional[ICatalogSnapshot], strict: bool = False) -> Callable[..., T]:
+    """
+    Constructor con el que un repositorio arma sus entidades.
+
+    Con el catálogo validado se usa entity_cls.trusted (sin __post_init__) y
+    se omite la validación por request; en modo estricto, o leyendo el CSV
+    sin catálogo, se usa el constructor que valida.
+    """
+    return entity_cls.trusted if is_trusted(catalog) and not strict else entity_cls
+
+
+def iter_rows(csv_path: str,
+              table: str,
+              key: Optional[str] = None,
+              catalog: Optional[ICatalogSnapshot] = None) -> Iterator[Row]:
+    """
+    Itera las filas de una tabla filtradas por clave.
+
+    Con catálogo se lee del snapshot; sin catálogo se recorre el CSV en csv_path
+    (comportamiento original de los repositorios). Las excepciones de lectura
+    (FileNotFoundError, etc.) se propagan al repositorio que llama.
+
+    Args:
+        csv_path: Ruta del CSV usada cuando no hay catálogo
+        table: Nombre de la tabla en CATALOG_TABLES
+        key: Valor de la columna clave; None para todas las filas
+        catalog: Snapshot del catálogo (opcional)
+    """
+    if catalog is not None:
+        _, key_column = CATALOG_TABLES[table]
+        if key is None:
+            yield from catalog.get_all(table)
+        else:
+            yield from catalog.get_rows(table, key if key_column else GLOBAL_KEY)
+        return
+
+    _, key_column = CATALOG_TABLES[table]
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            if key is None or key_column is None or row[key_column] == key:
+                yield row
@@ -0,0 +1,232 @@
+"""
+Validación del catálogo en tiempo de carga.
+
+Construye una vez cada entidad del catálogo con los constructores que validan
+(__post_init__) y revisa la integridad referencial entre tablas. Todos los
+problemas se acumulan en un reporte estructurado en lugar de aparecer, uno a
+uno, como excepciones silenciadas en cada request.
+
+Si el reporte no tiene errores, el snapshot se marca como validado y los
+repositorios construyen entidades con el constructor trusted.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from domain.product_variant.entity.product_variant_mapping import ProductVariantMapping
+from infrastructure.persist.catalog.catalog_snapshot import GLOBAL_KEY, ICatalogSnapshot
+from infrastructure.persist.category_path.category_path_repository import CategoryPathRepository
+from infrastructure.persist.characteristic.characteristic_repository import CharacteristicRepository
+from infrastructure.persist.highlight.highlight_repository import HighlightRepository
+from infrastructure.persist.payment.payment_repository import PaymentRepository
+from infrastructure.persist.product_detail.product_detail_repository import ProductDetailRepository
+from infrastructure.persist.product_image.product_image_repository import ProductImageRepository
+from infrastructure.persist.product_variant.variant_repository import VariantRepository
+from infrastructure.persist.question.question_repository import QuestionRepository
+from infrastructure.persist.rating_category.rating_category_repository import RatingCategoryRepository
+from infrastructure.persist.related_product.related_product_repository import RelatedProductRepository
+from infrastructure.persist.review.review_repository import ReviewRepository
+from infrastructure.persist.seller_information.seller_information_repository import SellerInformationRepository
+from infrastructure.persist.shipping.shipping_repository import ShippingRepository
+
+# Severidades
+ERROR = "error"      # Dato que rompe una sección de la página
+WARNING = "warning"  # Dato inconsistente pero inofensivo (ej: filas huérfanas)
+
+# Tipos de chequeo
+CHECK_INVARIANT = "invariant"
+CHECK_REFERENCE = "reference"
+
+# Tablas indexadas por producto base (no necesariamente presente en product_detail)
+_BASE_PRODUCT_TABLES = {"variant", "variant_product_mapping"}
+
+# Tablas indexadas por una clave que no es de producto
+_NON_PRODUCT_TABLES = {"seller"}
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """Problema encontrado en una clave de una tabla del catálogo"""
+    severity: str
+    check: str
+    table: str
+    key: str
+    message: str
+
+
+@dataclass
+class ValidationReport:
+    """Resultado de validar un snapshot del catálogo"""
+    catalog_version: str
+    checked_keys: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationIssue]:
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    @property
+    def ok(self) -> bool:
+        """True si no hay errores (las advertencias no invalidan el catálogo)"""
+        return not self.errors
+
+    def add(self, severity: str, check: str, table: str, key: str, message: str) -> None:
+        self.issues.append(ValidationIssue(severity, check, table, key, message))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representación serializable (header del snapshot, monitoreo)"""
+        return {
+            "catalog_version": self.catalog_version,
+            "ok": self.ok,
+            "checked_keys": self.checked_keys,
+            "error_count": len(self.errors),
+            "warning_count": len(self.warnings),
+            "issues": [
+                {
+                    "severity": issue.severity,
+                    "check": issue.check,
+                    "table": issue.table,
+                    "key": issue.key,
+                    "message": issue.message
+                }
+                for issue in self.issues
+            ]
+        }
+
+    def summary(self) -> str:
+        """Resumen legible para logs y CLI"""
+        lines = [
+            f"Catalog {self.catalog_version}: {self.checked_keys} keys checked, "
+            f"{len(self.errors)} errors, {len(self.warnings)} warnings"
+        ]
+        for issue in self.issues:
+            lines.append(f"  [{issue.severity}] {issue.table}[{issue.key}] {issue.check}: {issue.message}")
+        return "\n".join(lines)
+
+
+def _product_loaders(catalog: ICatalogSnapshot) -> Dict[str, Callable[[str], Any]]:
+    """Getters por clave de cada tabla, con repositorios en modo estricto"""
+    return {
+        "category_path": CategoryPathRepository(catalog, strict=True).get_by_product_id,
+        "characteristic": CharacteristicRepository(catalog, strict=True).get_by_product_id,
+        "highlight": HighlightRepository(catalog, strict=True).get_by_product_id,
+        "product_detail": ProductDetailRepository(catalog, strict=True).get_by_product_id,
+        "product_image": ProductImageRepository(catalog, strict=True).get_by_product_id,
+        "variant": VariantRepository(catalog, strict=True).get_by_product_id,
+        "question": QuestionRepository(catalog, strict=True).get_by_product_id,
+        "related_product": RelatedProductRepository(catalog, strict=True).get_by_product_id,
+        "review": ReviewRepository(catalog, strict=True).get_by_product_id,
+        "seller": SellerInformationRepository(catalog, strict=True).get_by_seller_id,
+        "product_seller": SellerInformationRepository(catalog, strict=True).get_seller_id_by_product_id,
+        "shipping": ShippingRepository(catalog, strict=True).get_by_product_id,
+    }
+
+
+def _parse_combination(combination: str) -> Dict[str, str]:
+    """'capacidad:128gb|color:azul' → {"capacidad": "128gb", "color": "azul"}"""
+    result = {}
+    for part in combination.split('|'):
+        if part:
+            key, _, value = part.partition(':')
+            result[key] = value
+    return result
+
+
+def _check_invariants(catalog: ICatalogSnapshot, report: ValidationReport) -> None:
+    for table, load in _product_loaders(catalog).items():
+        for key in catalog.keys(table):
+            report.checked_keys += 1
+            try:
+                load(key)
+            except Exception as e:
+                report.add(ERROR, CHECK_INVARIANT, table, key, f"{type(e).__name__}: {e}")
+
+    global_loaders = {
+        "payment": PaymentRepository(catalog, strict=True),
+        "rating_category": RatingCategoryRepository(catalog, strict=True),
+    }
+    for table, repository in global_loaders.items():
+        report.checked_keys += 1
+        try:
+            repository.get_all()
+            if table == "payment":
+                repository.get_max_installments()
+        except Exception as e:
+            report.add(ERROR, CHECK_INVARIANT, table, GLOBAL_KEY, f"{type(e).__name__}: {e}")
+
+
+def _check_references(catalog: ICatalogSnapshot, report: ValidationReport) -> None:
+    products = set(catalog.keys("product_detail"))
+
+    # Mappings de variantes: SKU destino existente y combinación con opciones existentes
+    for base_product_id in catalog.keys("variant_product_mapping"):
+        option_slugs: Dict[str, set] = {}
+        for row in catalog.get_rows("variant", base_product_id):
+            option_slugs.setdefault(row['group_key'], set()).add(row['option_slug'])
+
+        for row in catalog.get_rows("variant_product_mapping", base_product_id):
+            report.checked_keys += 1
+            combination = _parse_combination(row['variant_combination'])
+            try:
+                ProductVariantMapping(
+                    base_product_id=row['base_product_id'],
+                    variant_combination=combination,
+                    product_variant_id=row['product_variant_id']
+                )
+            except Exception as e:
+                report.add(ERROR, CHECK_INVARIANT, "variant_product_mapping", base_product_id,
+                           f"{type(e).__name__}: {e}")
+                continue
+
+            if row['product_variant_id'] not in products:
+                report.add(ERROR, CHECK_REFERENCE, "variant_product_mapping", base_product_id,
+                           f"product_variant_id '{row['product_variant_id']}' not found in product_detail")
+            for group_key, slug in combination.items():
+                if slug not in option_slugs.get(group_key, ()):
+                    report.add(ERROR, CHECK_REFERENCE, "variant_product_mapping", base_product_id,
+                               f"option '{group_key}:{slug}' not found in variant groups")
+
+    # Productos asignados a un vendedor inexistente
+    sellers = set(catalog.keys("seller"))
+    for product_id in catalog.keys("product_seller"):
+        for row in catalog.get_rows("product_seller", product_id):
+            if row['seller_id'] not in sellers:
+                report.add(ERROR, CHECK_REFERENCE, "product_seller", product_id,
+                           f"seller_id '{row['seller_id']}' not found in seller")
+
+    # Filas de productos que no existen en product_detail
+    for table in _product_loaders(catalog):
+        if table == "product_detail" or table in _BASE_PRODUCT_TABLES or table in _NON_PRODUCT_TABLES:
+            continue
+        for key in catalog.keys(table):
+            if key not in products:
+                report.add(WARNING, CHECK_REFERENCE, table, key, "product_id not found in product_detail")
+
+
+def validate_catalog(catalog: ICatalogSnapshot) -> ValidationReport:
+    """
+    Valida todas las tablas de un snapshot del catálogo.
+
+    Args:
+        catalog: Snapshot a validar (no se modifica)
+
+    Returns:
+        ValidationReport con todos los errores y advertencias encontrados
+    """
+    report = ValidationReport(catalog_version=catalog.version)
+    _check_invariants(catalog, report)
+    _check_references(catalog, report)
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+    from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+
+    validation = validate_catalog(CatalogSnapshot.load())
+    print(validation.summary())
+    sys.exit(0 if validation.ok else 1)
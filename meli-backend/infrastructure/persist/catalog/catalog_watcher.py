@@ -0,0 +1,108 @@
+"""
+Seguimiento de los CSV del catálogo.
+
+Cada worker corre su propio CatalogWatcher: una edición de los CSV llega a
+todos los workers sin depender de cuál recibió una petición. Solo se
+consulta la huella de los archivos (tamaño y mtime, ver source_fingerprint);
+el catálogo se vuelve a cargar recién cuando cambia.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from infrastructure.persist.catalog.catalog_snapshot import source_fingerprint
+
+CATALOG_POLL_ENV = "MELI_CATALOG_POLL_INTERVAL"
+# Segundos entre consultas de la huella de los CSV (0 desactiva el seguimiento)
+DEFAULT_POLL_INTERVAL = float(os.getenv(CATALOG_POLL_ENV, "5"))
+
+
+class CatalogWatcher:
+    """
+    Consulta periódicamente la huella de los CSV y llama a on_change cuando
+    cambia.
+
+    Un cambio se aplica cuando la huella nueva se repite en dos consultas
+    seguidas: los CSV se editan de a uno y así no se recarga a mitad de una
+    edición de varias tablas.
+    """
+
+    def __init__(self,
+                 on_change: Callable[[], Any],
+                 source: Optional[str] = None,
+                 interval: float = DEFAULT_POLL_INTERVAL,
+                 fingerprint: Callable[[], str] = source_fingerprint):
+        """
+        Args:
+            on_change: Se llama (en el hilo del watcher) al detectar un cambio
+            source: Huella del catálogo en uso (por defecto, la de los CSV actuales)
+            interval: Segundos entre consultas
+            fingerprint: Calcula la huella de los CSV
+        """
+        self._on_change = on_change
+        self._fingerprint = fingerprint
+        self._source = source if source is not None else fingerprint()
+        self._pending: Optional[str] = None
+        self._interval = interval
+        self._changes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """
+        Consulta la huella una vez.
+
+        Returns:
+            True si se detectó un cambio estable y se llamó a on_change
+        """
+        current = self._fingerprint()
+        if current == self._source:
+            self._pending = None
+            return False
+        if current != self._pending:
+            # Recién cambió: se espera una consulta más por si la edición sigue
+            self._pending = current
+            return False
+        # Si la recarga falla la huella en uso no cambia y se reintenta después
+        self._pending = None
+        self._on_change()
+        self._source = current
+        self._changes += 1
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Error reloading catalog: {e}")
+
+    def start(self) -> None:
+        """Inicia el seguimiento en segundo plano (no hace nada con intervalo 0)"""
+        if self._thread is not None or self._interval <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el hilo de segundo plano"""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    @property
+    def running(self) -> bool:
+        """Indica si el seguimiento en segundo plano está activo"""
+        return self._thread is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Huella en uso, cambios aplicados y estado del seguimiento"""
+        return {
+            "source": self._source,
+            "changes": self._changes,
+            "interval": self._interval,
+            "running": self.running
+        }
@@ -0,0 +1,208 @@
+"""
+Snapshot del catálogo compartido entre procesos mediante un archivo mmap de solo lectura.
+
+El proceso padre compila el snapshot una vez (compile_snapshot) y cada worker de
+uvicorn lo adjunta con MmapCatalogSnapshot. Índices y filas viven en el archivo
+mapeado, que el sistema operativo comparte entre procesos a través del page cache:
+agregar workers no duplica el catálogo en memoria.
+
+Formato del archivo:
+
+    MAGIC (8 bytes) | largo del header (uint32) | header JSON | cuerpo
+
+    Por cada tabla, el cuerpo contiene las claves, los bloques de filas (JSON
+    compacto, una lista de valores por fila) y un índice de entradas de tamaño
+    fijo ordenadas por clave, sobre el que se hace búsqueda binaria.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from infrastructure.persist.catalog.catalog_snapshot import (
+    CATALOG_TABLES,
+    ICatalogSnapshot,
+    Row
+)
+
+MAGIC = b"MELICAT1"
+
+_HEADER_LENGTH = struct.Struct("<I")
+# key_offset, key_length, data_offset, data_length (relativos al inicio del cuerpo)
+_INDEX_ENTRY = struct.Struct("<QIQI")
+
+
+def compile_snapshot(snapshot: ICatalogSnapshot, output_path: str) -> str:
+    """
+    Serializa un snapshot al formato compartido.
+
+    La escritura es atómica (archivo temporal + os.replace), así que los workers
+    que adjunten el archivo nunca ven un snapshot a medio escribir.
+
+    Args:
+        snapshot: Snapshot fuente (normalmente CatalogSnapshot.load())
+        output_path: Ruta del archivo de salida
+
+    Returns:
+        Ruta del archivo compilado
+    """
+    body = bytearray()
+    tables_header = {}
+
+    for table in CATALOG_TABLES:
+        columns = snapshot.columns(table)
+        keys = sorted(snapshot.keys(table), key=lambda k: k.encode('utf-8'))
+
+        entries = []
+        for key in keys:
+            encoded_key = key.encode('utf-8')
+            key_offset = len(body)
+            body += encoded_key
+
+            rows = [[row.get(column) for column in columns] for row in snapshot.get_rows(table, key)]
+            data = json.dumps(rows, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            data_offset = len(body)
+            body += data
+
+            entries.append(_INDEX_ENTRY.pack(key_offset, len(encoded_key), data_offset, len(data)))
+
+        index_offset = len(body)
+        for entry in entries:
+            body += entry
+
+        tables_header[table] = {
+            "columns": columns,
+            "index_offset": index_offset,
+            "count": len(entries)
+        }
+
+    header = json.dumps({
+        "version": snapshot.version,
+        "last_modified": snapshot.last_modified,
+        "validated": snapshot.validated,
+        "validation_report": snapshot.validation_report,
+        "source": snapshot.source,
+        "tables": tables_header
+    }).encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header)))
+            file.write(header)
+            file.write(body)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return output_path
+
+
+class MmapCatalogSnapshot(ICatalogSnapshot):
+    """
+    Snapshot del catálogo adjunto a un archivo compilado vía mmap.
+
+    Solo el header (nombres de columnas y offsets) se decodifica al adjuntar;
+    las filas se decodifican bajo demanda en cada búsqueda y no se retienen.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Catalog snapshot file is empty: {path}")
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Invalid catalog snapshot file: {path}")
+
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mm, len(MAGIC))
+        header = json.loads(self._mm[header_start:header_start + header_length].decode('utf-8'))
+
+        self._body_offset = header_start + header_length
+        self._tables: Dict[str, dict] = header["tables"]
+        self.version = header["version"]
+        self.last_modified = header["last_modified"]
+        # La validación se ejecuta una vez, al compilar en el proceso padre
+        self.validated = header.get("validated", False)
+        self.validation_report = header.get("validation_report")
+        self.source = header.get("source")
+
+    def _entry(self, table: str, position: int) -> Tuple[int, int, int, int]:
+        index_offset = self._body_offset + self._tables[table]["index_offset"]
+        return _INDEX_ENTRY.unpack_from(self._mm, index_offset + position * _INDEX_ENTRY.size)
+
+    def _key_at(self, key_offset: int, key_length: int) -> bytes:
+        start = self._body_offset + key_offset
+        return self._mm[start:start + key_length]
+
+    def _find(self, table: str, key: str) -> Optional[Tuple[int, int]]:
+        """Búsqueda binaria de la clave en el índice de la tabla"""
+        target = key.encode('utf-8')
+        low, high = 0, self._tables[table]["count"] - 1
+        while low <= high:
+            middle = (low + high) // 2
+            key_offset, key_length, data_offset, data_length = self._entry(table, middle)
+            current = self._key_at(key_offset, key_length)
+            if current == target:
+                return data_offset, data_length
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def get_rows(self, table: str, key: str) -> List[Row]:
+        location = self._find(table, key)
+        if location is None:
+            return []
+        data_offset, data_length = location
+        start = self._body_offset + data_offset
+        columns = self._tables[table]["columns"]
+        values = json.loads(self._mm[start:start + data_length].decode('utf-8'))
+        return [dict(zip(columns, row)) for row in values]
+
+    def has_key(self, table: str, key: str) -> bool:
+        # Solo búsqueda binaria en el índice, sin decodificar filas
+        return self._find(table, key) is not None
+
+    def keys(self, table: str) -> List[str]:
+        keys = []
+        for position in range(self._tables[table]["count"]):
+            key_offset, key_length, _, _ = self._entry(table, position)
+            keys.append(self._key_at(key_offset, key_length).decode('utf-8'))
+        return keys
+
+    def columns(self, table: str) -> List[str]:
+        return list(self._tables[table]["columns"])
+
+    def close(self) -> None:
+        """Libera el mapeo y el descriptor de archivo"""
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    from infrastructure.persist.catalog.catalog_loader import load_validated_snapshot
+
+    parser = argparse.ArgumentParser(description="Compila el snapshot compartido del catálogo")
+    parser.add_argument("output", help="Ruta del archivo de snapshot a generar")
+    args = parser.parse_args()
+
+    catalog = load_validated_snapshot()
+    compile_snapshot(catalog, args.output)
+    print(f"Catalog snapshot {catalog.version} written to {args.output}")
@@ -1,17 +1,20 @@
 """Repositorio CSV para CategoryPath"""
 
-import csv
 import os
-from typing import List
+from typing import List, Optional
 from domain.category_path.entity.category_path import CategoryPath
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class CategoryPathRepository:
     """Repositorio que lee category paths desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "category_path.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> List[CategoryPath]:
         """
@@ -25,21 +28,21 @@ class CategoryPathRepository:
             Lista de CategoryPath ordenada por el campo 'order'
         """
         category_paths = []
+        make_category_path = entity_constructor(CategoryPath, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        category_path = CategoryPath(
-                            label=row['label'],
-                            href=row['href'],
-                            order=int(row['order'])
-                        )
-                        category_paths.append(category_path)
+            for row in iter_rows(self.csv_path, "category_path", product_id, self._catalog):
+                category_path = make_category_path(
+                    label=row['label'],
+                    href=row['href'],
+                    order=int(row['order'])
+                )
+                category_paths.append(category_path)
 
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading category_path CSV: {e}")
 
         # Ordenar por el campo 'order'
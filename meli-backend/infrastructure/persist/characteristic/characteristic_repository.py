@@ -1,76 +1,82 @@
 """Repositorio CSV para Characteristic"""
 
-import csv
 import os
 import json
-from typing import List, Union
+from typing import List, Union, Optional
 from domain.characteristic.entity.characteristic import (
     SimpleCharacteristic,
     RangeCharacteristic,
     HighlightCharacteristic,
     CategoryCharacteristic, CharacteristicType
 )
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class CharacteristicRepository:
     """Repositorio que lee características desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "characteristic.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> List[Union[RangeCharacteristic, HighlightCharacteristic, CategoryCharacteristic]]:
         """Obtiene todas las características de un producto"""
         characteristics = []
+        make_range = entity_constructor(RangeCharacteristic, self._catalog, self._strict)
+        make_highlight = entity_constructor(HighlightCharacteristic, self._catalog, self._strict)
+        make_simple = entity_constructor(SimpleCharacteristic, self._catalog, self._strict)
+        make_category = entity_constructor(CategoryCharacteristic, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        char_type = row['type']
+            for row in iter_rows(self.csv_path, "characteristic", product_id, self._catalog):
+                char_type = row['type']
 
-                        if char_type == 'range':
-                            char = RangeCharacteristic(
-                                type=CharacteristicType.RANGE,
-                                name=row['name'],
-                                value=row['value'],
-                                current=float(row['current']),
-                                min=float(row['min']),
-                                max=float(row['max']),
-                                min_label=row['min_label'],
-                                max_label=row['max_label'],
-                                icon=row['icon'] if row['icon'] else None,
-                                segments=int(row['segments']) if row['segments'] else 5  # Default: 5
-                            )
-                            characteristics.append(char)
+                if char_type == 'range':
+                    char = make_range(
+                        type=CharacteristicType.RANGE,
+                        name=row['name'],
+                        value=row['value'],
+                        current=float(row['current']),
+                        min=float(row['min']),
+                        max=float(row['max']),
+                        min_label=row['min_label'],
+                        max_label=row['max_label'],
+                        icon=row['icon'] if row['icon'] else None,
+                        segments=int(row['segments']) if row['segments'] else 5  # Default: 5
+                    )
+                    characteristics.append(char)
 
-                        elif char_type == 'highlight':
-                            char = HighlightCharacteristic(
-                                type=CharacteristicType.HIGHLIGHT,
-                                name=row['name'],
-                                value=row['value'],
-                                icon=row['icon']
-                            )
-                            characteristics.append(char)
+                elif char_type == 'highlight':
+                    char = make_highlight(
+                        type=CharacteristicType.HIGHLIGHT,
+                        name=row['name'],
+                        value=row['value'],
+                        icon=row['icon']
+                    )
+                    characteristics.append(char)
 
-                        elif char_type == 'category':
-                            # Parse JSON para características
-                            char_list = json.loads(row['characteristics_json'])
-                            simple_chars = [
-                                SimpleCharacteristic(name=c['name'], value=c['value'])
-                                for c in char_list
-                            ]
+                elif char_type == 'category':
+                    # Parse JSON para características
+                    char_list = json.loads(row['characteristics_json'])
+                    simple_chars = [
+                        make_simple(name=c['name'], value=c['value'])
+                        for c in char_list
+                    ]
 
-                            char = CategoryCharacteristic(
-                                type=CharacteristicType.CATEGORY,
-                                category_name=row['category_name'],
-                                characteristics=simple_chars
-                            )
-                            characteristics.append(char)
+                    char = make_category(
+                        type=CharacteristicType.CATEGORY,
+                        category_name=row['category_name'],
+                        characteristics=simple_chars
+                    )
+                    characteristics.append(char)
 
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading characteristic CSV: {e}")
 
         return characteristics
@@ -1,28 +1,30 @@
 """Repositorio CSV para Highlights"""
 
-import csv
 import os
-from typing import List
+from typing import List, Optional
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, iter_rows
 
 
 class HighlightRepository:
     """Repositorio que lee highlights desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "highlight.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> List[str]:
         """Obtiene todos los highlights de un producto"""
         highlights = []
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        highlights.append(row['highlight'])
+            for row in iter_rows(self.csv_path, "highlight", product_id, self._catalog):
+                highlights.append(row['highlight'])
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading highlight CSV: {e}")
         return highlights
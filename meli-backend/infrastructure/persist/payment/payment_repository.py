@@ -1,35 +1,44 @@
 """Repositorio CSV para Payment"""
 
-import csv
 import os
-from typing import List
+from typing import List, Optional
 from domain.payment.entity.payment import Payment, PaymentMethodType
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class PaymentRepository:
     """Repositorio que lee métodos de pago desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "payment.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+
+    @property
+    def data_version(self) -> Optional[str]:
+        """Versión del catálogo leído (None si se lee el CSV directamente)"""
+        return self._catalog.version if self._catalog is not None else None
 
     def get_all(self) -> List[Payment]:
         """Obtiene todos los métodos de pago disponibles"""
         payments = []
+        make_payment = entity_constructor(Payment, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    payment = Payment(
-                        id=row['id'],
-                        name=row['name'],
-                        image_url=row['image_url'],
-                        type=PaymentMethodType(row['type'])
-                    )
-                    payments.append(payment)
+            for row in iter_rows(self.csv_path, "payment", None, self._catalog):
+                payment = make_payment(
+                    id=row['id'],
+                    name=row['name'],
+                    image_url=row['image_url'],
+                    type=PaymentMethodType(row['type'])
+                )
+                payments.append(payment)
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading payment CSV: {e}")
         return payments
 
@@ -37,12 +46,12 @@ class PaymentRepository:
         """Obtiene el máximo número de cuotas disponible"""
         max_inst = 1
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    installments = int(row['max_installments'])
-                    if installments > max_inst:
-                        max_inst = installments
+            for row in iter_rows(self.csv_path, "payment", None, self._catalog):
+                installments = int(row['max_installments'])
+                if installments > max_inst:
+                    max_inst = installments
         except (FileNotFoundError, Exception) as e:
+            if self._strict and not isinstance(e, FileNotFoundError):
+                raise
             print(f"Error reading max installments: {e}")
         return max_inst
@@ -0,0 +1,178 @@
+"""
+Almacén columnar de los atributos numéricos de los productos.
+
+price, original_price, discount, sold_count y available_stock se guardan como
+arrays tipados contiguos (módulo array), una posición por producto, en lugar de
+un int de Python por atributo en cada entidad. Las consultas de listado
+(filtros por rango y top-K por una columna) recorren las columnas completas;
+si NumPy está instalado se usan vistas sin copia sobre los mismos buffers y
+operaciones vectorizadas.
+"""
+
+import heapq
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot
+
+try:  # NumPy es opcional: sin él las consultas se resuelven en Python puro
+    import numpy
+except ImportError:  # pragma: no cover - depende del entorno
+    numpy = None
+
+# Columnas numéricas del almacén (int64)
+NUMERIC_COLUMNS = ("price", "original_price", "discount", "sold_count", "available_stock")
+
+# Columnas permitidas para ordenar
+SORTABLE_COLUMNS = frozenset(NUMERIC_COLUMNS)
+
+_TYPECODE = "q"
+
+
+class ProductAttributes(NamedTuple):
+    """Atributos numéricos de un producto"""
+    product_id: str
+    price: int
+    original_price: int
+    discount: int
+    sold_count: int
+    available_stock: int
+
+
+class ProductAttributeStore:
+    """
+    Columnas numéricas de todos los productos de una versión del catálogo.
+
+    La posición i de cada columna corresponde a product_ids[i]; el almacén es
+    inmutable una vez construido.
+    """
+
+    def __init__(self, product_ids: Sequence[str], columns: Dict[str, array], version: Optional[str] = None):
+        if set(columns) != set(NUMERIC_COLUMNS):
+            raise ValueError(f"columns must be exactly {NUMERIC_COLUMNS}")
+        if any(len(values) != len(product_ids) for values in columns.values()):
+            raise ValueError("all columns must have one value per product")
+        self.product_ids = list(product_ids)
+        self.version = version
+        self._columns = columns
+
+    @classmethod
+    def from_catalog(cls, catalog: ICatalogSnapshot) -> "ProductAttributeStore":
+        """
+        Construye el almacén desde la tabla product_detail del catálogo.
+
+        Los valores vacíos se toman como 0, igual que ProductDetailRepository.
+        """
+        product_ids: List[str] = []
+        columns = {name: array(_TYPECODE) for name in NUMERIC_COLUMNS}
+        for product_id in catalog.keys("product_detail"):
+            for row in catalog.get_rows("product_detail", product_id):
+                product_ids.append(product_id)
+                for name in NUMERIC_COLUMNS:
+                    columns[name].append(int(row[name]) if row[name] else 0)
+                break
+        return cls(product_ids, columns, catalog.version)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def column(self, name: str) -> array:
+        """Retorna la columna tipada (compartida, no modificar)"""
+        return self._columns[name]
+
+    def get(self, position: int) -> ProductAttributes:
+        """Retorna los atributos del producto en la posición indicada"""
+        return ProductAttributes(
+            self.product_ids[position],
+            *(self._columns[name][position] for name in NUMERIC_COLUMNS)
+        )
+
+    def query(self,
+              min_price: Optional[int] = None,
+              max_price: Optional[int] = None,
+              discounted: Optional[bool] = None,
+              in_stock: bool = False,
+              sort_by: str = "sold_count",
+              descending: bool = True,
+              limit: int = 20) -> Tuple[int, List[ProductAttributes]]:
+        """
+        Filtra productos y retorna el top-K ordenado por una columna.
+
+        Los empates se resuelven por el orden del catálogo, con y sin NumPy.
+
+        Args:
+            min_price: Precio mínimo (inclusive)
+            max_price: Precio máximo (inclusive)
+            discounted: True solo con descuento, False solo sin descuento
+            in_stock: Solo productos con stock disponible
+            sort_by: Columna de orden (ver SORTABLE_COLUMNS)
+            descending: Orden descendente
+            limit: Cantidad máxima de resultados
+
+        Returns:
+            (cantidad total de coincidencias, resultados ordenados)
+        """
+        if sort_by not in SORTABLE_COLUMNS:
+            raise ValueError(f"Unknown sort column: {sort_by}")
+        if limit < 0:
+            raise ValueError("limit must be non-negative")
+
+        query = (self._query_vectorized if numpy is not None else self._query_python)
+        total, positions = query(min_price, max_price, discounted, in_stock, sort_by, descending, limit)
+        return total, [self.get(position) for position in positions]
+
+    def _query_python(self, min_price, max_price, discounted, in_stock,
+                      sort_by, descending, limit) -> Tuple[int, List[int]]:
+        price = self._columns["price"]
+        discount = self._columns["discount"]
+        stock = self._columns["available_stock"]
+
+        low = min_price if min_price is not None else float("-inf")
+        high = max_price if max_price is not None else float("inf")
+        matches = [
+            position
+            for position, (product_price, product_discount, product_stock) in enumerate(zip(price, discount, stock))
+            if low <= product_price <= high
+            and (discounted is None or (product_discount > 0) == discounted)
+            and (not in_stock or product_stock > 0)
+        ]
+
+        values = self._columns[sort_by]
+
+        def key(position: int) -> int:
+            return -values[position] if descending else values[position]
+
+        # nsmallest es estable: los empates conservan el orden del catálogo
+        return len(matches), heapq.nsmallest(limit, matches, key=key)
+
+    def _query_vectorized(self, min_price, max_price, discounted, in_stock,
+                          sort_by, descending, limit) -> Tuple[int, List[int]]:
+        # Vistas sin copia sobre los buffers de los arrays
+        price = numpy.frombuffer(self._columns["price"], dtype=numpy.int64)
+        mask = numpy.ones(len(price), dtype=bool)
+        if min_price is not None:
+            mask &= price >= min_price
+        if max_price is not None:
+            mask &= price <= max_price
+        if discounted is not None:
+            discount = numpy.frombuffer(self._columns["discount"], dtype=numpy.int64)
+            mask &= (discount > 0) == discounted
+        if in_stock:
+            mask &= numpy.frombuffer(self._columns["available_stock"], dtype=numpy.int64) > 0
+
+        positions = numpy.flatnonzero(mask)
+        total = len(positions)
+        keys = numpy.frombuffer(self._columns[sort_by], dtype=numpy.int64)[positions]
+        if descending:
+            keys = -keys
+
+        if 0 < limit < total:
+            # Selección parcial O(n): todo lo menor al umbral más los primeros empates
+            threshold = numpy.partition(keys, limit - 1)[limit - 1]
+            below = keys < threshold
+            ties = numpy.flatnonzero(keys == threshold)[:limit - int(below.sum())]
+            selected = numpy.concatenate((numpy.flatnonzero(below), ties))
+            positions, keys = positions[selected], keys[selected]
+
+        order = numpy.lexsort((positions, keys))[:limit]
+        return total, positions[order].tolist()
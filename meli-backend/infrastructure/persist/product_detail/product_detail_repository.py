@@ -1,18 +1,49 @@
 """Repositorio CSV para ProductDetail"""
 
-import csv
 import os
 import json
 from typing import Optional
 from domain.product_detail.entity.product_detail import ProductDetail, ConditionType
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class ProductDetailRepository:
     """Repositorio que lee información básica del producto desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "product_detail.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+
+    def exists(self, product_id: str) -> bool:
+        """
+        Indica si el producto existe sin construir la entidad.
+
+        Con catálogo es una búsqueda en el índice de product_detail; sin catálogo
+        recorre el CSV hasta encontrar el ID.
+
+        Args:
+            product_id: ID del producto
+
+        Returns:
+            True si existe una fila de product_detail para el ID
+        """
+        if self._catalog is not None:
+            return self._catalog.has_key("product_detail", product_id)
+
+        try:
+            for _ in iter_rows(self.csv_path, "product_detail", product_id):
+                return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            if self._strict:
+                raise
+            print(f"Error reading product_detail CSV: {e}")
+
+        return False
 
     def get_by_product_id(self, product_id: str) -> Optional[ProductDetail]:
         """
@@ -24,34 +55,34 @@ class ProductDetailRepository:
         Returns:
             ProductDetail o None si no existe
         """
+        make_product = entity_constructor(ProductDetail, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        # Parsear condition
-                        condition_map = {
-                            'new': ConditionType.NEW,
-                            'used': ConditionType.USED,
-                            'refurbished': ConditionType.REFURBISHED
-                        }
-                        condition = condition_map.get(row['condition'].lower(), ConditionType.NEW)
-
-                        return ProductDetail(
-                            id=row['product_id'],
-                            title=row['title'],
-                            price=int(row['price']),
-                            original_price=int(row['original_price']) if row['original_price'] else 0,
-                            discount=int(row['discount']) if row['discount'] else 0,
-                            condition=condition,
-                            sold_count=int(row['sold_count']) if row['sold_count'] else 0,
-                            available_stock=int(row['available_stock']) if row['available_stock'] else 0,
-                            description=row['description']
-                        )
+            for row in iter_rows(self.csv_path, "product_detail", product_id, self._catalog):
+                # Parsear condition
+                condition_map = {
+                    'new': ConditionType.NEW,
+                    'used': ConditionType.USED,
+                    'refurbished': ConditionType.REFURBISHED
+                }
+                condition = condition_map.get(row['condition'].lower(), ConditionType.NEW)
+
+                return make_product(
+                    id=row['product_id'],
+                    title=row['title'],
+                    price=int(row['price']),
+                    original_price=int(row['original_price']) if row['original_price'] else 0,
+                    discount=int(row['discount']) if row['discount'] else 0,
+                    condition=condition,
+                    sold_count=int(row['sold_count']) if row['sold_count'] else 0,
+                    available_stock=int(row['available_stock']) if row['available_stock'] else 0,
+                    description=row['description']
+                )
 
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading product_detail CSV: {e}")
 
         return None
@@ -1,17 +1,20 @@
 """Repositorio CSV para ProductImage"""
 
-import csv
 import os
-from typing import List
+from typing import List, Optional
 from domain.product_image.entity.product_image import ProductImage, ImageType
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class ProductImageRepository:
     """Repositorio que lee imágenes del producto desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "product_image.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> List[ProductImage]:
         """
@@ -24,24 +27,24 @@ class ProductImageRepository:
             Lista de ProductImage ordenada por el campo 'order'
         """
         images = []
+        make_image = entity_constructor(ProductImage, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        # Parsear el tipo de imagen
-                        image_type = ImageType.DETAIL if row['type'].lower() == 'detail' else ImageType.DESCRIPTION
-
-                        image = ProductImage(
-                            url=row['url'],
-                            type=image_type,
-                            order=int(row['order'])
-                        )
-                        images.append(image)
+            for row in iter_rows(self.csv_path, "product_image", product_id, self._catalog):
+                # Parsear el tipo de imagen
+                image_type = ImageType.DETAIL if row['type'].lower() == 'detail' else ImageType.DESCRIPTION
+
+                image = make_image(
+                    url=row['url'],
+                    type=image_type,
+                    order=int(row['order'])
+                )
+                images.append(image)
 
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading product_image CSV: {e}")
 
         # Ordenar por el campo 'order'
@@ -1,16 +1,19 @@
-import csv
 import os
 from typing import Optional, Dict
 from domain.product_variant.entity.product_variant_mapping import ProductVariantMapping
 from domain.product_variant.interfaces.iproduct_variant_mapping_repository import IProductVariantMappingRepository
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class ProductVariantMappingRepository(IProductVariantMappingRepository):
     """Repositorio CSV para mappings de variantes a product IDs."""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "variant_product_mapping.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_combination(
         self,
@@ -18,24 +21,24 @@ class ProductVariantMappingRepository(IProductVariantMappingRepository):
         variant_combination: Dict[str, str]
     ) -> Optional[ProductVariantMapping]:
         """Busca mapping en CSV."""
+        make_mapping = entity_constructor(ProductVariantMapping, self._catalog, self._strict)
         try:
             # Normalizar combinación: ordenar por key alfabéticamente
             normalized_combo = self._normalize_combination(variant_combination)
 
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['base_product_id'] == base_product_id:
-                        row_combo = self._parse_combination(row['variant_combination'])
-                        if row_combo == normalized_combo:
-                            return ProductVariantMapping(
-                                base_product_id=row['base_product_id'],
-                                variant_combination=variant_combination,
-                                product_variant_id=row['product_variant_id']
-                            )
+            for row in iter_rows(self.csv_path, "variant_product_mapping", base_product_id, self._catalog):
+                row_combo = self._parse_combination(row['variant_combination'])
+                if row_combo == normalized_combo:
+                    return make_mapping(
+                        base_product_id=row['base_product_id'],
+                        variant_combination=variant_combination,
+                        product_variant_id=row['product_variant_id']
+                    )
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading variant mapping CSV: {e}")
 
         return None
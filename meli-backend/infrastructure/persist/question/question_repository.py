@@ -1,37 +1,243 @@
 """Repositorio CSV para Question"""
 
 import csv
+import dataclasses
 import os
-from typing import List
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 from domain.question.entity.question import Question, QuestionStatus
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
+
+# Directorio de question.csv (y, por defecto, del log de preguntas que se compacta en él)
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def _insert(questions: Tuple[Question, ...], question: Question) -> Tuple[Question, ...]:
+    """Inserta en una tupla ordenada por asked_at descendente (antes de las del mismo momento)"""
+    low, high = 0, len(questions)
+    while low < high:
+        middle = (low + high) // 2
+        if questions[middle].asked_at > question.asked_at:
+            low = middle + 1
+        else:
+            high = middle
+    return questions[:low] + (question,) + questions[low:]
+
+
+def _without(questions: Tuple[Question, ...], question_id: str) -> Tuple[Question, ...]:
+    return tuple(question for question in questions if question.id != question_id)
+
+
+class QuestionIndex(NamedTuple):
+    """Preguntas de un producto ordenadas por asked_at (de la más nueva a la más vieja)"""
+    questions: Tuple[Question, ...]
+    # Estado → preguntas en ese estado, en el mismo orden
+    by_status: Dict[QuestionStatus, Tuple[Question, ...]]
+    by_id: Dict[str, Question]
+
+    @classmethod
+    def build(cls, questions: Iterable[Question]) -> "QuestionIndex":
+        # sorted es estable: a igual asked_at se conserva el orden del CSV
+        ordered = tuple(sorted(questions, key=lambda question: question.asked_at, reverse=True))
+        return cls(
+            ordered,
+            {status: tuple(q for q in ordered if q.status == status) for status in QuestionStatus},
+            {question.id: question for question in ordered}
+        )
+
+    def put(self, question: Question) -> "QuestionIndex":
+        """Retorna un índice nuevo con la pregunta agregada o reemplazada (no modifica este)"""
+        by_status = dict(self.by_status)
+        questions = self.questions
+        previous = self.by_id.get(question.id)
+        if previous is not None:
+            questions = _without(questions, question.id)
+            by_status[previous.status] = _without(by_status[previous.status], question.id)
+        by_status[question.status] = _insert(by_status[question.status], question)
+        by_id = dict(self.by_id)
+        by_id[question.id] = question
+        return QuestionIndex(_insert(questions, question), by_status, by_id)
 
 
 class QuestionRepository:
-    """Repositorio que lee preguntas desde CSV"""
+    """
+    Repositorio que lee preguntas desde CSV.
 
-    def __init__(self):
-        current_dir = os.path.dirname(__file__)
-        self.csv_path = os.path.join(current_dir, "data", "question.csv")
+    Las preguntas y respuestas escritas por la API se aplican a un índice en
+    memoria por producto, ordenado por asked_at y separado por estado (para
+    paginar sin recorrer ni ordenar). Cada escritura publica un índice nuevo
+    de forma atómica: los lectores nunca toman locks ni ven una pregunta
+    respondida a medias.
+    """
 
-    def get_by_product_id(self, product_id: str) -> List[Question]:
-        """Obtiene todas las preguntas de un producto"""
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
+        self.csv_path = os.path.join(DATA_DIR, "question.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+        # Índices de los productos leídos (solo con catálogo) o escritos por la API
+        self._indexes: Dict[str, QuestionIndex] = {}
+        # Preguntas escritas por la API (estado actual), por producto
+        self._written: Dict[str, Dict[str, Question]] = {}
+        self._write_lock = threading.Lock()
+
+    def _read_base(self, product_id: str) -> List[Question]:
+        """Preguntas del producto en los datos base (catálogo o CSV)"""
         questions = []
+        make_question = entity_constructor(Question, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        question = Question(
-                            id=row['id'],
-                            question=row['question'],
-                            answer=row['answer'] if row['answer'] else "",
-                            asked_at=row['asked_at'],
-                            answered_at=row['answered_at'] if row['answered_at'] else "",
-                            status=QuestionStatus(row['status'])
-                        )
-                        questions.append(question)
+            for row in iter_rows(self.csv_path, "question", product_id, self._catalog):
+                questions.append(self._from_row(row, make_question))
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading question CSV: {e}")
         return questions
+
+    def read_csv(self) -> List[Tuple[str, Question]]:
+        """
+        Todas las preguntas de question.csv tal como está en disco, sin pasar
+        por el catálogo (incluye lo volcado por compactaciones posteriores a su carga).
+
+        Returns:
+            (product_id, pregunta) en el orden del archivo
+        """
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            return [(row['product_id'], self._from_row(row, Question)) for row in csv.DictReader(file)]
+
+    @staticmethod
+    def _from_row(row: Dict[str, str], make_question: Callable[..., Question]) -> Question:
+        return make_question(
+            id=row['id'],
+            question=row['question'],
+            answer=row['answer'] if row['answer'] else "",
+            asked_at=row['asked_at'],
+            answered_at=row['answered_at'] if row['answered_at'] else "",
+            status=QuestionStatus(row['status'])
+        )
+
+    def get_index(self, product_id: str) -> QuestionIndex:
+        """
+        Índice de preguntas del producto.
+
+        Con catálogo se arma una vez por producto y las escrituras lo
+        actualizan; sin catálogo el CSV puede cambiar (compactación) y se
+        vuelve a leer en cada llamada.
+        """
+        index = self._indexes.get(product_id)
+        if index is not None:
+            return index
+        questions = {question.id: question for question in self._read_base(product_id)}
+        questions.update(self._written.get(product_id, {}))
+        index = QuestionIndex.build(questions.values())
+        if self._catalog is None:
+            return index
+        with self._write_lock:
+            # Si una escritura publicó un índice mientras se armaba este, gana el suyo
+            return self._indexes.setdefault(product_id, index)
+
+    def get_by_product_id(self, product_id: str) -> List[Question]:
+        """Obtiene todas las preguntas de un producto (de la más nueva a la más vieja)"""
+        return list(self.get_index(product_id).questions)
+
+    def get_by_id(self, product_id: str, question_id: str) -> Optional[Question]:
+        """Obtiene una pregunta de un producto por su ID"""
+        return self.get_index(product_id).by_id.get(question_id)
+
+    def get_page(self,
+                 product_id: str,
+                 offset: int = 0,
+                 limit: int = 20,
+                 status: Optional[QuestionStatus] = None) -> Tuple[int, List[Question]]:
+        """
+        Página de preguntas de un producto (de la más nueva a la más vieja).
+
+        Args:
+            product_id: ID del producto
+            offset: Preguntas a saltear
+            limit: Tamaño de la página
+            status: Solo preguntas en ese estado (None: todas)
+
+        Returns:
+            (total de preguntas que cumplen el filtro, preguntas de la página)
+        """
+        index = self.get_index(product_id)
+        questions = index.questions if status is None else index.by_status[status]
+        return len(questions), list(questions[offset:offset + limit])
+
+    def put(self, product_id: str, question: Question) -> None:
+        """Agrega o reemplaza una pregunta en el índice del producto"""
+        index = self.get_index(product_id) if self._catalog is not None else None
+        with self._write_lock:
+            written = dict(self._written.get(product_id, {}))
+            written[question.id] = question
+            self._written[product_id] = written
+            if index is not None:
+                self._indexes[product_id] = self._indexes[product_id].put(question)
+
+    def merge_into_csv(self, questions: Iterable[Tuple[str, Question]]) -> int:
+        """
+        Escribe preguntas en question.csv (compactación del log de escrituras).
+
+        Las preguntas nuevas se agregan y las existentes (respondidas después)
+        se reemplazan; las filas de cada producto quedan ordenadas por
+        asked_at. El archivo se reemplaza de forma atómica.
+
+        Args:
+            questions: (product_id, estado final de la pregunta)
+
+        Returns:
+            Cantidad de filas agregadas o modificadas
+        """
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.DictReader(file)
+            columns = reader.fieldnames
+            rows = list(reader)
+
+        by_product: "OrderedDict[str, OrderedDict[str, Dict[str, str]]]" = OrderedDict()
+        for row in rows:
+            by_product.setdefault(row['product_id'], OrderedDict())[row['id']] = row
+        changed = 0
+        for product_id, question in questions:
+            row = self._to_row(product_id, question)
+            product_rows = by_product.setdefault(product_id, OrderedDict())
+            if product_rows.get(question.id) != row:
+                product_rows[question.id] = row
+                changed += 1
+        if not changed:
+            return 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.csv_path), prefix=".question-", suffix=".csv")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=columns)
+                writer.writeheader()
+                for product_rows in by_product.values():
+                    writer.writerows(sorted(product_rows.values(), key=lambda row: row['asked_at'], reverse=True))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.csv_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return changed
+
+    @staticmethod
+    def _to_row(product_id: str, question: Question) -> Dict[str, str]:
+        row = {key: value for key, value in dataclasses.asdict(question).items() if key != 'status'}
+        row.update(product_id=product_id, status=question.status.value)
+        return row
+
+    def get_stats(self) -> Dict[str, int]:
+        """Productos y preguntas escritos por la API"""
+        written = list(self._written.values())
+        return {
+            "products": len(written),
+            "questions": sum(len(questions) for questions in written),
+            "indexed_products": len(self._indexes)
+        }
@@ -1,33 +1,42 @@
 """Repositorio CSV para RatingCategory"""
 
-import csv
 import os
-from typing import List
+from typing import List, Optional
 from domain.review.entity.rating_category import RatingCategory
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class RatingCategoryRepository:
     """Repositorio que lee categorías de rating desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "rating_category.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+
+    @property
+    def data_version(self) -> Optional[str]:
+        """Versión del catálogo leído (None si se lee el CSV directamente)"""
+        return self._catalog.version if self._catalog is not None else None
 
     def get_all(self) -> List[RatingCategory]:
         """Obtiene todas las categorías de rating disponibles"""
         categories = []
+        make_category = entity_constructor(RatingCategory, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    category = RatingCategory(
-                        id=row['id'],
-                        name=row['name'],
-                        order=int(row['order'])
-                    )
-                    categories.append(category)
+            for row in iter_rows(self.csv_path, "rating_category", None, self._catalog):
+                category = make_category(
+                    id=row['id'],
+                    name=row['name'],
+                    order=int(row['order'])
+                )
+                categories.append(category)
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading rating category CSV: {e}")
         return categories
@@ -0,0 +1,498 @@
+"""
+Motor de productos relacionados por similitud de catálogo.
+
+Cada producto se representa con un vector disperso de features (ruta de
+categorías, características y términos de los highlights), normalizado L2.
+La similitud entre dos productos es el coseno de sus vectores combinado con
+la proximidad de precio. Los productos candidatos salen de un índice
+invertido feature → {producto: peso}: solo se puntúan los pares que
+comparten al menos una feature (producto matriz dispersa × vector). Si NumPy
+está instalado, cada posting se guarda además como columna dispersa (posiciones
+y pesos en arrays) y el producto se resuelve vectorizado con bincount; sin
+NumPy se acumula en Python puro. Ambos caminos suman en el mismo orden y dan
+los mismos puntajes.
+
+El cálculo es incremental: al cambiar un producto se recalcula su lista y
+solo se corrigen las listas de los productos que lo contenían o que comparten
+features con él. El resultado se escribe en related_product_computed.csv, la
+tabla que RelatedProductRepository usa para los productos sin lista curada,
+junto con el estado del cálculo (related_product_state.json). Ambos archivos
+son artefactos generados: no se versionan y se regeneran al arrancar el
+contenedor.
+
+Uso (recalcula solo los productos que cambiaron desde la última ejecución):
+    python -m infrastructure.persist.related_product.related_product_engine [--full]
+"""
+
+import csv
+import hashlib
+import heapq
+import json
+import os
+import re
+import tempfile
+from array import array
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from infrastructure.persist.catalog.catalog_snapshot import GLOBAL_KEY, ICatalogSnapshot
+
+try:  # NumPy es opcional: sin él la similitud se acumula en Python puro
+    import numpy
+except ImportError:  # pragma: no cover - depende del entorno
+    numpy = None
+
+# Peso de cada familia de features en el vector
+CATEGORY_WEIGHT = 1.0
+CHARACTERISTIC_WEIGHT = 1.0
+HIGHLIGHT_WEIGHT = 0.5
+
+# Peso de la proximidad de precio en la similitud final (el resto es el coseno)
+PRICE_WEIGHT = 0.2
+
+DEFAULT_TOP_N = int(os.getenv("MELI_RELATED_TOP_N", "6"))
+
+# Decimales de los puntajes: el cálculo incremental y el completo deben coincidir
+_SCORE_DIGITS = 6
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+COMPUTED_FILE = os.path.join(_DATA_DIR, "related_product_computed.csv")
+STATE_FILE = os.path.join(_DATA_DIR, "related_product_state.json")
+
+COMPUTED_COLUMNS = [
+    "product_id", "id", "title", "price", "original_price", "image", "discount",
+    "installments", "installment_amount", "is_free_shipping", "is_first_purchase_free_shipping"
+]
+
+_TERM = re.compile(r"\w{3,}")
+
+Related = List[Tuple[str, float]]
+
+
+class ProductFeatures(NamedTuple):
+    """Vector disperso normalizado y precio de un producto"""
+    vector: Dict[str, float]
+    price: int
+
+    def fingerprint(self) -> str:
+        """Hash estable de las features (detecta productos modificados)"""
+        payload = json.dumps([sorted(self.vector.items()), self.price], ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = sum(weight * weight for weight in vector.values()) ** 0.5
+    if not norm:
+        return {}
+    return {feature: weight / norm for feature, weight in vector.items()}
+
+
+def extract_features(catalog: ICatalogSnapshot, product_id: str) -> Optional[ProductFeatures]:
+    """
+    Construye el vector de features de un producto desde el catálogo.
+
+    Returns:
+        ProductFeatures o None si el producto no existe en product_detail
+    """
+    rows = catalog.get_rows("product_detail", product_id)
+    if not rows:
+        return None
+
+    vector: Dict[str, float] = {}
+
+    # Ruta de categorías: los niveles más profundos pesan más
+    path = catalog.get_rows("category_path", product_id)
+    for row in path:
+        vector[f"cat:{row['href']}"] = CATEGORY_WEIGHT * (int(row['order']) + 1) / len(path)
+
+    for row in catalog.get_rows("characteristic", product_id):
+        if row['type'] == 'category':
+            for characteristic in json.loads(row['characteristics_json'] or "[]"):
+                vector[f"char:{characteristic['name']}={characteristic['value']}".lower()] = CHARACTERISTIC_WEIGHT
+        else:
+            vector[f"char:{row['name']}={row['value']}".lower()] = CHARACTERISTIC_WEIGHT
+
+    for row in catalog.get_rows("highlight", product_id):
+        for term in _TERM.findall(row['highlight'].lower()):
+            vector[f"hl:{term}"] = HIGHLIGHT_WEIGHT
+
+    price = int(rows[0]['price']) if rows[0]['price'] else 0
+    return ProductFeatures(_normalize(vector), price)
+
+
+def price_proximity(price: int, other_price: int) -> float:
+    """Proximidad de precio en [0, 1] (1 = mismo precio)"""
+    high = max(price, other_price)
+    return min(price, other_price) / high if high > 0 else 1.0
+
+
+def _rank_key(entry: Tuple[str, float]) -> Tuple[float, str]:
+    # Mayor puntaje primero; empates por ID para un orden determinista
+    return -entry[1], entry[0]
+
+
+class RelatedProductEngine:
+    """
+    Top-N de productos relacionados de todo el catálogo, con actualización incremental.
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        if top_n < 1:
+            raise ValueError("top_n must be positive")
+        self.top_n = top_n
+        self._features: Dict[str, ProductFeatures] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        # Posición fija de cada producto indexado (fila de la matriz dispersa) y su precio
+        self._positions: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._prices = array("q")
+        # Feature → (posiciones, pesos) de su posting en arrays de NumPy; se
+        # arma al puntuar y se descarta cuando el posting cambia
+        self._columns: Dict[str, Tuple["numpy.ndarray", "numpy.ndarray"]] = {}
+        self._related: Dict[str, Related] = {}
+        # Producto → productos cuya lista lo contiene
+        self._listed_by: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def related(self, product_id: str) -> Related:
+        """Retorna [(product_id, puntaje)] ordenado de mayor a menor similitud"""
+        return list(self._related.get(product_id, ()))
+
+    def fingerprints(self) -> Dict[str, str]:
+        return {product_id: features.fingerprint() for product_id, features in self._features.items()}
+
+    def _index(self, product_id: str, features: ProductFeatures) -> None:
+        self._features[product_id] = features
+        position = self._positions.get(product_id)
+        if position is None:
+            position = self._positions[product_id] = len(self._ids)
+            self._ids.append(product_id)
+            self._prices.append(features.price)
+        else:
+            self._prices[position] = features.price
+        for feature, weight in features.vector.items():
+            self._postings.setdefault(feature, {})[product_id] = weight
+            self._columns.pop(feature, None)
+
+    def _unindex(self, product_id: str) -> None:
+        features = self._features.pop(product_id, None)
+        if features is None:
+            return
+        for feature in features.vector:
+            self._columns.pop(feature, None)
+            posting = self._postings.get(feature)
+            if posting is not None:
+                posting.pop(product_id, None)
+                if not posting:
+                    del self._postings[feature]
+
+    def _set_related(self, product_id: str, related: Related) -> None:
+        for other_id, _ in self._related.get(product_id, ()):
+            self._listed_by.get(other_id, set()).discard(product_id)
+        if related:
+            self._related[product_id] = related
+            for other_id, _ in related:
+                self._listed_by.setdefault(other_id, set()).add(product_id)
+        else:
+            self._related.pop(product_id, None)
+
+    def _scores(self, product_id: str, limit: Optional[int] = None) -> Dict[str, float]:
+        """
+        Similitud con todos los productos que comparten alguna feature.
+
+        Con limit solo se necesitan los limit mejores: el camino vectorizado
+        descarta antes de redondear los candidatos que no pueden entrar.
+        """
+        if numpy is not None:
+            return self._scores_vectorized(product_id, limit)
+        features = self._features[product_id]
+        dots: Dict[str, float] = {}
+        for feature, weight in features.vector.items():
+            for other_id, other_weight in self._postings[feature].items():
+                if other_id != product_id:
+                    dots[other_id] = dots.get(other_id, 0.0) + weight * other_weight
+        return {
+            other_id: round(
+                (1 - PRICE_WEIGHT) * dot + PRICE_WEIGHT * price_proximity(features.price, self._features[other_id].price),
+                _SCORE_DIGITS
+            )
+            for other_id, dot in dots.items()
+        }
+
+    def _column(self, feature: str) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        column = self._columns.get(feature)
+        if column is None:
+            posting = self._postings[feature]
+            positions = self._positions
+            column = self._columns[feature] = (
+                numpy.fromiter((positions[other_id] for other_id in posting), dtype=numpy.int64, count=len(posting)),
+                numpy.fromiter(posting.values(), dtype=numpy.float64, count=len(posting))
+            )
+        return column
+
+    def _scores_vectorized(self, product_id: str, limit: Optional[int]) -> Dict[str, float]:
+        # Matriz dispersa (columnas de las features del producto) × vector del producto
+        features = self._features[product_id]
+        columns = [(self._column(feature), weight) for feature, weight in features.vector.items()]
+        if not columns:
+            return {}
+        rows = numpy.concatenate([positions for (positions, _), _ in columns])
+        products = numpy.concatenate([weights * weight for (_, weights), weight in columns])
+        # bincount acumula en el orden de rows: el mismo que el camino en Python
+        dots = numpy.bincount(rows, weights=products, minlength=len(self._ids))
+
+        candidates = numpy.unique(rows)
+        candidates = candidates[candidates != self._positions[product_id]]
+        prices = numpy.frombuffer(self._prices, dtype=numpy.int64)[candidates]
+        high = numpy.maximum(prices, features.price)
+        proximity = numpy.where(high > 0, numpy.minimum(prices, features.price) / numpy.maximum(high, 1), 1.0)
+        scores = (1 - PRICE_WEIGHT) * dots[candidates] + PRICE_WEIGHT * proximity
+        if limit is not None and len(scores) > limit:
+            # Redondear es monótono: quien queda más de una unidad de redondeo
+            # por debajo del limit-ésimo puntaje no puede entrar al top
+            kth = numpy.partition(scores, len(scores) - limit)[len(scores) - limit]
+            keep = scores >= kth - 2 * 10 ** -_SCORE_DIGITS
+            candidates, scores = candidates[keep], scores[keep]
+        # round de Python (no numpy.round) para redondear igual que el camino en Python
+        ids = self._ids
+        return {
+            ids[position]: round(score, _SCORE_DIGITS)
+            for position, score in zip(candidates.tolist(), scores.tolist())
+        }
+
+    def _top(self, scores: Dict[str, float]) -> Related:
+        return heapq.nsmallest(self.top_n, scores.items(), key=_rank_key)
+
+    def _best(self, product_id: str) -> Related:
+        return self._top(self._scores(product_id, self.top_n))
+
+    def _reset(self, features: Dict[str, ProductFeatures]) -> None:
+        self._features.clear()
+        self._postings.clear()
+        self._positions.clear()
+        self._ids.clear()
+        self._prices = array("q")
+        self._columns.clear()
+        self._related.clear()
+        self._listed_by.clear()
+        for product_id, product_features in features.items():
+            self._index(product_id, product_features)
+
+    def build(self, features: Dict[str, ProductFeatures]) -> None:
+        """Cálculo completo para todo el catálogo"""
+        self._reset(features)
+        for product_id in features:
+            self._set_related(product_id, self._best(product_id))
+
+    def load(self, features: Dict[str, ProductFeatures], related: Dict[str, Related]) -> None:
+        """
+        Restaura un cálculo previo.
+
+        Args:
+            features: Features de los productos que no cambiaron desde ese cálculo
+            related: Listas calculadas entonces (pueden referenciar productos
+                modificados o eliminados; sync los corrige)
+        """
+        self._reset(features)
+        for product_id, entries in related.items():
+            self._set_related(product_id, list(entries))
+
+    def update(self, product_id: str, features: Optional[ProductFeatures]) -> Set[str]:
+        """
+        Aplica el cambio de un producto (features None = producto eliminado).
+
+        Solo se tocan las listas de los productos que contenían al producto o
+        que comparten features con su nueva versión.
+
+        Returns:
+            IDs de los productos cuya lista cambió
+        """
+        containing = set(self._listed_by.get(product_id, ()))
+        self._unindex(product_id)
+
+        scores: Dict[str, float] = {}
+        changed: Set[str] = set()
+        if features is None:
+            self._set_related(product_id, [])
+            self._listed_by.pop(product_id, None)
+        else:
+            self._index(product_id, features)
+            scores = self._scores(product_id)
+            self._set_related(product_id, self._top(scores))
+            changed.add(product_id)
+
+        for other_id in containing | set(scores):
+            current = self._related.get(other_id, [])
+            old_score = next((score for listed_id, score in current if listed_id == product_id), None)
+            new_score = scores.get(other_id)
+            entries = [entry for entry in current if entry[0] != product_id]
+
+            if old_score is not None and (new_score is None or new_score < old_score):
+                # Bajó o salió: otro producto fuera de la lista puede ocupar su lugar
+                updated = self._best(other_id)
+            elif new_score is not None:
+                updated = sorted(entries + [(product_id, new_score)], key=_rank_key)[:self.top_n]
+            else:
+                continue
+
+            if updated != current:
+                self._set_related(other_id, updated)
+                changed.add(other_id)
+        return changed
+
+    def sync(self, features: Dict[str, ProductFeatures], previous: Dict[str, str]) -> Set[str]:
+        """
+        Actualiza incrementalmente contra el catálogo actual.
+
+        Args:
+            features: Features actuales de todos los productos
+            previous: Fingerprints del cálculo restaurado con load
+
+        Returns:
+            IDs de los productos cuya lista cambió
+        """
+        changed: Set[str] = set()
+        for product_id in [product_id for product_id in previous if product_id not in features]:
+            changed |= self.update(product_id, None)
+        for product_id, product_features in features.items():
+            if previous.get(product_id) != product_features.fingerprint():
+                changed |= self.update(product_id, product_features)
+        return changed
+
+
+def catalog_features(catalog: ICatalogSnapshot) -> Dict[str, ProductFeatures]:
+    """Features de todos los productos del catálogo"""
+    features = {}
+    for product_id in catalog.keys("product_detail"):
+        product_features = extract_features(catalog, product_id)
+        if product_features is not None:
+            features[product_id] = product_features
+    return features
+
+
+def _related_rows(catalog: ICatalogSnapshot, engine: RelatedProductEngine,
+                  product_ids: Iterable[str]) -> List[Dict[str, str]]:
+    """Filas de related_product_computed.csv con los datos de display actuales"""
+    max_installments = max(
+        (int(row['max_installments']) for row in catalog.get_rows("payment", GLOBAL_KEY) if row['max_installments']),
+        default=1
+    )
+    rows = []
+    for product_id in product_ids:
+        for related_id, _ in engine.related(product_id):
+            detail = catalog.get_rows("product_detail", related_id)[0]
+            images = sorted(catalog.get_rows("product_image", related_id), key=lambda image: int(image['order']))
+            shipping = catalog.get_rows("shipping", related_id)
+            is_free = bool(shipping) and shipping[0]['is_free'].lower() == 'true'
+            price = int(detail['price'])
+            discount = int(detail['discount']) if detail['discount'] else 0
+            rows.append({
+                "product_id": product_id,
+                "id": related_id,
+                "title": detail['title'],
+                "price": str(price),
+                "original_price": detail['original_price'] if discount else "",
+                "image": images[0]['url'] if images else "",
+                "discount": str(discount) if discount else "",
+                "installments": str(max_installments),
+                "installment_amount": str(price // max_installments),
+                # Sin datos de envío por primera compra: se asume igual al envío gratis
+                "is_free_shipping": "true" if is_free else "false",
+                "is_first_purchase_free_shipping": "true" if is_free else "false"
+            })
+    return rows
+
+
+def _write_atomic(path: str, write) -> None:
+    # Temporal propio en el mismo directorio: ejecuciones concurrentes no se
+    # pisan y el archivo queda en disco antes del rename
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".related-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+            write(file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save(catalog: ICatalogSnapshot, engine: RelatedProductEngine,
+         computed_path: str = COMPUTED_FILE, state_path: str = STATE_FILE) -> int:
+    """
+    Escribe la tabla calculada y el estado para la próxima ejecución incremental.
+
+    Returns:
+        Cantidad de filas escritas
+    """
+    rows = _related_rows(catalog, engine, catalog.keys("product_detail"))
+
+    def write_csv(file):
+        writer = csv.DictWriter(file, fieldnames=COMPUTED_COLUMNS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    def write_state(file):
+        json.dump({
+            "top_n": engine.top_n,
+            "fingerprints": engine.fingerprints(),
+            "related": {product_id: engine.related(product_id) for product_id in catalog.keys("product_detail")}
+        }, file, ensure_ascii=False, indent=1, sort_keys=True)
+
+    _write_atomic(computed_path, write_csv)
+    _write_atomic(state_path, write_state)
+    return len(rows)
+
+
+def rebuild(catalog: ICatalogSnapshot, state_path: str = STATE_FILE, full: bool = False,
+            top_n: int = DEFAULT_TOP_N) -> Tuple[RelatedProductEngine, Set[str]]:
+    """
+    Recalcula los relacionados, incrementalmente si hay un estado previo compatible.
+
+    Returns:
+        (motor con las listas actualizadas, IDs cuya lista cambió)
+    """
+    features = catalog_features(catalog)
+    engine = RelatedProductEngine(top_n)
+
+    state = None
+    if not full and os.path.exists(state_path):
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        if state.get("top_n") != top_n:
+            state = None
+
+    if state is None:
+        engine.build(features)
+        return engine, set(features)
+
+    # Las features de los productos sin cambios son las mismas que en el estado
+    previous = state["fingerprints"]
+    engine.load(
+        {
+            product_id: product_features for product_id, product_features in features.items()
+            if previous.get(product_id) == product_features.fingerprint()
+        },
+        {
+            product_id: [(other_id, score) for other_id, score in entries]
+            for product_id, entries in state["related"].items()
+        }
+    )
+    return engine, engine.sync(features, previous)
+
+
+if __name__ == "__main__":
+    import argparse
+    from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+
+    parser = argparse.ArgumentParser(description="Calcula los productos relacionados del catálogo")
+    parser.add_argument("--full", action="store_true", help="Ignora el estado previo y recalcula todo")
+    args = parser.parse_args()
+
+    snapshot = CatalogSnapshot.load()
+    result, changed_ids = rebuild(snapshot, full=args.full)
+    written = save(snapshot, result)
+    print(f"Related products: {len(changed_ids)} lists recomputed, {written} rows written to {COMPUTED_FILE}")
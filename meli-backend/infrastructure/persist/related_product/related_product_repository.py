@@ -1,41 +1,53 @@
 """Repositorio CSV para RelatedProduct"""
 
-import csv
 import os
 from typing import List, Optional
 from domain.related_product.entity.related_product import RelatedProduct
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class RelatedProductRepository:
-    """Repositorio que lee productos relacionados desde CSV"""
+    """
+    Repositorio que lee productos relacionados desde CSV.
 
-    def __init__(self):
+    Usa la lista curada (related_product.csv) si el producto la tiene; si no,
+    la calculada por el motor de similitud (related_product_computed.csv).
+    """
+
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "related_product.csv")
+        self.computed_csv_path = os.path.join(current_dir, "data", "related_product_computed.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> List[RelatedProduct]:
         """Obtiene todos los productos relacionados de un producto"""
         related_products = []
+        make_related = entity_constructor(RelatedProduct, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        product = RelatedProduct(
-                            id=row['id'],
-                            title=row['title'],
-                            price=int(row['price']),
-                            original_price=int(row['original_price']) if row['original_price'] else None,
-                            image=row['image'],
-                            discount=int(row['discount']) if row['discount'] else None,
-                            installments=int(row['installments']),
-                            installment_amount=int(row['installment_amount']),
-                            is_free_shipping=row['is_free_shipping'].lower() == 'true',
-                            is_first_purchase_free_shipping=row['is_first_purchase_free_shipping'].lower() == 'true'
-                        )
-                        related_products.append(product)
+            rows = list(iter_rows(self.csv_path, "related_product", product_id, self._catalog))
+            if not rows:
+                rows = iter_rows(self.computed_csv_path, "related_product_computed", product_id, self._catalog)
+            for row in rows:
+                product = make_related(
+                    id=row['id'],
+                    title=row['title'],
+                    price=int(row['price']),
+                    original_price=int(row['original_price']) if row['original_price'] else None,
+                    image=row['image'],
+                    discount=int(row['discount']) if row['discount'] else None,
+                    installments=int(row['installments']),
+                    installment_amount=int(row['installment_amount']),
+                    is_free_shipping=row['is_free_shipping'].lower() == 'true',
+                    is_first_purchase_free_shipping=row['is_first_purchase_free_shipping'].lower() == 'true'
+                )
+                related_products.append(product)
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading related product CSV: {e}")
         return related_products
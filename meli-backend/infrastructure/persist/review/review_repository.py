@@ -2,94 +2,277 @@
 
 import csv
 import os
-from typing import List, Dict, Optional
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
 from domain.review.entity.review import Review
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
+
+# Directorio de review.csv (y, por defecto, del log de reviews que se compacta en él)
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# Columnas del CSV con el rating de cada categoría
+CATEGORY_RATING_COLUMNS = ('camera_quality', 'battery_life', 'screen_quality',
+                           'performance', 'build_quality', 'value_for_money')
+
+
+class ReviewAggregate(NamedTuple):
+    """Sumas y conteos de los ratings de un producto (se actualizan de a una review)"""
+    count: int
+    rating_sum: float
+    distribution: Dict[int, int]
+    category_sums: Dict[str, int]
+    category_counts: Dict[str, int]
+
+    @classmethod
+    def empty(cls) -> "ReviewAggregate":
+        return cls(0, 0.0, {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}, {}, {})
+
+    def add(self, review: Review) -> "ReviewAggregate":
+        """Retorna un agregado nuevo que incluye la review (no modifica este)"""
+        star = int(review.rating)
+        distribution = dict(self.distribution)
+        distribution[star] = distribution.get(star, 0) + 1
+        category_sums = dict(self.category_sums)
+        category_counts = dict(self.category_counts)
+        for cat_id, rating in (review.category_ratings or {}).items():
+            category_sums[cat_id] = category_sums.get(cat_id, 0) + rating
+            category_counts[cat_id] = category_counts.get(cat_id, 0) + 1
+        return ReviewAggregate(self.count + 1, self.rating_sum + review.rating,
+                               distribution, category_sums, category_counts)
+
+    def to_statistics(self) -> Dict:
+        """Estadísticas en el formato de get_statistics"""
+        if not self.count:
+            return {
+                'average_rating': 0.0,
+                'total_reviews': 0,
+                'rating_distribution': {5: 0, 4: 0, 3: 0, 2: 0, 1: 0},
+                'average_category_ratings': {}
+            }
+        return {
+            'average_rating': round(self.rating_sum / self.count, 1),
+            'total_reviews': self.count,
+            'rating_distribution': dict(self.distribution),
+            'average_category_ratings': {
+                cat_id: self.category_sums[cat_id] / self.category_counts[cat_id]
+                for cat_id in self.category_sums
+            }
+        }
+
+
+class _ProductReviews(NamedTuple):
+    """Reviews agregadas a un producto por la API, con el agregado ya actualizado"""
+    # De la más nueva a la más vieja
+    reviews: Tuple[Review, ...]
+    ids: FrozenSet[str]
+    aggregate: ReviewAggregate
 
 
 class ReviewRepository:
-    """Repositorio que lee reviews desde CSV"""
+    """
+    Repositorio que lee reviews desde CSV.
 
-    def __init__(self):
-        current_dir = os.path.dirname(__file__)
-        self.csv_path = os.path.join(current_dir, "data", "review.csv")
+    Las reviews escritas por la API se guardan en un índice en memoria por
+    producto, delante de las del CSV. Cada escritura publica de forma atómica
+    una entrada nueva (reviews y agregado de ratings): los lectores nunca
+    toman locks ni ven un estado intermedio, y las estadísticas se leen del
+    agregado sin recorrer las reviews.
+    """
 
-    def get_by_product_id(self, product_id: str) -> List[Review]:
-        """Obtiene todos los reviews de un producto"""
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
+        self.csv_path = os.path.join(DATA_DIR, "review.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+        self._appended: Dict[str, _ProductReviews] = {}
+        # IDs y agregado de las reviews del catálogo (inmutable) por producto
+        self._base: Dict[str, Tuple[FrozenSet[str], ReviewAggregate]] = {}
+        self._write_lock = threading.Lock()
+
+    def _read_base(self, product_id: str) -> List[Review]:
+        """Reviews del producto en los datos base (catálogo o CSV)"""
         reviews = []
+        make_review = entity_constructor(Review, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        # Procesar imágenes
-                        images = None
-                        if row['images']:
-                            images = row['images'].split('|')
-
-                        # Procesar category ratings
-                        category_ratings = {}
-                        for key in ['camera_quality', 'battery_life', 'screen_quality',
-                                   'performance', 'build_quality', 'value_for_money']:
-                            if row[key]:
-                                category_ratings[key] = int(row[key])
-
-                        review = Review(
-                            id=row['id'],
-                            user_name=row['user_name'],
-                            rating=float(row['rating']),
-                            date=row['date'],
-                            comment=row['comment'],
-                            likes=int(row['likes']),
-                            verified=row['verified'].lower() == 'true',
-                            images=images,
-                            category_ratings=category_ratings if category_ratings else None
-                        )
-                        reviews.append(review)
+            for row in iter_rows(self.csv_path, "review", product_id, self._catalog):
+                reviews.append(self._from_row(row, make_review))
         except FileNotFoundError:
             pass
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading review CSV: {e}")
         return reviews
 
+    def read_csv(self) -> List[Tuple[str, Review]]:
+        """
+        Todas las reviews de review.csv tal como está en disco, sin pasar por
+        el catálogo (incluye lo volcado por compactaciones posteriores a su carga).
+
+        Returns:
+            (product_id, review) en el orden del archivo
+        """
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            return [(row['product_id'], self._from_row(row, Review)) for row in csv.DictReader(file)]
+
+    @staticmethod
+    def _from_row(row: Dict[str, str], make_review: Callable[..., Review]) -> Review:
+        # Procesar imágenes
+        images = None
+        if row['images']:
+            images = row['images'].split('|')
+
+        # Procesar category ratings
+        category_ratings = {}
+        for key in CATEGORY_RATING_COLUMNS:
+            if row[key]:
+                category_ratings[key] = int(row[key])
+
+        return make_review(
+            id=row['id'],
+            user_name=row['user_name'],
+            rating=float(row['rating']),
+            date=row['date'],
+            comment=row['comment'],
+            likes=int(row['likes']),
+            verified=row['verified'].lower() == 'true',
+            images=images,
+            category_ratings=category_ratings if category_ratings else None
+        )
+
+    def _get_base(self, product_id: str) -> Tuple[FrozenSet[str], ReviewAggregate]:
+        """IDs y agregado de las reviews base (memorizados si hay catálogo)"""
+        base = self._base.get(product_id)
+        if base is None:
+            reviews = self._read_base(product_id)
+            aggregate = ReviewAggregate.empty()
+            for review in reviews:
+                aggregate = aggregate.add(review)
+            base = (frozenset(review.id for review in reviews), aggregate)
+            # Sin catálogo el CSV puede cambiar (compactación): no se memoriza
+            if self._catalog is not None:
+                self._base[product_id] = base
+        return base
+
+    def get_by_product_id(self, product_id: str) -> List[Review]:
+        """Obtiene todos los reviews de un producto (los agregados por la API primero)"""
+        reviews = self._read_base(product_id)
+        appended = self._appended.get(product_id)
+        if appended is None:
+            return reviews
+        base_ids = {review.id for review in reviews}
+        return [review for review in appended.reviews if review.id not in base_ids] + reviews
+
     def get_statistics(self, product_id: str) -> Dict:
         """Calcula estadísticas de reviews para un producto"""
-        reviews = self.get_by_product_id(product_id)
+        appended = self._appended.get(product_id)
+        if self._catalog is None:
+            # Sin catálogo se recalcula sobre el CSV actual más lo agregado
+            aggregate = ReviewAggregate.empty()
+            for review in self.get_by_product_id(product_id):
+                aggregate = aggregate.add(review)
+        elif appended is not None:
+            aggregate = appended.aggregate
+        else:
+            aggregate = self._get_base(product_id)[1]
+        return aggregate.to_statistics()
 
-        if not reviews:
-            return {
-                'average_rating': 0.0,
-                'total_reviews': 0,
-                'rating_distribution': {5: 0, 4: 0, 3: 0, 2: 0, 1: 0},
-                'average_category_ratings': {}
-            }
+    def add(self, product_id: str, review: Review) -> bool:
+        """
+        Agrega una review al índice en memoria y actualiza el agregado del producto.
+
+        Returns:
+            False si la review ya estaba (en el CSV o agregada antes), True si se agregó
+        """
+        with self._write_lock:
+            base_ids, base_aggregate = self._get_base(product_id)
+            current = self._appended.get(product_id) or _ProductReviews((), frozenset(), base_aggregate)
+            if review.id in base_ids or review.id in current.ids:
+                return False
+            # Se publica una entrada nueva: los lectores ven la anterior o esta, completas
+            self._appended[product_id] = _ProductReviews(
+                (review,) + current.reviews,
+                current.ids | {review.id},
+                current.aggregate.add(review)
+            )
+            return True
+
+    def merge_into_csv(self, reviews: Iterable[Tuple[str, Review]]) -> int:
+        """
+        Escribe reviews en review.csv (compactación del log de escrituras).
+
+        Las reviews nuevas de cada producto quedan antes de las existentes (de
+        la más nueva a la más vieja) y las que ya están en el CSV se omiten,
+        así que repetir una compactación interrumpida no duplica filas. El
+        archivo se reemplaza de forma atómica.
+
+        Args:
+            reviews: (product_id, review) en el orden en que se escribieron
+
+        Returns:
+            Cantidad de filas agregadas
+        """
+        with open(self.csv_path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.DictReader(file)
+            columns = reader.fieldnames
+            rows = list(reader)
+
+        existing = {row['id'] for row in rows}
+        pending: "OrderedDict[str, List[Dict[str, str]]]" = OrderedDict()
+        for product_id, review in reviews:
+            if review.id in existing:
+                continue
+            existing.add(review.id)
+            pending.setdefault(product_id, []).insert(0, self._to_row(product_id, review))
+        if not pending:
+            return 0
+
+        merged: List[Dict[str, str]] = []
+        for row in rows:
+            merged.extend(pending.pop(row['product_id'], ()))
+            merged.append(row)
+        for new_rows in pending.values():
+            merged.extend(new_rows)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.csv_path), prefix=".review-", suffix=".csv")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(merged)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.csv_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return len(merged) - len(rows)
 
-        # Calcular promedio general
-        total_rating = sum(r.rating for r in reviews)
-        average_rating = total_rating / len(reviews)
-
-        # Calcular distribución de ratings
-        distribution = {5: 0, 4: 0, 3: 0, 2: 0, 1: 0}
-        for review in reviews:
-            star = int(review.rating)
-            distribution[star] = distribution.get(star, 0) + 1
-
-        # Calcular promedios por categoría
-        category_sums = {}
-        category_counts = {}
-        for review in reviews:
-            if review.category_ratings:
-                for cat_id, rating in review.category_ratings.items():
-                    category_sums[cat_id] = category_sums.get(cat_id, 0) + rating
-                    category_counts[cat_id] = category_counts.get(cat_id, 0) + 1
-
-        average_category_ratings = {
-            cat_id: category_sums[cat_id] / category_counts[cat_id]
-            for cat_id in category_sums
+    @staticmethod
+    def _to_row(product_id: str, review: Review) -> Dict[str, str]:
+        row = {
+            'id': review.id,
+            'product_id': product_id,
+            'user_name': review.user_name,
+            'rating': str(review.rating),
+            'date': review.date,
+            'comment': review.comment,
+            'likes': str(review.likes),
+            'verified': 'true' if review.verified else 'false',
+            'images': '|'.join(review.images or ())
         }
+        for key in CATEGORY_RATING_COLUMNS:
+            rating = (review.category_ratings or {}).get(key)
+            row[key] = '' if rating is None else str(rating)
+        return row
 
+    def get_stats(self) -> Dict[str, int]:
+        """Productos y reviews del índice en memoria"""
+        appended = list(self._appended.values())
         return {
-            'average_rating': round(average_rating, 1),
-            'total_reviews': len(reviews),
-            'rating_distribution': distribution,
-            'average_category_ratings': average_category_ratings
+            "products": len(appended),
+            "reviews": sum(len(entry.reviews) for entry in appended)
         }
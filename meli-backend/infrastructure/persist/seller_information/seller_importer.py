@@ -0,0 +1,125 @@
+"""
+Importador del CSV de vendedores por producto al formato normalizado.
+
+El formato original (seller_information.csv) repite el registro completo del
+vendedor en cada producto. El importador lo separa en:
+
+- seller.csv: un registro por vendedor, identificado por seller_id
+- product_seller.csv: mapa product_id → seller_id
+
+Los registros idénticos se deduplican; dos vendedores distintos con el mismo
+nombre reciben seller_id distintos (sufijo -2, -3...).
+
+Uso:
+    python -m infrastructure.persist.seller_information.seller_importer legacy.csv [directorio_salida]
+"""
+
+import csv
+import os
+import re
+import unicodedata
+from typing import Dict, List, NamedTuple, Tuple
+
+# Columnas del CSV normalizado de vendedores (sin product_id)
+SELLER_COLUMNS = [
+    "seller_id", "name", "logo", "is_official_store", "followers", "total_products",
+    "level", "location", "positive_rating", "total_sales", "rating", "review_count",
+    "reputation_red", "reputation_orange", "reputation_yellow", "reputation_green",
+    "reputation_message", "good_attention", "on_time_delivery"
+]
+PRODUCT_SELLER_COLUMNS = ["product_id", "seller_id"]
+
+SELLER_FILE = "seller.csv"
+PRODUCT_SELLER_FILE = "product_seller.csv"
+
+
+class SellerImportResult(NamedTuple):
+    """Resultado de la importación"""
+    seller_count: int
+    product_count: int
+    seller_path: str
+    product_seller_path: str
+
+
+def slugify(name: str) -> str:
+    """'Apple Store Oficial' → 'apple-store-oficial'"""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-") or "seller"
+
+
+def deduplicate_sellers(rows: List[Dict[str, str]]) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    """
+    Separa filas por producto en vendedores únicos y el mapa producto → vendedor.
+
+    Args:
+        rows: Filas del CSV original (con product_id y todas las columnas del vendedor)
+
+    Returns:
+        (filas de seller.csv, filas de product_seller.csv), en orden de aparición
+    """
+    record_columns = SELLER_COLUMNS[1:]
+    seller_ids: Dict[Tuple[str, ...], str] = {}
+    used_ids: Dict[str, int] = {}
+    sellers: List[Dict[str, str]] = []
+    product_sellers: List[Dict[str, str]] = []
+
+    for row in rows:
+        record = tuple(row[column] for column in record_columns)
+        seller_id = seller_ids.get(record)
+        if seller_id is None:
+            base_id = slugify(row["name"])
+            used_ids[base_id] = used_ids.get(base_id, 0) + 1
+            seller_id = base_id if used_ids[base_id] == 1 else f"{base_id}-{used_ids[base_id]}"
+            seller_ids[record] = seller_id
+            sellers.append(dict(zip(SELLER_COLUMNS, (seller_id,) + record)))
+        product_sellers.append({"product_id": row["product_id"], "seller_id": seller_id})
+
+    return sellers, product_sellers
+
+
+def _write_csv(path: str, columns: List[str], rows: List[Dict[str, str]]) -> None:
+    # Escritura atómica: el catálogo nunca ve un archivo a medio escribir
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=columns, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temporary_path, path)
+
+
+def import_legacy_sellers(legacy_path: str, output_dir: str) -> SellerImportResult:
+    """
+    Convierte un seller_information.csv por producto al formato normalizado.
+
+    Args:
+        legacy_path: Ruta del CSV original
+        output_dir: Directorio donde se escriben seller.csv y product_seller.csv
+
+    Returns:
+        SellerImportResult con la cantidad de vendedores y productos importados
+    """
+    with open(legacy_path, 'r', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+
+    sellers, product_sellers = deduplicate_sellers(rows)
+
+    os.makedirs(output_dir, exist_ok=True)
+    seller_path = os.path.join(output_dir, SELLER_FILE)
+    product_seller_path = os.path.join(output_dir, PRODUCT_SELLER_FILE)
+    _write_csv(seller_path, SELLER_COLUMNS, sellers)
+    _write_csv(product_seller_path, PRODUCT_SELLER_COLUMNS, product_sellers)
+
+    return SellerImportResult(len(sellers), len(product_sellers), seller_path, product_seller_path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m infrastructure.persist.seller_information.seller_importer "
+              "<legacy_csv> [output_dir]")
+        sys.exit(2)
+
+    default_dir = os.path.join(os.path.dirname(__file__), "data")
+    result = import_legacy_sellers(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else default_dir)
+    print(f"Imported {result.product_count} products from {result.seller_count} sellers")
@@ -1,50 +1,98 @@
 """Repositorio CSV para SellerInformation"""
 
-import csv
 import os
-from typing import Optional
+from typing import Dict, Optional
 from domain.seller_information.entity.seller_information import SellerInformation, Reputation, SellerLevel
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class SellerInformationRepository:
-    """Repositorio que lee información del vendedor desde CSV"""
+    """
+    Repositorio que lee información del vendedor desde CSV.
 
-    def __init__(self):
+    Los vendedores están normalizados: seller.csv tiene un registro por vendedor
+    y product_seller.csv mapea cada producto a su seller_id. Con catálogo, cada
+    vendedor se construye una sola vez y la misma instancia inmutable se
+    comparte entre todos sus productos.
+    """
+
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
-        self.csv_path = os.path.join(current_dir, "data", "seller_information.csv")
+        self.csv_path = os.path.join(current_dir, "data", "seller.csv")
+        self.product_seller_csv_path = os.path.join(current_dir, "data", "product_seller.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
+        # Vendedores ya construidos por seller_id (el snapshot es inmutable)
+        self._sellers: Dict[str, SellerInformation] = {}
 
-    def get_by_product_id(self, product_id: str) -> Optional[SellerInformation]:
-        """Obtiene información del vendedor por ID de producto"""
+    @property
+    def data_version(self) -> Optional[str]:
+        """Versión del catálogo leído (None si se lee el CSV directamente)"""
+        return self._catalog.version if self._catalog is not None else None
+
+    def get_seller_id_by_product_id(self, product_id: str) -> Optional[str]:
+        """Obtiene el seller_id del vendedor de un producto"""
+        try:
+            for row in iter_rows(self.product_seller_csv_path, "product_seller", product_id, self._catalog):
+                return row['seller_id']
+            return None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self._strict:
+                raise
+            print(f"Error reading product seller CSV: {e}")
+            return None
+
+    def get_by_seller_id(self, seller_id: str) -> Optional[SellerInformation]:
+        """Obtiene información del vendedor por su seller_id"""
+        seller = self._sellers.get(seller_id)
+        if seller is not None:
+            return seller
+
+        make_seller = entity_constructor(SellerInformation, self._catalog, self._strict)
+        make_reputation = entity_constructor(Reputation, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        return SellerInformation(
-                            name=row['name'],
-                            logo=row['logo'],
-                            is_official_store=row['is_official_store'].lower() == 'true',
-                            followers=int(row['followers']),
-                            total_products=int(row['total_products']),
-                            level=SellerLevel(row['level']),
-                            location=row['location'],
-                            positive_rating=float(row['positive_rating']),
-                            total_sales=int(row['total_sales']),
-                            rating=float(row['rating']),
-                            review_count=int(row['review_count']),
-                            reputation=Reputation(
-                                red=int(row['reputation_red']),
-                                orange=int(row['reputation_orange']),
-                                yellow=int(row['reputation_yellow']),
-                                green=int(row['reputation_green'])
-                            ),
-                            reputation_message=row['reputation_message'],
-                            good_attention=row['good_attention'].lower() == 'true',
-                            on_time_delivery=row['on_time_delivery'].lower() == 'true'
-                        )
+            for row in iter_rows(self.csv_path, "seller", seller_id, self._catalog):
+                seller = make_seller(
+                    name=row['name'],
+                    logo=row['logo'],
+                    is_official_store=row['is_official_store'].lower() == 'true',
+                    followers=int(row['followers']),
+                    total_products=int(row['total_products']),
+                    level=SellerLevel(row['level']),
+                    location=row['location'],
+                    positive_rating=float(row['positive_rating']),
+                    total_sales=int(row['total_sales']),
+                    rating=float(row['rating']),
+                    review_count=int(row['review_count']),
+                    reputation=make_reputation(
+                        red=int(row['reputation_red']),
+                        orange=int(row['reputation_orange']),
+                        yellow=int(row['reputation_yellow']),
+                        green=int(row['reputation_green'])
+                    ),
+                    reputation_message=row['reputation_message'],
+                    good_attention=row['good_attention'].lower() == 'true',
+                    on_time_delivery=row['on_time_delivery'].lower() == 'true'
+                )
+                if self._catalog is not None:
+                    # setdefault: si dos hilos lo construyen a la vez, ambos comparten la misma instancia
+                    seller = self._sellers.setdefault(seller_id, seller)
+                return seller
             return None
         except FileNotFoundError:
             return None
         except Exception as e:
-            print(f"Error reading seller information CSV: {e}")
+            if self._strict:
+                raise
+            print(f"Error reading seller CSV: {e}")
+            return None
+
+    def get_by_product_id(self, product_id: str) -> Optional[SellerInformation]:
+        """Obtiene información del vendedor por ID de producto"""
+        seller_id = self.get_seller_id_by_product_id(product_id)
+        if seller_id is None:
             return None
+        return self.get_by_seller_id(seller_id)
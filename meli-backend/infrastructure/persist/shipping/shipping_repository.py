@@ -1,35 +1,39 @@
 """Repositorio CSV para Shipping"""
 
-import csv
 import os
 from typing import Optional
 from domain.shipping.entity.shipping import Shipping, EstimatedDays
+from infrastructure.persist.catalog.catalog_snapshot import ICatalogSnapshot, entity_constructor, iter_rows
 
 
 class ShippingRepository:
     """Repositorio que lee datos de shipping desde CSV"""
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ICatalogSnapshot] = None, strict: bool = False):
         current_dir = os.path.dirname(__file__)
         self.csv_path = os.path.join(current_dir, "data", "shipping.csv")
+        self._catalog = catalog
+        # En modo estricto los errores de datos se propagan (validación de carga)
+        self._strict = strict
 
     def get_by_product_id(self, product_id: str) -> Optional[Shipping]:
         """Obtiene información de envío por ID de producto"""
+        make_shipping = entity_constructor(Shipping, self._catalog, self._strict)
+        make_estimated_days = entity_constructor(EstimatedDays, self._catalog, self._strict)
         try:
-            with open(self.csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row['product_id'] == product_id:
-                        return Shipping(
-                            is_free=row['is_free'].lower() == 'true',
-                            estimated_days=EstimatedDays(
-                                min=int(row['min_days']),
-                                max=int(row['max_days'])
-                            )
-                        )
+            for row in iter_rows(self.csv_path, "shipping", product_id, self._catalog):
+                return make_shipping(
+                    is_free=row['is_free'].lower() == 'true',
+                    estimated_days=make_estimated_days(
+                        min=int(row['min_days']),
+                        max=int(row['max_days'])
+                    )
+                )
             return None
         except FileNotFoundError:
             return None
         except Exception as e:
+            if self._strict:
+                raise
             print(f"Error reading shipping CSV: {e}")
             return None
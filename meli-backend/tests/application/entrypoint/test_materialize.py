@@ -0,0 +1,86 @@
+"""Tests para el job de materialización offline"""
+
+import csv
+import gzip
+import os
+import shutil
+
+import pytest
+from application.entrypoint.materialize import materialize, payload_fingerprint
+from infrastructure.cache.compression import GZIP, IDENTITY
+from infrastructure.cache.payload_pack import MmapPayloadPack
+from infrastructure.persist.catalog.catalog_loader import load_validated_snapshot
+from infrastructure.persist.catalog.catalog_snapshot import PERSIST_DIR
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Copia de los CSV del catálogo que el test puede modificar"""
+    target = tmp_path / "persist"
+    shutil.copytree(PERSIST_DIR, target, ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    return str(target)
+
+
+def _edit_review(base_dir: str, product_id: str) -> None:
+    """Modifica el comentario de una review del producto"""
+    path = os.path.join(base_dir, "review", "data", "review.csv")
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        rows = list(csv.reader(file))
+    header = rows[0]
+    row = next(row for row in rows[1:] if row[header.index("product_id")] == product_id)
+    row[header.index("comment")] = "Comentario editado"
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        csv.writer(file).writerows(rows)
+
+
+class TestMaterialize:
+    """Tests para la materialización e incremental del pack"""
+
+    def test_materializes_every_product(self, base_dir, tmp_path):
+        """Debe renderizar en el pool cada producto de product_detail.csv"""
+        output = str(tmp_path / "payloads.pack")
+
+        summary = materialize(output, workers=2, encodings=[GZIP], base_dir=base_dir)
+
+        catalog = load_validated_snapshot(base_dir)
+        pack = MmapPayloadPack(output)
+        assert summary["version"] == catalog.version == pack.version
+        assert summary["reused"] == 0
+        assert len(pack) == summary["products"] == len(catalog.keys("product_detail")) - len(summary["skipped"])
+        body = pack.get("MLC621083881")
+        assert b'"MLC621083881"' in body
+        assert gzip.decompress(pack.get("MLC621083881", GZIP)) == body
+        pack.close()
+
+    def test_rebuilds_only_changed_products(self, base_dir, tmp_path):
+        """Tras editar una review solo ese producto se vuelve a renderizar"""
+        output = str(tmp_path / "payloads.pack")
+        first = materialize(output, workers=1, encodings=[GZIP], base_dir=base_dir)
+
+        unchanged = materialize(output, workers=1, encodings=[GZIP], base_dir=base_dir)
+        assert unchanged["rendered"] == 0
+        assert unchanged["reused"] == first["products"]
+
+        _edit_review(base_dir, "MLC621083881")
+        changed = materialize(output, workers=1, encodings=[GZIP], base_dir=base_dir)
+
+        assert changed["rendered"] == 1
+        assert changed["reused"] == first["products"] - 1
+        pack = MmapPayloadPack(output)
+        assert b"Comentario editado" in pack.get("MLC621083881")
+        assert pack.version != first["version"]
+        pack.close()
+
+    def test_fingerprint_depends_on_product_rows(self, base_dir):
+        """La huella solo cambia para el producto cuyas filas cambiaron"""
+        before = load_validated_snapshot(base_dir)
+        _edit_review(base_dir, "MLC621083881")
+        after = load_validated_snapshot(base_dir)
+
+        assert payload_fingerprint(before, "MLC621083881") != payload_fingerprint(after, "MLC621083881")
+        assert payload_fingerprint(before, "MLC137702355") == payload_fingerprint(after, "MLC137702355")
+
+    def test_unsupported_encoding(self, tmp_path):
+        """Debe rechazar codificaciones que no se pueden generar"""
+        with pytest.raises(ValueError):
+            materialize(str(tmp_path / "payloads.pack"), encodings=[IDENTITY, "zstd"])
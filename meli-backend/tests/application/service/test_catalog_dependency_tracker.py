@@ -0,0 +1,178 @@
+"""Tests para el tracker de dependencias entre el catálogo y las secciones del detalle"""
+
+import csv
+import os
+import shutil
+
+import pytest
+from application.service.catalog_dependency_tracker import (
+    SECTION_TABLES,
+    UNTRACKED_TABLES,
+    CatalogDependencyTracker,
+    diff_catalogs,
+    plan_catalog_update
+)
+from application.service.detail_product_orchestrator_service import SECTIONS
+from infrastructure.container import dependency_container
+from infrastructure.persist.catalog.catalog_snapshot import GLOBAL_KEY, PERSIST_DIR, CatalogSnapshot
+
+
+def _render(assembler, product_id: str, version: str) -> bytes:
+    """JSON completo de un producto, armado igual que el endpoint"""
+    return ''.join(assembler.assemble(product_id, version).pieces).encode('utf-8')
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Copia de los CSV del catálogo que el test puede modificar"""
+    target = tmp_path / "persist"
+    shutil.copytree(PERSIST_DIR, target, ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    return str(target)
+
+
+def _edit_csv(base_dir: str, relative_path: str, key_column: str, key: str, column: str, value: str) -> None:
+    """Modifica un campo de la primera fila con la clave indicada"""
+    path = os.path.join(base_dir, relative_path)
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        rows = list(csv.reader(file))
+    header = rows[0]
+    row = next(row for row in rows[1:] if row[header.index(key_column)] == key)
+    row[header.index(column)] = value
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        csv.writer(file).writerows(rows)
+
+
+class TestCatalogDependencyTracker:
+    """Tests para las dependencias registradas por sección"""
+
+    def test_every_section_is_tracked(self):
+        """Cada sección del detalle debe declarar sus tablas"""
+        assert set(SECTION_TABLES) == set(SECTIONS)
+        assert UNTRACKED_TABLES == {"variant_product_mapping"}
+
+    def test_dependencies_include_rows_and_entities(self):
+        """Las dependencias incluyen las filas del producto, su vendedor y las tablas globales"""
+        dependencies = CatalogDependencyTracker(CatalogSnapshot.load()).dependencies("MLC621083881")
+
+        assert dependencies["basics"] == [("product_detail", "MLC621083881")]
+        assert ("seller", "apple-store-oficial") in dependencies["seller"]
+        assert ("payment", GLOBAL_KEY) in dependencies["payments"]
+
+    def test_referencing_products(self):
+        """Debe resolver los productos de un vendedor"""
+        tracker = CatalogDependencyTracker(CatalogSnapshot.load())
+
+        assert "MLC621083881" in tracker.referencing_products("seller", "apple-store-oficial")
+
+
+class TestCatalogUpdate:
+    """Tests para el diff fila a fila y el conjunto mínimo de secciones afectadas"""
+
+    def test_same_data_has_no_changes(self, base_dir):
+        """Dos cargas de los mismos CSV no deben tener diferencias"""
+        assert diff_catalogs(CatalogSnapshot.load(base_dir), CatalogSnapshot.load(base_dir)).empty
+
+    def test_review_edit_affects_one_section_of_one_product(self, base_dir):
+        """Editar una review solo invalida la sección de reviews de ese producto"""
+        old = CatalogSnapshot.load(base_dir)
+        _edit_csv(base_dir, "review/data/review.csv", "product_id", "MLC621083881", "comment", "Editado")
+        new = CatalogSnapshot.load(base_dir)
+
+        update = plan_catalog_update(old, new)
+
+        assert update.affected == {"MLC621083881": frozenset({"reviews"})}
+        assert update.diff.tables["review"].added_rows == 1
+        assert update.diff.tables["review"].removed_rows == 1
+
+    def test_category_path_edit(self, base_dir):
+        """Editar la ruta de categorías solo invalida esa sección"""
+        old = CatalogSnapshot.load(base_dir)
+        _edit_csv(base_dir, "category_path/data/category_path.csv", "product_id", "MLC621083881", "label", "Tecnología")
+        new = CatalogSnapshot.load(base_dir)
+
+        assert plan_catalog_update(old, new).affected == {"MLC621083881": frozenset({"category_path"})}
+
+    def test_seller_edit_affects_its_products(self, base_dir):
+        """Editar un vendedor invalida la sección de vendedor de todos sus productos"""
+        old = CatalogSnapshot.load(base_dir)
+        _edit_csv(base_dir, "seller_information/data/seller.csv", "seller_id", "apple-store-oficial", "followers", "1")
+        new = CatalogSnapshot.load(base_dir)
+
+        update = plan_catalog_update(old, new)
+
+        assert update.stale_products == CatalogDependencyTracker(new).referencing_products(
+            "seller", "apple-store-oficial"
+        )
+        assert "MLC621083881" in update.stale_products
+        assert set(update.affected.values()) == {frozenset({"seller"})}
+
+    def test_global_table_edit_affects_every_product(self, base_dir):
+        """Editar un medio de pago invalida la sección de pagos de todos los productos"""
+        old = CatalogSnapshot.load(base_dir)
+        _edit_csv(base_dir, "payment/data/payment.csv", "id", "amex", "max_installments", "6")
+        new = CatalogSnapshot.load(base_dir)
+
+        update = plan_catalog_update(old, new)
+
+        assert update.stale_products == frozenset(new.keys("product_detail"))
+        assert set(update.affected.values()) == {frozenset({"payments"})}
+        assert update.to_dict()["tables"] == {"payment": {"changed_keys": 1, "added_rows": 1, "removed_rows": 1}}
+
+
+class TestCatalogReload:
+    """Tests para la recarga del catálogo conservando los cachés"""
+
+    def test_reload_keeps_unaffected_payloads(self, base_dir, monkeypatch):
+        """Tras editar una review solo se descarta el payload de ese producto"""
+        container = dependency_container.DependencyContainer(CatalogSnapshot.load(base_dir))
+        monkeypatch.setattr(dependency_container, "_default_container", container)
+        old_version = container.get_catalog().version
+        response_cache = container.get_product_response_cache()
+        assembler = container.get_section_assembler()
+        for product_id in ("MLC621083881", "MLC137702355"):
+            response_cache.put(product_id, old_version, _render(assembler, product_id, old_version))
+
+        _edit_csv(base_dir, "review/data/review.csv", "product_id", "MLC621083881", "comment", "Editado")
+        summary = dependency_container.reload_default_container(CatalogSnapshot.load(base_dir))
+
+        reloaded = dependency_container.get_default_container()
+        new_version = reloaded.get_catalog().version
+        assert summary["changed"] is True
+        assert summary["stale_products"] == 1
+        assert reloaded.get_product_response_cache() is response_cache
+        assert response_cache.get("MLC137702355", new_version) is not None
+        assert response_cache.get("MLC621083881", new_version) is None
+        # Solo la sección de reviews se vuelve a consultar
+        fragments = reloaded.get_section_fragment_cache()
+        assert fragments.get("MLC621083881", new_version, "seller") is not None
+        assert fragments.get("MLC621083881", new_version, "reviews") is None
+        assert b"Editado" in _render(reloaded.get_section_assembler(), "MLC621083881", new_version)
+        response_cache.clear()
+
+    def test_reload_closes_replaced_container(self, base_dir, monkeypatch):
+        """El container reemplazado libera el pool de secciones del orquestador"""
+        container = dependency_container.DependencyContainer(CatalogSnapshot.load(base_dir))
+        monkeypatch.setattr(dependency_container, "_default_container", container)
+        executor = container.get_detail_product_service()._executor
+
+        _edit_csv(base_dir, "review/data/review.csv", "product_id", "MLC621083881", "comment", "Editado")
+        dependency_container.reload_default_container(CatalogSnapshot.load(base_dir), retire_grace=0)
+
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+        container.get_product_response_cache().clear()
+
+    def test_reload_skips_unchanged_csvs(self, monkeypatch):
+        """Si la huella de los CSV no cambió, la recarga no vuelve a leerlos"""
+        container = dependency_container.DependencyContainer(CatalogSnapshot.load())
+        monkeypatch.setattr(dependency_container, "_default_container", container)
+
+        def load_catalog():
+            raise AssertionError("the CSVs should not be loaded again")
+
+        monkeypatch.setattr(dependency_container, "load_catalog", load_catalog)
+
+        summary = dependency_container.reload_default_container()
+
+        assert summary["changed"] is False
+        assert dependency_container.get_default_container() is container
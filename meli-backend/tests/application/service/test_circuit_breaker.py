@@ -0,0 +1,157 @@
+"""Tests para CircuitBreaker y Bulkhead"""
+
+import pytest
+
+from application.service.bulkhead import Bulkhead, BulkheadFullError
+from application.service.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Reloj manual para controlar el tiempo del breaker"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Reloj detenido en 0"""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    """Breaker chico: ventana de 4, abre con 50% de fallas, 10s abierto, 2 pruebas"""
+    return CircuitBreaker(
+        "questions",
+        window_size=4,
+        minimum_calls=4,
+        failure_rate_threshold=0.5,
+        slow_call_threshold=0.2,
+        slow_call_rate_threshold=0.75,
+        open_seconds=10.0,
+        half_open_calls=2,
+        clock=clock
+    )
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        breaker.acquire()
+        breaker.record_failure(0.01)
+
+
+class TestCircuitBreaker:
+    """Tests para las transiciones de estado del circuit breaker"""
+
+    def test_stays_closed_below_minimum_calls(self, breaker):
+        """Con menos llamadas que minimum_calls no debe abrirse"""
+        for _ in range(3):
+            breaker.acquire()
+            breaker.record_failure(0.01)
+
+        assert breaker.state == "closed"
+
+    def test_opens_when_failure_rate_reaches_threshold(self, breaker):
+        """Debe abrirse al alcanzar la tasa de fallas y rechazar sin ejecutar"""
+        for failed in (True, False, True, False):
+            breaker.acquire()
+            if failed:
+                breaker.record_failure(0.01)
+            else:
+                breaker.record_success(0.01)
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+        assert breaker.get_stats()["rejected"] == 1
+
+    def test_opens_when_calls_are_slow(self, breaker):
+        """Las llamadas exitosas pero lentas también deben abrir el circuito"""
+        for _ in range(3):
+            breaker.acquire()
+            breaker.record_success(0.5)
+        breaker.acquire()
+        breaker.record_success(0.01)
+
+        assert breaker.state == "open"
+        assert breaker.get_stats()["slow_call_rate"] == 0.75
+
+    def test_window_drops_old_outcomes(self, breaker):
+        """Las fallas fuera de la ventana móvil no deben contar"""
+        breaker.acquire()
+        breaker.record_failure(0.01)
+        for _ in range(4):
+            breaker.acquire()
+            breaker.record_success(0.01)
+
+        assert breaker.state == "closed"
+        assert breaker.get_stats()["failure_rate"] == 0.0
+        assert breaker.get_stats()["window_calls"] == 4
+
+    def test_half_open_closes_after_successful_trials(self, breaker, clock):
+        """Pasado open_seconds deben permitirse pruebas y cerrar si salen bien"""
+        _trip(breaker)
+        clock.now = 10.0
+
+        assert breaker.state == "half_open"
+        trials = [breaker.acquire(), breaker.acquire()]
+        assert trials == [True, True]
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+        for trial in trials:
+            breaker.record_success(0.01, trial)
+
+        assert breaker.state == "closed"
+        assert breaker.get_stats()["window_calls"] == 0
+
+    def test_half_open_reopens_on_failed_trial(self, breaker, clock):
+        """Una prueba fallida debe volver a abrir el circuito"""
+        _trip(breaker)
+        clock.now = 10.0
+
+        breaker.record_failure(0.01, breaker.acquire())
+
+        assert breaker.state == "open"
+        assert breaker.get_stats()["times_opened"] == 2
+
+    def test_cancelled_trial_returns_its_permit(self, breaker, clock):
+        """Una prueba que no llegó a ejecutarse debe liberar su lugar"""
+        _trip(breaker)
+        clock.now = 10.0
+        trials = [breaker.acquire(), breaker.acquire()]
+
+        breaker.cancel(trials[0])
+
+        assert breaker.acquire() is True
+
+    def test_invalid_configuration_raises(self):
+        """minimum_calls no puede superar el tamaño de la ventana"""
+        with pytest.raises(ValueError):
+            CircuitBreaker("seller", window_size=5, minimum_calls=6)
+
+
+class TestBulkhead:
+    """Tests para el cupo de concurrencia"""
+
+    def test_rejects_when_full_without_waiting(self):
+        """Con el cupo lleno debe rechazar de inmediato"""
+        bulkhead = Bulkhead("reviews", 2)
+        bulkhead.acquire()
+        bulkhead.acquire()
+
+        with pytest.raises(BulkheadFullError):
+            bulkhead.acquire()
+
+        bulkhead.release()
+        bulkhead.acquire()
+        assert bulkhead.get_stats() == {"max_concurrent": 2, "in_use": 2, "max_in_use": 2, "rejected": 1}
+
+    def test_release_without_acquire_raises(self):
+        """Liberar más veces de las reservadas es un error de programación"""
+        with pytest.raises(RuntimeError):
+            Bulkhead("reviews", 1).release()
@@ -2,10 +2,21 @@
 Tests unitarios para DetailProductService (Orquestador actualizado)
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock
 
-from application.service.detail_product_orchestrator_service import DetailProductService
+from application.service.circuit_breaker import CircuitBreaker
+from application.service.detail_product_orchestrator_service import (
+    BUY_BOX_SECTIONS,
+    BULKHEAD_SIZE,
+    DetailProductService,
+    GUARDED_SECTIONS,
+    PARTIAL_FIELD,
+    SECTION_FIELDS
+)
 from application.dto.detail_product_output_dto import (
     DetailProductOutputDto,
     CategoryPathItemDto,
@@ -449,3 +460,177 @@ class TestDetailProductService:
         assert len(result.characteristics) == 2
         assert result.characteristics[0].type == "range"
         assert result.characteristics[1].type == "highlight"
+
+    def test_get_detail_product_by_id_unknown_product_skips_sections(
+        self,
+        detail_product_service,
+        mock_product_detail_service,
+        mock_shipping_service,
+        mock_review_statistics_service,
+        mock_seller_information_service
+    ):
+        """Un ID inexistente debe retornar None sin consultar ninguna sección"""
+        mock_product_detail_service.exists.return_value = False
+
+        result = detail_product_service.get_detail_product_by_id("UNKNOWN")
+
+        assert result is None
+        mock_product_detail_service.exists.assert_called_once_with("UNKNOWN")
+        mock_product_detail_service.get_basics_by_product_id.assert_not_called()
+        mock_shipping_service.get_shipping_by_product_id.assert_not_called()
+        mock_review_statistics_service.get_reviews_by_product_id.assert_not_called()
+        mock_seller_information_service.get_seller_information_by_product_id.assert_not_called()
+
+    def test_get_sections_by_product_id_should_only_call_requested_sections(
+        self,
+        detail_product_service,
+        mock_review_statistics_service,
+        mock_shipping_service,
+        mock_seller_information_service
+    ):
+        """Debe consultar solo los servicios de las secciones pedidas"""
+        values = detail_product_service.get_sections_by_product_id("MLC123456789", ["reviews"])
+
+        assert set(values) == set(SECTION_FIELDS["reviews"]) | {PARTIAL_FIELD}
+        assert values[PARTIAL_FIELD] == []
+        mock_review_statistics_service.get_reviews_by_product_id.assert_called_once_with("MLC123456789")
+        mock_shipping_service.get_shipping_by_product_id.assert_not_called()
+        mock_seller_information_service.get_seller_information_by_product_id.assert_not_called()
+
+    def test_get_sections_by_product_id_should_return_none_for_unknown_product(
+        self,
+        detail_product_service,
+        mock_product_detail_service
+    ):
+        """Debe retornar None sin orquestar si el producto no existe"""
+        mock_product_detail_service.exists.return_value = False
+
+        assert detail_product_service.get_sections_by_product_id("ABC999", ["seller"]) is None
+
+    @pytest.fixture
+    def tight_budget_service(self, detail_product_service):
+        """Orquestador con presupuestos cortos para simular dependencias lentas"""
+        detail_product_service._section_budgets = {
+            section: 0.05 for section in detail_product_service._section_budgets
+        }
+        detail_product_service._request_deadline = 0.2
+        return detail_product_service
+
+    def test_slow_section_is_degraded_with_placeholder(
+        self,
+        tight_budget_service,
+        mock_review_statistics_service
+    ):
+        """Una sección que supera su presupuesto debe reemplazarse y listarse en partial"""
+        mock_review_statistics_service.get_reviews_by_product_id.side_effect = \
+            lambda product_id: time.sleep(0.5) or []
+
+        started = time.monotonic()
+        result = tight_budget_service.get_detail_product_by_id("MLC123456789")
+
+        assert time.monotonic() - started < 0.4
+        assert result.partial == ["reviews"]
+        assert result.reviews == []
+        assert result.total_reviews == 0
+        assert result.basics.id == "MLC123456789"
+
+    def test_failing_section_is_degraded(self, tight_budget_service, mock_question_service):
+        """Una sección secundaria que falla no debe romper la página"""
+        mock_question_service.get_questions_by_product_id.side_effect = RuntimeError("backend down")
+
+        result = tight_budget_service.get_detail_product_by_id("MLC123456789")
+
+        assert result.partial == ["questions"]
+        assert result.questions == []
+
+    def test_buy_box_is_always_rendered(self, tight_budget_service, mock_shipping_service):
+        """Las secciones del buy box se esperan aunque superen el presupuesto"""
+        shipping = mock_shipping_service.get_shipping_by_product_id.return_value
+        mock_shipping_service.get_shipping_by_product_id.side_effect = \
+            lambda product_id: time.sleep(0.1) or shipping
+
+        result = tight_budget_service.get_detail_product_by_id("MLC123456789")
+
+        assert result.partial == []
+        assert result.shipping is shipping
+
+    def test_complete_response_has_empty_partial(self, detail_product_service):
+        """Sin degradación, partial debe estar vacío"""
+        assert detail_product_service.get_detail_product_by_id("MLC123456789").partial == []
+
+    def test_open_breaker_fails_fast_to_fallback(self, detail_product_service, mock_question_service):
+        """Con el breaker abierto la sección no debe llamar a la dependencia"""
+        mock_question_service.get_questions_by_product_id.side_effect = RuntimeError("backend down")
+        for _ in range(10):
+            detail_product_service.get_detail_product_by_id("MLC123456789")
+        mock_question_service.get_questions_by_product_id.reset_mock()
+
+        result = detail_product_service.get_detail_product_by_id("MLC123456789")
+
+        assert result.partial == ["questions"]
+        mock_question_service.get_questions_by_product_id.assert_not_called()
+        stats = detail_product_service.get_resilience_stats()
+        assert stats["questions"]["breaker"]["state"] == "open"
+        assert stats["reviews"]["breaker"]["state"] == "closed"
+
+    def test_open_seller_breaker_uses_unknown_seller_fallback(
+        self,
+        detail_product_service,
+        mock_seller_information_service
+    ):
+        """El buy box también debe degradar al fallback del servicio con el breaker abierto"""
+        breaker = CircuitBreaker("seller", window_size=1, minimum_calls=1)
+        breaker.record_failure(0.01)
+        detail_product_service._breakers["seller"] = breaker
+
+        result = detail_product_service.get_detail_product_by_id("MLC123456789")
+
+        assert result.partial == ["seller"]
+        assert result.seller.name == "Vendedor Desconocido"
+        mock_seller_information_service.get_seller_information_by_product_id.assert_not_called()
+
+    def test_full_bulkhead_rejects_without_calling(
+        self,
+        detail_product_service,
+        mock_review_statistics_service
+    ):
+        """Con el cupo de la sección lleno debe degradarse sin ocupar un hilo"""
+        bulkhead = detail_product_service._bulkheads["reviews"]
+        for _ in range(bulkhead.max_concurrent):
+            bulkhead.acquire()
+
+        result = detail_product_service.get_detail_product_by_id("MLC123456789")
+
+        assert result.partial == ["reviews"]
+        assert result.questions != []
+        mock_review_statistics_service.get_reviews_by_product_id.assert_not_called()
+        assert bulkhead.get_stats()["rejected"] == 1
+
+    def test_bulkheads_are_released_after_each_request(self, detail_product_service):
+        """Todas las llamadas terminadas deben devolver su lugar del cupo"""
+        detail_product_service.get_detail_product_by_id("MLC123456789")
+
+        stats = detail_product_service.get_resilience_stats()
+        assert set(stats) == set(GUARDED_SECTIONS)
+        assert all(section["bulkhead"]["in_use"] == 0 for section in stats.values() if section["bulkhead"])
+        assert all(stats[section]["bulkhead"] is None for section in BUY_BOX_SECTIONS if section in stats)
+
+    def test_buy_box_is_not_rejected_by_concurrency(self, detail_product_service, mock_seller_information_service):
+        """Con más peticiones concurrentes que el cupo, un vendedor sano nunca se degrada"""
+        seller = mock_seller_information_service.get_seller_information_by_product_id.return_value
+        mock_seller_information_service.get_seller_information_by_product_id.side_effect = \
+            lambda product_id: time.sleep(0.05) or seller
+        results = []
+
+        def request():
+            results.append(detail_product_service.get_sections_by_product_id("MLC123456789", ("basics", "seller")))
+
+        threads = [threading.Thread(target=request) for _ in range(BULKHEAD_SIZE * 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == BULKHEAD_SIZE * 2
+        assert all(result[PARTIAL_FIELD] == [] and result["seller"] is seller for result in results)
+        assert detail_product_service.get_resilience_stats()["seller"]["breaker"]["state"] == "closed"
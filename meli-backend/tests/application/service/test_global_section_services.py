@@ -0,0 +1,82 @@
+"""Tests para las secciones globales memoizadas (pagos y categorías de rating)"""
+
+import pytest
+from unittest.mock import patch
+
+from application.service.payment_service import PaymentService
+from application.service.rating_category_service import RatingCategoryService
+from application.service.versioned_memo import VersionedMemo
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.payment.payment_repository import PaymentRepository
+from infrastructure.persist.rating_category.rating_category_repository import RatingCategoryRepository
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    """Snapshot del catálogo real"""
+    return CatalogSnapshot.load()
+
+
+class TestVersionedMemo:
+    """Tests para VersionedMemo"""
+
+    def test_computes_once_per_version(self):
+        """Debe calcular una sola vez mientras la versión no cambie"""
+        memo = VersionedMemo()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return object()
+
+        first = memo.get("v1", compute)
+        assert memo.get("v1", compute) is first
+        assert memo.get("v2", compute) is not first
+        assert len(calls) == 2
+
+    def test_no_version_disables_memoization(self):
+        """Sin versión se calcula en cada llamada"""
+        memo = VersionedMemo()
+        assert memo.get(None, object) is not memo.get(None, object)
+
+
+class TestPaymentService:
+    """Tests para la memoización de PaymentService"""
+
+    def test_payment_methods_shared_across_products(self, catalog):
+        """Todos los productos deben recibir la misma tupla inmutable"""
+        service = PaymentService(PaymentRepository(catalog))
+
+        methods = service.get_payment_methods_by_product_id("MLC1")
+
+        assert isinstance(methods, tuple)
+        assert len(methods) > 0
+        assert service.get_payment_methods_by_product_id("MLC2") is methods
+
+    def test_no_repository_reads_after_first_call(self, catalog):
+        """Pagos y cuotas máximas no deben volver a leer el repositorio"""
+        repository = PaymentRepository(catalog)
+        service = PaymentService(repository)
+        service.get_payment_methods_by_product_id("MLC1")
+
+        with patch.object(repository, "get_all") as get_all, \
+                patch.object(repository, "get_max_installments") as get_max_installments:
+            service.get_payment_methods_by_product_id("MLC2")
+            service.get_max_installments()
+
+        get_all.assert_not_called()
+        get_max_installments.assert_not_called()
+        assert service.get_max_installments() >= 1
+
+
+class TestRatingCategoryService:
+    """Tests para la memoización de RatingCategoryService"""
+
+    def test_categories_shared_across_products(self, catalog):
+        """Todos los productos deben recibir la misma tupla inmutable"""
+        service = RatingCategoryService(RatingCategoryRepository(catalog))
+
+        categories = service.get_rating_categories_by_product_id("MLC1")
+
+        assert isinstance(categories, tuple)
+        assert service.get_rating_categories_by_product_id("MLC2") is categories
@@ -0,0 +1,67 @@
+"""Tests para ProductDetailService y NegativeCache"""
+
+import pytest
+from unittest.mock import Mock
+
+from application.service.negative_cache import NegativeCache
+from application.service.product_detail_service import ProductDetailService
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.product_detail.product_detail_mapper import ProductDetailMapper
+from infrastructure.persist.product_detail.product_detail_repository import ProductDetailRepository
+
+
+class TestNegativeCache:
+    """Tests para el caché negativo acotado"""
+
+    def test_add_and_contains(self):
+        """Debe recordar las claves agregadas"""
+        cache = NegativeCache()
+        cache.add("MLC000")
+        assert cache.contains("MLC000") is True
+        assert cache.contains("MLC001") is False
+
+    def test_evicts_least_recently_used(self):
+        """Debe descartar la clave usada hace más tiempo al superar max_size"""
+        cache = NegativeCache(max_size=2)
+        cache.add("a")
+        cache.add("b")
+        cache.contains("a")
+        cache.add("c")
+
+        assert len(cache) == 2
+        assert cache.contains("a") is True
+        assert cache.contains("b") is False
+        assert cache.contains("c") is True
+
+    def test_invalid_max_size(self):
+        """Debe rechazar tamaños no positivos"""
+        with pytest.raises(ValueError):
+            NegativeCache(max_size=0)
+
+
+class TestProductDetailServiceExists:
+    """Tests para la verificación de existencia de productos"""
+
+    def test_exists_with_catalog(self):
+        """Debe usar el índice del catálogo para verificar existencia"""
+        repository = ProductDetailRepository(CatalogSnapshot.load())
+        service = ProductDetailService(repository, ProductDetailMapper())
+
+        assert service.exists("MLC621083881") is True
+        assert service.exists("INVALID_ID") is False
+
+    def test_exists_without_catalog(self):
+        """Sin catálogo debe verificar existencia leyendo el CSV"""
+        repository = ProductDetailRepository()
+        assert repository.exists("MLC621083881") is True
+        assert repository.exists("INVALID_ID") is False
+
+    def test_unknown_ids_are_cached(self):
+        """Un ID inexistente solo debe consultar el repositorio una vez"""
+        repository = Mock()
+        repository.exists.return_value = False
+        service = ProductDetailService(repository, ProductDetailMapper())
+
+        assert service.exists("INVALID_ID") is False
+        assert service.exists("INVALID_ID") is False
+        repository.exists.assert_called_once_with("INVALID_ID")
@@ -0,0 +1,38 @@
+"""Tests para las revisiones por producto de las escrituras de la API"""
+
+from application.service.product_revisions import ProductRevisions
+
+
+class TestProductRevisions:
+    """Tests para ProductRevisions"""
+
+    def test_product_without_writes_keeps_catalog_version(self):
+        """Sin escrituras la versión de caché es la del catálogo"""
+        assert ProductRevisions().versioned("v1", "MLC1") == "v1"
+
+    def test_revision_does_not_depend_on_apply_order(self):
+        """Dos workers que aplican las mismas escrituras en otro orden llegan a la misma revisión"""
+        first, second = ProductRevisions(), ProductRevisions()
+        first.bump("MLC1", "reviews", "a", 1.0)
+        first.bump("MLC1", "reviews", "b", 2.0)
+        second.bump("MLC1", "reviews", "b", 2.0)
+        second.bump("MLC1", "reviews", "a", 1.0)
+
+        assert first.versioned("v1", "MLC1") == second.versioned("v1", "MLC1")
+        assert first.get("MLC1").last_modified == 2.0
+
+    def test_different_writes_give_different_revisions(self):
+        """La misma cantidad de escrituras distintas no comparte revisión"""
+        first, second = ProductRevisions(), ProductRevisions()
+        first.bump("MLC1", "reviews", "a", 1.0)
+        second.bump("MLC1", "reviews", "b", 1.0)
+
+        assert first.versioned("v1", "MLC1") != second.versioned("v1", "MLC1")
+
+    def test_section_version_only_changes_written_section(self):
+        """Solo la sección escrita cambia de versión"""
+        revisions = ProductRevisions()
+        revisions.bump("MLC1", "reviews", "a", 1.0)
+
+        assert revisions.versioned("v1", "MLC1", "reviews") != "v1"
+        assert revisions.versioned("v1", "MLC1", "seller") == "v1"
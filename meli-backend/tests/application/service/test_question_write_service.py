@@ -0,0 +1,208 @@
+"""Tests para el alta de preguntas y respuestas respaldada por el log de escrituras"""
+
+import os
+import shutil
+
+import pytest
+from application.service.question_write_service import (
+    QUESTION_ANSWERED,
+    QUESTION_LOG_ENV,
+    QuestionAlreadyAnsweredError,
+    default_question_log
+)
+from domain.question.entity.question import QuestionStatus
+from infrastructure.container.dependency_container import DependencyContainer
+from infrastructure.persist.append_log.append_log import AppendLog
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.question.question_repository import DATA_DIR, QuestionRepository
+
+PRODUCT_ID = "MLC137702355"
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return CatalogSnapshot.load()
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "questions.jsonl")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Copia de question.csv que la compactación puede reescribir"""
+    target = tmp_path / "question.csv"
+    shutil.copy(QuestionRepository().csv_path, target)
+    return str(target)
+
+
+def _container(catalog, log_path):
+    return DependencyContainer(catalog, question_log=AppendLog(log_path))
+
+
+def _worker(catalog, log_path, csv_path):
+    """Container de un worker que comparte el log y el CSV con los demás"""
+    container = _container(catalog, log_path)
+    container.get_question_write_service().repository.csv_path = csv_path
+    return container
+
+
+class TestQuestionWriteService:
+    """Tests para QuestionWriteService"""
+
+    def test_question_is_durable_and_pending(self, catalog, log_path):
+        """La pregunta queda en el log y se lista primero como pendiente"""
+        container = _container(catalog, log_path)
+        service = container.get_question_write_service()
+
+        question = service.ask_question(PRODUCT_ID, "  ¿Tiene garantía?  ")
+
+        records, _ = service.get_log().read_from(0)
+        assert [record["question_id"] for record in records] == [question.id]
+        assert question.question == "¿Tiene garantía?"
+        assert question.status == QuestionStatus.PENDING
+        questions = container.get_question_service().get_questions_by_product_id(PRODUCT_ID)
+        assert questions[0].id == question.id
+
+    def test_answer_moves_question_to_answered(self, catalog, log_path):
+        """Responder pasa la pregunta a answered y suma una revisión a la sección"""
+        container = _container(catalog, log_path)
+        service = container.get_question_write_service()
+        question = service.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        token = container.get_product_revisions().get(PRODUCT_ID).token
+
+        answered = service.answer_question(PRODUCT_ID, question.id, "Sí, 1 año")
+
+        assert answered.status == QuestionStatus.ANSWERED
+        assert answered.answer == "Sí, 1 año"
+        assert answered.answered_at >= question.asked_at
+        assert service.repository.get_page(PRODUCT_ID, status=QuestionStatus.PENDING) == (0, [])
+        revision = container.get_product_revisions().get(PRODUCT_ID)
+        assert revision.token != token
+        assert revision.token.startswith("questions2-")
+
+    def test_second_answer_is_rejected(self, catalog, log_path):
+        """Una pregunta ya respondida no se vuelve a responder"""
+        service = _container(catalog, log_path).get_question_write_service()
+        question = service.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        service.answer_question(PRODUCT_ID, question.id, "Sí")
+        size = service.get_log().size()
+
+        with pytest.raises(QuestionAlreadyAnsweredError):
+            service.answer_question(PRODUCT_ID, question.id, "No")
+        assert service.get_log().size() == size
+
+    def test_unknown_product_or_question_returns_none(self, catalog, log_path):
+        """Un producto o una pregunta inexistentes no escriben nada"""
+        service = _container(catalog, log_path).get_question_write_service()
+
+        assert service.ask_question("MLC000000000", "¿Tiene garantía?") is None
+        assert service.answer_question(PRODUCT_ID, "missing", "Sí") is None
+        assert service.get_log().size() == 0
+
+    @pytest.mark.parametrize("text", ["", "   "])
+    def test_empty_question_is_rejected(self, catalog, log_path, text):
+        """Una pregunta vacía se rechaza antes de escribir"""
+        service = _container(catalog, log_path).get_question_write_service()
+
+        with pytest.raises(ValueError):
+            service.ask_question(PRODUCT_ID, text)
+        assert service.get_log().size() == 0
+
+    def test_concurrent_answers_converge(self, catalog, log_path):
+        """Con respuestas concurrentes, todos los workers se quedan con la más nueva"""
+        service = _container(catalog, log_path).get_question_write_service()
+        question = service.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        older = {"type": QUESTION_ANSWERED, "product_id": PRODUCT_ID, "question_id": question.id,
+                 "answer": "No", "answered_at": "2099-01-01T00:00:00"}
+        newer = dict(older, answer="Sí", answered_at="2099-01-01T00:00:01")
+
+        # Un worker aplica primero la más nueva y el otro la más vieja
+        assert service._apply(newer) is True
+        assert service._apply(older) is False
+        assert service.repository.get_by_id(PRODUCT_ID, question.id).answer == "Sí"
+
+    def test_catch_up_applies_writes_from_other_workers(self, catalog, log_path):
+        """Un worker ve las preguntas y respuestas escritas por otro al seguir el log"""
+        writer = _container(catalog, log_path).get_question_write_service()
+        follower = _container(catalog, log_path).get_question_write_service()
+
+        question = writer.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        writer.answer_question(PRODUCT_ID, question.id, "Sí")
+
+        assert follower.catch_up() == 2
+        assert follower.catch_up() == 0
+        assert follower.repository.get_by_id(PRODUCT_ID, question.id).status == QuestionStatus.ANSWERED
+
+    def test_log_is_replayed_on_startup(self, catalog, log_path):
+        """Un proceso nuevo aplica las preguntas del log al arrancar"""
+        writer = _container(catalog, log_path).get_question_write_service()
+        question = writer.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        writer.answer_question(PRODUCT_ID, question.id, "Sí")
+
+        restarted = _container(catalog, log_path).get_question_write_service()
+
+        assert restarted.repository.get_by_product_id(PRODUCT_ID)[0].answer == "Sí"
+
+    def test_compaction_merges_final_state_into_csv(self, catalog, log_path, tmp_path):
+        """La compactación vuelca el estado final de cada pregunta y vacía el log"""
+        service = _container(catalog, log_path).get_question_write_service()
+        csv_path = tmp_path / "question.csv"
+        shutil.copy(service.repository.csv_path, csv_path)
+        service.repository.csv_path = str(csv_path)
+        question = service.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        service.answer_question(PRODUCT_ID, question.id, "Sí")
+
+        assert service.compact() == 2
+
+        assert service.get_log().size() == 0
+        assert service.get_log().generation() == 1
+        content = csv_path.read_text(encoding='utf-8')
+        assert content.count(question.id) == 1
+        assert f"{question.id},{PRODUCT_ID}" in content
+        assert service.repository.get_by_id(PRODUCT_ID, question.id).status == QuestionStatus.ANSWERED
+
+    def test_compaction_by_other_worker_keeps_unread_questions(self, catalog, log_path, csv_path):
+        """Si otro worker compacta mientras este tiene preguntas sin leer, las sigue viendo todas"""
+        worker_a = _worker(catalog, log_path, csv_path).get_question_write_service()
+        worker_b = _worker(catalog, log_path, csv_path).get_question_write_service()
+        answered = worker_a.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        worker_a.answer_question(PRODUCT_ID, answered.id, "Sí")
+        pending = worker_a.ask_question(PRODUCT_ID, "¿Viene con cargador?")
+
+        assert worker_a.compact() == 3
+        after = worker_a.ask_question(PRODUCT_ID, "¿Es original?")
+
+        assert worker_b.catch_up() == 4
+        assert worker_b.repository.get_by_id(PRODUCT_ID, answered.id).answer == "Sí"
+        assert worker_b.repository.get_by_id(PRODUCT_ID, pending.id).status == QuestionStatus.PENDING
+        assert worker_b.repository.get_by_id(PRODUCT_ID, after.id) is not None
+        assert worker_b.get_stats()["base_reloads"] == 0
+
+    def test_worker_behind_discarded_generation_reloads_csv(self, catalog, log_path, csv_path):
+        """Un worker que se perdió generaciones ya descartadas las recupera del CSV compactado"""
+        container_a, container_b = _worker(catalog, log_path, csv_path), _worker(catalog, log_path, csv_path)
+        worker_a, worker_b = container_a.get_question_write_service(), container_b.get_question_write_service()
+        question = worker_a.ask_question(PRODUCT_ID, "¿Tiene garantía?")
+        worker_a.compact()
+        worker_a.answer_question(PRODUCT_ID, question.id, "Sí")
+        worker_a.compact()
+
+        assert worker_b.catch_up() == 2
+
+        recovered = worker_b.repository.get_by_id(PRODUCT_ID, question.id)
+        assert (recovered.status, recovered.answer) == (QuestionStatus.ANSWERED, "Sí")
+        assert worker_b.get_stats()["base_reloads"] == 1
+        # La pregunta y la respuesta recuperadas suman la misma revisión que en el worker que escribió
+        revision_a = container_a.get_product_revisions().get(PRODUCT_ID)
+        assert container_b.get_product_revisions().get(PRODUCT_ID).token == revision_a.token
+
+    def test_default_log_lives_next_to_question_csv(self, monkeypatch):
+        """Sin MELI_QUESTION_LOG_PATH el log queda junto al CSV en el que se compacta"""
+        monkeypatch.delenv(QUESTION_LOG_ENV, raising=False)
+
+        log = default_question_log()
+
+        assert os.path.dirname(log.path) == DATA_DIR
+        assert os.path.dirname(QuestionRepository().csv_path) == DATA_DIR
@@ -0,0 +1,188 @@
+"""Tests para el alta de reviews respaldada por el log de escrituras"""
+
+import os
+import shutil
+
+import pytest
+from application.service.review_write_service import REVIEW_LOG_ENV, default_review_log
+from infrastructure.container.dependency_container import DependencyContainer
+from infrastructure.persist.append_log.append_log import AppendLog
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.review.review_repository import DATA_DIR, ReviewRepository
+
+PRODUCT_ID = "MLC137702355"
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return CatalogSnapshot.load()
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "reviews.jsonl")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Copia de review.csv que la compactación puede reescribir"""
+    target = tmp_path / "review.csv"
+    shutil.copy(ReviewRepository().csv_path, target)
+    return str(target)
+
+
+def _container(catalog, log_path):
+    return DependencyContainer(catalog, review_log=AppendLog(log_path))
+
+
+def _worker(catalog, log_path, csv_path):
+    """Container de un worker que comparte el log y el CSV con los demás"""
+    container = _container(catalog, log_path)
+    container.get_review_write_service().repository.csv_path = csv_path
+    return container
+
+
+class TestReviewWriteService:
+    """Tests para ReviewWriteService"""
+
+    def test_review_is_durable_and_counted(self, catalog, log_path):
+        """La review queda en el log y ya cuenta en las estadísticas"""
+        container = _container(catalog, log_path)
+        service = container.get_review_write_service()
+        total = service.get_statistics(PRODUCT_ID)["total_reviews"]
+
+        review = service.add_review(PRODUCT_ID, "Ana", 5, "Excelente", category_ratings={"battery_life": 5})
+
+        records, _ = service.get_log().read_from(0)
+        assert [record["review"]["id"] for record in records] == [review.id]
+        assert service.get_statistics(PRODUCT_ID)["total_reviews"] == total + 1
+        reviews = container.get_review_statistics_service().get_reviews_by_product_id(PRODUCT_ID)
+        assert reviews[0].id == review.id
+
+    def test_write_bumps_product_revision(self, catalog, log_path):
+        """Cada review suma una revisión a la sección de reviews del producto"""
+        container = _container(catalog, log_path)
+        revisions = container.get_product_revisions()
+        version = catalog.version
+
+        container.get_review_write_service().add_review(PRODUCT_ID, "Ana", 4, "Bien")
+
+        assert revisions.versioned(version, PRODUCT_ID).startswith(f"{version}+reviews1-")
+        assert revisions.versioned(version, PRODUCT_ID, "seller") == version
+        assert revisions.versioned(version, "MLC621083881") == version
+
+    def test_unknown_product_returns_none(self, catalog, log_path):
+        """Un producto inexistente no escribe nada"""
+        service = _container(catalog, log_path).get_review_write_service()
+
+        assert service.add_review("MLC000000000", "Ana", 5, "Excelente") is None
+        assert service.get_log().size() == 0
+
+    @pytest.mark.parametrize("rating, category_ratings", [
+        (0, None),
+        (5, {"color": 5}),
+        (5, {"battery_life": 9})
+    ])
+    def test_invalid_review_is_rejected(self, catalog, log_path, rating, category_ratings):
+        """Los datos inválidos se rechazan antes de escribir"""
+        service = _container(catalog, log_path).get_review_write_service()
+
+        with pytest.raises(ValueError):
+            service.add_review(PRODUCT_ID, "Ana", rating, "Excelente", category_ratings=category_ratings)
+        assert service.get_log().size() == 0
+
+    def test_log_is_replayed_on_startup(self, catalog, log_path):
+        """Un proceso nuevo aplica las reviews del log al arrancar"""
+        review = _container(catalog, log_path).get_review_write_service().add_review(PRODUCT_ID, "Ana", 5, "Excelente")
+
+        restarted = _container(catalog, log_path).get_review_write_service()
+
+        assert restarted.repository.get_by_product_id(PRODUCT_ID)[0].id == review.id
+
+    def test_catch_up_applies_writes_from_other_workers(self, catalog, log_path):
+        """Un worker ve las reviews escritas por otro al seguir el log"""
+        writer = _container(catalog, log_path).get_review_write_service()
+        follower_container = _container(catalog, log_path)
+        follower = follower_container.get_review_write_service()
+        total = follower.get_statistics(PRODUCT_ID)["total_reviews"]
+
+        writer.add_review(PRODUCT_ID, "Ana", 5, "Excelente")
+
+        assert follower.catch_up() == 1
+        assert follower.catch_up() == 0
+        assert follower.get_statistics(PRODUCT_ID)["total_reviews"] == total + 1
+        assert follower_container.get_product_revisions().get(PRODUCT_ID) is not None
+
+    def test_compaction_merges_log_into_csv(self, catalog, log_path, tmp_path):
+        """La compactación vuelca las reviews al CSV y vacía el log"""
+        service = _container(catalog, log_path).get_review_write_service()
+        csv_path = tmp_path / "review.csv"
+        shutil.copy(service.repository.csv_path, csv_path)
+        service.repository.csv_path = str(csv_path)
+        review = service.add_review(PRODUCT_ID, "Ana", 5, "Excelente")
+        total = service.get_statistics(PRODUCT_ID)["total_reviews"]
+
+        assert service.compact() == 1
+
+        assert service.get_log().size() == 0
+        assert service.get_log().generation() == 1
+        assert review.id in csv_path.read_text(encoding='utf-8')
+        # Lo ya aplicado sigue visible y no se cuenta dos veces
+        assert service.catch_up() == 0
+        assert service.get_statistics(PRODUCT_ID)["total_reviews"] == total
+
+    def test_background_follower_starts_and_stops(self, catalog, log_path):
+        """El seguimiento en segundo plano se puede iniciar y detener"""
+        container = _container(catalog, log_path)
+        service = container.get_review_write_service()
+
+        container.start_background_writers()
+        assert service.running
+        container.stop_background_writers()
+        assert not service.running
+
+    def test_compaction_by_other_worker_keeps_unread_reviews(self, catalog, log_path, csv_path):
+        """Si otro worker compacta mientras este tiene reviews sin leer, las sigue viendo todas"""
+        container_a, container_b = _worker(catalog, log_path, csv_path), _worker(catalog, log_path, csv_path)
+        worker_a, worker_b = container_a.get_review_write_service(), container_b.get_review_write_service()
+        total = worker_b.get_statistics(PRODUCT_ID)["total_reviews"]
+        unread = [worker_a.add_review(PRODUCT_ID, "Ana", 5, "Excelente"),
+                  worker_a.add_review(PRODUCT_ID, "Luis", 4, "Muy bueno")]
+
+        assert worker_a.compact() == 2
+        after = worker_a.add_review(PRODUCT_ID, "Eva", 3, "Regular")
+
+        assert worker_b.catch_up() == 3
+        ids = {review.id for review in worker_b.repository.get_by_product_id(PRODUCT_ID)}
+        assert {review.id for review in unread + [after]} <= ids
+        assert worker_b.get_statistics(PRODUCT_ID)["total_reviews"] == total + 3
+        assert worker_b.get_stats()["base_reloads"] == 0
+
+    def test_worker_behind_discarded_generation_reloads_csv(self, catalog, log_path, csv_path):
+        """Un worker que se perdió generaciones ya descartadas las recupera del CSV compactado"""
+        container_a, container_b = _worker(catalog, log_path, csv_path), _worker(catalog, log_path, csv_path)
+        worker_a, worker_b = container_a.get_review_write_service(), container_b.get_review_write_service()
+        total = worker_b.get_statistics(PRODUCT_ID)["total_reviews"]
+        first = worker_a.add_review(PRODUCT_ID, "Ana", 5, "Excelente")
+        worker_a.compact()
+        second = worker_a.add_review(PRODUCT_ID, "Luis", 4, "Muy bueno")
+        worker_a.compact()
+
+        assert worker_b.catch_up() == 2
+
+        ids = {review.id for review in worker_b.repository.get_by_product_id(PRODUCT_ID)}
+        assert {first.id, second.id} <= ids
+        assert worker_b.get_statistics(PRODUCT_ID)["total_reviews"] == total + 2
+        assert worker_b.get_stats()["base_reloads"] == 1
+        # La revisión coincide con la del worker que escribió
+        revision_a = container_a.get_product_revisions().get(PRODUCT_ID)
+        assert container_b.get_product_revisions().get(PRODUCT_ID).token == revision_a.token
+
+    def test_default_log_lives_next_to_review_csv(self, monkeypatch):
+        """Sin MELI_REVIEW_LOG_PATH el log queda junto al CSV en el que se compacta"""
+        monkeypatch.delenv(REVIEW_LOG_ENV, raising=False)
+
+        log = default_review_log()
+
+        assert os.path.dirname(log.path) == DATA_DIR
+        assert os.path.dirname(ReviewRepository().csv_path) == DATA_DIR
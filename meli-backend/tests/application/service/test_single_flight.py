@@ -0,0 +1,89 @@
+"""Tests para SingleFlight y CoalescingDetailProductService"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from application.service.single_flight import SingleFlight
+from application.service.coalescing_detail_product_service import CoalescingDetailProductService
+
+
+class TestSingleFlight:
+    """Tests para la coalescencia de llamadas concurrentes"""
+
+    def _run_concurrently(self, single_flight, key, fn, count):
+        """Lanza count hilos que llaman a single_flight.do con la misma clave"""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(single_flight.do(key, fn)))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_sequential_calls_execute_each_time(self):
+        """Llamadas no concurrentes deben ejecutar la función cada vez (no es caché)"""
+        single_flight = SingleFlight()
+        fn = Mock(return_value="value")
+
+        assert single_flight.do("key", fn) == "value"
+        assert single_flight.do("key", fn) == "value"
+        assert fn.call_count == 2
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Llamadas concurrentes con la misma clave deben compartir un único cómputo"""
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        leader = threading.Thread(target=lambda: single_flight.do("key", slow))
+        leader.start()
+        started.wait(5)
+
+        threads, results = self._run_concurrently(single_flight, "key", slow, 5)
+        # Esperar a que los seguidores estén encolados antes de liberar al líder
+        while single_flight.get_stats()["coalesced"] < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads + [leader]:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert results == ["value"] * 5
+        stats = single_flight.get_stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced"] == 5
+        assert stats["in_flight"] == 0
+
+    def test_error_is_propagated_to_caller(self):
+        """La excepción del cómputo debe propagarse y liberar la clave"""
+        single_flight = SingleFlight()
+
+        with pytest.raises(RuntimeError):
+            single_flight.do("key", Mock(side_effect=RuntimeError("boom")))
+
+        assert single_flight.do("key", lambda: "recovered") == "recovered"
+        assert single_flight.get_stats()["in_flight"] == 0
+
+
+class TestCoalescingDetailProductService:
+    """Tests para la capa single-flight del orquestador"""
+
+    def test_delegates_to_orchestrator(self):
+        """Debe delegar en el orquestador y reportar estadísticas"""
+        orchestrator = Mock()
+        orchestrator.get_detail_product_by_id.return_value = "detail"
+        service = CoalescingDetailProductService(orchestrator)
+
+        assert service.get_detail_product_by_id("MLC123") == "detail"
+        orchestrator.get_detail_product_by_id.assert_called_once_with("MLC123")
+        assert service.get_stats()["total_calls"] == 1
@@ -0,0 +1,59 @@
+"""Configuración compartida de los tests"""
+
+import os
+
+import pytest
+from infrastructure.cache.disk_payload_cache import L2_PATH_ENV
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.related_product import related_product_engine
+
+# Con MELI_REQUIRE_NUMPY=1 la corrida falla si numpy falta, en lugar de
+# saltear los tests de las rutas vectorizadas (así se corre en CI)
+REQUIRE_NUMPY_ENV = "MELI_REQUIRE_NUMPY"
+
+_WRITE_LOGS = {
+    "MELI_REVIEW_LOG_PATH": "reviews.jsonl",
+    "MELI_QUESTION_LOG_PATH": "questions.jsonl"
+}
+
+
+def pytest_sessionstart(session):
+    """
+    Exige numpy cuando la corrida lo pide (ver REQUIRE_NUMPY_ENV) y genera
+    los relacionados calculados si faltan (no se versionan)
+    """
+    if os.getenv(REQUIRE_NUMPY_ENV) == "1":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            pytest.exit(f"{REQUIRE_NUMPY_ENV}=1 pero numpy no está instalado", returncode=1)
+    if not os.path.exists(related_product_engine.COMPUTED_FILE):
+        snapshot = CatalogSnapshot.load()
+        engine, _ = related_product_engine.rebuild(snapshot, full=True)
+        related_product_engine.save(snapshot, engine)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_write_logs(tmp_path_factory):
+    """Los logs de escrituras de la API van a un directorio temporal de la sesión"""
+    directory = tmp_path_factory.mktemp("write-logs")
+    previous = {name: os.environ.get(name) for name in _WRITE_LOGS}
+    for name, filename in _WRITE_LOGS.items():
+        os.environ[name] = str(directory / filename)
+    yield directory
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+@pytest.fixture(autouse=True)
+def isolated_l2_cache(tmp_path_factory, monkeypatch):
+    """
+    Cada test usa su propio archivo de L2: nunca lee payloads de otra
+    corrida ni de un servidor de desarrollo (el default vive en /tmp)
+    """
+    path = tmp_path_factory.mktemp("l2") / "payloads.sqlite3"
+    monkeypatch.setenv(L2_PATH_ENV, str(path))
+    return path
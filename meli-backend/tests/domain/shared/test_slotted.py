@@ -0,0 +1,73 @@
+"""Tests para el decorador slotted"""
+
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List
+
+import pytest
+from domain.shared.slotted import slotted
+from domain.product_variant.entity.variant import Variant, VariantGroup
+from application.dto.detail_product_output_dto import ReputationDto
+
+
+@slotted
+@dataclass(frozen=True)
+class Sample:
+    name: str
+    tags: List[str] = field(default_factory=list)
+    count: int = 1
+
+    def __post_init__(self):
+        if not self.name:
+            raise ValueError("name cannot be empty")
+
+
+class TestSlotted:
+    """Tests para slotted y el constructor trusted"""
+
+    def test_instances_have_no_dict(self):
+        """Las instancias deben usar __slots__ en lugar de __dict__"""
+        sample = Sample("a")
+        assert Sample.__slots__ == ("name", "tags", "count")
+        assert not hasattr(sample, "__dict__")
+
+    def test_defaults_preserved(self):
+        """Los defaults y default_factory deben seguir funcionando"""
+        sample = Sample("a")
+        assert sample.count == 1
+        assert sample.tags == []
+        assert Sample.trusted("a").tags is not Sample.trusted("a").tags
+
+    def test_still_frozen(self):
+        """La clase debe seguir siendo inmutable"""
+        with pytest.raises(FrozenInstanceError):
+            Sample("a").name = "b"
+
+    def test_regular_construction_validates(self):
+        """El constructor normal debe ejecutar __post_init__"""
+        with pytest.raises(ValueError):
+            Sample("")
+
+    def test_trusted_construction_skips_validation(self):
+        """trusted no debe ejecutar __post_init__"""
+        assert Sample.trusted("", count=2) == Sample.trusted("", [], 2)
+
+    def test_trusted_equals_regular(self):
+        """trusted y el constructor normal deben producir instancias iguales"""
+        assert Sample.trusted("a", ["x"]) == Sample("a", ["x"])
+
+    def test_pickle_and_deepcopy(self):
+        """Debe poder serializarse y copiarse pese a ser frozen con slots"""
+        sample = Sample("a", ["x"], 3)
+        assert pickle.loads(pickle.dumps(sample)) == sample
+        assert copy.deepcopy(sample) == sample
+
+    def test_entities_and_dtos_are_slotted(self):
+        """Las entidades y DTOs del proyecto deben usar __slots__"""
+        variant = Variant.trusted(id="v1", label="Azul", value="azul", slug="azul")
+        group = VariantGroup.trusted(title="Color", options=[variant], selected_id="missing")
+        reputation = ReputationDto.trusted(red=0, orange=0, yellow=0, green=0)
+
+        for instance in (variant, group, reputation):
+            assert not hasattr(instance, "__dict__")
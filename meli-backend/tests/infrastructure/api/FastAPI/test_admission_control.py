@@ -0,0 +1,185 @@
+"""Tests para el control de admisión y descarte de carga"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from application.entrypoint.main import create_application
+from infrastructure.api.FastAPI.admission_control import (
+    CRITICAL,
+    LOW,
+    NORMAL,
+    AdmissionControlMiddleware,
+    AdmissionController,
+    GradientLimit,
+    classify
+)
+
+
+def _scope(path: str, user_agent: bytes = b"Mozilla/5.0") -> dict:
+    return {"type": "http", "path": path, "headers": [(b"user-agent", user_agent)]}
+
+
+def _controller(limit: int, queue_timeouts=(0.05, 0.05, 0.0)) -> AdmissionController:
+    """Controlador con límite fijo"""
+    return AdmissionController(GradientLimit(limit, limit, limit), queue_timeouts=queue_timeouts)
+
+
+class TestGradientLimit:
+    """Tests para el límite adaptativo"""
+
+    def test_grows_while_latency_stays_low(self):
+        """Con latencia estable y el límite en uso, debe crecer"""
+        limit = GradientLimit(initial_limit=10, min_limit=1, max_limit=100)
+        for _ in range(20):
+            limit.on_sample(0.01, in_flight=10)
+
+        assert limit.limit > 10
+
+    def test_shrinks_when_latency_rises(self):
+        """Si la latencia supera la tolerancia sobre la mínima, debe bajar"""
+        limit = GradientLimit(initial_limit=50, min_limit=1, max_limit=100)
+        limit.on_sample(0.01, in_flight=50)
+        for _ in range(20):
+            limit.on_sample(0.2, in_flight=50)
+
+        assert limit.limit < 50
+
+    def test_does_not_grow_when_underused(self):
+        """Con poco trabajo en curso el límite no debe agrandarse"""
+        limit = GradientLimit(initial_limit=10, min_limit=1, max_limit=100)
+        for _ in range(20):
+            limit.on_sample(0.01, in_flight=1)
+
+        assert limit.limit == 10
+
+    def test_respects_bounds(self):
+        """El límite nunca debe salir de [min_limit, max_limit]"""
+        limit = GradientLimit(initial_limit=5, min_limit=4, max_limit=6)
+        for _ in range(50):
+            limit.on_sample(0.01, in_flight=6)
+        assert limit.limit == 6
+        for _ in range(50):
+            limit.on_sample(1.0, in_flight=6)
+        assert limit.limit == 4
+
+
+class TestClassify:
+    """Tests para la prioridad de cada petición"""
+
+    def test_product_page_is_critical(self):
+        assert classify(_scope("/products/MLC123")) == CRITICAL
+
+    def test_docs_static_and_crawlers_are_low(self):
+        assert classify(_scope("/docs")) == LOW
+        assert classify(_scope("/static/logo.png")) == LOW
+        assert classify(_scope("/products/MLC123", b"Googlebot/2.1")) == LOW
+
+    def test_other_api_routes_are_normal(self):
+        assert classify(_scope("/listings/products")) == NORMAL
+
+    def test_health_and_monitoring_bypass(self):
+        assert classify(_scope("/health")) is None
+        assert classify(_scope("/monitoring/admission")) is None
+
+
+class TestAdmissionController:
+    """Tests para la admisión, la cola por prioridad y el descarte"""
+
+    def test_low_priority_uses_only_its_share(self):
+        """LOW solo debe ocupar su fracción del límite"""
+        controller = _controller(4)
+
+        assert controller.try_acquire(LOW)
+        assert controller.try_acquire(LOW)
+        assert not controller.try_acquire(LOW)
+        assert controller.try_acquire(CRITICAL)
+
+    def test_sheds_when_queue_times_out(self):
+        """Sin lugar libre dentro del timeout de cola, debe descartar"""
+        async def scenario():
+            controller = _controller(1)
+            assert await controller.acquire(CRITICAL)
+            admitted = await controller.acquire(CRITICAL)
+            return admitted, controller.get_stats()
+
+        admitted, stats = asyncio.run(scenario())
+
+        assert admitted is False
+        assert stats["priorities"]["critical"]["shed"] == 1
+        assert stats["priorities"]["critical"]["waiting"] == 0
+
+    def test_released_slot_goes_to_highest_priority_waiter(self):
+        """El lugar liberado debe ir a la cola CRITICAL antes que a NORMAL"""
+        async def scenario():
+            controller = _controller(2, queue_timeouts=(1.0, 1.0, 0.0))
+            assert await controller.acquire(CRITICAL)
+            assert await controller.acquire(CRITICAL)
+            normal = asyncio.ensure_future(controller.acquire(NORMAL))
+            critical = asyncio.ensure_future(controller.acquire(CRITICAL))
+            await asyncio.sleep(0)
+
+            controller.release(0.01)
+            await asyncio.sleep(0)
+            return critical.done() and critical.result(), normal.done(), controller
+
+        critical_admitted, normal_done, controller = asyncio.run(scenario())
+
+        assert critical_admitted is True
+        assert normal_done is False
+        assert controller.in_flight == 2
+
+    def test_low_priority_is_shed_without_queueing(self):
+        """LOW no debe esperar en cola bajo presión"""
+        async def scenario():
+            controller = _controller(2)
+            assert await controller.acquire(LOW)
+            return await controller.acquire(LOW)
+
+        assert asyncio.run(scenario()) is False
+
+
+class TestAdmissionControlMiddleware:
+    """Tests para el middleware ASGI"""
+
+    @pytest.fixture
+    def saturated_client(self):
+        """Aplicación mínima con el controlador ya lleno"""
+        controller = _controller(1)
+        assert controller.try_acquire(CRITICAL)
+        app = FastAPI()
+        app.add_middleware(AdmissionControlMiddleware, controller=controller)
+
+        @app.get("/products/{product_id}")
+        async def product(product_id: str):
+            return {"id": product_id}
+
+        @app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+
+        return TestClient(app)
+
+    def test_overload_returns_503_with_retry_after(self, saturated_client):
+        """Bajo sobrecarga debe responder 503 con Retry-After"""
+        response = saturated_client.get("/products/MLC123")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.headers["cache-control"] == "no-store"
+
+    def test_health_check_is_never_shed(self, saturated_client):
+        """El health check no debe pasar por el control de admisión"""
+        assert saturated_client.get("/health").status_code == 200
+
+    def test_application_exposes_admission_stats(self):
+        """La aplicación debe registrar el middleware y exponer sus métricas"""
+        client = TestClient(create_application())
+        client.get("/products/MLC621083881")
+
+        stats = client.get("/monitoring/admission").json()
+
+        assert stats["in_flight"] == 0
+        assert stats["priorities"]["critical"]["admitted"] >= 1
@@ -1,8 +1,42 @@
 """Tests para el endpoint de detalle de producto"""
 
+import asyncio
+import gzip
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 from application.entrypoint.main import create_application
+from infrastructure.api.FastAPI import section_assembler
+from infrastructure.cache.compression import GZIP, IDENTITY
+from infrastructure.cache.disk_payload_cache import DiskPayloadCache
+from infrastructure.cache.product_response_cache import ProductResponseCache
+from infrastructure.cache.payload_pack import MmapPayloadPack, PackedPayload, write_pack
+from infrastructure.container.dependency_container import get_default_container
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class RecordingDiskCache(DiskPayloadCache):
+    """L2 que registra si cada acceso corrió dentro del event loop"""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self.calls = []
+
+    def get(self, *args):
+        self.calls.append(("get", _on_event_loop()))
+        return super().get(*args)
+
+    def put(self, *args):
+        self.calls.append(("put", _on_event_loop()))
+        super().put(*args)
 
 
 class TestDetailProductEndpoint:
@@ -156,3 +190,223 @@ class TestDetailProductEndpoint:
         response = client.get("/products/MLC123456789")
         # Verificar que se permite CORS (configurado en el main.py)
         assert response.status_code == 200
+
+    def test_coalescing_stats_endpoint(self, client):
+        """Debe exponer las estadísticas de coalescencia del detalle de producto"""
+        client.get("/products/MLC123456789")
+        response = client.get("/monitoring/coalescing")
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total_calls"] >= 1
+        assert stats["in_flight"] == 0
+
+    def test_get_product_detail_returns_cache_headers(self, client):
+        """Debe incluir ETag, Last-Modified y Cache-Control"""
+        response = client.get("/products/MLC123456789")
+
+        assert response.headers["etag"].startswith('W/"')
+        assert "last-modified" in response.headers
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_if_none_match_returns_304(self, client):
+        """Debe responder 304 sin cuerpo cuando el ETag coincide"""
+        etag = client.get("/products/MLC123456789").headers["etag"]
+
+        response = client.get("/products/MLC123456789", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_if_none_match_with_stale_etag_returns_200(self, client):
+        """Debe responder 200 cuando el ETag no coincide"""
+        response = client.get("/products/MLC123456789", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    def test_if_modified_since_returns_304(self, client):
+        """Debe responder 304 cuando el catálogo no cambió desde la fecha enviada"""
+        last_modified = client.get("/products/MLC123456789").headers["last-modified"]
+
+        response = client.get("/products/MLC123456789", headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    def test_conditional_request_for_unknown_product_returns_404(self, client):
+        """Un producto inexistente nunca debe responder 304"""
+        response = client.get("/products/ABC999", headers={"If-None-Match": "*"})
+        assert response.status_code == 404
+
+    def test_gzip_encoding_negotiated(self, client):
+        """Debe entregar el cuerpo comprimido con gzip cuando el cliente lo acepta"""
+        response = client.get("/products/MLC123456789", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert "basics" in response.json()
+
+    def test_encodings_share_a_weak_etag(self, client):
+        """gzip e identity no son idénticos byte a byte: el ETag compartido es débil"""
+        compressed = client.get("/products/MLC123456789", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/products/MLC123456789", headers={"Accept-Encoding": "identity"})
+
+        assert compressed.headers["etag"] == plain.headers["etag"]
+        assert compressed.headers["etag"].startswith("W/")
+        response = client.get("/products/MLC123456789", headers={
+            "Accept-Encoding": "identity",
+            "If-None-Match": compressed.headers["etag"]
+        })
+        assert response.status_code == 304
+
+    def test_identity_encoding_when_not_accepted(self, client):
+        """Debe entregar el cuerpo sin comprimir si el cliente no acepta compresión"""
+        response = client.get("/products/MLC123456789", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert "basics" in response.json()
+
+    def test_large_product_is_streamed(self, client, monkeypatch):
+        """Los productos grandes deben transmitirse en streaming con el mismo JSON"""
+        expected = client.get("/products/MLC123456789", headers={"Accept-Encoding": "identity"}).json()
+        get_default_container().get_product_response_cache().clear()
+        get_default_container().get_section_assembler().invalidate("MLC137702355")
+        monkeypatch.setattr(section_assembler, "STREAMING_MIN_ITEMS", 0)
+
+        response = client.get("/products/MLC123456789", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.json() == expected
+
+    def test_catalog_status_endpoint(self, client):
+        """Debe exponer el estado del catálogo y el reporte de validación"""
+        response = client.get("/monitoring/catalog")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["validated"] is True
+        assert data["validation_report"]["ok"] is True
+
+    def test_section_cache_stats_endpoint(self, client):
+        """Debe exponer las estadísticas del caché de fragmentos por sección"""
+        client.get("/products/MLC123456789")
+        response = client.get("/monitoring/sections")
+
+        assert response.status_code == 200
+        assert response.json()["entries"] >= 1
+
+    def test_degraded_response_is_not_cached(self, client, monkeypatch):
+        """Una respuesta con secciones degradadas no debe cachearse ni llevar validadores"""
+        container = get_default_container()
+        container.get_product_response_cache().clear()
+        container.get_section_assembler().invalidate("MLC137702355")
+
+        def failing_questions(product_id):
+            raise RuntimeError("questions backend down")
+
+        monkeypatch.setattr(container.get_question_service(), "get_questions_by_product_id", failing_questions)
+        response = client.get("/products/MLC123456789")
+
+        assert response.status_code == 200
+        assert response.json()["partial"] == ["questions"]
+        assert response.json()["questions"] == []
+        assert response.headers["cache-control"] == "no-store"
+        assert "etag" not in response.headers
+
+        monkeypatch.undo()
+        recovered = client.get("/products/MLC123456789")
+        assert recovered.json()["partial"] == []
+        assert "etag" in recovered.headers
+
+    def test_breaker_stats_endpoint(self, client):
+        """Debe exponer el estado de los circuit breakers y bulkheads por sección"""
+        response = client.get("/monitoring/breakers")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["seller"]["breaker"]["state"] in ("closed", "open", "half_open")
+        assert "in_use" in data["reviews"]["bulkhead"]
+        assert "basics" not in data
+
+    def test_stale_payload_is_served_and_refreshed(self, monkeypatch):
+        """Un payload stale debe servirse de inmediato y recalcularse en segundo plano"""
+        container = get_default_container()
+        response_cache = container.get_product_response_cache()
+        version = container.get_catalog().version
+        response_cache.clear()
+        monkeypatch.setattr(response_cache, "_hard_ttl", float("inf"))
+        response_cache.put("MLC621083881", version, b'{"stale":true}')
+        response_cache.get("MLC621083881", version).stored_at -= 3600
+
+        # Con el cliente abierto el event loop sigue vivo y el recálculo puede terminar
+        with TestClient(create_application()) as client:
+            response = client.get("/products/MLC621083881", headers={"Accept-Encoding": "identity"})
+            deadline = time.monotonic() + 5
+            while response_cache.get_stats()["refreshing"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+        refreshed = response_cache.get("MLC621083881", version)
+        response_cache.clear()
+
+        assert response.json() == {"stale": True}
+        assert b'"basics"' in refreshed.body
+        assert response_cache.is_stale(refreshed) is False
+
+    def test_l2_is_accessed_off_the_event_loop(self, monkeypatch, tmp_path):
+        """La lectura y la escritura del L2 (SQLite) corren en el threadpool, no en el event loop"""
+        container = get_default_container()
+        l2 = RecordingDiskCache(str(tmp_path / "payloads.sqlite3"))
+        monkeypatch.setattr(container, "_product_response_cache", ProductResponseCache(l2=l2))
+
+        with TestClient(create_application()) as client:
+            response = client.get("/products/MLC621083881")
+            # La escritura al L2 no demora la respuesta: termina en segundo plano
+            deadline = time.monotonic() + 5
+            while ("put", False) not in l2.calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert response.status_code == 200
+        assert ("get", False) in l2.calls
+        assert ("put", False) in l2.calls
+        assert not any(on_loop for _, on_loop in l2.calls)
+        assert len(l2) == 1
+
+    def test_materialized_payload_is_served_from_pack(self, client, monkeypatch, tmp_path):
+        """Con un pack de la versión actual, el JSON se sirve desde el pack sin orquestar"""
+        container = get_default_container()
+        path = str(tmp_path / "payloads.pack")
+        body = b'{"id":"MLC621083881","packed":true}'
+        payloads = [PackedPayload("MLC621083881", b"\x00" * 16, {IDENTITY: body, GZIP: gzip.compress(body)})]
+        write_pack(payloads, path, container.get_catalog().version, [IDENTITY, GZIP])
+        pack = MmapPayloadPack(path)
+        monkeypatch.setattr(container, "_payload_pack", pack)
+
+        plain = client.get("/products/MLC621083881", headers={"Accept-Encoding": "identity"})
+        compressed = client.get("/products/MLC621083881", headers={"Accept-Encoding": "gzip"})
+        # Lo que no está en el pack sigue el camino normal
+        other = client.get("/products/MLC137702355")
+
+        assert plain.content == body
+        assert "etag" in plain.headers
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.json()["packed"] is True
+        assert other.status_code == 200
+        assert "basics" in other.json()
+        assert client.get("/monitoring/payload-pack").json()["served"] == 2
+        pack.close()
+
+    def test_pack_from_another_catalog_version_is_ignored(self, client, monkeypatch, tmp_path):
+        """Un pack de otra versión del catálogo no debe servirse"""
+        path = str(tmp_path / "payloads.pack")
+        payloads = [PackedPayload("MLC621083881", b"\x00" * 16, {IDENTITY: b'{"packed":true}'})]
+        write_pack(payloads, path, "old-version", [IDENTITY])
+        pack = MmapPayloadPack(path)
+        monkeypatch.setattr(get_default_container(), "_payload_pack", pack)
+
+        response = client.get("/products/MLC621083881")
+
+        assert "packed" not in response.json()
+        assert client.get("/monitoring/payload-pack").json()["current"] is False
+        pack.close()
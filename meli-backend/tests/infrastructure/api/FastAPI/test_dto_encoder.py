@@ -0,0 +1,69 @@
+"""Tests para los encoders generados desde los DTOs"""
+
+import json
+
+import pytest
+from infrastructure.api.FastAPI.dto_encoder import get_encoder, to_plain
+from infrastructure.api.FastAPI.msgpack_serializer import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    msgpack_available,
+    negotiate_media_type,
+    to_msgpack_bytes
+)
+from infrastructure.api.FastAPI.serializer import serialize_to_dict
+from infrastructure.container.dependency_container import get_default_container
+
+
+@pytest.fixture(scope="module")
+def product_detail():
+    """DTO real orquestado desde el catálogo"""
+    return get_default_container().get_detail_product_service().get_detail_product_by_id("MLC137702355")
+
+
+class TestDtoEncoder:
+    """Tests para to_plain / get_encoder"""
+
+    def test_matches_json_contract(self, product_detail):
+        """Debe producir las mismas claves y valores que el JSON del frontend"""
+        assert to_plain(product_detail) == json.loads(json.dumps(serialize_to_dict(product_detail)))
+
+    def test_encoder_is_compiled_once_per_class(self, product_detail):
+        """El encoder de cada DTO debe generarse una sola vez"""
+        assert get_encoder(type(product_detail)) is get_encoder(type(product_detail))
+
+
+class TestNegotiateMediaType:
+    """Tests para negotiate_media_type"""
+
+    def test_defaults_to_json(self):
+        """Sin Accept o con */* se responde JSON"""
+        assert negotiate_media_type(None) == JSON_MEDIA_TYPE
+        assert negotiate_media_type("*/*") == JSON_MEDIA_TYPE
+
+    def test_json_preferred_over_msgpack(self):
+        """Debe respetar la calidad pedida por el cliente"""
+        assert negotiate_media_type("application/json, application/msgpack;q=0.5") == JSON_MEDIA_TYPE
+
+    @pytest.mark.skipif(not msgpack_available(), reason="msgpack no instalado")
+    def test_msgpack_requested(self):
+        """Debe elegir msgpack cuando el cliente lo pide explícitamente"""
+        assert negotiate_media_type("application/msgpack") == MSGPACK_MEDIA_TYPE
+        assert negotiate_media_type("application/x-msgpack, */*;q=0.1") == MSGPACK_MEDIA_TYPE
+
+    @pytest.mark.skipif(msgpack_available(), reason="msgpack instalado")
+    def test_falls_back_to_json_without_msgpack(self):
+        """Sin el paquete msgpack siempre se responde JSON"""
+        assert negotiate_media_type("application/msgpack") == JSON_MEDIA_TYPE
+
+
+@pytest.mark.skipif(not msgpack_available(), reason="msgpack no instalado")
+class TestMsgpackSerializer:
+    """Tests para to_msgpack_bytes"""
+
+    def test_roundtrip(self, product_detail):
+        """El payload msgpack debe decodificar al mismo contrato que el JSON"""
+        import msgpack
+
+        decoded = msgpack.unpackb(to_msgpack_bytes(product_detail), raw=False)
+        assert decoded == json.loads(json.dumps(serialize_to_dict(product_detail)))
@@ -0,0 +1,40 @@
+"""Tests para los fragmentos pre-renderizados de secciones globales"""
+
+import pytest
+from infrastructure.api.FastAPI.streaming_serializer import iter_json_pieces
+from infrastructure.container.dependency_container import get_default_container
+
+
+@pytest.fixture(scope="module")
+def container():
+    return get_default_container()
+
+
+@pytest.fixture(scope="module")
+def product_detail(container):
+    """DTO real orquestado desde el catálogo"""
+    return container.get_detail_product_service().get_detail_product_by_id("MLC137702355")
+
+
+class TestGlobalSectionFragments:
+    """Tests para GlobalSectionFragments"""
+
+    def test_rendered_once_per_version(self, container):
+        """Los fragmentos deben calcularse una vez por versión del catálogo"""
+        fragments = container.get_global_section_fragments()
+        version = container.get_catalog().version
+        assert fragments.get(version) is fragments.get(version)
+
+    def test_fragments_reference_shared_dtos(self, container, product_detail):
+        """El fragmento debe corresponder a la misma tupla que recibe el DTO"""
+        fragments = container.get_global_section_fragments().get(container.get_catalog().version)
+
+        assert fragments["payment_methods"].value is product_detail.payment_methods
+        assert fragments["available_rating_categories"].value is product_detail.available_rating_categories
+
+    def test_fragments_match_full_serialization(self, container, product_detail):
+        """El JSON pre-renderizado debe ser el mismo que serializar la sección"""
+        fragments = container.get_global_section_fragments().get(container.get_catalog().version)
+
+        for name in ("payment_methods", "available_rating_categories"):
+            assert fragments[name].json == "".join(iter_json_pieces(getattr(product_detail, name)))
@@ -0,0 +1,42 @@
+"""Tests para las utilidades de caché HTTP"""
+
+from email.utils import formatdate
+
+from infrastructure.api.FastAPI.http_cache import build_etag, etag_matches, not_modified_since
+
+
+class TestHttpCache:
+    """Tests para ETag y fechas de modificación"""
+
+    def test_etag_depends_on_version_and_product(self):
+        """El ETag debe cambiar con la versión del catálogo y con el producto"""
+        etag = build_etag("v1", "MLC1")
+        assert etag == build_etag("v1", "MLC1")
+        assert etag != build_etag("v2", "MLC1")
+        assert etag != build_etag("v1", "MLC2")
+
+    def test_etag_depends_on_representation(self):
+        """Cada formato (JSON, msgpack) debe tener su propio ETag"""
+        assert build_etag("v1", "MLC1") == build_etag("v1", "MLC1", "")
+        assert build_etag("v1", "MLC1") != build_etag("v1", "MLC1", "application/msgpack")
+
+    def test_etag_is_weak(self):
+        """Las codificaciones comparten el ETag, así que debe ser débil"""
+        assert build_etag("v1", "MLC1").startswith('W/"')
+
+    def test_etag_matches_list_and_weak_validators(self):
+        """Debe aceptar listas, validadores débiles o fuertes y comodín"""
+        etag = build_etag("v1", "MLC1")
+        assert etag_matches(f'"other", {etag}', etag) is True
+        assert etag_matches(etag[2:], etag) is True
+        assert etag_matches('*', etag) is True
+        assert etag_matches('"other"', etag) is False
+        assert etag_matches(None, etag) is False
+
+    def test_not_modified_since(self):
+        """Debe comparar contra la fecha de modificación con resolución de segundos"""
+        last_modified = 1700000000.5
+        assert not_modified_since(formatdate(1700000000, usegmt=True), last_modified) is True
+        assert not_modified_since(formatdate(1600000000, usegmt=True), last_modified) is False
+        assert not_modified_since("not a date", last_modified) is False
+        assert not_modified_since(None, last_modified) is False
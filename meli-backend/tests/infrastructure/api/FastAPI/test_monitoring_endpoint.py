@@ -0,0 +1,49 @@
+"""Tests para los endpoints de monitoreo"""
+
+import pytest
+from fastapi.testclient import TestClient
+from application.entrypoint.main import create_application
+from infrastructure.api.FastAPI import monitoring
+
+RELOAD_URL = "/monitoring/catalog/reload"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Cliente con la recarga del catálogo reemplazada por una que solo se registra"""
+    calls = []
+    monkeypatch.setattr(monitoring, "reload_default_container", lambda: calls.append(1) or {"changed": False})
+    client = TestClient(create_application())
+    client.reload_calls = calls
+    return client
+
+
+class TestCatalogReloadEndpoint:
+    """Tests para POST /monitoring/catalog/reload"""
+
+    def test_disabled_without_admin_token(self, client, monkeypatch):
+        """Sin MELI_ADMIN_TOKEN el endpoint no existe"""
+        monkeypatch.delenv(monitoring.ADMIN_TOKEN_ENV, raising=False)
+
+        response = client.post(RELOAD_URL, headers={"X-Admin-Token": ""})
+
+        assert response.status_code == 404
+        assert client.reload_calls == []
+
+    @pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}])
+    def test_invalid_token_is_rejected(self, client, monkeypatch, headers):
+        """Sin el token correcto se responde 403 y no se recarga"""
+        monkeypatch.setenv(monitoring.ADMIN_TOKEN_ENV, "secret")
+
+        assert client.post(RELOAD_URL, headers=headers).status_code == 403
+        assert client.reload_calls == []
+
+    def test_valid_token_reloads(self, client, monkeypatch):
+        """Con el token correcto se recarga el catálogo del worker"""
+        monkeypatch.setenv(monitoring.ADMIN_TOKEN_ENV, "secret")
+
+        response = client.post(RELOAD_URL, headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 200
+        assert response.json() == {"changed": False}
+        assert client.reload_calls == [1]
@@ -0,0 +1,42 @@
+"""Tests para el endpoint de listados de productos"""
+
+import pytest
+from fastapi.testclient import TestClient
+from application.entrypoint.main import create_application
+
+
+class TestProductListingEndpoint:
+    """Tests para /listings/products"""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture que crea el cliente de prueba"""
+        return TestClient(create_application())
+
+    def test_discounted_products_in_range_sorted_by_sold_count(self, client):
+        """Debe filtrar por rango de precio y ordenar por ventas descendente"""
+        response = client.get("/listings/products", params={
+            "discounted": "true", "min_price": 1000000, "max_price": 1300000, "sort": "sold_count"
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        sold = [item["soldCount"] for item in data["items"]]
+        assert sold == sorted(sold, reverse=True)
+        assert data["items"][0]["id"] == "MLC677194340"
+        assert all(1000000 <= item["price"] <= 1300000 for item in data["items"])
+
+    def test_limit(self, client):
+        """Debe respetar el límite de resultados"""
+        response = client.get("/listings/products", params={"limit": 2, "sort": "price", "order": "asc"})
+
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["total"] == 9
+        assert data["items"][0]["price"] <= data["items"][1]["price"]
+
+    def test_invalid_sort_returns_400(self, client):
+        """Debe rechazar columnas de orden inválidas"""
+        response = client.get("/listings/products", params={"sort": "title"})
+        assert response.status_code == 400
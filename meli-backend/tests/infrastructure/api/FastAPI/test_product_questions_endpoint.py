@@ -0,0 +1,87 @@
+"""Tests para los endpoints de preguntas y respuestas"""
+
+import pytest
+from fastapi.testclient import TestClient
+from application.entrypoint.main import create_application
+from infrastructure.container import dependency_container
+from infrastructure.persist.append_log.append_log import AppendLog
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+
+PRODUCT_ID = "MLC137702355"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Cliente sobre un container propio con el log de preguntas en tmp_path"""
+    container = dependency_container.DependencyContainer(
+        CatalogSnapshot.load(), question_log=AppendLog(str(tmp_path / "questions.jsonl"))
+    )
+    monkeypatch.setattr(dependency_container, "_default_container", container)
+    return TestClient(create_application())
+
+
+def _ask(client, text="¿Tiene garantía?"):
+    return client.post(f"/products/{PRODUCT_ID}/questions", json={"question": text})
+
+
+class TestProductQuestionsEndpoint:
+    """Tests para /products/{product_id}/questions"""
+
+    def test_created_question_is_pending(self, client):
+        """El alta responde 201 con la pregunta sin responder"""
+        response = _ask(client)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["status"] == "pending"
+        assert data["answer"] == ""
+        assert data["askedAt"]
+
+    def test_answer_appears_on_product_detail_immediately(self, client):
+        """El detalle (aunque estuviera cacheado) muestra la respuesta y cambia su ETag"""
+        question_id = _ask(client).json()["id"]
+        first = client.get(f"/products/{PRODUCT_ID}")
+        assert first.json()["questions"][0]["status"] == "pending"
+
+        response = client.post(f"/products/{PRODUCT_ID}/questions/{question_id}/answer", json={"answer": "Sí"})
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "answered"
+        second = client.get(f"/products/{PRODUCT_ID}")
+        question = second.json()["questions"][0]
+        assert (question["id"], question["answer"], question["status"]) == (question_id, "Sí", "answered")
+        assert second.headers["etag"] != first.headers["etag"]
+
+    def test_second_answer_returns_409(self, client):
+        """Responder una pregunta ya respondida responde 409"""
+        question_id = _ask(client).json()["id"]
+        url = f"/products/{PRODUCT_ID}/questions/{question_id}/answer"
+        client.post(url, json={"answer": "Sí"})
+
+        assert client.post(url, json={"answer": "No"}).status_code == 409
+
+    def test_questions_are_paginated_by_status(self, client):
+        """El listado filtra por estado y pagina de la más nueva a la más vieja"""
+        first_id = _ask(client, "¿Primera?").json()["id"]
+        _ask(client, "¿Segunda?")
+        client.post(f"/products/{PRODUCT_ID}/questions/{first_id}/answer", json={"answer": "Sí"})
+
+        pending = client.get(f"/products/{PRODUCT_ID}/questions", params={"status": "pending"}).json()
+        page = client.get(f"/products/{PRODUCT_ID}/questions", params={"offset": 1, "limit": 1}).json()
+
+        assert pending["total"] == 1
+        assert pending["items"][0]["question"] == "¿Segunda?"
+        assert page["total"] == 2
+        assert len(page["items"]) == 1
+
+    def test_unknown_product_or_question_returns_404(self, client):
+        """Un producto o una pregunta inexistentes responden 404"""
+        assert client.post("/products/MLC000000000/questions", json={"question": "¿Hola?"}).status_code == 404
+        assert client.get("/products/MLC000000000/questions").status_code == 404
+        response = client.post(f"/products/{PRODUCT_ID}/questions/missing/answer", json={"answer": "Sí"})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("body", [{"question": ""}, {"question": "   "}, {}])
+    def test_invalid_question_returns_422(self, client, body):
+        """Los datos inválidos responden 422"""
+        assert client.post(f"/products/{PRODUCT_ID}/questions", json=body).status_code == 422
@@ -0,0 +1,91 @@
+"""Tests para el endpoint de alta de reviews"""
+
+import pytest
+from fastapi.testclient import TestClient
+from application.entrypoint.main import create_application
+from infrastructure.container import dependency_container
+from infrastructure.persist.append_log.append_log import AppendLog
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+
+PRODUCT_ID = "MLC137702355"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Cliente sobre un container propio con el log de reviews en tmp_path"""
+    container = dependency_container.DependencyContainer(
+        CatalogSnapshot.load(), review_log=AppendLog(str(tmp_path / "reviews.jsonl"))
+    )
+    monkeypatch.setattr(dependency_container, "_default_container", container)
+    return TestClient(create_application())
+
+
+class TestProductReviewsEndpoint:
+    """Tests para POST /products/{product_id}/reviews"""
+
+    def test_created_review_updates_statistics(self, client):
+        """El alta responde 201 con la review y las estadísticas ya actualizadas"""
+        before = client.get(f"/products/{PRODUCT_ID}").json()["totalReviews"]
+
+        response = client.post(f"/products/{PRODUCT_ID}/reviews", json={
+            "userName": "Ana",
+            "rating": 5,
+            "comment": "Excelente",
+            "categoryRatings": {"battery_life": 5}
+        })
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["review"]["userName"] == "Ana"
+        assert data["review"]["likes"] == 0
+        assert data["statistics"]["totalReviews"] == before + 1
+
+    def test_product_detail_shows_new_review_immediately(self, client):
+        """El detalle (aunque estuviera cacheado) incluye la review y cambia su ETag"""
+        first = client.get(f"/products/{PRODUCT_ID}")
+
+        created = client.post(f"/products/{PRODUCT_ID}/reviews", json={
+            "userName": "Ana", "rating": 4, "comment": "Muy bueno"
+        }).json()["review"]
+
+        second = client.get(f"/products/{PRODUCT_ID}")
+        detail = second.json()
+        assert detail["reviews"][0]["id"] == created["id"]
+        assert detail["totalReviews"] == first.json()["totalReviews"] + 1
+        assert second.headers["etag"] != first.headers["etag"]
+        # El ETag anterior ya no valida
+        assert client.get(f"/products/{PRODUCT_ID}", headers={"If-None-Match": first.headers["etag"]}).status_code == 200
+
+    def test_other_sections_are_not_reorchestrated(self, client):
+        """Tras una review solo se vuelve a armar la sección de reviews del producto"""
+        container = dependency_container.get_default_container()
+        version = container.get_catalog().version
+        container.get_section_assembler().assemble(PRODUCT_ID, version)
+        misses = container.get_section_fragment_cache().get_stats()["misses"]
+
+        client.post(f"/products/{PRODUCT_ID}/reviews", json={"userName": "Ana", "rating": 4})
+        container.get_section_assembler().assemble(PRODUCT_ID, version)
+
+        assert container.get_section_fragment_cache().get_stats()["misses"] - misses == 1
+
+    def test_alias_resolves_to_canonical_product(self, client):
+        """El ID redirigido publica la review en el producto canónico"""
+        response = client.post("/products/MLC123456789/reviews", json={"userName": "Ana", "rating": 5})
+
+        assert response.status_code == 201
+        assert client.get(f"/products/{PRODUCT_ID}").json()["reviews"][0]["id"] == response.json()["review"]["id"]
+
+    def test_unknown_product_returns_404(self, client):
+        """Un producto inexistente responde 404"""
+        response = client.post("/products/MLC000000000/reviews", json={"userName": "Ana", "rating": 5})
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("body", [
+        {"userName": "Ana", "rating": 6},
+        {"userName": "", "rating": 5},
+        {"userName": "Ana", "rating": 5, "categoryRatings": {"color": 5}}
+    ])
+    def test_invalid_review_returns_422(self, client, body):
+        """Los datos inválidos responden 422"""
+        assert client.post(f"/products/{PRODUCT_ID}/reviews", json=body).status_code == 422
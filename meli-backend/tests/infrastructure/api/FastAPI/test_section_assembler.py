@@ -0,0 +1,97 @@
+"""Tests para el ensamblado del detalle a partir de fragmentos por sección"""
+
+import json
+
+import pytest
+from application.service.detail_product_orchestrator_service import SECTIONS
+from infrastructure.api.FastAPI.section_assembler import SectionAssembler
+from infrastructure.api.FastAPI.serializer import serialize_to_dict
+from infrastructure.cache.section_fragment_cache import SectionFragmentCache
+from infrastructure.container.dependency_container import get_default_container
+
+
+class _CountingService:
+    """Envuelve el servicio de detalle registrando las secciones consultadas"""
+
+    def __init__(self, service):
+        self._service = service
+        self.calls = []
+
+    def get_sections_by_product_id(self, product_id, sections):
+        self.calls.append(tuple(sections))
+        return self._service.get_sections_by_product_id(product_id, sections)
+
+
+def _render(assembler, product_id: str, version: str) -> bytes:
+    """JSON completo de un producto, armado igual que el endpoint"""
+    return ''.join(assembler.assemble(product_id, version).pieces).encode('utf-8')
+
+
+@pytest.fixture(scope="module")
+def container():
+    return get_default_container()
+
+
+@pytest.fixture
+def service(container):
+    return _CountingService(container.get_detail_product_service())
+
+
+@pytest.fixture
+def assembler(container, service):
+    return SectionAssembler(service, SectionFragmentCache(), container.get_global_section_fragments())
+
+
+class TestSectionAssembler:
+    """Tests para SectionAssembler"""
+
+    def test_assembled_json_matches_full_serialization(self, container, assembler):
+        """Concatenar los fragmentos debe producir exactamente el mismo JSON"""
+        version = container.get_catalog().version
+        product_detail = container.get_detail_product_service().get_detail_product_by_id("MLC137702355")
+
+        assert json.loads(_render(assembler, "MLC137702355", version)) == json.loads(json.dumps(serialize_to_dict(product_detail)))
+
+    def test_cached_sections_are_not_requested_again(self, container, assembler, service):
+        """Una segunda petición debe armarse solo con fragmentos cacheados"""
+        version = container.get_catalog().version
+        first = _render(assembler, "MLC137702355", version)
+        second = _render(assembler, "MLC137702355", version)
+
+        assert first == second
+        assert len(service.calls) == 1
+
+    def test_invalidated_section_is_the_only_one_refetched(self, container, assembler, service):
+        """Invalidar reviews debe volver a consultar únicamente esa sección"""
+        version = container.get_catalog().version
+        expected = _render(assembler, "MLC137702355", version)
+
+        assembler.invalidate("MLC137702355", "reviews")
+
+        assert _render(assembler, "MLC137702355", version) == expected
+        assert service.calls[-1] == ("reviews",)
+
+    def test_refresh_recomputes_every_section(self, container, assembler, service):
+        """Con refresh se deben volver a consultar todas las secciones"""
+        version = container.get_catalog().version
+        expected = _render(assembler, "MLC137702355", version)
+
+        assembled = assembler.assemble("MLC137702355", version, refresh=True)
+
+        assert ''.join(assembled.pieces).encode('utf-8') == expected
+        assert service.calls[-1] == SECTIONS
+
+    def test_unknown_product_returns_none(self, container, assembler):
+        """Un producto inexistente no debe armarse ni cachearse"""
+        version = container.get_catalog().version
+
+        assert assembler.assemble("ABC999", version) is None
+        assert assembler.get_stats()["entries"] == 0
+
+    def test_shared_sections_reuse_fragments_across_products(self, container, assembler):
+        """Los SKUs del mismo vendedor deben compartir el fragmento del vendedor"""
+        version = container.get_catalog().version
+        _render(assembler, "MLC137702355", version)
+        _render(assembler, "MLC621083881", version)
+
+        assert assembler.get_stats()["shared_hits"] >= 1
@@ -0,0 +1,69 @@
+"""Tests para el serializador JSON incremental"""
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+import pytest
+from infrastructure.api.FastAPI.serializer import serialize_to_dict
+from infrastructure.api.FastAPI.streaming_serializer import iter_chunks, iter_json_pieces
+from infrastructure.container.dependency_container import get_default_container
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass(frozen=True)
+class Item:
+    item_name: str
+    color: Color
+    score: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class Page:
+    page_items: List[Item]
+    rating_distribution: Dict[int, int]
+    category_ratings: Dict[str, float]
+
+
+def _full_json(obj) -> bytes:
+    """JSON de referencia: serialize_to_dict + json.dumps compacto"""
+    return json.dumps(serialize_to_dict(obj), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def product_detail():
+    """DTO real orquestado desde el catálogo"""
+    return get_default_container().get_detail_product_service().get_detail_product_by_id("MLC137702355")
+
+
+class TestIterJsonPieces:
+    """Tests para iter_json_pieces / iter_chunks"""
+
+    def test_matches_full_serialization_for_dataclasses(self):
+        """Debe producir exactamente el mismo JSON que la serialización completa"""
+        page = Page(
+            page_items=[Item("a", Color.RED, 4.5), Item("ñandú", Color.RED)],
+            rating_distribution={5: 10, 1: 2},
+            category_ratings={"camera_quality": 4.7}
+        )
+        assert b"".join(iter_chunks(iter_json_pieces(page))) == _full_json(page)
+
+    def test_matches_full_serialization_for_product_detail(self, product_detail):
+        """Debe producir el mismo JSON que la serialización completa para un producto real"""
+        assert b"".join(iter_chunks(iter_json_pieces(product_detail))) == _full_json(product_detail)
+
+    def test_splits_large_payload_in_chunks(self, product_detail):
+        """Debe emitir varios fragmentos cuando el payload supera chunk_size"""
+        chunks = list(iter_chunks(iter_json_pieces(product_detail), chunk_size=256))
+
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks))["basics"]["id"] == "MLC137702355"
+
+    def test_rejects_nan(self):
+        """Debe rechazar NaN igual que la respuesta JSON"""
+        with pytest.raises(ValueError):
+            "".join(iter_json_pieces({"value": float("nan")}))
@@ -0,0 +1,118 @@
+"""Tests para el warm-up del arranque y el endpoint de readiness"""
+
+import time
+
+from fastapi.testclient import TestClient
+
+from application.entrypoint.main import create_application
+from infrastructure.api.FastAPI.warmup import (
+    FAILED,
+    READY,
+    WARMUP_ACCESS_LOG_ENV,
+    WARMUP_PRODUCTS_ENV,
+    WARMUP_PRODUCTS_FILE_ENV,
+    Readiness,
+    resolve_warmup_products,
+    top_products_from_access_log,
+    warm_up
+)
+from infrastructure.container.dependency_container import get_default_container
+
+ACCESS_LOG = (
+    'INFO:     10.0.0.1:5000 - "GET /products/MLC621083881 HTTP/1.1" 200 OK\n'
+    'INFO:     10.0.0.2:5000 - "GET /products/MLC137702355 HTTP/1.1" 200 OK\n'
+    'INFO:     10.0.0.3:5000 - "GET /products/MLC123456789 HTTP/1.1" 200 OK\n'
+    'INFO:     10.0.0.4:5000 - "GET /monitoring/catalog HTTP/1.1" 200 OK\n'
+    '10.0.0.5 - - [19/Oct/2026:10:00:00 +0000] "GET /products/MLC621083881?ref=home HTTP/1.1" 200 512\n'
+    '10.0.0.6 - - [19/Oct/2026:10:00:01 +0000] "GET /products/MLC137702355 HTTP/1.1" 200 512\n'
+)
+
+
+class TestWarmupProducts:
+    """Tests para la selección de productos a pre-renderizar"""
+
+    def test_access_log_counts_product_requests(self, tmp_path):
+        """Debe ordenar por cantidad de peticiones y resolver los alias"""
+        log = tmp_path / "access.log"
+        log.write_text(ACCESS_LOG, encoding="utf-8")
+
+        assert top_products_from_access_log(str(log)) == ["MLC137702355", "MLC621083881"]
+        assert top_products_from_access_log(str(log), limit=1) == ["MLC137702355"]
+
+    def test_explicit_list_takes_precedence(self, tmp_path):
+        """La lista del entorno debe tener prioridad sobre el archivo y el log"""
+        products_file = tmp_path / "top.txt"
+        products_file.write_text("# más vistos\nMLC1\n\nMLC2\n", encoding="utf-8")
+        environ = {
+            WARMUP_PRODUCTS_ENV: "MLC9, MLC123456789,MLC9",
+            WARMUP_PRODUCTS_FILE_ENV: str(products_file)
+        }
+
+        assert resolve_warmup_products(environ=environ) == ["MLC9", "MLC137702355"]
+        del environ[WARMUP_PRODUCTS_ENV]
+        assert resolve_warmup_products(environ=environ) == ["MLC1", "MLC2"]
+
+    def test_access_log_source(self, tmp_path):
+        """Sin lista explícita debe usar el access log"""
+        log = tmp_path / "access.log"
+        log.write_text(ACCESS_LOG, encoding="utf-8")
+
+        assert resolve_warmup_products(environ={WARMUP_ACCESS_LOG_ENV: str(log)})[0] == "MLC137702355"
+
+    def test_without_configuration_warms_nothing(self):
+        """Sin configuración no se pre-renderiza ningún producto"""
+        assert resolve_warmup_products(environ={}) == []
+
+
+class TestWarmUp:
+    """Tests para la fase de warm-up"""
+
+    def test_prerenders_products_into_response_cache(self):
+        """Los productos pre-renderizados deben quedar en el caché de respuestas"""
+        container = get_default_container()
+        response_cache = container.get_product_response_cache()
+        response_cache.clear()
+
+        readiness = warm_up(Readiness(), ["MLC621083881", "NOT_A_PRODUCT"], container)
+
+        assert readiness.phase == READY
+        assert readiness.prerendered == 1
+        assert readiness.skipped == ["NOT_A_PRODUCT"]
+        assert response_cache.get("MLC621083881", container.get_catalog().version) is not None
+
+    def test_catalog_failure_is_never_ready(self):
+        """Si no se puede cargar el catálogo la instancia no debe reportarse lista"""
+        class BrokenContainer:
+            def get_catalog(self):
+                raise OSError("catalog unavailable")
+
+        readiness = warm_up(Readiness(), [], BrokenContainer())
+
+        assert readiness.phase == FAILED
+        assert readiness.ready is False
+        assert readiness.error == "catalog unavailable"
+
+
+class TestReadinessEndpoint:
+    """Tests para /ready"""
+
+    def test_not_ready_before_startup(self):
+        """Sin ejecutar el lifespan la instancia no está lista"""
+        response = TestClient(create_application()).get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["phase"] == "starting"
+
+    def test_ready_after_lifespan_warm_up(self, monkeypatch):
+        """Tras el warm-up del lifespan /ready debe responder 200"""
+        monkeypatch.setenv(WARMUP_PRODUCTS_ENV, "MLC621083881")
+
+        with TestClient(create_application()) as client:
+            deadline = time.monotonic() + 10
+            response = client.get("/ready")
+            while response.status_code != 200 and time.monotonic() < deadline:
+                time.sleep(0.01)
+                response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["prerendered"] == 1
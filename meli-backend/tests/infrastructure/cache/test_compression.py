@@ -0,0 +1,75 @@
+"""Tests para la compresión y negociación de Accept-Encoding"""
+
+import gzip
+
+import pytest
+from infrastructure.cache.compression import (
+    BROTLI,
+    GZIP,
+    IDENTITY,
+    compress,
+    iter_compress,
+    negotiate_encoding,
+    parse_accept_encoding
+)
+
+
+class TestParseAcceptEncoding:
+    """Tests para parse_accept_encoding"""
+
+    def test_parses_quality_values(self):
+        """Debe leer la calidad de cada codificación (1.0 por defecto)"""
+        assert parse_accept_encoding("gzip, br;q=0.5") == {"gzip": 1.0, "br": 0.5}
+
+    def test_empty_header(self):
+        """Debe retornar un diccionario vacío sin header"""
+        assert parse_accept_encoding(None) == {}
+
+
+class TestNegotiateEncoding:
+    """Tests para negotiate_encoding"""
+
+    def test_prefers_first_available_on_equal_quality(self):
+        """Ante igual calidad gana el orden de preferencia del servidor"""
+        assert negotiate_encoding("gzip, br", [BROTLI, GZIP]) == BROTLI
+
+    def test_respects_client_quality(self):
+        """Debe elegir la codificación con mayor calidad"""
+        assert negotiate_encoding("gzip;q=1.0, br;q=0.2", [BROTLI, GZIP]) == GZIP
+
+    def test_rejected_encoding(self):
+        """q=0 significa que la codificación no es aceptable"""
+        assert negotiate_encoding("gzip;q=0", [GZIP]) == IDENTITY
+
+    def test_wildcard(self):
+        """'*' acepta cualquier codificación disponible"""
+        assert negotiate_encoding("*", [GZIP]) == GZIP
+
+    def test_no_header_returns_identity(self):
+        """Sin Accept-Encoding se responde sin comprimir"""
+        assert negotiate_encoding(None, [GZIP]) == IDENTITY
+
+
+class TestCompress:
+    """Tests para compress"""
+
+    def test_gzip_roundtrip(self):
+        """El resultado gzip debe descomprimirse al original"""
+        body = b'{"id":"MLC1"}' * 100
+        assert gzip.decompress(compress(body, GZIP, 6)) == body
+
+    def test_gzip_is_deterministic(self):
+        """Dos compresiones del mismo cuerpo deben ser idénticas"""
+        body = b"x" * 2048
+        assert compress(body, GZIP, 6) == compress(body, GZIP, 6)
+
+    def test_unsupported_encoding(self):
+        """Debe rechazar codificaciones desconocidas"""
+        with pytest.raises(ValueError):
+            compress(b"x", "deflate", 6)
+
+    def test_iter_compress_gzip_roundtrip(self):
+        """La compresión incremental debe producir un gzip válido del flujo completo"""
+        chunks = [b'{"reviews":[', b'1,' * 5000, b'1]}']
+        compressed = b"".join(iter_compress(iter(chunks), GZIP, 6))
+        assert gzip.decompress(compressed) == b"".join(chunks)
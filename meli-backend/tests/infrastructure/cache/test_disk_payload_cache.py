@@ -0,0 +1,85 @@
+"""Tests para DiskPayloadCache"""
+
+import pytest
+from infrastructure.cache.disk_payload_cache import L2_PATH_ENV, DiskPayloadCache, default_disk_cache
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Archivo SQLite temporal"""
+    return str(tmp_path / "l2" / "payloads.sqlite3")
+
+
+class TestDiskPayloadCache:
+    """Tests para el caché persistente de payloads"""
+
+    def test_put_and_get(self, path):
+        """Debe retornar el payload y su momento de almacenamiento"""
+        cache = DiskPayloadCache(path)
+        cache.put("MLC1", "v1", "application/json", b'{"id":"MLC1"}', 100.0)
+
+        assert cache.get("MLC1", "v1", "application/json") == (b'{"id":"MLC1"}', 100.0)
+        assert cache.get("MLC1", "v2", "application/json") is None
+        assert cache.get("MLC1", "v1", "application/x-msgpack") is None
+
+    def test_survives_reopening(self, path):
+        """Otra instancia sobre el mismo archivo (ej: tras un reinicio) debe ver los payloads"""
+        DiskPayloadCache(path).put("MLC1", "v1", "application/json", b"{}", 100.0)
+
+        assert DiskPayloadCache(path).get("MLC1", "v1", "application/json") == (b"{}", 100.0)
+
+    def test_invalidate_drops_every_version(self, path):
+        """Debe descartar todas las versiones y formatos del producto"""
+        cache = DiskPayloadCache(path)
+        cache.put("MLC1", "v1", "application/json", b"1", 100.0)
+        cache.put("MLC1", "v2", "application/json", b"2", 100.0)
+        cache.put("MLC2", "v1", "application/json", b"3", 100.0)
+
+        assert cache.invalidate("MLC1") == 2
+        assert len(cache) == 1
+
+    def test_prune_keeps_most_recently_accessed(self, path):
+        """Debe recortar a max_entries descartando lo accedido hace más tiempo"""
+        cache = DiskPayloadCache(path, max_entries=2)
+        for product_id in ("MLC1", "MLC2", "MLC3"):
+            cache.put(product_id, "v1", "application/json", b"{}", 100.0)
+
+        assert cache.prune() == 1
+        assert cache.get("MLC1", "v1", "application/json") is None
+        assert cache.get("MLC3", "v1", "application/json") is not None
+
+    def test_carry_over_copies_unaffected_products(self, path):
+        """Debe copiar a la versión nueva solo los productos no afectados"""
+        cache = DiskPayloadCache(path)
+        cache.put("MLC1", "v1", "application/json", b"1", 100.0)
+        cache.put("MLC2", "v1", "application/json", b"2", 100.0)
+
+        assert cache.carry_over("v1", "v2", {"MLC2"}) == 1
+        assert cache.get("MLC1", "v2", "application/json") == (b"1", 100.0)
+        assert cache.get("MLC2", "v2", "application/json") is None
+        # La versión anterior sigue disponible para los workers que aún no recargaron
+        assert cache.get("MLC2", "v1", "application/json") is not None
+
+    def test_clear_and_stats(self, path):
+        """Debe vaciar el archivo y contar hits y misses"""
+        cache = DiskPayloadCache(path)
+        cache.put("MLC1", "v1", "application/json", b"{}", 100.0)
+        cache.get("MLC1", "v1", "application/json")
+        cache.clear()
+        cache.get("MLC1", "v1", "application/json")
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 0
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_invalid_max_entries(self, path):
+        """Debe rechazar un máximo de entradas no positivo"""
+        with pytest.raises(ValueError):
+            DiskPayloadCache(path, max_entries=0)
+
+    def test_empty_path_disables_l2(self, monkeypatch):
+        """Con MELI_L2_CACHE_PATH vacío no hay L2"""
+        monkeypatch.setenv(L2_PATH_ENV, "")
+
+        assert default_disk_cache() is None
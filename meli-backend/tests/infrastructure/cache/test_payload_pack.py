@@ -0,0 +1,64 @@
+"""Tests para el pack de payloads materializados"""
+
+import gzip
+
+import pytest
+from infrastructure.cache.compression import GZIP, IDENTITY
+from infrastructure.cache.payload_pack import MmapPayloadPack, PackedPayload, write_pack
+
+
+def _payload(product_id: str, body: bytes, fingerprint: bytes = b"\x01" * 16) -> PackedPayload:
+    return PackedPayload(product_id, fingerprint, {IDENTITY: body, GZIP: gzip.compress(body, mtime=0)})
+
+
+@pytest.fixture
+def pack(tmp_path):
+    """Pack con tres productos escritos fuera de orden"""
+    path = str(tmp_path / "payloads.pack")
+    write_pack(
+        [_payload("MLC3", b'{"id":"MLC3"}'), _payload("MLC1", b'{"id":"MLC1"}', b"\x02" * 16),
+         _payload("MLC2", b'{"id":"MLC2"}')],
+        path, "v1", [IDENTITY, GZIP]
+    )
+    pack = MmapPayloadPack(path)
+    yield pack
+    pack.close()
+
+
+class TestPayloadPack:
+    """Tests para la escritura y la lectura vía mmap del pack"""
+
+    def test_get_each_encoding(self, pack):
+        """Debe retornar el payload en cada codificación incluida"""
+        assert pack.get("MLC1") == b'{"id":"MLC1"}'
+        assert gzip.decompress(pack.get("MLC2", GZIP)) == b'{"id":"MLC2"}'
+
+    def test_missing_product_or_encoding(self, pack):
+        """Un producto o una codificación ausentes retornan None"""
+        assert pack.get("MLC9") is None
+        assert pack.get("MLC1", "br") is None
+
+    def test_header_and_index(self, pack):
+        """Debe exponer la versión y los productos ordenados"""
+        assert pack.version == "v1"
+        assert pack.encodings == [IDENTITY, GZIP]
+        assert pack.keys() == ["MLC1", "MLC2", "MLC3"]
+        assert len(pack) == 3
+
+    def test_fingerprint_and_full_payload(self, pack):
+        """La huella y todas las codificaciones se recuperan para reutilizarlas"""
+        assert pack.fingerprint("MLC1") == b"\x02" * 16
+        assert pack.get_payload("MLC3").bodies[IDENTITY] == b'{"id":"MLC3"}'
+
+    def test_encodings_must_start_with_identity(self, tmp_path):
+        """El payload sin comprimir siempre debe estar en el pack"""
+        with pytest.raises(ValueError):
+            write_pack([], str(tmp_path / "payloads.pack"), "v1", [GZIP])
+
+    def test_invalid_file(self, tmp_path):
+        """Debe rechazar archivos que no son un pack"""
+        path = tmp_path / "payloads.pack"
+        path.write_bytes(b"not a pack")
+
+        with pytest.raises(ValueError):
+            MmapPayloadPack(str(path))
@@ -0,0 +1,235 @@
+"""Tests para ProductResponseCache"""
+
+import gzip
+
+import pytest
+from infrastructure.cache.compression import GZIP, IDENTITY
+from infrastructure.cache.disk_payload_cache import DiskPayloadCache
+from infrastructure.cache.product_response_cache import ProductResponseCache
+
+
+LARGE_BODY = b'{"description":"' + b"a" * 4096 + b'"}'
+
+
+class TestProductResponseCache:
+    """Tests para el caché de payloads renderizados"""
+
+    def test_get_missing_returns_none(self):
+        """Debe retornar None si el producto no está cacheado"""
+        assert ProductResponseCache().get("MLC1", "v1") is None
+
+    def test_put_and_get(self):
+        """Debe retornar el payload almacenado para la misma versión"""
+        cache = ProductResponseCache()
+        cache.put("MLC1", "v1", LARGE_BODY)
+
+        assert cache.get("MLC1", "v1").body == LARGE_BODY
+        assert cache.get("MLC1", "v2") is None
+
+    def test_compressed_variant_is_computed_once(self):
+        """La variante gzip debe generarse una vez y reutilizarse"""
+        payload = ProductResponseCache().put("MLC1", "v1", LARGE_BODY)
+
+        first = payload.encoded(GZIP)
+
+        assert gzip.decompress(first) == LARGE_BODY
+        assert payload.encoded(GZIP) is first
+
+    def test_small_bodies_are_not_compressed(self):
+        """Los cuerpos bajo el umbral no ofrecen variantes comprimidas"""
+        payload = ProductResponseCache(compression_min_size=1024).put("MLC1", "v1", b"{}")
+
+        assert payload.encodings == []
+        assert payload.encoded(GZIP) == b"{}"
+
+    def test_identity_returns_raw_body(self):
+        """identity debe retornar los bytes originales"""
+        payload = ProductResponseCache().put("MLC1", "v1", LARGE_BODY)
+        assert payload.encoded(IDENTITY) is LARGE_BODY
+
+    def test_evicts_least_recently_used(self):
+        """Debe descartar la entrada menos usada al superar el límite"""
+        cache = ProductResponseCache(max_entries=2)
+        cache.put("MLC1", "v1", b"1")
+        cache.put("MLC2", "v1", b"2")
+        cache.get("MLC1", "v1")
+        cache.put("MLC3", "v1", b"3")
+
+        assert cache.get("MLC1", "v1") is not None
+        assert cache.get("MLC2", "v1") is None
+
+    def test_invalid_gzip_level(self):
+        """Debe rechazar niveles de gzip fuera de rango"""
+        with pytest.raises(ValueError):
+            ProductResponseCache(gzip_level=10)
+
+    def test_stats(self):
+        """Debe contar hits y misses"""
+        cache = ProductResponseCache()
+        cache.get("MLC1", "v1")
+        cache.put("MLC1", "v1", b"1")
+        cache.get("MLC1", "v1")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+
+class FakeClock:
+    """Reloj manual para controlar los TTL"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStaleWhileRevalidate:
+    """Tests para los soft y hard TTL del caché de payloads"""
+
+    @pytest.fixture
+    def clock(self):
+        """Reloj detenido en 0"""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        """Caché con soft TTL de 5s y hard TTL de 60s"""
+        return ProductResponseCache(soft_ttl=5, hard_ttl=60, clock=clock)
+
+    def test_fresh_payload_is_not_stale(self, cache):
+        """Antes del soft TTL el payload está fresco"""
+        cache.put("MLC1", "v1", LARGE_BODY)
+
+        assert cache.is_stale(cache.get("MLC1", "v1")) is False
+
+    def test_stale_payload_is_still_served(self, cache, clock):
+        """Entre el soft y el hard TTL el payload se sirve marcado como stale"""
+        cache.put("MLC1", "v1", LARGE_BODY)
+        clock.now = 10
+
+        payload = cache.get("MLC1", "v1")
+
+        assert payload.body == LARGE_BODY
+        assert cache.is_stale(payload) is True
+        assert cache.get_stats()["stale_hits"] == 1
+
+    def test_hard_expired_payload_is_a_miss(self, cache, clock):
+        """Pasado el hard TTL el payload se descarta"""
+        cache.put("MLC1", "v1", LARGE_BODY)
+        clock.now = 60
+
+        assert cache.get("MLC1", "v1") is None
+        assert cache.get_stats()["expired"] == 1
+        assert cache.get_stats()["entries"] == 0
+
+    def test_at_most_one_refresh_per_key(self, cache):
+        """Solo el primero que reserva la clave debe recalcular"""
+        assert cache.begin_refresh("MLC1", "v1") is True
+        assert cache.begin_refresh("MLC1", "v1") is False
+        assert cache.begin_refresh("MLC2", "v1") is True
+
+        cache.end_refresh("MLC1", "v1")
+
+        assert cache.begin_refresh("MLC1", "v1") is True
+
+    def test_put_renews_the_payload(self, cache, clock):
+        """El payload recalculado vuelve a estar fresco"""
+        cache.put("MLC1", "v1", LARGE_BODY)
+        clock.now = 10
+        cache.put("MLC1", "v1", b"{}")
+
+        payload = cache.get("MLC1", "v1")
+        assert payload.body == b"{}"
+        assert cache.is_stale(payload) is False
+
+    def test_invalid_ttls(self):
+        """El soft TTL no puede superar al hard TTL"""
+        with pytest.raises(ValueError):
+            ProductResponseCache(soft_ttl=10, hard_ttl=5)
+
+
+class TestTwoLevelCache:
+    """Tests para el L1 en memoria respaldado por el L2 en disco"""
+
+    @pytest.fixture
+    def l2(self, tmp_path):
+        """L2 sobre un archivo temporal"""
+        return DiskPayloadCache(str(tmp_path / "payloads.sqlite3"))
+
+    @pytest.fixture
+    def clock(self):
+        """Reloj detenido en 0"""
+        return FakeClock()
+
+    def test_writes_go_through_to_l2(self, l2, clock):
+        """put debe escribir también en el L2"""
+        ProductResponseCache(clock=clock, l2=l2).put("MLC1", "v1", LARGE_BODY)
+
+        assert l2.get("MLC1", "v1", "application/json") == (LARGE_BODY, 0.0)
+
+    def test_l1_miss_is_promoted_from_l2(self, l2, clock):
+        """Tras un reinicio (L1 vacío) el payload se recupera del L2 y queda en el L1"""
+        ProductResponseCache(clock=clock, l2=l2).put("MLC1", "v1", LARGE_BODY)
+        restarted = ProductResponseCache(clock=clock, l2=l2)
+
+        assert restarted.get("MLC1", "v1").body == LARGE_BODY
+        assert restarted.get("MLC1", "v1").body == LARGE_BODY
+        stats = restarted.get_stats()
+        assert stats["l2_hits"] == 1
+        assert stats["hits"] == 2
+        assert stats["entries"] == 1
+
+    def test_l1_only_operations_do_not_touch_l2(self, l2, clock):
+        """get_l1 y put_l1 no hacen I/O; put_l2 y get_l2 completan los niveles por separado"""
+        cache = ProductResponseCache(clock=clock, l2=l2)
+
+        payload = cache.put_l1("MLC1", "v1", LARGE_BODY)
+        assert l2.get("MLC1", "v1", "application/json") is None
+        assert cache.get_l1("MLC1", "v1") is payload
+
+        cache.put_l2("MLC1", "v1", payload)
+        restarted = ProductResponseCache(clock=clock, l2=l2)
+        assert restarted.get_l1("MLC1", "v1") is None
+        assert restarted.get_l2("MLC1", "v1").body == LARGE_BODY
+        assert restarted.get_l1("MLC1", "v1").body == LARGE_BODY
+        assert restarted.get_stats()["misses"] == 0
+
+    def test_l2_entries_survive_restart_past_hard_ttl(self, l2, clock):
+        """Tras un reinicio, una entrada del L2 más vieja que el hard TTL se sirve sin recalcular"""
+        ProductResponseCache(soft_ttl=5, hard_ttl=60, clock=clock, l2=l2).put("MLC1", "v1", LARGE_BODY)
+        clock.now = 3600
+        restarted = ProductResponseCache(soft_ttl=5, hard_ttl=60, clock=clock, l2=l2)
+
+        payload = restarted.get("MLC1", "v1")
+
+        assert payload.body == LARGE_BODY
+        # Promovida al L1 como recién almacenada: no está stale ni agenda un recálculo
+        assert restarted.is_stale(payload) is False
+        stats = restarted.get_stats()
+        assert (stats["l2_hits"], stats["stale_hits"], stats["misses"]) == (1, 0, 0)
+
+    def test_invalidate_and_clear_reach_l2(self, l2):
+        """invalidate y clear deben aplicar a ambos niveles"""
+        cache = ProductResponseCache(l2=l2)
+        cache.put("MLC1", "v1", b"1")
+        cache.put("MLC2", "v1", b"2")
+
+        assert cache.invalidate("MLC1") == 1
+        assert l2.get("MLC1", "v1", "application/json") is None
+        cache.clear()
+        assert len(l2) == 0
+
+    def test_carry_over_reaches_l2(self, l2, clock):
+        """Los payloads no afectados pasan a la versión nueva en ambos niveles"""
+        cache = ProductResponseCache(clock=clock, l2=l2)
+        cache.put("MLC1", "v1", b"1")
+        cache.put("MLC2", "v1", b"2")
+
+        assert cache.carry_over("v1", "v2", {"MLC2"}) == 1
+        assert cache.get("MLC1", "v2").body == b"1"
+        assert cache.get("MLC2", "v2") is None
+        assert l2.get("MLC1", "v2", "application/json") == (b"1", 0.0)
+        assert l2.get("MLC2", "v2", "application/json") is None
@@ -0,0 +1,78 @@
+"""Tests para SectionFragmentCache"""
+
+import pytest
+from infrastructure.cache.section_fragment_cache import SectionFragmentCache
+
+
+class TestSectionFragmentCache:
+    """Tests para el caché de fragmentos JSON por sección"""
+
+    def test_get_missing_returns_none(self):
+        """Debe retornar None si la sección no está cacheada"""
+        assert SectionFragmentCache().get("MLC1", "v1", "seller") is None
+
+    def test_put_and_get(self):
+        """Debe retornar los fragmentos almacenados para la misma versión"""
+        cache = SectionFragmentCache()
+        cache.put("MLC1", "v1", "payments", ('[]', '12'))
+
+        assert cache.get("MLC1", "v1", "payments") == ('[]', '12')
+        assert cache.get("MLC1", "v2", "payments") is None
+
+    def test_identical_fragments_are_shared(self):
+        """Los fragmentos con el mismo contenido deben almacenarse una vez"""
+        cache = SectionFragmentCache()
+        seller = '{"name":"' + "Apple" * 10 + '"}'
+        first = cache.put("MLC1", "v1", "seller", (seller,))
+        second = cache.put("MLC2", "v1", "seller", (''.join(seller),))
+
+        assert second[0] is first[0]
+        assert cache.get_stats()["shared_fragments"] == 1
+
+    def test_invalidate_single_section(self):
+        """Invalidar una sección no debe afectar las demás del producto"""
+        cache = SectionFragmentCache()
+        cache.put("MLC1", "v1", "reviews", ('0',))
+        cache.put("MLC1", "v1", "seller", ('{}',))
+
+        assert cache.invalidate("MLC1", "reviews") == 1
+        assert cache.get("MLC1", "v1", "reviews") is None
+        assert cache.get("MLC1", "v1", "seller") == ('{}',)
+
+    def test_invalidate_whole_product(self):
+        """Sin sección, debe invalidar todas las secciones del producto"""
+        cache = SectionFragmentCache()
+        cache.put("MLC1", "v1", "reviews", ('0',))
+        cache.put("MLC1", "v2", "seller", ('{}',))
+        cache.put("MLC2", "v1", "seller", ('{}',))
+
+        assert cache.invalidate("MLC1") == 2
+        assert cache.get("MLC2", "v1", "seller") == ('{}',)
+
+    def test_evicts_least_recently_used(self):
+        """Debe descartar la entrada menos usada al superar la capacidad"""
+        cache = SectionFragmentCache(max_entries=2)
+        cache.put("MLC1", "v1", "seller", ('1',))
+        cache.put("MLC2", "v1", "seller", ('2',))
+        cache.get("MLC1", "v1", "seller")
+        cache.put("MLC3", "v1", "seller", ('3',))
+
+        assert cache.get("MLC2", "v1", "seller") is None
+        assert cache.get("MLC1", "v1", "seller") == ('1',)
+
+    def test_carry_over_skips_stale_sections(self):
+        """Las secciones no afectadas pasan a la versión nueva; las afectadas no"""
+        cache = SectionFragmentCache()
+        cache.put("MLC1", "v1", "seller", ('{"id":"s1"}',))
+        cache.put("MLC1", "v1", "reviews", ('[]',))
+        cache.put("MLC2", "v1", "reviews", ('[]',))
+
+        assert cache.carry_over("v1", "v2", {"MLC1": {"reviews"}}) == 2
+        assert cache.get("MLC1", "v2", "seller") == ('{"id":"s1"}',)
+        assert cache.get("MLC1", "v2", "reviews") is None
+        assert cache.get("MLC2", "v2", "reviews") == ('[]',)
+
+    def test_rejects_non_positive_capacity(self):
+        """Debe rechazar capacidades no positivas"""
+        with pytest.raises(ValueError):
+            SectionFragmentCache(max_entries=0)
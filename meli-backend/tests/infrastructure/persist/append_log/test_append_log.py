@@ -0,0 +1,160 @@
+"""Tests para el log de solo agregado con group commit"""
+
+import threading
+
+import pytest
+from infrastructure.persist.append_log.append_log import AppendLog
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = AppendLog(str(tmp_path / "writes.jsonl"), max_delay=0.05)
+    yield log
+    log.close()
+
+
+class TestAppendLog:
+    """Tests para AppendLog"""
+
+    def test_appended_records_are_read_back_in_order(self, log):
+        """Los registros se leen en el orden en que se agregaron"""
+        log.append({"n": 1})
+        log.append({"n": 2, "text": "ñandú"})
+
+        records, offset = log.read_from(0)
+
+        assert records == [{"n": 1}, {"n": 2, "text": "ñandú"}]
+        assert offset == log.size()
+
+    def test_read_from_offset_returns_only_new_records(self, log):
+        """Leer desde el offset anterior solo devuelve lo agregado después"""
+        log.append({"n": 1})
+        _, offset = log.read_from(0)
+        log.append({"n": 2})
+
+        records, _ = log.read_from(offset)
+
+        assert records == [{"n": 2}]
+
+    def test_concurrent_appends_share_fsyncs(self, log):
+        """Los appends concurrentes se escriben en menos lotes que registros"""
+        threads = [threading.Thread(target=log.append, args=({"n": n},)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = log.get_stats()
+        assert stats["records"] == 20
+        assert stats["batches"] < 20
+        assert sorted(record["n"] for record in log.read_from(0)[0]) == list(range(20))
+
+    def test_partial_line_is_left_for_next_read(self, log):
+        """Una línea a medio escribir no se devuelve hasta completarse"""
+        log.append({"n": 1})
+        with open(log.path, 'ab') as file:
+            file.write(b'{"n":')
+
+        records, offset = log.read_from(0)
+        with open(log.path, 'ab') as file:
+            file.write(b'2}\n')
+
+        assert records == [{"n": 1}]
+        assert log.read_from(offset)[0] == [{"n": 2}]
+
+    def test_reading_missing_log_does_not_create_it(self, tmp_path):
+        """Leer un log que no existe no crea el archivo"""
+        log = AppendLog(str(tmp_path / "missing.jsonl"))
+
+        assert log.read_from(0) == ([], 0)
+        assert not (tmp_path / "missing.jsonl").exists()
+        log.close()
+
+    def test_compact_merges_and_rotates(self, log, tmp_path):
+        """La compactación entrega todos los registros y empieza una generación nueva"""
+        log.append({"n": 1})
+        log.append({"n": 2})
+        merged = []
+
+        assert log.compact(merged.extend) == 2
+        assert merged == [{"n": 1}, {"n": 2}]
+        assert log.generation() == 1
+        assert log.size() == 0
+        # La generación compactada queda archivada para los lectores atrasados
+        assert (tmp_path / "writes.jsonl.0").read_text(encoding='utf-8').count("\n") == 2
+
+        log.append({"n": 3})
+        assert log.read_from(0)[0] == [{"n": 3}]
+
+    def test_failed_merge_keeps_log(self, log):
+        """Si el merge falla, el log queda intacto"""
+        log.append({"n": 1})
+
+        def merge(records):
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            log.compact(merge)
+        assert log.read_from(0)[0] == [{"n": 1}]
+
+    def test_follower_finishes_compacted_generation(self, log):
+        """Un lector atrasado lee lo que le faltaba de la generación compactada y sigue en la nueva"""
+        log.append({"n": 1})
+        position = log.follow().position
+        log.append({"n": 2})
+        log.compact(lambda records: None)
+        log.append({"n": 3})
+
+        read = log.follow(position)
+
+        assert read.records == [{"n": 2}, {"n": 3}]
+        assert read.missed is False
+        assert read.position.generation == 1
+        assert log.follow(read.position).records == []
+
+    def test_follower_behind_discarded_generation_is_flagged(self, log, tmp_path):
+        """Si la generación del lector ya no está archivada, se indica que debe recargar los datos base"""
+        log.append({"n": 1})
+        position = log.follow().position
+        log.append({"n": 2})
+        log.compact(lambda records: None)
+        log.append({"n": 3})
+        log.compact(lambda records: None)
+        log.append({"n": 4})
+
+        read = log.follow(position)
+
+        assert not (tmp_path / "writes.jsonl.0").exists()
+        assert read.missed is True
+        assert read.records == [{"n": 4}]
+
+    def test_new_follower_reads_last_archived_generation(self, log):
+        """Un lector nuevo también lee la última generación compactada"""
+        log.append({"n": 1})
+        log.compact(lambda records: None)
+        log.append({"n": 2})
+
+        read = log.follow()
+
+        assert read.records == [{"n": 1}, {"n": 2}]
+        assert read.missed is False
+
+    def test_writer_of_other_process_follows_rotation(self, log):
+        """Otro proceso que ya tenía el archivo abierto escribe en la generación nueva"""
+        other = AppendLog(log.path, max_delay=0)
+        other.append({"n": 1})
+
+        log.compact(lambda records: None)
+        other.append({"n": 2})
+
+        assert log.read_from(0)[0] == [{"n": 2}]
+        assert log.follow().records == [{"n": 1}, {"n": 2}]
+        other.close()
+
+    def test_closed_log_rejects_appends(self, log):
+        """No se puede agregar a un log cerrado"""
+        log.append({"n": 1})
+        log.close()
+
+        with pytest.raises(ValueError):
+            log.append({"n": 2})
@@ -0,0 +1,123 @@
+"""Tests para CatalogSnapshot"""
+
+import pytest
+from domain.shipping.entity.shipping import Shipping
+from infrastructure.persist.catalog.catalog_snapshot import (
+    CatalogSnapshot,
+    StringTable,
+    entity_constructor,
+    is_trusted,
+    iter_rows
+)
+from infrastructure.persist.category_path.category_path_repository import CategoryPathRepository
+from infrastructure.persist.payment.payment_repository import PaymentRepository
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    """Fixture que carga el catálogo una vez para todo el módulo"""
+    return CatalogSnapshot.load()
+
+
+class TestCatalogSnapshot:
+    """Tests para el snapshot en memoria del catálogo"""
+
+    def test_get_rows_groups_by_product_id(self, catalog):
+        """Debe retornar solo las filas del producto, en el orden del CSV"""
+        rows = catalog.get_rows("category_path", "MLC621083881")
+        assert [row['label'] for row in rows] == ["Electrónica", "Celulares y Smartphones", "iPhone"]
+
+    def test_get_rows_unknown_key_returns_empty_list(self, catalog):
+        """Debe retornar lista vacía para claves inexistentes"""
+        assert catalog.get_rows("shipping", "INVALID_ID") == []
+
+    def test_global_tables_return_all_rows(self, catalog):
+        """Las tablas globales deben retornar todas sus filas con get_all"""
+        payments = catalog.get_all("payment")
+        assert len(payments) > 0
+        assert all('max_installments' in row for row in payments)
+
+    def test_version_is_stable_for_same_data(self, catalog):
+        """Dos cargas sobre los mismos CSV deben tener la misma versión"""
+        assert CatalogSnapshot.load().version == catalog.version
+
+    def test_iter_rows_matches_csv_reading(self, catalog):
+        """iter_rows debe entregar las mismas filas con y sin catálogo"""
+        repository = CategoryPathRepository()
+        from_csv = list(iter_rows(repository.csv_path, "category_path", "MLC621083881"))
+        from_catalog = list(iter_rows(repository.csv_path, "category_path", "MLC621083881", catalog))
+        assert from_csv == from_catalog
+
+    def test_repositories_read_from_catalog(self, catalog):
+        """Los repositorios con catálogo deben dar el mismo resultado que leyendo el CSV"""
+        assert CategoryPathRepository(catalog).get_by_product_id("MLC621083881") == \
+            CategoryPathRepository().get_by_product_id("MLC621083881")
+        assert PaymentRepository(catalog).get_max_installments() == PaymentRepository().get_max_installments()
+
+    def test_repository_with_catalog_ignores_csv_path(self, catalog):
+        """Con catálogo, el repositorio no debe volver a abrir el CSV"""
+        repository = CategoryPathRepository(catalog)
+        repository.csv_path = "/path/that/does/not/exist.csv"
+        assert len(repository.get_by_product_id("MLC621083881")) == 3
+
+    def test_is_trusted_requires_validated_catalog(self):
+        """Solo un catálogo validado habilita la construcción sin validación"""
+        snapshot = CatalogSnapshot({}, StringTable(), "v1", 0.0)
+        assert is_trusted(None) is False
+        assert is_trusted(snapshot) is False
+        snapshot.validated = True
+        assert is_trusted(snapshot) is True
+
+    def test_entity_constructor_skips_validation_only_when_trusted(self):
+        """Los repositorios usan trusted solo con catálogo validado y fuera del modo estricto"""
+        snapshot = CatalogSnapshot({}, StringTable(), "v1", 0.0)
+        assert entity_constructor(Shipping, snapshot) is Shipping
+        snapshot.validated = True
+        assert entity_constructor(Shipping, snapshot) == Shipping.trusted
+        assert entity_constructor(Shipping, snapshot, strict=True) is Shipping
+        assert entity_constructor(Shipping, None) is Shipping
+
+    def test_repeated_values_share_one_string(self, catalog):
+        """Los valores repetidos deben decodificarse a la misma instancia"""
+        first, second = catalog.get_rows("product_seller", "MLC621083881")[0], \
+            catalog.get_rows("product_seller", "MLC137702355")[0]
+        assert first['seller_id'] is second['seller_id']
+
+    def test_get_rows_returns_independent_dicts(self, catalog):
+        """Modificar una fila decodificada no debe alterar el snapshot"""
+        catalog.get_rows("shipping", "MLC621083881")[0]['product_id'] = "changed"
+        assert catalog.get_rows("shipping", "MLC621083881")[0]['product_id'] == "MLC621083881"
+
+    def test_dictionary_is_smaller_than_encoded_values(self, catalog):
+        """El diccionario de strings debe tener menos entradas que valores codificados"""
+        stats = catalog.get_stats()
+        assert 0 < stats["distinct_strings"] < stats["encoded_values"]
+
+    def test_short_rows_decode_missing_values_as_none(self, tmp_path):
+        """Las filas con menos campos que el header deben completar con None"""
+        (tmp_path / "payment" / "data").mkdir(parents=True)
+        (tmp_path / "payment" / "data" / "payment.csv").write_text("id,name\n1\n\n2,Visa\n", encoding="utf-8")
+
+        snapshot = CatalogSnapshot.load(str(tmp_path))
+
+        assert snapshot.get_all("payment") == [{"id": "1", "name": None}, {"id": "2", "name": "Visa"}]
+        assert snapshot.get_rows("shipping", "MLC1") == []
+
+
+class TestStringTable:
+    """Tests para el diccionario de strings"""
+
+    def test_encode_assigns_stable_codes(self):
+        """El mismo valor debe recibir siempre el mismo código"""
+        strings = StringTable()
+        code = strings.encode("https://example.com/a.png")
+
+        assert strings.encode("https://example.com/a.png") == code
+        assert strings.encode("otro") != code
+        assert strings.code_of("desconocido") is None
+        assert len(strings) == 2
+
+    def test_none_uses_reserved_code(self):
+        """None debe codificarse con el código reservado"""
+        strings = StringTable()
+        assert strings.strings[strings.encode(None)] is None
@@ -0,0 +1,142 @@
+"""Tests para la validación del catálogo en tiempo de carga"""
+
+import os
+import shutil
+
+import pytest
+from infrastructure.persist.catalog.catalog_loader import load_validated_snapshot
+from infrastructure.persist.catalog.catalog_snapshot import CATALOG_TABLES, PERSIST_DIR, CatalogSnapshot
+from infrastructure.persist.catalog.catalog_validator import (
+    CHECK_INVARIANT,
+    CHECK_REFERENCE,
+    ERROR,
+    validate_catalog
+)
+from infrastructure.persist.catalog.shared_catalog import MmapCatalogSnapshot, compile_snapshot
+
+
+def _copy_catalog(target_dir):
+    """Copia los CSV del catálogo a un directorio temporal"""
+    for relative_path, _ in CATALOG_TABLES.values():
+        destination = os.path.join(target_dir, relative_path)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copy(os.path.join(PERSIST_DIR, relative_path), destination)
+    return str(target_dir)
+
+
+def _replace_in_csv(base_dir, table, old, new):
+    """Reemplaza la primera aparición de old en el CSV de la tabla"""
+    path = os.path.join(base_dir, CATALOG_TABLES[table][0])
+    with open(path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    assert old in content
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content.replace(old, new, 1))
+
+
+@pytest.fixture(scope="module")
+def report():
+    """Reporte de validación sobre el catálogo real"""
+    return validate_catalog(CatalogSnapshot.load())
+
+
+class TestCatalogValidator:
+    """Tests para validate_catalog"""
+
+    def test_real_catalog_has_no_errors(self, report):
+        """El catálogo del repositorio debe validar sin errores"""
+        assert report.ok is True
+        assert report.errors == []
+        assert report.checked_keys > 0
+
+    def test_report_is_serializable(self, report):
+        """El reporte debe exponerse como diccionario"""
+        data = report.to_dict()
+        assert data["ok"] is True
+        assert data["error_count"] == 0
+        assert data["warning_count"] == len(data["issues"])
+
+    def test_reports_broken_reputation(self, tmp_path):
+        """Una reputación que no suma 100 debe reportarse para su vendedor"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "seller", "5,8,12,75", "5,8,12,70")
+
+        report = validate_catalog(CatalogSnapshot.load(base_dir))
+
+        assert report.ok is False
+        issue = report.errors[0]
+        assert (issue.table, issue.key, issue.check) == ("seller", "apple-store-oficial", CHECK_INVARIANT)
+        assert "sum to 100" in issue.message
+
+    def test_reports_selected_id_missing_from_options(self, tmp_path):
+        """Un selected_id inexistente en las opciones debe reportarse"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "variant", "MLC123456789,color,Color,natural", "MLC123456789,color,Color,rosa")
+
+        report = validate_catalog(CatalogSnapshot.load(base_dir))
+
+        assert any(issue.table == "variant" and "selected_id" in issue.message for issue in report.errors)
+
+    def test_reports_mapping_to_unknown_product(self, tmp_path):
+        """Un mapping de variantes hacia un SKU inexistente es un error de referencia"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "variant_product_mapping", ",MLC621083881", ",MLC000000000")
+
+        report = validate_catalog(CatalogSnapshot.load(base_dir))
+
+        assert any(
+            issue.severity == ERROR and issue.check == CHECK_REFERENCE and "MLC000000000" in issue.message
+            for issue in report.issues
+        )
+
+    def test_reports_product_with_unknown_seller(self, tmp_path):
+        """Un producto asignado a un vendedor inexistente es un error de referencia"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "product_seller", "MLC621083881,apple-store-oficial", "MLC621083881,unknown")
+
+        report = validate_catalog(CatalogSnapshot.load(base_dir))
+
+        assert any(
+            (issue.table, issue.key, issue.check) == ("product_seller", "MLC621083881", CHECK_REFERENCE)
+            for issue in report.errors
+        )
+
+    def test_collects_every_error(self, tmp_path):
+        """Debe reportar todos los errores, no solo el primero"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "seller", "5,8,12,75", "5,8,12,70")
+        _replace_in_csv(base_dir, "variant_product_mapping", ",MLC621083881", ",MLC000000000")
+
+        report = validate_catalog(CatalogSnapshot.load(base_dir))
+
+        assert {issue.table for issue in report.errors} >= {"seller", "variant_product_mapping"}
+
+
+class TestLoadValidatedSnapshot:
+    """Tests para load_validated_snapshot"""
+
+    def test_marks_valid_catalog_as_validated(self):
+        """Un catálogo sin errores queda marcado como validado"""
+        snapshot = load_validated_snapshot()
+        assert snapshot.validated is True
+        assert snapshot.validation_report["ok"] is True
+
+    def test_invalid_catalog_is_not_trusted(self, tmp_path):
+        """Con errores, los repositorios siguen validando por objeto"""
+        base_dir = _copy_catalog(tmp_path)
+        _replace_in_csv(base_dir, "seller", "5,8,12,75", "5,8,12,70")
+
+        snapshot = load_validated_snapshot(base_dir)
+
+        assert snapshot.validated is False
+        assert snapshot.validation_report["error_count"] >= 1
+
+    def test_shared_snapshot_keeps_validation(self, tmp_path):
+        """El snapshot compilado conserva el resultado de la validación"""
+        path = compile_snapshot(load_validated_snapshot(), str(tmp_path / "catalog.snapshot"))
+        shared = MmapCatalogSnapshot(path)
+        try:
+            assert shared.validated is True
+            assert shared.validation_report["ok"] is True
+        finally:
+            shared.close()
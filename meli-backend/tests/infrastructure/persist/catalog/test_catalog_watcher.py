@@ -0,0 +1,90 @@
+"""Tests para el seguimiento de los CSV del catálogo"""
+
+import os
+import shutil
+
+import pytest
+from infrastructure.persist.catalog.catalog_snapshot import PERSIST_DIR, source_fingerprint
+from infrastructure.persist.catalog.catalog_watcher import CatalogWatcher
+
+
+@pytest.fixture
+def base_dir(tmp_path):
+    """Copia de los CSV del catálogo que el test puede modificar"""
+    target = tmp_path / "persist"
+    shutil.copytree(PERSIST_DIR, target, ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    return str(target)
+
+
+def _touch_csv(base_dir: str) -> None:
+    """Agrega una línea vacía al CSV de reviews (cambia tamaño y mtime)"""
+    with open(os.path.join(base_dir, "review/data/review.csv"), "a", encoding='utf-8') as file:
+        file.write("\n")
+
+
+def _watcher(base_dir, changes):
+    return CatalogWatcher(lambda: changes.append(1), fingerprint=lambda: source_fingerprint(base_dir))
+
+
+class TestCatalogWatcher:
+    """Tests para CatalogWatcher"""
+
+    def test_unchanged_csvs_do_not_reload(self, base_dir):
+        """Sin cambios en los CSV no se llama a on_change"""
+        changes = []
+        watcher = _watcher(base_dir, changes)
+
+        assert watcher.check() is False
+        assert watcher.check() is False
+        assert changes == []
+
+    def test_change_is_applied_once_stable(self, base_dir):
+        """Un cambio se aplica cuando la huella nueva se repite en la consulta siguiente"""
+        changes = []
+        watcher = _watcher(base_dir, changes)
+        _touch_csv(base_dir)
+
+        assert watcher.check() is False
+        assert watcher.check() is True
+        assert watcher.check() is False
+        assert changes == [1]
+        assert watcher.get_stats()["changes"] == 1
+
+    def test_every_worker_sees_the_change(self, base_dir):
+        """Cada worker detecta la edición con su propio watcher"""
+        workers = [[], []]
+        watchers = [_watcher(base_dir, changes) for changes in workers]
+        _touch_csv(base_dir)
+
+        for watcher in watchers:
+            watcher.check()
+            watcher.check()
+
+        assert workers == [[1], [1]]
+
+    def test_failed_reload_is_retried(self, base_dir):
+        """Si la recarga falla, el cambio se vuelve a intentar"""
+        calls = []
+
+        def on_change():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("catalog is being written")
+
+        watcher = CatalogWatcher(on_change, fingerprint=lambda: source_fingerprint(base_dir))
+        _touch_csv(base_dir)
+        watcher.check()
+        with pytest.raises(OSError):
+            watcher.check()
+
+        watcher.check()
+        assert watcher.check() is True
+        assert len(calls) == 2
+
+    def test_zero_interval_disables_background_thread(self, base_dir):
+        """Con intervalo 0 no se inicia el hilo de seguimiento"""
+        watcher = CatalogWatcher(lambda: None, interval=0, fingerprint=lambda: source_fingerprint(base_dir))
+
+        watcher.start()
+
+        assert watcher.running is False
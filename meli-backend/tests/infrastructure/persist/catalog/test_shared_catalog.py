@@ -0,0 +1,87 @@
+"""Tests para el snapshot compartido vía mmap"""
+
+import pytest
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot, CATALOG_TABLES, source_fingerprint
+from infrastructure.persist.catalog.catalog_loader import load_catalog, load_validated_snapshot, MODE_SHARED
+from infrastructure.persist.catalog.shared_catalog import MmapCatalogSnapshot, compile_snapshot
+
+
+@pytest.fixture(scope="module")
+def source():
+    """Snapshot en memoria usado como fuente"""
+    return CatalogSnapshot.load()
+
+
+class TestSharedCatalog:
+    """Tests para compilar y adjuntar el snapshot compartido"""
+
+    @pytest.fixture
+    def shared(self, source, tmp_path):
+        """Snapshot compilado y adjunto vía mmap"""
+        path = compile_snapshot(source, str(tmp_path / "catalog.snapshot"))
+        snapshot = MmapCatalogSnapshot(path)
+        yield snapshot
+        snapshot.close()
+
+    def test_preserves_version(self, source, shared):
+        """Debe conservar la versión y la fecha de modificación del snapshot fuente"""
+        assert shared.version == source.version
+        assert shared.last_modified == source.last_modified
+
+    def test_all_tables_match_source(self, source, shared):
+        """Todas las tablas deben tener las mismas claves y filas que la fuente"""
+        for table in CATALOG_TABLES:
+            assert sorted(shared.keys(table)) == sorted(source.keys(table))
+            for key in source.keys(table):
+                assert shared.get_rows(table, key) == source.get_rows(table, key)
+
+    def test_unknown_key_returns_empty_list(self, shared):
+        """Debe retornar lista vacía para claves inexistentes"""
+        assert shared.get_rows("product_detail", "INVALID_ID") == []
+        assert shared.get_rows("product_detail", "") == []
+
+    def test_rejects_invalid_file(self, tmp_path):
+        """Debe rechazar archivos que no son snapshots"""
+        path = tmp_path / "invalid.snapshot"
+        path.write_bytes(b"not a catalog snapshot")
+        with pytest.raises(ValueError):
+            MmapCatalogSnapshot(str(path))
+
+    def test_load_catalog_compiles_missing_snapshot(self, tmp_path):
+        """En modo compartido debe compilar el snapshot si el archivo no existe"""
+        path = tmp_path / "missing.snapshot"
+        catalog = load_catalog(MODE_SHARED, str(path))
+        try:
+            assert path.exists()
+            assert isinstance(catalog, MmapCatalogSnapshot)
+            assert catalog.get_rows("shipping", "MLC621083881")
+        finally:
+            catalog.close()
+
+    def test_load_catalog_reuses_matching_snapshot(self, tmp_path):
+        """Un snapshot compilado a partir de los CSV actuales se adjunta sin recompilar"""
+        path = tmp_path / "current.snapshot"
+        compile_snapshot(load_validated_snapshot(), str(path))
+        compiled_at = path.stat().st_mtime_ns
+
+        catalog = load_catalog(MODE_SHARED, str(path))
+        try:
+            assert catalog.source == source_fingerprint()
+            assert path.stat().st_mtime_ns == compiled_at
+        finally:
+            catalog.close()
+
+    def test_load_catalog_recompiles_stale_snapshot(self, tmp_path):
+        """Un snapshot de otros CSV (despliegue anterior) se vuelve a compilar"""
+        path = tmp_path / "stale.snapshot"
+        stale = CatalogSnapshot.load()
+        stale.source = "0" * 16
+        stale.version = "stale"
+        compile_snapshot(stale, str(path))
+
+        catalog = load_catalog(MODE_SHARED, str(path))
+        try:
+            assert catalog.source == source_fingerprint()
+            assert catalog.version == CatalogSnapshot.load().version
+        finally:
+            catalog.close()
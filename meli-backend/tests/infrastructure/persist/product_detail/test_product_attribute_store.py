@@ -0,0 +1,90 @@
+"""Tests para el almacén columnar de atributos numéricos"""
+
+from array import array
+
+import pytest
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.product_detail import product_attribute_store
+from infrastructure.persist.product_detail.product_attribute_store import NUMERIC_COLUMNS, ProductAttributeStore
+
+
+def _store(rows):
+    """Construye un almacén desde tuplas (id, price, original_price, discount, sold_count, stock)"""
+    columns = {name: array("q", [row[position + 1] for row in rows]) for position, name in enumerate(NUMERIC_COLUMNS)}
+    return ProductAttributeStore([row[0] for row in rows], columns)
+
+
+@pytest.fixture
+def store():
+    return _store([
+        ("A", 100, 120, 16, 10, 5),
+        ("B", 200, 200, 0, 50, 0),
+        ("C", 300, 400, 25, 30, 2),
+        ("D", 400, 500, 20, 30, 1),
+        ("E", 500, 500, 0, 90, 7),
+    ])
+
+
+@pytest.fixture(params=["python", "numpy"])
+def engine(request, monkeypatch):
+    """Ejecuta cada test con la implementación en Python puro y con NumPy (si está instalado)"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(product_attribute_store, "numpy", None)
+    return request.param
+
+
+class TestProductAttributeStore:
+    """Tests para ProductAttributeStore"""
+
+    def test_columns_are_typed_arrays(self, store):
+        """Cada atributo debe guardarse en un array contiguo de int64"""
+        assert store.column("price").typecode == "q"
+        assert list(store.column("sold_count")) == [10, 50, 30, 30, 90]
+
+    def test_discounted_in_price_range_sorted_by_sold_count(self, store, engine):
+        """Debe filtrar por descuento y rango de precio y ordenar por ventas"""
+        total, products = store.query(min_price=100, max_price=400, discounted=True, sort_by="sold_count")
+
+        assert total == 3
+        assert [product.product_id for product in products] == ["C", "D", "A"]
+
+    def test_top_k_keeps_catalog_order_on_ties(self, store, engine):
+        """Los empates en el límite deben resolverse por el orden del catálogo"""
+        total, products = store.query(sort_by="sold_count", limit=3)
+
+        assert total == 5
+        assert [product.product_id for product in products] == ["E", "B", "C"]
+
+    def test_ascending_order_and_stock_filter(self, store, engine):
+        """Debe ordenar ascendente y excluir productos sin stock"""
+        total, products = store.query(in_stock=True, sort_by="price", descending=False, limit=2)
+
+        assert total == 4
+        assert [product.product_id for product in products] == ["A", "C"]
+
+    def test_not_discounted_filter(self, store, engine):
+        """discounted=False debe retornar solo productos sin descuento"""
+        _, products = store.query(discounted=False)
+        assert {product.product_id for product in products} == {"B", "E"}
+
+    def test_rejects_unknown_sort_column(self, store):
+        """Debe rechazar columnas de orden no numéricas"""
+        with pytest.raises(ValueError):
+            store.query(sort_by="title")
+
+    def test_rejects_misaligned_columns(self):
+        """Todas las columnas deben tener un valor por producto"""
+        columns = {name: array("q", [1]) for name in NUMERIC_COLUMNS}
+        with pytest.raises(ValueError):
+            ProductAttributeStore(["A", "B"], columns)
+
+    def test_from_catalog(self):
+        """Debe construirse con los valores de product_detail del catálogo"""
+        store = ProductAttributeStore.from_catalog(CatalogSnapshot.load())
+        position = store.product_ids.index("MLC621083881")
+
+        assert len(store) == 9
+        assert store.get(position).price == 1099990
+        assert store.get(position).sold_count == 145
@@ -0,0 +1,126 @@
+"""Tests para el índice en memoria de preguntas por producto"""
+
+import csv
+import shutil
+
+import pytest
+from domain.question.entity.question import Question, QuestionStatus
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.question.question_repository import QuestionRepository
+
+# Producto con preguntas en question.csv
+PRODUCT_ID = "MLC123456789"
+
+
+def _question(question_id, asked_at, answer=""):
+    return Question(
+        id=question_id,
+        question="¿Tiene garantía?",
+        answer=answer,
+        asked_at=asked_at,
+        answered_at="2026-10-19T12:00:00" if answer else "",
+        status=QuestionStatus.ANSWERED if answer else QuestionStatus.PENDING
+    )
+
+
+@pytest.fixture
+def repository():
+    return QuestionRepository(CatalogSnapshot.load())
+
+
+class TestQuestionRepositoryIndex:
+    """Tests para QuestionRepository.put y la lectura del índice"""
+
+    def test_questions_are_ordered_by_asked_at(self, repository):
+        """Las preguntas se listan de la más nueva a la más vieja"""
+        asked = [question.asked_at for question in repository.get_by_product_id(PRODUCT_ID)]
+
+        assert asked == sorted(asked, reverse=True)
+
+    def test_put_inserts_in_order(self, repository):
+        """Una pregunta nueva se inserta en su posición sin reordenar el resto"""
+        before = repository.get_by_product_id(PRODUCT_ID)
+
+        repository.put(PRODUCT_ID, _question("api-old", "2000-01-01T00:00:00"))
+        repository.put(PRODUCT_ID, _question("api-new", "2099-01-01T00:00:00"))
+
+        questions = repository.get_by_product_id(PRODUCT_ID)
+        assert questions[0].id == "api-new"
+        assert questions[-1].id == "api-old"
+        assert questions[1:-1] == before
+
+    def test_answer_moves_question_between_statuses(self, repository):
+        """Responder mueve la pregunta de pending a answered en su lugar"""
+        repository.put(PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00"))
+        pending_total, pending = repository.get_page(PRODUCT_ID, status=QuestionStatus.PENDING)
+        assert (pending_total, pending[0].id) == (1, "api-1")
+
+        repository.put(PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00", answer="Sí"))
+
+        assert repository.get_page(PRODUCT_ID, status=QuestionStatus.PENDING) == (0, [])
+        answered_total, answered = repository.get_page(PRODUCT_ID, status=QuestionStatus.ANSWERED)
+        assert answered[0].answer == "Sí"
+        assert answered_total == len(repository.get_by_product_id(PRODUCT_ID))
+
+    def test_readers_keep_their_snapshot(self, repository):
+        """Un índice ya leído no cambia con las escrituras posteriores"""
+        index = repository.get_index(PRODUCT_ID)
+
+        repository.put(PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00"))
+
+        assert "api-1" not in index.by_id
+        assert repository.get_by_id(PRODUCT_ID, "api-1") is not None
+
+    def test_page_slices_ordered_questions(self, repository):
+        """La paginación devuelve el total del filtro y la porción pedida"""
+        questions = repository.get_by_product_id(PRODUCT_ID)
+
+        total, page = repository.get_page(PRODUCT_ID, offset=1, limit=1)
+
+        assert total == len(questions)
+        assert page == questions[1:2]
+
+    def test_writes_are_visible_without_catalog(self):
+        """Sin catálogo las escrituras se combinan con cada lectura del CSV"""
+        repository = QuestionRepository()
+
+        repository.put("MLC000000000", _question("api-1", "2099-01-01T00:00:00"))
+
+        assert [question.id for question in repository.get_by_product_id("MLC000000000")] == ["api-1"]
+
+
+class TestQuestionRepositoryCompaction:
+    """Tests para QuestionRepository.merge_into_csv"""
+
+    @pytest.fixture
+    def csv_repository(self, tmp_path):
+        repository = QuestionRepository()
+        target = tmp_path / "question.csv"
+        shutil.copy(repository.csv_path, target)
+        repository.csv_path = str(target)
+        return repository
+
+    def test_merge_adds_and_replaces_rows(self, csv_repository):
+        """Las preguntas nuevas se agregan en orden y las respondidas se reemplazan"""
+        existing = csv_repository.get_by_product_id(PRODUCT_ID)[-1]
+        answered = Question(existing.id, existing.question, "Nueva respuesta", existing.asked_at,
+                            existing.answered_at, existing.status)
+
+        changed = csv_repository.merge_into_csv([
+            (PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00")),
+            (PRODUCT_ID, answered)
+        ])
+
+        questions = csv_repository.get_by_product_id(PRODUCT_ID)
+        assert changed == 2
+        assert questions[0].status == QuestionStatus.PENDING
+        assert questions[-1].answer == "Nueva respuesta"
+
+    def test_merge_is_idempotent(self, csv_repository):
+        """Repetir la compactación no duplica filas"""
+        csv_repository.merge_into_csv([(PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00"))])
+
+        assert csv_repository.merge_into_csv([(PRODUCT_ID, _question("api-1", "2099-01-01T00:00:00"))]) == 0
+        with open(csv_repository.csv_path, encoding='utf-8', newline='') as file:
+            ids = [row["id"] for row in csv.DictReader(file)]
+        assert ids.count("api-1") == 1
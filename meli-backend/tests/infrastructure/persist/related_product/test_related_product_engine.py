@@ -0,0 +1,220 @@
+"""Tests para el motor de productos relacionados"""
+
+import random
+
+import pytest
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.related_product import related_product_engine
+from infrastructure.persist.related_product.related_product_engine import (
+    ProductFeatures,
+    RelatedProductEngine,
+    extract_features,
+    rebuild,
+    save
+)
+from infrastructure.persist.related_product.related_product_repository import RelatedProductRepository
+
+
+def _features(terms, price):
+    """Vector normalizado a partir de una lista de features con peso 1"""
+    weight = 1 / len(terms) ** 0.5
+    return ProductFeatures({term: weight for term in terms}, price)
+
+
+def _random_catalog(seed, size=40):
+    rng = random.Random(seed)
+    vocabulary = [f"f{index}" for index in range(25)]
+    return {
+        f"P{index:03d}": _features(rng.sample(vocabulary, rng.randint(2, 6)), rng.randint(100, 1000))
+        for index in range(size)
+    }
+
+
+def _all_related(engine, product_ids):
+    return {product_id: engine.related(product_id) for product_id in product_ids}
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return CatalogSnapshot.load()
+
+
+class TestExtractFeatures:
+    """Tests para la extracción de features desde el catálogo"""
+
+    def test_vector_is_normalized(self, catalog):
+        """El vector debe tener norma 1 e incluir todas las familias de features"""
+        features = extract_features(catalog, "MLC621083881")
+
+        assert abs(sum(weight * weight for weight in features.vector.values()) - 1) < 1e-9
+        assert any(feature.startswith("cat:") for feature in features.vector)
+        assert any(feature.startswith("char:") for feature in features.vector)
+        assert any(feature.startswith("hl:") for feature in features.vector)
+        assert features.price == 1099990
+
+    def test_unknown_product_returns_none(self, catalog):
+        """Un producto inexistente no tiene features"""
+        assert extract_features(catalog, "ABC999") is None
+
+
+class TestRelatedProductEngine:
+    """Tests para RelatedProductEngine"""
+
+    @pytest.fixture(autouse=True, params=["python", "numpy"])
+    def scoring(self, request, monkeypatch):
+        """Ejecuta cada test con la similitud en Python puro y con NumPy (si está instalado)"""
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(related_product_engine, "numpy", None)
+        return request.param
+
+    def test_build_ranks_by_similarity(self):
+        """Debe ordenar por similitud y excluir al propio producto"""
+        engine = RelatedProductEngine(top_n=2)
+        engine.build({
+            "A": _features(["x", "y", "z"], 100),
+            "B": _features(["x", "y", "z"], 100),
+            "C": _features(["x", "w"], 100),
+            "D": _features(["q"], 100),
+        })
+
+        assert [product_id for product_id, _ in engine.related("A")] == ["B", "C"]
+        assert engine.related("D") == []
+
+    def test_price_proximity_breaks_similar_features(self):
+        """Con las mismas features, debe preferir el precio más cercano"""
+        engine = RelatedProductEngine(top_n=1)
+        engine.build({
+            "A": _features(["x"], 100),
+            "B": _features(["x"], 900),
+            "C": _features(["x"], 110),
+        })
+
+        assert engine.related("A")[0][0] == "C"
+
+    def test_incremental_updates_match_full_rebuild(self):
+        """Una secuencia de cambios incrementales debe dar el mismo resultado que recalcular todo"""
+        features = _random_catalog(seed=7)
+        engine = RelatedProductEngine(top_n=5)
+        engine.build(features)
+
+        changes = _random_catalog(seed=8)
+        for product_id in ["P003", "P010", "P021"]:
+            features[product_id] = changes[product_id]
+            engine.update(product_id, features[product_id])
+        del features["P015"]
+        engine.update("P015", None)
+        features["P999"] = changes["P001"]
+        engine.update("P999", features["P999"])
+
+        expected = RelatedProductEngine(top_n=5)
+        expected.build(features)
+        assert _all_related(engine, features) == _all_related(expected, features)
+        assert all("P015" not in dict(engine.related(product_id)) for product_id in features)
+
+    def test_update_only_touches_affected_products(self):
+        """Un producto sin features compartidas no debe recalcularse"""
+        engine = RelatedProductEngine(top_n=2)
+        engine.build({
+            "A": _features(["x"], 100),
+            "B": _features(["x"], 100),
+            "C": _features(["z"], 100),
+            "D": _features(["z"], 100),
+        })
+
+        changed = engine.update("A", _features(["x", "y"], 120))
+
+        assert "C" not in changed and "D" not in changed
+        assert engine.related("B") == [("A", pytest.approx(engine.related("B")[0][1]))]
+
+    def test_sync_from_previous_state_matches_full_rebuild(self):
+        """Restaurar el estado previo y sincronizar solo los cambios debe ser exacto"""
+        previous_features = _random_catalog(seed=3)
+        previous = RelatedProductEngine(top_n=4)
+        previous.build(previous_features)
+
+        current = dict(previous_features)
+        current["P005"] = _random_catalog(seed=4)["P005"]
+        del current["P030"]
+
+        engine = RelatedProductEngine(top_n=4)
+        fingerprints = previous.fingerprints()
+        engine.load(
+            {product_id: f for product_id, f in current.items() if fingerprints.get(product_id) == f.fingerprint()},
+            _all_related(previous, previous_features)
+        )
+        changed = engine.sync(current, fingerprints)
+
+        expected = RelatedProductEngine(top_n=4)
+        expected.build(current)
+        assert "P005" in changed
+        assert _all_related(engine, current) == _all_related(expected, current)
+
+    def test_rejects_non_positive_top_n(self):
+        """top_n debe ser positivo"""
+        with pytest.raises(ValueError):
+            RelatedProductEngine(top_n=0)
+
+
+class TestVectorizedScoring:
+    """Tests para la similitud vectorizada con NumPy"""
+
+    def test_matches_pure_python_scores(self, monkeypatch):
+        """El producto disperso vectorizado debe dar exactamente los mismos puntajes"""
+        pytest.importorskip("numpy")
+        features = _random_catalog(seed=11, size=80)
+        vectorized = RelatedProductEngine(top_n=8)
+        vectorized.build(features)
+
+        monkeypatch.setattr(related_product_engine, "numpy", None)
+        python = RelatedProductEngine(top_n=8)
+        python.build(features)
+
+        assert _all_related(vectorized, features) == _all_related(python, features)
+
+
+class TestRebuild:
+    """Tests para el cálculo sobre el catálogo y su persistencia"""
+
+    def test_second_rebuild_is_incremental(self, catalog, tmp_path):
+        """Con el estado guardado y sin cambios, no debe recalcular ninguna lista"""
+        state_path = str(tmp_path / "state.json")
+        engine, changed = rebuild(catalog, state_path=state_path, top_n=3)
+        rows = save(catalog, engine, str(tmp_path / "computed.csv"), state_path)
+
+        again, changed_again = rebuild(catalog, state_path=state_path, top_n=3)
+
+        assert len(changed) == 9
+        assert rows == 27
+        assert changed_again == set()
+        assert again.related("MLC621083881") == engine.related("MLC621083881")
+
+    def test_save_replaces_files_without_leftovers(self, catalog, tmp_path):
+        """La escritura atómica no deja temporales y reemplaza el contenido anterior"""
+        computed, state = tmp_path / "computed.csv", tmp_path / "state.json"
+        computed.write_text("stale", encoding="utf-8")
+        engine, _ = rebuild(catalog, state_path=str(state), top_n=3)
+
+        save(catalog, engine, str(computed), str(state))
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["computed.csv", "state.json"]
+        assert computed.read_text(encoding="utf-8").startswith("product_id,id,")
+
+    def test_repository_falls_back_to_computed_list(self, tmp_path):
+        """Sin lista curada, el repositorio debe usar la lista calculada"""
+        curated = tmp_path / "related_product.csv"
+        with open(RelatedProductRepository().csv_path, encoding="utf-8") as file:
+            curated.write_text(file.readline(), encoding="utf-8")
+        repository = RelatedProductRepository()
+        repository.csv_path = str(curated)
+
+        related = repository.get_by_product_id("MLC621083881")
+
+        assert len(related) > 0
+        assert all(product.id.startswith("MLC") and product.id != "MLC621083881" for product in related)
+
+    def test_curated_list_takes_precedence(self, catalog):
+        """Con lista curada, no debe mezclarse con la calculada"""
+        related = RelatedProductRepository(catalog).get_by_product_id("MLC621083881")
+        assert [product.id for product in related][:2] == ["RP001", "RP002"]
@@ -0,0 +1,101 @@
+"""Tests para el índice en memoria de reviews escritas por la API"""
+
+import csv
+import shutil
+
+import pytest
+from domain.review.entity.review import Review
+from infrastructure.persist.catalog.catalog_snapshot import CatalogSnapshot
+from infrastructure.persist.review.review_repository import ReviewRepository
+
+PRODUCT_ID = "MLC137702355"
+
+
+def _review(review_id, rating=5.0, category_ratings=None):
+    return Review(id=review_id, user_name="Ana", rating=rating, date="2026-10-19",
+                  comment="Muy bueno", likes=0, verified=True, category_ratings=category_ratings)
+
+
+@pytest.fixture
+def repository():
+    return ReviewRepository(CatalogSnapshot.load())
+
+
+class TestReviewRepositoryWrites:
+    """Tests para ReviewRepository.add y sus estadísticas incrementales"""
+
+    def test_added_review_is_listed_first(self, repository):
+        """La review agregada aparece antes que las del CSV"""
+        before = repository.get_by_product_id(PRODUCT_ID)
+
+        assert repository.add(PRODUCT_ID, _review("api-1")) is True
+
+        reviews = repository.get_by_product_id(PRODUCT_ID)
+        assert reviews[0].id == "api-1"
+        assert reviews[1:] == before
+
+    def test_statistics_match_full_recomputation(self, repository):
+        """El agregado incremental coincide con recalcular sobre todas las reviews"""
+        repository.add(PRODUCT_ID, _review("api-1", 3.0, {"battery_life": 2}))
+        repository.add(PRODUCT_ID, _review("api-2", 1.0))
+
+        # Sin catálogo las estadísticas se recalculan sobre la lista completa
+        recomputed = ReviewRepository()
+        recomputed.get_by_product_id = repository.get_by_product_id
+
+        assert repository.get_statistics(PRODUCT_ID) == recomputed.get_statistics(PRODUCT_ID)
+
+    def test_duplicate_ids_are_ignored(self, repository):
+        """Una review repetida (del log o del CSV) no se vuelve a contar"""
+        base_id = repository.get_by_product_id(PRODUCT_ID)[0].id
+        repository.add(PRODUCT_ID, _review("api-1"))
+        total = repository.get_statistics(PRODUCT_ID)["total_reviews"]
+
+        assert repository.add(PRODUCT_ID, _review("api-1")) is False
+        assert repository.add(PRODUCT_ID, _review(base_id)) is False
+        assert repository.get_statistics(PRODUCT_ID)["total_reviews"] == total
+
+    def test_product_without_reviews(self, repository):
+        """Un producto sin reviews en el CSV arranca el agregado en cero"""
+        repository.add("MLC000000000", _review("api-1", 4.0))
+
+        stats = repository.get_statistics("MLC000000000")
+        assert stats["total_reviews"] == 1
+        assert stats["average_rating"] == 4.0
+        assert stats["rating_distribution"][4] == 1
+
+
+class TestReviewRepositoryCompaction:
+    """Tests para ReviewRepository.merge_into_csv"""
+
+    @pytest.fixture
+    def csv_repository(self, tmp_path):
+        repository = ReviewRepository()
+        target = tmp_path / "review.csv"
+        shutil.copy(repository.csv_path, target)
+        repository.csv_path = str(target)
+        return repository
+
+    def test_merged_reviews_precede_existing_rows(self, csv_repository):
+        """Las reviews volcadas quedan primero, de la más nueva a la más vieja"""
+        before = csv_repository.get_by_product_id(PRODUCT_ID)
+
+        added = csv_repository.merge_into_csv([
+            (PRODUCT_ID, _review("api-1", 4.0, {"battery_life": 4})),
+            (PRODUCT_ID, _review("api-2"))
+        ])
+
+        reviews = csv_repository.get_by_product_id(PRODUCT_ID)
+        assert added == 2
+        assert [review.id for review in reviews[:2]] == ["api-2", "api-1"]
+        assert reviews[1].category_ratings == {"battery_life": 4}
+        assert reviews[2:] == before
+
+    def test_merge_is_idempotent(self, csv_repository):
+        """Repetir la compactación no duplica filas"""
+        csv_repository.merge_into_csv([(PRODUCT_ID, _review("api-1"))])
+
+        assert csv_repository.merge_into_csv([(PRODUCT_ID, _review("api-1"))]) == 0
+        with open(csv_repository.csv_path, encoding='utf-8', newline='') as file:
+            ids = [row["id"] for row in csv.DictReader(file)]
+        assert ids.count("api-1") == 1
@@ -0,0 +1,57 @@
+"""Tests para el importador de vendedores al formato normalizado"""
+
+import csv
+
+from infrastructure.persist.seller_information.seller_importer import (
+    SELLER_COLUMNS,
+    deduplicate_sellers,
+    import_legacy_sellers,
+    slugify
+)
+
+
+def _legacy_row(product_id, name="Apple Store Oficial", followers="100"):
+    row = {column: "0" for column in SELLER_COLUMNS[1:]}
+    row.update({"product_id": product_id, "name": name, "followers": followers})
+    return row
+
+
+class TestSellerImporter:
+    """Tests para deduplicate_sellers e import_legacy_sellers"""
+
+    def test_slugify(self):
+        """Debe generar un identificador ASCII estable"""
+        assert slugify("Apple Store Oficial") == "apple-store-oficial"
+        assert slugify("Tienda Ñandú") == "tienda-nandu"
+
+    def test_identical_records_are_deduplicated(self):
+        """Las filas repetidas del mismo vendedor deben producir un solo registro"""
+        sellers, product_sellers = deduplicate_sellers([_legacy_row("MLC1"), _legacy_row("MLC2")])
+
+        assert len(sellers) == 1
+        assert [row["seller_id"] for row in product_sellers] == ["apple-store-oficial"] * 2
+
+    def test_different_records_with_same_name_get_distinct_ids(self):
+        """Dos vendedores distintos con el mismo nombre no deben fusionarse"""
+        sellers, product_sellers = deduplicate_sellers([
+            _legacy_row("MLC1", followers="100"),
+            _legacy_row("MLC2", followers="200")
+        ])
+
+        assert [row["seller_id"] for row in sellers] == ["apple-store-oficial", "apple-store-oficial-2"]
+        assert product_sellers[1]["seller_id"] == "apple-store-oficial-2"
+
+    def test_import_writes_normalized_csvs(self, tmp_path):
+        """Debe escribir seller.csv y product_seller.csv"""
+        legacy_path = tmp_path / "seller_information.csv"
+        with open(legacy_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=["product_id"] + SELLER_COLUMNS[1:])
+            writer.writeheader()
+            writer.writerows([_legacy_row("MLC1"), _legacy_row("MLC2"), _legacy_row("MLC3", name="Otro")])
+
+        result = import_legacy_sellers(str(legacy_path), str(tmp_path / "out"))
+
+        assert (result.seller_count, result.product_count) == (2, 3)
+        with open(result.product_seller_path, encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        assert rows[2] == {"product_id": "MLC3", "seller_id": "otro"}
@@ -0,0 +1,56 @@
+"""Tests para SellerInformationRepository"""
+
+import pytest
+from application.service.seller_information_service import SellerInformationService
+from domain.seller_information.entity.seller_information import SellerInformation
+from infrastructure.persist.catalog.catalog_loader import load_validated_snapshot
+from infrastructure.persist.seller_information.seller_information_repository import SellerInformationRepository
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return load_validated_snapshot()
+
+
+class TestSellerInformationRepository:
+    """Tests para el repositorio normalizado de vendedores"""
+
+    def test_get_seller_id_by_product_id(self):
+        """Debe resolver el seller_id a partir del mapa producto → vendedor"""
+        assert SellerInformationRepository().get_seller_id_by_product_id("MLC621083881") == "apple-store-oficial"
+
+    def test_get_by_product_id_from_csv(self):
+        """Sin catálogo, debe leer el vendedor desde los CSV normalizados"""
+        seller = SellerInformationRepository().get_by_product_id("MLC621083881")
+
+        assert isinstance(seller, SellerInformation)
+        assert seller.name == "Apple Store Oficial"
+        assert seller.reputation.green == 75
+
+    def test_unknown_product_returns_none(self, catalog):
+        """Un producto sin vendedor debe retornar None"""
+        assert SellerInformationRepository(catalog).get_by_product_id("ABC999") is None
+
+    def test_products_of_same_seller_share_instance(self, catalog):
+        """Con catálogo, todos los SKUs del vendedor deben compartir la misma entidad"""
+        repository = SellerInformationRepository(catalog)
+
+        first = repository.get_by_product_id("MLC621083881")
+        second = repository.get_by_product_id("MLC137702355")
+
+        assert first is second
+
+    def test_service_shares_dto_across_products(self, catalog):
+        """El servicio debe entregar el mismo DTO para los productos del mismo vendedor"""
+        service = SellerInformationService(SellerInformationRepository(catalog))
+
+        first = service.get_seller_information_by_product_id("MLC621083881")
+        second = service.get_seller_information_by_product_id("MLC137702355")
+
+        assert first is second
+        assert first.name == "Apple Store Oficial"
+
+    def test_service_fallback_for_unknown_product(self, catalog):
+        """Un producto sin vendedor debe usar el vendedor por defecto"""
+        service = SellerInformationService(SellerInformationRepository(catalog))
+        assert service.get_seller_information_by_product_id("ABC999").name == "Vendedor Desconocido"
@@ -255,4 +255,6 @@ export interface ProductDetail {
   totalReviews: number;
   ratingDistribution: RatingDistribution;
   averageCategoryRatings: CategoryRatings;
+  // Secciones secundarias que no respondieron a tiempo (vienen vacías)
+  partial?: string[];
 }